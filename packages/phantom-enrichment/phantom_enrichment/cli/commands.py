@@ -2,7 +2,8 @@
 
 import typer
 from typing_extensions import Annotated
-from typing import Union # Keep Union for internal type hint
+from typing import Optional, Union # Keep Union for internal type hint
+from contextlib import nullcontext
 from pathlib import Path
 from loguru import logger
 import pandas as pd
@@ -12,8 +13,11 @@ import sys # Import sys for exit on import error
 # Ensure these imports work based on your project structure and __init__.py files
 try:
     from phantom_enrichment.config.settings import settings, api_fields_config # Import loaded settings & config
+    from phantom_enrichment.cli.dashboard import EnrichmentDashboard
     from phantom_enrichment.core.orchestrator import Orchestrator
     from phantom_enrichment.datasources.excel_handler import ExcelHandler
+    from phantom_enrichment.datasources.journal import EnrichmentJournal
+    from phantom_enrichment.datasources.output_writers import OUTPUT_WRITERS, create_output_writer, output_column_types
     from phantom_enrichment.utils.exceptions import DataSourceError, ConfigurationError, EnrichmentError
 except ImportError as e:
      # Provide a more informative error if imports fail during startup
@@ -38,9 +42,17 @@ def enrich_books(
     )],
     output_filename: Annotated[str, typer.Option(
         "--output", "-o",
-        help="Filename for the enriched Excel file (.xlsx) to be saved in the configured output directory. "
-             "If not provided, defaults to '[input_file_name]_enriched.xlsx'.",
+        help="Filename for the enriched output to be saved in the configured output directory. "
+             "The extension is set by --format. If not provided, defaults to '[input_file_name]_enriched'.",
     )] = None,
+    output_format: Annotated[str, typer.Option(
+        "--format", "-f",
+        help="Output format written in chunks as rows finish: 'parquet', 'csv' or 'jsonl'. Default: OUTPUT_FORMAT setting.",
+    )] = None,
+    excel: Annotated[bool, typer.Option(
+        "--excel",
+        help="Also export the final result to an Excel file (.xlsx) next to the main output.",
+    )] = False,
     # Accept as string from Typer
     input_sheet_str: Annotated[str, typer.Option(
         "--sheet", "-s",
@@ -48,15 +60,31 @@ def enrich_books(
     )] = "0", # Default to string "0"
     providers: Annotated[str, typer.Option(
         "--providers", "-p",
-        help="Comma-separated list of providers to use (e.g., 'isbndb'). Default: 'isbndb'.",
+        help="Comma-separated list of providers to query concurrently (e.g., 'isbndb,openlibrary'). Default: 'isbndb'.",
     )] = "isbndb",
+    refresh: Annotated[bool, typer.Option(
+        "--refresh",
+        help="Ignore cached provider responses and query the providers again (fresh responses are still cached).",
+    )] = False,
+    resume: Annotated[bool, typer.Option(
+        "--resume",
+        help="Continue an interrupted run: skip rows already recorded in the output's journal.",
+    )] = False,
+    dashboard: Annotated[bool, typer.Option(
+        "--dashboard/--no-dashboard",
+        help="Show a live progress panel (rows/min, ETA, request latency and match rates) while enriching.",
+    )] = True,
 ):
     """
     Enriches book metadata from an input Excel file using configured providers
-    (currently supports ISBNDB) and saves the results to a new Excel file.
+    (ISBNDB and Open Library) and streams the results to a Parquet, CSV or JSONL
+    file, optionally exporting them to Excel at the end.
+    Editions found by more than one provider are merged into a single row.
 
-    Reads 'Title' and 'Author' columns from the input file.
-    Produces an output file with detailed edition information for matched books.
+    Reads 'Title' and 'Author' columns from the input file. Rows that also carry
+    an ISBN (in an 'ISBN', 'ISBN13' or 'ISBN10' column) are looked up in bulk first.
+    Produces an output file with detailed edition information for matched books,
+    plus a '<output>.metrics.json' summary of request timings and match rates.
     """
     # Logger should be configured by the time this command runs due to settings import
     logger.info("--- Starting Book Enrichment Process ---")
@@ -96,11 +124,16 @@ def enrich_books(
              raise DataSourceError(f"Input path is not a file: {resolved_input_path}")
 
 
+        output_format = (output_format or settings.output_format).lower()
+        if output_format not in OUTPUT_WRITERS:
+            raise ConfigurationError(f"Unknown output format '{output_format}'. Choose one of: {', '.join(OUTPUT_WRITERS)}")
         if output_filename is None:
             # Use stem from the original input_file name as provided by user
-            output_filename = f"{Path(input_file).stem}_enriched.xlsx"
-        # Output path is resolved relative to output_dir setting
-        resolved_output_path = settings.output_dir / output_filename
+            output_filename = f"{Path(input_file).stem}_enriched"
+        # Output path is resolved relative to output_dir setting; the format sets the extension
+        known_extensions = {".xlsx", *(writer_class.EXTENSION for writer_class in OUTPUT_WRITERS.values())}
+        output_stem = Path(output_filename).stem if Path(output_filename).suffix.lower() in known_extensions else output_filename
+        resolved_output_path = settings.output_dir / f"{output_stem}{OUTPUT_WRITERS[output_format].EXTENSION}"
         logger.info(f"Resolved Output Path: {resolved_output_path}")
 
         # Ensure output directory exists (settings validator should have created it)
@@ -136,6 +169,7 @@ def enrich_books(
 
 
     # --- Core Workflow ---
+    orchestrator: Optional[Orchestrator] = None
     try:
         # 1. Load Input Data
         logger.info("Loading input data...")
@@ -152,21 +186,33 @@ def enrich_books(
         # Ensure settings and api_fields_config are available
         if not settings or not api_fields_config:
              raise ConfigurationError("Settings or API fields configuration not loaded correctly.")
-        orchestrator = Orchestrator(settings=settings, api_fields_config=api_fields_config)
+        orchestrator = Orchestrator(settings=settings, api_fields_config=api_fields_config, refresh_cache=refresh)
 
-        # 3. Run Enrichment
+        # 3. Run Enrichment (checkpointed to a journal next to the output file)
+        journal_path = settings.output_dir / f"{output_stem}.journal.jsonl"
+        journal = EnrichmentJournal(journal_path, checkpoint_interval=settings.checkpoint_interval, resume=resume)
+        logger.info(f"Checkpointing progress to: {journal_path}")
+        # 4. Stream results to the output as rows finish
+        writer = create_output_writer(
+            output_format,
+            resolved_output_path,
+            column_types=output_column_types(api_fields_config, provider_list)
+        )
         logger.info("Starting enrichment process...")
-        enriched_df = orchestrator.enrich_books(input_df, providers=provider_list)
+        with EnrichmentDashboard(orchestrator.metrics) if dashboard else nullcontext():
+            enriched_df = orchestrator.enrich_books(input_df, providers=provider_list, journal=journal, writer=writer)
 
-        # 4. Save Results
+        # 5. Optional Excel export of the final result
         if enriched_df is not None and not enriched_df.empty:
-            logger.info(f"Enrichment successful. Saving {len(enriched_df)} enriched records...")
-            ExcelHandler.save_dataframe_to_excel(enriched_df, resolved_output_path)
+            logger.info(f"Enrichment successful. {writer.rows_written} enriched records written.")
+            if excel:
+                excel_path = settings.output_dir / f"{output_stem}.xlsx"
+                ExcelHandler.save_dataframe_to_excel(enriched_df, excel_path)
+                logger.info(f"Excel export saved to: {excel_path}")
             logger.success(f"--- Book Enrichment Process Completed Successfully ---")
-            logger.info(f"Output saved to: {resolved_output_path}")
+            logger.info(f"Output saved to: {writer.path}")
         elif enriched_df is not None and enriched_df.empty:
              logger.warning("Enrichment process completed, but no matching editions were found or collected.")
-             logger.info("No output file generated.")
         else:
             # This case might occur if orchestrator returns None due to client errors etc.
             logger.error("Enrichment process failed to produce results (returned None). Check logs for details.")
@@ -178,6 +224,9 @@ def enrich_books(
         # Optionally log traceback for these expected errors if needed for debugging
         # logger.exception("Traceback:")
         raise typer.Exit(code=1)
+    except KeyboardInterrupt:
+        logger.warning("Enrichment interrupted. Completed rows are saved in the journal; rerun with --resume to continue.")
+        raise typer.Exit(code=130)
     except ImportError as e:
         # Catch potential import errors missed earlier
         logger.critical(f"Import error during execution: {e}")
@@ -187,6 +236,17 @@ def enrich_books(
         logger.critical(f"An unexpected error occurred during the enrichment process.")
         logger.exception("Unexpected Error Details:") # Log full traceback for unexpected errors
         raise typer.Exit(code=1)
+    finally:
+        # 6. Metrics summary (also written for failed or interrupted runs)
+        if orchestrator is not None:
+            metrics_path = settings.output_dir / f"{output_stem}.metrics.json"
+            try:
+                orchestrator.metrics.write_json(
+                    metrics_path,
+                    extra={"run_summary": orchestrator.run_summary.model_dump(mode="json")}
+                )
+            except DataSourceError as e:
+                logger.error(str(e))
 
 
 # --- Placeholder for other media types ---
@@ -0,0 +1,133 @@
+# phantom_enrichment/cli/dashboard.py
+
+from datetime import timedelta
+from typing import Dict, Optional
+from rich.console import Console, Group
+from rich.live import Live
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, ProgressColumn, Task, TextColumn
+from rich.table import Table
+from rich.text import Text
+
+from phantom_enrichment.utils.logging_config import set_console_sink
+from phantom_enrichment.utils.metrics import EnrichmentMetrics
+
+
+class RowsPerMinuteColumn(ProgressColumn):
+    """Rows processed per minute in this run (resumed rows excluded)."""
+
+    def render(self, task: Task) -> Text:
+        rows_per_minute = task.fields.get("rows_per_minute")
+        if rows_per_minute is None:
+            return Text("-- rows/min", style="progress.data.speed")
+        return Text(f"{rows_per_minute:,.1f} rows/min", style="progress.data.speed")
+
+
+class EtaColumn(ProgressColumn):
+    """Estimated time to finish at the current rows/min."""
+
+    def render(self, task: Task) -> Text:
+        eta = task.fields.get("eta")
+        if task.finished:
+            return Text("done", style="progress.elapsed")
+        if eta is None:
+            return Text("ETA -:--:--", style="progress.remaining")
+        return Text(f"ETA {timedelta(seconds=int(eta))}", style="progress.remaining")
+
+
+class EnrichmentDashboard:
+    """
+    Live terminal panel for an enrichment run.
+
+    Shows one progress bar per provider (rows/min and ETA) above a table of
+    per-provider request statistics read from EnrichmentMetrics. While active,
+    console log lines are printed above the panel instead of tearing through it.
+
+    Usage:
+        with EnrichmentDashboard(orchestrator.metrics):
+            orchestrator.enrich_books(...)
+    """
+
+    def __init__(self, metrics: EnrichmentMetrics, refresh_per_second: float = 2, console: Optional[Console] = None):
+        self.metrics = metrics
+        self.console = console or Console(stderr=True)
+        self.refresh_per_second = refresh_per_second
+        self.progress = Progress(
+            TextColumn("[bold]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TextColumn("[progress.percentage]{task.percentage:>5.1f}%"),
+            RowsPerMinuteColumn(),
+            EtaColumn(),
+            console=self.console,
+        )
+        self._tasks: Dict[str, int] = {}
+        self._live: Optional[Live] = None
+
+    def _log_sink(self, message) -> None:
+        """Loguru sink printing log lines above the live panel."""
+        self.console.print(Text.from_ansi(str(message).rstrip("\n")), soft_wrap=True)
+
+    def _update_progress(self) -> None:
+        metrics = self.metrics
+        elapsed = metrics.elapsed
+        for provider in list(metrics.providers):
+            if provider not in self._tasks:
+                self._tasks[provider] = self.progress.add_task(provider, total=metrics.total_rows or None)
+            done = metrics.rows_done[provider]
+            processed = done - metrics.rows_resumed[provider]
+            rows_per_minute = processed / elapsed * 60 if elapsed > 0 and processed else None
+            remaining = max(metrics.total_rows - done, 0)
+            eta = remaining / (rows_per_minute / 60) if rows_per_minute else None
+            self.progress.update(
+                self._tasks[provider],
+                total=metrics.total_rows or None,
+                completed=done,
+                rows_per_minute=rows_per_minute,
+                eta=eta,
+            )
+
+    def _stats_table(self) -> Table:
+        table = Table(expand=False, box=None, header_style="bold", pad_edge=False)
+        for column in ("Provider", "Match %", "Requests", "Failed", "Retries", "p50 ms", "p90 ms", "Limiter wait", "Cand./search"):
+            table.add_column(column, justify="left" if column == "Provider" else "right")
+        for provider in list(self.metrics.providers):
+            stats = self.metrics.provider_stats(provider)
+            latency = stats["latency_ms"]
+            candidates = stats["candidates_per_search"]
+            table.add_row(
+                provider,
+                f"{stats['match_rate'] * 100:.1f}" if stats["match_rate"] is not None else "-",
+                str(stats["requests"]),
+                str(stats["failed_requests"]),
+                str(stats["retries"]),
+                f"{latency['p50']:.0f}" if latency else "-",
+                f"{latency['p90']:.0f}" if latency else "-",
+                f"{stats['limiter_wait_share'] * 100:.0f}%" if stats["limiter_wait_share"] is not None else "-",
+                f"{candidates['mean']:.1f}" if candidates.get("searches") else "-",
+            )
+        return table
+
+    def render(self) -> Group:
+        """Builds the current panel from the metrics."""
+        self._update_progress()
+        return Group(self.progress, self._stats_table())
+
+    def __enter__(self) -> "EnrichmentDashboard":
+        self._live = Live(
+            get_renderable=self.render,
+            console=self.console,
+            refresh_per_second=self.refresh_per_second,
+            transient=False,
+        )
+        self._live.start()
+        set_console_sink(self._log_sink)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            if self._live is not None:
+                self._live.refresh()
+                self._live.stop()
+        finally:
+            self._live = None
+            set_console_sink(None)
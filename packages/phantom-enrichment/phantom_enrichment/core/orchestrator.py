@@ -1,422 +1,955 @@
-# phantom_enrichment/core/orchestrator.py
-
-import time
-import json
-import pandas as pd
-from typing import Dict, Any, List, Optional
-from loguru import logger
-from rapidfuzz import fuzz, process
-import importlib # Used to dynamically get scorer function
-
-# Project specific imports
-from phantom_enrichment.config.settings import Settings
-from phantom_enrichment.enrichment.providers.isbndb_client import IsbnDbClient
-from phantom_enrichment.utils.helpers import normalize_string, generate_book_id
-from phantom_enrichment.utils.exceptions import EnrichmentError, ProviderApiError, ConfigurationError
-
-class Orchestrator:
-    """
-    Coordinates the media enrichment process.
-
-    Reads input data, interacts with configured API providers via clients,
-    applies matching logic, extracts relevant fields based on configuration,
-    and returns the enriched data.
-    """
-
-    def __init__(self, settings: Settings, api_fields_config: Dict[str, Any]):
-        """
-        Initializes the Orchestrator.
-
-        Args:
-            settings: The application settings object.
-            api_fields_config: The loaded configuration mapping output fields
-                               to provider-specific fields.
-        """
-        self.settings = settings
-        self.api_fields_config = api_fields_config
-        self.clients = self._initialize_clients()
-
-        # Validate fuzzy scorer name from settings
-        self.fuzzy_scorer_func = self._get_fuzzy_scorer(settings.fuzzy_scorer)
-
-        logger.info("Orchestrator initialized.")
-
-    def _initialize_clients(self) -> Dict[str, Any]:
-        """Initializes API client instances based on settings."""
-        clients = {}
-        # --- Initialize ISBNDB Client ---
-        try:
-            isbndb_client = IsbnDbClient(
-                api_key=self.settings.isbndb_api_key.get_secret_value(),
-                base_url=str(self.settings.isbndb_base_url)
-                # Pass rate_limit_delay explicitly if needed, otherwise uses client default
-            )
-            clients["isbndb"] = isbndb_client
-            logger.info("ISBNDB client successfully initialized in Orchestrator.")
-        except ConfigurationError as e:
-            logger.error(f"Failed to initialize ISBNDB client: {e}")
-            # Decide if this is critical - maybe allow running without some clients?
-            # For now, let's assume ISBNDB is needed if requested.
-        except Exception as e:
-            logger.exception("Unexpected error initializing ISBNDB client.")
-
-        # --- Initialize other clients here (e.g., Hardcover) ---
-        # try:
-        #     hardcover_client = HardcoverClient(...)
-        #     clients["hardcover"] = hardcover_client
-        # except ConfigurationError as e:
-        #     logger.error(f"Failed to initialize Hardcover client: {e}")
-
-        return clients
-
-    def _get_fuzzy_scorer(self, scorer_name: str) -> callable:
-        """Gets the specified fuzzy matching function from rapidfuzz."""
-        try:
-            # Attempt to get the function from rapidfuzz.fuzz module
-            scorer_func = getattr(fuzz, scorer_name)
-            if not callable(scorer_func):
-                raise AttributeError # Not a function
-            logger.info(f"Using fuzzy scorer: rapidfuzz.fuzz.{scorer_name}")
-            return scorer_func
-        except AttributeError:
-            default_scorer = 'token_sort_ratio'
-            logger.warning(
-                f"Invalid fuzzy scorer '{scorer_name}' specified in settings. "
-                f"Falling back to default: '{default_scorer}'."
-            )
-            return getattr(fuzz, default_scorer) # Fallback to a reliable default
-        except Exception as e:
-             default_scorer = 'token_sort_ratio'
-             logger.exception(f"Unexpected error getting fuzzy scorer '{scorer_name}'. Falling back to default: '{default_scorer}'. Error: {e}")
-             return getattr(fuzz, default_scorer)
-
-
-    def enrich_books(
-        self,
-        input_df: pd.DataFrame,
-        providers: List[str] = ["isbndb"]
-    ) -> Optional[pd.DataFrame]:
-        """
-        Enriches book data from the input DataFrame using specified providers.
-
-        Args:
-            input_df: DataFrame containing book data with columns 'Title' and 'Author'.
-            providers: A list of provider names (e.g., ["isbndb"]) to use for enrichment.
-
-        Returns:
-            A DataFrame containing the enriched edition data for matched books,
-            or None if no enrichment could be performed.
-        """
-        if input_df.empty:
-            logger.warning("Input DataFrame is empty. No enrichment to perform.")
-            return None
-        if not all(col in input_df.columns for col in ['Title', 'Author']):
-            logger.error("Input DataFrame must contain 'Title' and 'Author' columns.")
-            raise ValueError("Input DataFrame missing required columns: 'Title', 'Author'")
-
-        all_enriched_data = []
-        valid_providers = [p for p in providers if p in self.clients]
-
-        if not valid_providers:
-            logger.error(f"No valid or initialized clients found for requested providers: {providers}. Cannot enrich.")
-            return None
-
-        logger.info(f"Starting book enrichment using providers: {valid_providers}")
-
-        for provider in valid_providers:
-            logger.info(f"--- Processing with provider: {provider} ---")
-            if provider == "isbndb":
-                try:
-                    provider_results = self._enrich_with_isbndb(input_df)
-                    if provider_results is not None and not provider_results.empty:
-                        all_enriched_data.append(provider_results)
-                    else:
-                        logger.warning(f"Provider '{provider}' yielded no enriched data.")
-                except Exception as e:
-                    logger.exception(f"Error during enrichment with provider '{provider}'. Skipping this provider.")
-            # Add elif blocks for other providers (e.g., hardcover)
-            # elif provider == "hardcover":
-            #     provider_results = self._enrich_with_hardcover(input_df)
-            #     ...
-            else:
-                logger.warning(f"Enrichment logic for provider '{provider}' is not implemented.")
-
-        if not all_enriched_data:
-            logger.warning("Enrichment process completed, but no data was collected from any provider.")
-            return None
-
-        # Combine results from different providers if necessary (simple concat for now)
-        # More sophisticated merging might be needed later if multiple providers return data for the same edition
-        final_df = pd.concat(all_enriched_data, ignore_index=True)
-        logger.success(f"Enrichment process completed. Collected {len(final_df)} edition records.")
-        return final_df
-
-
-    def _enrich_with_isbndb(self, input_df: pd.DataFrame) -> Optional[pd.DataFrame]:
-        """Handles the enrichment process specifically for the ISBNDB provider."""
-        isbndb_client: IsbnDbClient = self.clients.get("isbndb")
-        if not isbndb_client:
-            logger.error("ISBNDB client not available in Orchestrator.")
-            return None # Cannot proceed without the client
-
-        # Get ISBNDB specific field config
-        try:
-             # Navigate the config structure safely
-            provider_config = self.api_fields_config.get("books", {}).get("isbndb", {})
-            if not provider_config or "fields_to_extract" not in provider_config:
-                 raise KeyError("ISBNDB field configuration missing or incomplete.")
-            isbndb_field_map = provider_config["fields_to_extract"]
-            list_fields = provider_config.get("list_fields", [])
-            object_fields = provider_config.get("object_fields", [])
-        except KeyError as e:
-            logger.error(f"Missing configuration for ISBNDB: {e}")
-            raise ConfigurationError(f"ISBNDB configuration error: {e}")
-
-        all_matched_editions = []
-        total_rows = len(input_df)
-
-        for index, row in input_df.iterrows():
-            input_title = row.get('Title')
-            input_author = row.get('Author')
-            book_id = generate_book_id(input_title, input_author) # Use helper
-
-            logger.info(f"Processing row {index + 1}/{total_rows}: Book ID '{book_id}' (Title: '{input_title}', Author: '{input_author}')")
-
-            if not input_title or not input_author:
-                logger.warning(f"Skipping row {index + 1} due to missing Title or Author. Book ID: '{book_id}'")
-                continue
-
-            try:
-                # Pass relevant configs to the row processing method
-                matched_editions_for_row = self._process_book_row_isbndb(
-                    input_title=input_title,
-                    input_author=input_author,
-                    book_id=book_id,
-                    isbndb_client=isbndb_client,
-                    isbndb_field_map=isbndb_field_map,
-                    list_fields=list_fields,
-                    object_fields=object_fields
-                )
-                if matched_editions_for_row:
-                    all_matched_editions.extend(matched_editions_for_row)
-                    logger.info(f"Found {len(matched_editions_for_row)} matching edition(s) for Book ID '{book_id}'.")
-                else:
-                     logger.warning(f"No matching editions found for Book ID '{book_id}' based on criteria.")
-
-            except Exception as e:
-                # Catch unexpected errors during row processing, log, and continue
-                logger.exception(f"Unexpected error processing Book ID '{book_id}'. Skipping row.")
-                # Optionally add this error to a separate error log/report
-
-        if not all_matched_editions:
-            return None
-
-        return pd.DataFrame(all_matched_editions)
-
-
-    def _process_book_row_isbndb(
-        self,
-        input_title: str,
-        input_author: str,
-        book_id: str,
-        isbndb_client: IsbnDbClient,
-        isbndb_field_map: Dict[str, str],
-        list_fields: List[str],
-        object_fields: List[str]
-    ) -> List[Dict[str, Any]]:
-        """Searches ISBNDB for a single book, filters candidates, and extracts data."""
-        search_query = f"{input_title} {input_author}"
-        matched_editions = []
-        fetch_timestamp = pd.Timestamp.utcnow() # Use UTC timestamp
-
-        try:
-            logger.debug(f"Book ID '{book_id}': Searching ISBNDB with query '{search_query}', page size {self.settings.initial_search_page_size}")
-            search_results = isbndb_client.search_books(
-                query=search_query,
-                page=1,
-                page_size=self.settings.initial_search_page_size
-            )
-        except ProviderApiError as e:
-            logger.error(f"Book ID '{book_id}': API error during ISBNDB search: {e}")
-            return [] # Return empty list on API failure for this book
-        except ValueError as e:
-             logger.error(f"Book ID '{book_id}': Invalid parameters for ISBNDB search: {e}")
-             return []
-
-        candidate_books = search_results.get("books", [])
-        total_candidates = search_results.get("total", len(candidate_books))
-        logger.debug(f"Book ID '{book_id}': Received {len(candidate_books)} candidates (Total reported: {total_candidates}). Filtering based on matching type '{self.settings.matching_type}'.")
-
-        if not candidate_books:
-            return [] # No candidates found
-
-        # Normalize input once for efficiency
-        norm_input_title = normalize_string(input_title)
-        norm_input_author = normalize_string(input_author)
-        # Handle "Surname, Name" in input author for matching
-        if ',' in norm_input_author:
-             norm_input_author = norm_input_author.split(',')[0].strip()
-
-
-        for candidate in candidate_books:
-            candidate_title = candidate.get("title")
-            candidate_authors_list = candidate.get("authors", []) # Expecting a list
-
-            # --- Perform Matching ---
-            is_match, details = self._check_match(
-                norm_input_title=norm_input_title,
-                norm_input_author=norm_input_author,
-                candidate_title=candidate_title,
-                candidate_authors_list=candidate_authors_list
-            )
-
-            candidate_isbn13 = candidate.get("isbn13", "N/A")
-            logger.trace(f"Book ID '{book_id}', Candidate ISBN '{candidate_isbn13}': Title='{candidate_title}', Authors={candidate_authors_list}. Match Result: {is_match}. Details: {details}")
-
-            if is_match:
-                # --- Extract Data for Matched Edition ---
-                try:
-                    extracted_data = self._extract_edition_data(
-                        candidate_book_data=candidate,
-                        field_map=isbndb_field_map,
-                        list_fields=list_fields,
-                        object_fields=object_fields
-                    )
-                    # Add standard metadata
-                    extracted_data["Book_ID"] = book_id
-                    extracted_data["DataSource"] = IsbnDbClient.PROVIDER_NAME
-                    extracted_data["Fetched_Timestamp"] = fetch_timestamp
-                    # Add match details if needed for analysis
-                    extracted_data["Match_Details"] = details
-
-                    matched_editions.append(extracted_data)
-                except Exception as e:
-                    logger.exception(f"Book ID '{book_id}', Candidate ISBN '{candidate_isbn13}': Error extracting data for matched edition.")
-
-        return matched_editions
-
-    def _check_match(
-        self,
-        norm_input_title: str,
-        norm_input_author: str,
-        candidate_title: Optional[str],
-        candidate_authors_list: Optional[List[str]]
-    ) -> tuple[bool, Dict[str, Any]]:
-        """
-        Checks if a candidate book matches the input criteria based on settings.
-
-        Args:
-            norm_input_title: Normalized title from the input source.
-            norm_input_author: Normalized primary author from the input source (surname preferred).
-            candidate_title: Title from the API candidate.
-            candidate_authors_list: List of authors from the API candidate.
-
-        Returns:
-            A tuple: (bool indicating match, dict containing match details/scores).
-        """
-        details = {"match_type": self.settings.matching_type}
-        if not candidate_title or not candidate_authors_list:
-            details["reason"] = "Missing candidate title or authors"
-            return False, details
-
-        norm_candidate_title = normalize_string(candidate_title)
-        norm_candidate_authors = [normalize_string(a) for a in candidate_authors_list if a]
-
-        if not norm_candidate_title or not norm_candidate_authors:
-             details["reason"] = "Normalized candidate title or authors are empty"
-             return False, details
-
-        # --- Exact Matching ---
-        if self.settings.matching_type == 'exact':
-            title_match = norm_input_title == norm_candidate_title
-            # Check if the normalized input author exists exactly in the normalized candidate list
-            # Also handle surname check if input was "Surname, ..."
-            author_match = any(norm_input_author == norm_cand_auth for norm_cand_auth in norm_candidate_authors) or \
-                           any(norm_input_author in norm_cand_auth.split() for norm_cand_auth in norm_candidate_authors) # Simple check if surname is in candidate name parts
-
-
-            details["title_match_exact"] = title_match
-            details["author_match_exact"] = author_match
-            return title_match and author_match, details
-
-        # --- Fuzzy Matching ---
-        elif self.settings.matching_type == 'fuzzy':
-            # Title Score
-            title_score = self.fuzzy_scorer_func(norm_input_title, norm_candidate_title)
-            details["title_score"] = round(title_score)
-
-            # Author Score - Find best match within the list
-            best_author_score = 0
-            if norm_candidate_authors:
-                # Use process.extractOne for efficiency if scorer supports it,
-                # otherwise loop manually
-                try:
-                    # extractOne returns (best_match, score, index)
-                    best_match_info = process.extractOne(
-                        norm_input_author,
-                        norm_candidate_authors,
-                        scorer=self.fuzzy_scorer_func,
-                        score_cutoff=0 # Get score even if below threshold initially
-                    )
-                    if best_match_info:
-                        best_author_score = best_match_info[1]
-                        details["best_candidate_author"] = best_match_info[0]
-                except Exception as e:
-                     # Fallback to manual loop if extractOne fails or scorer is incompatible
-                     logger.trace(f"extractOne failed for author matching (scorer: {self.fuzzy_scorer_func.__name__}), using loop. Error: {e}")
-                     best_author_score = max(self.fuzzy_scorer_func(norm_input_author, norm_cand_auth)
-                                             for norm_cand_auth in norm_candidate_authors)
-
-
-            details["author_score"] = round(best_author_score)
-
-            # Check against thresholds
-            title_match = title_score >= self.settings.fuzzy_title_threshold
-            author_match = best_author_score >= self.settings.fuzzy_author_threshold
-            details["thresholds"] = f"T:{self.settings.fuzzy_title_threshold}/A:{self.settings.fuzzy_author_threshold}"
-
-            return title_match and author_match, details
-
-        else:
-            # Should not happen if settings validation works, but handle defensively
-            logger.error(f"Unknown matching_type: {self.settings.matching_type}")
-            details["reason"] = "Unknown matching type"
-            return False, details
-
-    def _extract_edition_data(
-        self,
-        candidate_book_data: Dict[str, Any],
-        field_map: Dict[str, str],
-        list_fields: List[str],
-        object_fields: List[str]
-    ) -> Dict[str, Any]:
-        """Extracts and formats data for a single matched edition."""
-        extracted_data = {}
-        for output_name, provider_field in field_map.items():
-            raw_value = candidate_book_data.get(provider_field)
-
-            # Handle special case for ISBN10 (might be in 'isbn' field)
-            if output_name == "ISBN10" and raw_value is None:
-                 raw_value = candidate_book_data.get("isbn")
-
-            processed_value = None
-            if raw_value is not None:
-                if output_name in list_fields or output_name in object_fields:
-                    try:
-                        # Store lists/dicts as JSON strings
-                        processed_value = json.dumps(raw_value)
-                    except TypeError as e:
-                        logger.warning(f"Could not JSON serialize field '{provider_field}' (value: {raw_value}): {e}")
-                        processed_value = str(raw_value) # Fallback to string representation
-                else:
-                    # Ensure basic types are strings or numbers, handle potential issues
-                    if isinstance(raw_value, (str, int, float, bool)):
-                         processed_value = raw_value
-                    else:
-                         # Fallback for unexpected types
-                         processed_value = str(raw_value)
-            # else: keep processed_value as None if raw_value is None
-
-            extracted_data[output_name] = processed_value
-
-        return extracted_data
\ No newline at end of file
+# phantom_enrichment/core/orchestrator.py
+
+import asyncio
+import time
+import numpy as np
+import pandas as pd
+from collections import defaultdict
+from typing import Dict, Any, List, Optional, Tuple
+from loguru import logger
+from rapidfuzz import fuzz, process
+import importlib # Used to dynamically get scorer function
+
+# Project specific imports
+from phantom_enrichment.config.settings import Settings
+from phantom_enrichment.core.output_sink import OutputSink
+from phantom_enrichment.datasources.journal import EnrichmentJournal
+from phantom_enrichment.datasources.output_writers import OutputWriter
+from phantom_enrichment.enrichment.edition_merger import EditionMerger
+from phantom_enrichment.enrichment.providers.base import BaseProviderClient
+from phantom_enrichment.enrichment.providers.isbndb_client import IsbnDbClient
+from phantom_enrichment.enrichment.providers.openlibrary_client import OpenLibraryClient
+from phantom_enrichment.enrichment.response_cache import ResponseCache
+from phantom_enrichment.models.run_summary import EnrichmentRunSummary
+from phantom_enrichment.utils.helpers import to_isbn13
+from phantom_enrichment.utils.metrics import EnrichmentMetrics
+from phantom_enrichment.utils.normalization import normalize_string, normalize_series, book_id_series, normalization_cache_info
+from phantom_enrichment.utils.exceptions import EnrichmentError, ProviderApiError, ConfigurationError
+
+class Orchestrator:
+    """
+    Coordinates the media enrichment process.
+
+    Reads input data, interacts with configured API providers via clients,
+    applies matching logic, extracts relevant fields based on configuration,
+    and returns the enriched data.
+    """
+
+    # Input columns checked (in order) for an ISBN that allows a direct bulk lookup
+    ISBN_INPUT_COLUMNS = ("ISBN", "ISBN13", "ISBN10", "ISBN_13", "ISBN_10")
+
+    def __init__(
+        self,
+        settings: Settings,
+        api_fields_config: Dict[str, Any],
+        refresh_cache: bool = False,
+        clients: Optional[Dict[str, BaseProviderClient]] = None
+    ):
+        """
+        Initializes the Orchestrator.
+
+        Args:
+            settings: The application settings object.
+            api_fields_config: The loaded configuration mapping output fields
+                               to provider-specific fields.
+            refresh_cache: If True, ignore cached provider responses (fresh ones are still stored).
+            clients: Optional provider clients keyed by provider name (e.g. local mock
+                     providers for testing). Defaults to the clients built from settings.
+        """
+        self.settings = settings
+        self.api_fields_config = api_fields_config
+        self.response_cache = self._initialize_cache(refresh_cache)
+        self.clients = clients if clients is not None else self._initialize_clients()
+        self.edition_merger = EditionMerger.from_config(api_fields_config)
+        self.run_summary = EnrichmentRunSummary(requests_per_second=settings.isbndb_requests_per_second)
+        self.journal: Optional[EnrichmentJournal] = None
+        self.output_sink: Optional[OutputSink] = None
+        # Request timings, row progress and stage timings, shared with every client
+        self.metrics = EnrichmentMetrics()
+        for client in self.clients.values():
+            client.metrics = self.metrics
+
+        # Validate fuzzy scorer name from settings
+        self.fuzzy_scorer_func = self._get_fuzzy_scorer(settings.fuzzy_scorer)
+
+        logger.info("Orchestrator initialized.")
+
+    def _initialize_clients(self) -> Dict[str, BaseProviderClient]:
+        """Initializes API client instances based on settings."""
+        clients = {}
+        # --- Initialize ISBNDB Client ---
+        try:
+            isbndb_client = IsbnDbClient(
+                api_key=self.settings.isbndb_api_key.get_secret_value(),
+                base_url=str(self.settings.isbndb_base_url),
+                requests_per_second=self.settings.isbndb_requests_per_second,
+                burst=self.settings.isbndb_burst,
+                max_concurrency=self.settings.max_concurrent_requests,
+                max_retries=self.settings.max_request_retries,
+                timeout=self.settings.request_timeout,
+                bulk_batch_size=self.settings.isbndb_bulk_batch_size,
+                cache=self.response_cache
+            )
+            clients["isbndb"] = isbndb_client
+            logger.info("ISBNDB client successfully initialized in Orchestrator.")
+        except ConfigurationError as e:
+            logger.error(f"Failed to initialize ISBNDB client: {e}")
+            # Decide if this is critical - maybe allow running without some clients?
+            # For now, let's assume ISBNDB is needed if requested.
+        except Exception as e:
+            logger.exception("Unexpected error initializing ISBNDB client.")
+
+        # --- Initialize Open Library Client (no API key required) ---
+        try:
+            clients["openlibrary"] = OpenLibraryClient(
+                base_url=str(self.settings.openlibrary_base_url),
+                requests_per_second=self.settings.openlibrary_requests_per_second,
+                burst=self.settings.openlibrary_burst,
+                max_concurrency=self.settings.max_concurrent_requests,
+                max_retries=self.settings.max_request_retries,
+                timeout=self.settings.request_timeout,
+                cache=self.response_cache
+            )
+            logger.info("Open Library client successfully initialized in Orchestrator.")
+        except ConfigurationError as e:
+            logger.error(f"Failed to initialize Open Library client: {e}")
+
+        # --- Initialize other clients here (e.g., Hardcover) ---
+        # try:
+        #     hardcover_client = HardcoverClient(...)
+        #     clients["hardcover"] = hardcover_client
+        # except ConfigurationError as e:
+        #     logger.error(f"Failed to initialize Hardcover client: {e}")
+
+        return clients
+
+    def _initialize_cache(self, refresh: bool) -> Optional[ResponseCache]:
+        """Creates the persistent provider response cache, if enabled in settings."""
+        if not self.settings.response_cache_enabled:
+            logger.info("Response cache disabled by settings.")
+            return None
+        return ResponseCache(
+            db_path=self.settings.response_cache_path,
+            ttls={
+                IsbnDbClient.PROVIDER_NAME: self.settings.isbndb_cache_ttl_hours * 3600,
+                OpenLibraryClient.PROVIDER_NAME: self.settings.openlibrary_cache_ttl_hours * 3600,
+            },
+            negative_ttls={
+                IsbnDbClient.PROVIDER_NAME: self.settings.isbndb_cache_negative_ttl_hours * 3600,
+                OpenLibraryClient.PROVIDER_NAME: self.settings.openlibrary_cache_negative_ttl_hours * 3600,
+            },
+            refresh=refresh
+        )
+
+    def _get_fuzzy_scorer(self, scorer_name: str) -> callable:
+        """Gets the specified fuzzy matching function from rapidfuzz."""
+        try:
+            # Attempt to get the function from rapidfuzz.fuzz module
+            scorer_func = getattr(fuzz, scorer_name)
+            if not callable(scorer_func):
+                raise AttributeError # Not a function
+            logger.info(f"Using fuzzy scorer: rapidfuzz.fuzz.{scorer_name}")
+            return scorer_func
+        except AttributeError:
+            default_scorer = 'token_sort_ratio'
+            logger.warning(
+                f"Invalid fuzzy scorer '{scorer_name}' specified in settings. "
+                f"Falling back to default: '{default_scorer}'."
+            )
+            return getattr(fuzz, default_scorer) # Fallback to a reliable default
+        except Exception as e:
+             default_scorer = 'token_sort_ratio'
+             logger.exception(f"Unexpected error getting fuzzy scorer '{scorer_name}'. Falling back to default: '{default_scorer}'. Error: {e}")
+             return getattr(fuzz, default_scorer)
+
+
+    def enrich_books(
+        self,
+        input_df: pd.DataFrame,
+        providers: List[str] = ["isbndb"],
+        journal: Optional[EnrichmentJournal] = None,
+        writer: Optional[OutputWriter] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        Enriches book data from the input DataFrame using specified providers.
+
+        Args:
+            input_df: DataFrame containing book data with columns 'Title' and 'Author'.
+            providers: A list of provider names (e.g., ["isbndb", "openlibrary"]) to use for enrichment.
+                       Providers are queried concurrently and their editions merged by ISBN-13.
+            journal: Optional checkpoint journal. Rows it already holds are skipped,
+                     new rows are appended to it as they finish, and the returned
+                     DataFrame is assembled from it.
+            writer: Optional output writer. Rows are merged and appended to it in
+                    input order, in chunks, as soon as every provider has finished them.
+
+        Returns:
+            A DataFrame containing the enriched edition data for matched books,
+            or None if no enrichment could be performed.
+        """
+        if input_df.empty:
+            logger.warning("Input DataFrame is empty. No enrichment to perform.")
+            return None
+        if not all(col in input_df.columns for col in ['Title', 'Author']):
+            logger.error("Input DataFrame must contain 'Title' and 'Author' columns.")
+            raise ValueError("Input DataFrame missing required columns: 'Title', 'Author'")
+
+        valid_providers = [p for p in providers if p in self.clients]
+
+        if not valid_providers:
+            logger.error(f"No valid or initialized clients found for requested providers: {providers}. Cannot enrich.")
+            return None
+
+        logger.info(f"Starting book enrichment using providers: {valid_providers}")
+        self.run_summary = EnrichmentRunSummary(
+            requests_per_second=self.settings.isbndb_requests_per_second,
+            rows_total=len(input_df)
+        )
+        if self.response_cache is not None:
+            self.response_cache.stats.clear()
+            self.response_cache.purge_expired()
+        self.journal = journal
+        self.metrics.reset(
+            total_rows=len(input_df),
+            providers=[self.clients[provider].PROVIDER_NAME for provider in valid_providers]
+        )
+
+        # Title/Author are normalized and Book_IDs built once for the whole sheet
+        row_keys = self._prepare_row_keys(input_df)
+        if journal is not None:
+            # The journal holds (provider, Book_ID) pairs; a row is resumed once every provider completed it
+            provider_names = [self.clients[provider].PROVIDER_NAME for provider in valid_providers]
+            self.run_summary.rows_resumed = sum(
+                all(journal.is_processed(name, book_id) for name in provider_names)
+                for book_id in row_keys['Book_ID']
+            )
+
+        # All providers share one event loop, each paced by its own limiter,
+        # so every row is looked up at all providers concurrently.
+        self.output_sink = None
+        if writer is not None:
+            self.output_sink = OutputSink(
+                writer=writer,
+                merger=self.edition_merger,
+                total_rows=len(input_df),
+                providers=[self.clients[provider].PROVIDER_NAME for provider in valid_providers],
+                chunk_size=self.settings.output_chunk_size
+            )
+        try:
+            provider_results = asyncio.run(self._enrich_with_providers(input_df, row_keys, valid_providers))
+        finally:
+            if self.output_sink is not None:
+                with self.metrics.stage("output"):
+                    self.output_sink.close()
+            self.metrics.finish()
+        all_enriched_data = [results for results in provider_results if results is not None and not results.empty]
+
+        if self.response_cache is not None:
+            cache_totals = self.response_cache.totals()
+            self.run_summary.cache_hits = cache_totals.get("hits", 0)
+            self.run_summary.cache_negative_hits = cache_totals.get("negative_hits", 0)
+            self.run_summary.cache_misses = cache_totals.get("misses", 0)
+            self.response_cache.close()
+        logger.debug(f"Normalization cache: {normalization_cache_info()}")
+
+        if journal is not None:
+            # The journal holds this run's rows plus any completed by earlier, interrupted runs
+            journal_df = journal.to_dataframe(book_id_order=row_keys['Book_ID'].tolist())
+            all_enriched_data = [journal_df] if not journal_df.empty else []
+
+        if not all_enriched_data:
+            self.run_summary.log_summary()
+            logger.warning("Enrichment process completed, but no data was collected from any provider.")
+            return None
+
+        combined_df = pd.concat(all_enriched_data, ignore_index=True)
+        if len(all_enriched_data) > 1:
+            # Regroup the per-provider frames by input row (stable, so provider order is kept)
+            position = {book_id: i for i, book_id in reversed(list(enumerate(row_keys['Book_ID'])))}
+            combined_df = combined_df.iloc[combined_df['Book_ID'].map(position).argsort(kind="stable")].reset_index(drop=True)
+        # The same edition found by several providers becomes one row (merged by ISBN-13)
+        with self.metrics.stage("merge"):
+            final_df = self.edition_merger.merge(combined_df)
+        self.run_summary.editions_merged = len(combined_df) - len(final_df)
+        self.run_summary.log_summary()
+        logger.success(f"Enrichment process completed. Collected {len(final_df)} edition records.")
+        return final_df
+
+
+    def _prepare_row_keys(self, input_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Normalizes the Title and Author columns and generates every Book_ID in one vectorized pass.
+
+        Args:
+            input_df: DataFrame containing 'Title' and 'Author' columns.
+
+        Returns:
+            DataFrame aligned with `input_df` with columns 'Norm_Title', 'Norm_Author' and 'Book_ID'.
+        """
+        norm_titles = normalize_series(input_df['Title'])
+        norm_authors = normalize_series(input_df['Author'])
+        return pd.DataFrame({
+            'Norm_Title': norm_titles,
+            'Norm_Author': norm_authors,
+            'Book_ID': book_id_series(norm_titles, norm_authors)
+        }, index=input_df.index)
+
+    async def _enrich_with_providers(
+        self,
+        input_df: pd.DataFrame,
+        row_keys: pd.DataFrame,
+        providers: List[str]
+    ) -> List[Optional[pd.DataFrame]]:
+        """Runs every provider concurrently. A failing provider is logged and skipped."""
+        async def run_provider(provider: str) -> Optional[pd.DataFrame]:
+            logger.info(f"--- Processing with provider: {provider} ---")
+            try:
+                provider_results = await self._enrich_with_provider(provider, input_df, row_keys)
+            except Exception:
+                logger.exception(f"Error during enrichment with provider '{provider}'. Skipping this provider.")
+                if self.output_sink is not None:
+                    self.output_sink.abandon(self.clients[provider].PROVIDER_NAME)
+                return None
+            if provider_results is None or provider_results.empty:
+                logger.warning(f"Provider '{provider}' yielded no enriched data.")
+            return provider_results
+
+        return await asyncio.gather(*(run_provider(provider) for provider in providers))
+
+    def _get_provider_field_config(self, provider: str) -> Tuple[Dict[str, str], List[str], List[str]]:
+        """Returns (field_map, list_fields, object_fields) for a provider from api_fields_config."""
+        try:
+             # Navigate the config structure safely
+            provider_config = self.api_fields_config.get("books", {}).get(provider, {})
+            if not provider_config or "fields_to_extract" not in provider_config:
+                 raise KeyError(f"{provider} field configuration missing or incomplete.")
+            field_map = provider_config["fields_to_extract"]
+            list_fields = provider_config.get("list_fields", [])
+            object_fields = provider_config.get("object_fields", [])
+        except KeyError as e:
+            logger.error(f"Missing configuration for {provider}: {e}")
+            raise ConfigurationError(f"{provider} configuration error: {e}")
+        return field_map, list_fields, object_fields
+
+    async def _enrich_with_provider(
+        self,
+        provider: str,
+        input_df: pd.DataFrame,
+        row_keys: pd.DataFrame
+    ) -> Optional[pd.DataFrame]:
+        """Handles the enrichment process for a single provider."""
+        client = self.clients.get(provider)
+        if not client:
+            logger.error(f"{provider} client not available in Orchestrator.")
+            return None # Cannot proceed without the client
+
+        field_map, list_fields, object_fields = self._get_provider_field_config(provider)
+
+        # Rows are fanned out concurrently; the client's own limiter paces the requests.
+        start_time = time.monotonic()
+        row_results = await self._enrich_rows(
+            input_df=input_df,
+            row_keys=row_keys,
+            client=client,
+            field_map=field_map,
+            list_fields=list_fields,
+            object_fields=object_fields
+        )
+        elapsed = time.monotonic() - start_time
+        logger.info(f"{client.PROVIDER_NAME} enrichment of {len(input_df)} rows took {elapsed:.1f}s.")
+
+        # gather() returns results in input order, so editions stay grouped by input row
+        all_matched_editions = [edition for row_editions in row_results for edition in row_editions]
+
+        if not all_matched_editions:
+            return None
+
+        return pd.DataFrame(all_matched_editions)
+
+    async def _enrich_rows(
+        self,
+        input_df: pd.DataFrame,
+        row_keys: pd.DataFrame,
+        client: BaseProviderClient,
+        field_map: Dict[str, str],
+        list_fields: List[str],
+        object_fields: List[str]
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Processes every input row concurrently and returns the matched editions per row, in input order.
+
+        Rows carrying an ISBN are resolved first through the provider's bulk ISBN
+        lookup; only the remaining rows go through free-text search.
+        """
+        provider = client.PROVIDER_NAME
+        total_rows = len(input_df)
+        rows = list(input_df.iterrows())
+        book_ids = row_keys['Book_ID'].tolist()
+        norm_titles = row_keys['Norm_Title'].tolist()
+        norm_authors = row_keys['Norm_Author'].tolist()
+
+        # Rows completed by an earlier run are already in the journal
+        pending_positions = [
+            position for position in range(total_rows)
+            if self.journal is None or not self.journal.is_processed(provider, book_ids[position])
+        ]
+        if len(pending_positions) < total_rows:
+            logger.info(f"Skipping {total_rows - len(pending_positions)} row(s) already recorded in the journal.")
+            pending = set(pending_positions)
+            for position in range(total_rows):
+                if position not in pending:
+                    recorded_editions = self.journal.recorded_editions(provider, book_ids[position])
+                    self.metrics.record_row(provider, matched=bool(recorded_editions), resumed=True)
+                    if self.output_sink is not None:
+                        self.output_sink.complete(provider, position, recorded_editions)
+        row_results: Dict[int, List[Dict[str, Any]]] = {position: [] for position in range(total_rows)}
+
+        async def search_and_record(position: int) -> Optional[List[Dict[str, Any]]]:
+            index, row = rows[position]
+            editions = await self._enrich_row(
+                index=index,
+                row=row,
+                norm_title=norm_titles[position],
+                norm_author=norm_authors[position],
+                book_id=book_ids[position],
+                total_rows=total_rows,
+                client=client,
+                field_map=field_map,
+                list_fields=list_fields,
+                object_fields=object_fields
+            )
+            # Failed rows (None) are not journaled, so a resumed run retries them
+            if editions is not None and self.journal is not None:
+                self.journal.record(provider, book_ids[position], editions)
+            self.metrics.record_row(provider, matched=bool(editions), failed=editions is None)
+            if self.output_sink is not None:
+                self.output_sink.complete(provider, position, editions or [])
+            return editions
+
+        try:
+            async with client:
+                with self.metrics.stage(f"{provider}.bulk_lookup"):
+                    bulk_results = await self._bulk_lookup(
+                        rows=rows,
+                        book_ids=book_ids,
+                        positions=pending_positions,
+                        client=client,
+                        field_map=field_map,
+                        list_fields=list_fields,
+                        object_fields=object_fields
+                    )
+                for position, editions in bulk_results.items():
+                    if self.journal is not None:
+                        self.journal.record(provider, book_ids[position], editions)
+                    self.metrics.record_row(provider, matched=True)
+                    if self.output_sink is not None:
+                        self.output_sink.complete(provider, position, editions)
+                row_results.update(bulk_results)
+
+                search_positions = [position for position in pending_positions if position not in bulk_results]
+                with self.metrics.stage(f"{provider}.search"):
+                    search_results = await asyncio.gather(*(search_and_record(position) for position in search_positions))
+                row_results.update((position, editions or []) for position, editions in zip(search_positions, search_results))
+        finally:
+            # Persist whatever finished, even when interrupted
+            if self.journal is not None:
+                self.journal.flush()
+
+        return [row_results[position] for position in range(total_rows)]
+
+    def _get_row_isbn13(self, row: pd.Series) -> Optional[str]:
+        """Returns the ISBN-13 from the first populated ISBN input column, if any."""
+        for column in self.ISBN_INPUT_COLUMNS:
+            isbn13 = to_isbn13(row.get(column))
+            if isbn13:
+                return isbn13
+        return None
+
+    async def _bulk_lookup(
+        self,
+        rows: List[Tuple[Any, pd.Series]],
+        book_ids: List[str],
+        positions: List[int],
+        client: BaseProviderClient,
+        field_map: Dict[str, str],
+        list_fields: List[str],
+        object_fields: List[str]
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Resolves rows that carry an ISBN through batched bulk lookups (e.g. ISBNDB POST /books).
+
+        Args:
+            rows: All input rows as (index, row) pairs.
+            book_ids: Precomputed Book_IDs, aligned with `rows`.
+            positions: Positions (into `rows`) of the rows still to be processed.
+
+        Returns:
+            Matched editions keyed by row position. Rows whose ISBN was not found
+            (or whose batch failed) are absent, so they fall back to text search.
+        """
+        positions_by_isbn13: Dict[str, List[int]] = defaultdict(list)
+        for position in positions:
+            isbn13 = self._get_row_isbn13(rows[position][1])
+            if isbn13:
+                positions_by_isbn13[isbn13].append(position)
+
+        rows_with_isbn = sum(len(positions) for positions in positions_by_isbn13.values())
+        self.run_summary.rows_with_isbn += rows_with_isbn
+        if not positions_by_isbn13:
+            return {}
+
+        isbns = list(positions_by_isbn13)
+        batch_size = client.bulk_batch_size
+        batches = [isbns[i:i + batch_size] for i in range(0, len(isbns), batch_size)]
+        logger.info(f"Looking up {len(isbns)} distinct ISBNs from {rows_with_isbn} rows in {len(batches)} {client.PROVIDER_NAME} bulk request(s).")
+
+        responses = await asyncio.gather(*(self._fetch_bulk_batch(client, batch) for batch in batches))
+
+        fetch_timestamp = pd.Timestamp.utcnow()
+        resolved: Dict[int, List[Dict[str, Any]]] = {}
+        for response in responses:
+            for book in response.get("data", response.get("books", [])):
+                book_isbn13 = to_isbn13(book.get("isbn13")) or to_isbn13(book.get("isbn10") or book.get("isbn"))
+                for position in positions_by_isbn13.get(book_isbn13, []):
+                    if position in resolved:
+                        continue # Same ISBN returned twice; keep the first
+                    book_id = book_ids[position]
+                    try:
+                        extracted_data = self._extract_edition_data(
+                            candidate_book_data=book,
+                            field_map=field_map,
+                            list_fields=list_fields,
+                            object_fields=object_fields
+                        )
+                    except Exception:
+                        logger.exception(f"Book ID '{book_id}', ISBN '{book_isbn13}': Error extracting data from bulk lookup.")
+                        continue
+                    extracted_data["Book_ID"] = book_id
+                    extracted_data["DataSource"] = client.PROVIDER_NAME
+                    extracted_data["Fetched_Timestamp"] = fetch_timestamp
+                    extracted_data["Match_Details"] = {"match_type": "isbn", "isbn13": book_isbn13}
+                    resolved[position] = [extracted_data]
+
+        self.run_summary.rows_resolved_by_isbn += len(resolved)
+        unresolved = rows_with_isbn - len(resolved)
+        logger.info(f"{client.PROVIDER_NAME} bulk ISBN lookup resolved {len(resolved)} row(s); {unresolved} will fall back to text search.")
+        return resolved
+
+    async def _fetch_bulk_batch(self, client: BaseProviderClient, isbns: List[str]) -> Dict[str, Any]:
+        """Fetches one bulk batch, returning an empty result on API failure so its rows fall back to search."""
+        self.run_summary.bulk_requests += 1
+        try:
+            return await client.get_books_by_isbns_bulk(isbns)
+        except ProviderApiError as e:
+            logger.error(f"Bulk ISBN lookup failed for a batch of {len(isbns)} ISBNs: {e}")
+            return {}
+
+    async def _enrich_row(
+        self,
+        index: Any,
+        row: pd.Series,
+        norm_title: str,
+        norm_author: str,
+        book_id: str,
+        total_rows: int,
+        client: BaseProviderClient,
+        field_map: Dict[str, str],
+        list_fields: List[str],
+        object_fields: List[str]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Enriches a single input row, logging and swallowing unexpected errors.
+
+        Args:
+            norm_title: Normalized input title (precomputed for the whole sheet).
+            norm_author: Normalized input author (precomputed for the whole sheet).
+            book_id: Book_ID of the row (precomputed for the whole sheet).
+
+        Returns:
+            The matched editions (possibly empty), or None if the row could not be
+            processed (e.g. an API error) and should be retried on a later run.
+        """
+        input_title = row.get('Title')
+        input_author = row.get('Author')
+
+        logger.info(f"Processing row {index + 1}/{total_rows}: Book ID '{book_id}' (Title: '{input_title}', Author: '{input_author}')")
+
+        if not norm_title or not norm_author:
+            logger.warning(f"Skipping row {index + 1} due to missing Title or Author. Book ID: '{book_id}'")
+            return []
+
+        try:
+            # Pass relevant configs to the row processing method
+            matched_editions_for_row = await self._process_book_row(
+                input_title=input_title,
+                input_author=input_author,
+                norm_input_title=norm_title,
+                norm_input_author=norm_author,
+                book_id=book_id,
+                client=client,
+                field_map=field_map,
+                list_fields=list_fields,
+                object_fields=object_fields
+            )
+            if matched_editions_for_row is None:
+                logger.warning(f"Book ID '{book_id}' could not be processed; it will be retried on the next run.")
+            elif matched_editions_for_row:
+                logger.info(f"Found {len(matched_editions_for_row)} matching edition(s) for Book ID '{book_id}'.")
+            else:
+                 logger.warning(f"No matching editions found for Book ID '{book_id}' based on criteria.")
+            return matched_editions_for_row
+
+        except Exception as e:
+            # Catch unexpected errors during row processing, log, and continue
+            logger.exception(f"Unexpected error processing Book ID '{book_id}'. Skipping row.")
+            # Optionally add this error to a separate error log/report
+            return None
+
+
+    async def _process_book_row(
+        self,
+        input_title: str,
+        input_author: str,
+        norm_input_title: str,
+        norm_input_author: str,
+        book_id: str,
+        client: BaseProviderClient,
+        field_map: Dict[str, str],
+        list_fields: List[str],
+        object_fields: List[str]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Searches the provider for a single book, filters candidates, and extracts data. Returns None on API failure (a 404 search counts as no results).
+
+        With adaptive paging (the default) the search starts with a small page and
+        further pages are fetched only while they look promising (see
+        _should_fetch_next_page), up to MAX_SEARCH_PAGES. Otherwise a single page of
+        INITIAL_SEARCH_PAGE_SIZE candidates is searched.
+        """
+        search_query = f"{input_title} {input_author}"
+        matched_editions = []
+        fetch_timestamp = pd.Timestamp.utcnow() # Use UTC timestamp
+        adaptive = self.settings.adaptive_search_paging
+        page_size = self.settings.adaptive_search_page_size if adaptive else self.settings.initial_search_page_size
+        max_pages = self.settings.max_search_pages if adaptive else 1
+
+        self.run_summary.rows_text_searched += 1
+        best_margin = float("-inf")
+        page = 1
+        while True:
+            try:
+                logger.debug(f"Book ID '{book_id}': Searching {client.PROVIDER_NAME} with query '{search_query}', page {page}, page size {page_size}")
+                self.run_summary.search_requests += 1
+                if page > 1:
+                    self.run_summary.search_pages_beyond_first += 1
+                search_results = await client.search_books(
+                    query=search_query,
+                    page=page,
+                    page_size=page_size
+                )
+            except ProviderApiError as e:
+                if e.status_code != 404:
+                    logger.error(f"Book ID '{book_id}': API error during {client.PROVIDER_NAME} search (page {page}): {e}")
+                    return None # Signal failure (not "no match") so the row can be retried
+                # A search without results is answered with 404: an empty page, not a failure
+                logger.debug(f"Book ID '{book_id}': {client.PROVIDER_NAME} search returned 404 on page {page}; treating it as no results.")
+                search_results = {"total": 0, "books": []}
+            except ValueError as e:
+                 logger.error(f"Book ID '{book_id}': Invalid parameters for {client.PROVIDER_NAME} search: {e}")
+                 return matched_editions
+
+            candidate_books = search_results.get("books", [])
+            total_candidates = search_results.get("total", len(candidate_books))
+            self.metrics.record_candidates(client.PROVIDER_NAME, len(candidate_books))
+            logger.debug(f"Book ID '{book_id}': Received {len(candidate_books)} candidates on page {page} (Total reported: {total_candidates}). Filtering based on matching type '{self.settings.matching_type}'.")
+
+            if not candidate_books:
+                break # No (more) candidates found
+
+            # --- Perform Matching (whole page scored at once) ---
+            with self.metrics.stage("matching"):
+                match_results = self._check_matches(
+                    norm_input_title=norm_input_title,
+                    norm_input_author=norm_input_author,
+                    candidate_titles=[candidate.get("title") for candidate in candidate_books],
+                    candidate_authors_lists=[candidate.get("authors", []) for candidate in candidate_books] # Expecting lists
+                )
+
+            for candidate, (is_match, details) in zip(candidate_books, match_results):
+                candidate_title = candidate.get("title")
+                candidate_authors_list = candidate.get("authors", [])
+
+                candidate_isbn13 = candidate.get("isbn13", "N/A")
+                logger.trace(f"Book ID '{book_id}', Candidate ISBN '{candidate_isbn13}': Title='{candidate_title}', Authors={candidate_authors_list}. Match Result: {is_match}. Details: {details}")
+
+                if is_match:
+                    # --- Extract Data for Matched Edition ---
+                    try:
+                        extracted_data = self._extract_edition_data(
+                            candidate_book_data=candidate,
+                            field_map=field_map,
+                            list_fields=list_fields,
+                            object_fields=object_fields
+                        )
+                        # Add standard metadata
+                        extracted_data["Book_ID"] = book_id
+                        extracted_data["DataSource"] = client.PROVIDER_NAME
+                        extracted_data["Fetched_Timestamp"] = fetch_timestamp
+                        # Add match details if needed for analysis
+                        extracted_data["Match_Details"] = {**details, "search_page": page}
+
+                        matched_editions.append(extracted_data)
+                    except Exception as e:
+                        logger.exception(f"Book ID '{book_id}', Candidate ISBN '{candidate_isbn13}': Error extracting data for matched edition.")
+
+            has_more = page * page_size < total_candidates and len(candidate_books) >= page_size
+            if page >= max_pages or not has_more:
+                break
+            fetch_next, best_margin, reason = self._should_fetch_next_page(match_results, best_margin)
+            logger.debug(f"Book ID '{book_id}': {'Fetching' if fetch_next else 'Not fetching'} page {page + 1} ({reason}).")
+            if not fetch_next:
+                break
+            page += 1
+
+        return matched_editions
+
+    def _page_scores(self, match_results: List[tuple[bool, Dict[str, Any]]]) -> Tuple[float, bool, bool]:
+        """
+        Summarizes how close the candidates of a page came to matching.
+
+        The margin of a fuzzy candidate is its smallest distance to the thresholds
+        (min of title score - title threshold and author score - author threshold),
+        so it is >= 0 exactly for matches. A candidate is a near miss when its title
+        or its author is within NEAR_MISS_MARGIN of its threshold (the search is
+        finding the title, or the author's books). Exact and case-insensitive
+        matching have no scores: matches get a margin of 0 and count as strong.
+
+        Returns:
+            (best margin on the page, any strong match, any near miss)
+        """
+        best_margin = float("-inf")
+        strong_match = False
+        near_miss = False
+        for is_match, details in match_results:
+            if "title_score" in details and "author_score" in details:
+                title_margin = details["title_score"] - self.settings.fuzzy_title_threshold
+                author_margin = details["author_score"] - self.settings.fuzzy_author_threshold
+                best_margin = max(best_margin, min(title_margin, author_margin))
+                near_miss = near_miss or title_margin >= -self.settings.near_miss_margin
+                if is_match and min(details["title_score"], details["author_score"]) >= self.settings.strong_match_score:
+                    strong_match = True
+            elif is_match:
+                best_margin = max(best_margin, 0.0)
+                strong_match = True
+        return best_margin, strong_match, near_miss
+
+    def _should_fetch_next_page(
+        self,
+        match_results: List[tuple[bool, Dict[str, Any]]],
+        best_margin: float
+    ) -> Tuple[bool, float, str]:
+        """
+        Decides whether another search page is worth a request.
+
+        - A page on which every candidate matched is followed: more editions of the
+          book are likely on the next page.
+        - Otherwise a strong match ends the search.
+        - Otherwise the next page is fetched only while the best score improves on
+          the previous pages and, before any match, the page held a near miss.
+
+        Args:
+            match_results: Results of _check_matches for the page just scored.
+            best_margin: Best margin seen on the earlier pages (-inf before the first).
+
+        Returns:
+            (fetch the next page, updated best margin, reason for logging)
+        """
+        page_best, strong_match, near_miss = self._page_scores(match_results)
+        new_best = max(best_margin, page_best)
+
+        if all(is_match for is_match, _ in match_results):
+            return True, new_best, "every candidate on the page matched"
+        if strong_match:
+            return False, new_best, "strong match found"
+        if page_best <= best_margin:
+            return False, new_best, "best score no longer improving"
+        if page_best < 0 and not near_miss:
+            return False, new_best, "no candidate close to the thresholds"
+        return True, new_best, "best score improving"
+
+    def _check_match(
+        self,
+        norm_input_title: str,
+        norm_input_author: str,
+        candidate_title: Optional[str],
+        candidate_authors_list: Optional[List[str]]
+    ) -> tuple[bool, Dict[str, Any]]:
+        """
+        Checks if a single candidate book matches the input criteria based on settings.
+
+        Args:
+            norm_input_title: Normalized title from the input source.
+            norm_input_author: Normalized primary author from the input source (surname preferred).
+            candidate_title: Title from the API candidate.
+            candidate_authors_list: List of authors from the API candidate.
+
+        Returns:
+            A tuple: (bool indicating match, dict containing match details/scores).
+        """
+        return self._check_matches(
+            norm_input_title=norm_input_title,
+            norm_input_author=norm_input_author,
+            candidate_titles=[candidate_title],
+            candidate_authors_lists=[candidate_authors_list]
+        )[0]
+
+    def _check_matches(
+        self,
+        norm_input_title: str,
+        norm_input_author: str,
+        candidate_titles: List[Optional[str]],
+        candidate_authors_lists: List[Optional[List[str]]]
+    ) -> List[tuple[bool, Dict[str, Any]]]:
+        """
+        Checks a page of candidate books against the input criteria in one batch.
+
+        Candidate strings go through the memoized normalize_string, and fuzzy scores
+        for all titles and all authors are computed with one rapidfuzz cdist call
+        each, then thresholded with NumPy.
+
+        Args:
+            norm_input_title: Normalized title from the input source.
+            norm_input_author: Normalized primary author from the input source (surname preferred).
+            candidate_titles: Titles of the API candidates.
+            candidate_authors_lists: Author lists of the API candidates.
+
+        Returns:
+            One (bool indicating match, dict containing match details/scores) tuple per candidate.
+        """
+        match_type = self.settings.matching_type
+        results: List[Optional[tuple[bool, Dict[str, Any]]]] = [None] * len(candidate_titles)
+
+        # --- Filter out candidates that cannot be scored ---
+        valid_positions = []
+        valid_titles = []
+        valid_authors = []
+        for position, (candidate_title, candidate_authors_list) in enumerate(zip(candidate_titles, candidate_authors_lists)):
+            details = {"match_type": match_type}
+            if not candidate_title or not candidate_authors_list:
+                details["reason"] = "Missing candidate title or authors"
+                results[position] = (False, details)
+                continue
+
+            norm_candidate_title = normalize_string(candidate_title)
+            norm_candidate_authors = [normalize_string(a) for a in candidate_authors_list if a]
+
+            if not norm_candidate_title or not norm_candidate_authors:
+                 details["reason"] = "Normalized candidate title or authors are empty"
+                 results[position] = (False, details)
+                 continue
+
+            valid_positions.append(position)
+            valid_titles.append(norm_candidate_title)
+            valid_authors.append(norm_candidate_authors)
+
+        if not valid_positions:
+            return results
+
+        # --- Exact Matching ---
+        if match_type == 'exact':
+            for position, norm_candidate_title, norm_candidate_authors in zip(valid_positions, valid_titles, valid_authors):
+                title_match = norm_input_title == norm_candidate_title
+                # Check if the normalized input author exists exactly in the normalized candidate list
+                # Also handle surname check if input was "Surname, ..."
+                author_match = any(norm_input_author == norm_cand_auth for norm_cand_auth in norm_candidate_authors) or \
+                               any(norm_input_author in norm_cand_auth.split() for norm_cand_auth in norm_candidate_authors) # Simple check if surname is in candidate name parts
+
+                details = {"match_type": match_type, "title_match_exact": title_match, "author_match_exact": author_match}
+                results[position] = (title_match and author_match, details)
+            return results
+
+        # --- Fuzzy Matching ---
+        elif match_type == 'fuzzy':
+            # Authors of all candidates are flattened; segment offsets map them back
+            flat_authors = [author for authors in valid_authors for author in authors]
+            segment_lengths = np.fromiter((len(authors) for authors in valid_authors), dtype=np.intp, count=len(valid_authors))
+            segment_starts = np.concatenate(([0], np.cumsum(segment_lengths)[:-1]))
+
+            try:
+                title_scores = process.cdist([norm_input_title], valid_titles, scorer=self.fuzzy_scorer_func, dtype=np.float64)[0]
+                author_scores = process.cdist([norm_input_author], flat_authors, scorer=self.fuzzy_scorer_func, dtype=np.float64)[0]
+            except Exception as e:
+                 # Fallback to pairwise scoring if the scorer is incompatible with cdist
+                 logger.trace(f"cdist failed for candidate scoring (scorer: {self.fuzzy_scorer_func.__name__}), using loop. Error: {e}")
+                 title_scores = np.array([self.fuzzy_scorer_func(norm_input_title, t) for t in valid_titles], dtype=np.float64)
+                 author_scores = np.array([self.fuzzy_scorer_func(norm_input_author, a) for a in flat_authors], dtype=np.float64)
+
+            # Best author score per candidate (first one wins on ties, like extractOne)
+            best_author_scores = np.maximum.reduceat(author_scores, segment_starts)
+            is_best = author_scores == np.repeat(best_author_scores, segment_lengths)
+            first_best = np.flatnonzero(is_best)
+            best_author_indices = first_best[np.searchsorted(first_best, segment_starts)]
+
+            # Check against thresholds
+            matches = (title_scores >= self.settings.fuzzy_title_threshold) & \
+                      (best_author_scores >= self.settings.fuzzy_author_threshold)
+            thresholds = f"T:{self.settings.fuzzy_title_threshold}/A:{self.settings.fuzzy_author_threshold}"
+
+            for k, position in enumerate(valid_positions):
+                details = {
+                    "match_type": match_type,
+                    "title_score": round(title_scores[k].item()),
+                    "best_candidate_author": flat_authors[best_author_indices[k]],
+                    "author_score": round(best_author_scores[k].item()),
+                    "thresholds": thresholds,
+                }
+                results[position] = (bool(matches[k]), details)
+            return results
+
+        else:
+            # Should not happen if settings validation works, but handle defensively
+            logger.error(f"Unknown matching_type: {match_type}")
+            for position in valid_positions:
+                results[position] = (False, {"match_type": match_type, "reason": "Unknown matching type"})
+            return results
+
+    def _extract_edition_data(
+        self,
+        candidate_book_data: Dict[str, Any],
+        field_map: Dict[str, str],
+        list_fields: List[str],
+        object_fields: List[str]
+    ) -> Dict[str, Any]:
+        """
+        Extracts and formats data for a single matched edition.
+
+        List and object fields keep their native structure; the output writers
+        decide how to store them (native nested columns, JSON text for CSV/Excel).
+        """
+        extracted_data = {}
+        for output_name, provider_field in field_map.items():
+            raw_value = candidate_book_data.get(provider_field)
+
+            # Handle special case for ISBN10 (might be in 'isbn' field)
+            if output_name == "ISBN10" and raw_value is None:
+                 raw_value = candidate_book_data.get("isbn")
+
+            processed_value = None
+            if raw_value is not None:
+                if output_name in list_fields:
+                    # Wrap single values so list columns always hold lists
+                    processed_value = list(raw_value) if isinstance(raw_value, (list, tuple)) else [raw_value]
+                elif output_name in object_fields:
+                    processed_value = raw_value
+                else:
+                    # Ensure basic types are strings or numbers, handle potential issues
+                    if isinstance(raw_value, (str, int, float, bool)):
+                         processed_value = raw_value
+                    else:
+                         # Fallback for unexpected types
+                         processed_value = str(raw_value)
+            # else: keep processed_value as None if raw_value is None
+
+            extracted_data[output_name] = processed_value
+
+        return extracted_data
@@ -0,0 +1,96 @@
+# phantom_enrichment/core/output_sink.py
+
+from collections import defaultdict
+from typing import Any, Dict, List, Set
+import pandas as pd
+from loguru import logger
+
+from phantom_enrichment.datasources.output_writers import OutputWriter
+from phantom_enrichment.enrichment.edition_merger import EditionMerger
+
+
+class OutputSink:
+    """
+    Streams finished input rows to an OutputWriter, in input order.
+
+    A row is finished once every provider has reported it (even with no editions).
+    Finished rows are released in input order as soon as all earlier rows are
+    finished too, buffered, merged across providers and written every
+    `chunk_size` editions, so the output grows with the run instead of being
+    written in one pass at the end.
+    """
+
+    def __init__(
+        self,
+        writer: OutputWriter,
+        merger: EditionMerger,
+        total_rows: int,
+        providers: List[str],
+        chunk_size: int = 500
+    ):
+        """
+        Initializes the sink.
+
+        Args:
+            writer: Destination writer.
+            merger: Merges editions of the same book found by several providers.
+            total_rows: Number of input rows.
+            providers: Names of the providers every row waits for.
+            chunk_size: Number of buffered editions that triggers a write.
+        """
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least 1.")
+        self.writer = writer
+        self.merger = merger
+        self.total_rows = total_rows
+        self.chunk_size = chunk_size
+        self._pending: List[Set[str]] = [set(providers) for _ in range(total_rows)]
+        self._editions: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+        self._next_position = 0
+        self._buffer: List[Dict[str, Any]] = []
+
+    @property
+    def rows_released(self) -> int:
+        """Number of input rows handed to the writer (or its buffer) so far."""
+        return self._next_position
+
+    def complete(self, provider: str, position: int, editions: List[Dict[str, Any]]) -> None:
+        """Records that `provider` finished the row at `position`."""
+        self._pending[position].discard(provider)
+        if editions:
+            self._editions[position].extend(editions)
+        self._release()
+
+    def abandon(self, provider: str) -> None:
+        """Stops waiting for a provider that failed as a whole."""
+        for pending in self._pending:
+            pending.discard(provider)
+        self._release()
+
+    def _release(self) -> None:
+        """Moves the finished prefix of rows into the buffer, writing full chunks."""
+        while self._next_position < self.total_rows and not self._pending[self._next_position]:
+            self._buffer.extend(self._editions.pop(self._next_position, []))
+            self._next_position += 1
+            if len(self._buffer) >= self.chunk_size:
+                self.flush()
+
+    def flush(self) -> None:
+        """Merges and writes the buffered editions."""
+        if not self._buffer:
+            return
+        chunk = self.merger.merge(pd.DataFrame(self._buffer))
+        self.writer.write(chunk)
+        self._buffer.clear()
+
+    def close(self) -> None:
+        """Writes the remaining finished rows and closes the writer."""
+        try:
+            self.flush()
+            if self._next_position < self.total_rows:
+                logger.warning(
+                    f"Output {self.writer.path} holds {self._next_position}/{self.total_rows} rows; "
+                    f"the rest did not finish (rerun with --resume to complete it)."
+                )
+        finally:
+            self.writer.close()
@@ -1,6 +1,7 @@
       
 # phantom_enrichment/datasources/excel_handler.py
 
+import json
 import pandas as pd
 from pathlib import Path
 from loguru import logger
@@ -55,6 +56,23 @@ class ExcelHandler:
             logger.exception(msg) # Log full traceback
             raise DataSourceError(msg) from e
 
+    @staticmethod
+    def _prepare_for_excel(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Converts values openpyxl cannot store.
+
+        Timezone-aware datetimes become naive UTC, and nested lists/objects become JSON text.
+        """
+        df = df.copy()
+        for column in df.columns:
+            if isinstance(df[column].dtype, pd.DatetimeTZDtype):
+                df[column] = df[column].dt.tz_convert("UTC").dt.tz_localize(None)
+            elif df[column].dtype == object:
+                df[column] = df[column].map(
+                    lambda value: json.dumps(value, default=str) if isinstance(value, (list, dict)) else value
+                )
+        return df
+
     @staticmethod
     def save_dataframe_to_excel(df: pd.DataFrame, file_path: Path, sheet_name: str = 'Enriched Data'):
         """
@@ -80,7 +98,7 @@ class ExcelHandler:
 
         try:
             # index=False prevents writing the DataFrame index as a column
-            df.to_excel(file_path, sheet_name=sheet_name, index=False, engine='openpyxl')
+            ExcelHandler._prepare_for_excel(df).to_excel(file_path, sheet_name=sheet_name, index=False, engine='openpyxl')
             logger.success(f"Successfully saved DataFrame to {file_path}")
         except Exception as e:
             msg = f"Failed to save DataFrame to Excel file {file_path}: {e}"
@@ -0,0 +1,138 @@
+# phantom_enrichment/datasources/journal.py
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+import pandas as pd
+from loguru import logger
+
+from phantom_enrichment.utils.exceptions import DataSourceError
+
+
+class EnrichmentJournal:
+    """
+    Append-only JSONL checkpoint of processed rows.
+
+    Every processed input row is recorded as one line holding its provider,
+    Book_ID and matched editions. Records are buffered and appended to disk
+    every `checkpoint_interval` rows, so an interrupted run loses at most one
+    interval of work. On resume, the recorded (provider, Book_ID) pairs are
+    skipped and the final output is assembled from the journal.
+    """
+
+    TIMESTAMP_FIELDS = ("Fetched_Timestamp",)
+
+    def __init__(self, path: Path, checkpoint_interval: int = 25, resume: bool = False):
+        """
+        Initializes the journal.
+
+        Args:
+            path: Path of the JSONL journal file.
+            checkpoint_interval: Number of processed rows buffered before appending to disk.
+            resume: If True, keep and load an existing journal; otherwise start a new one.
+        """
+        if checkpoint_interval < 1:
+            raise ValueError("Checkpoint interval must be at least 1.")
+        self.path = Path(path)
+        self.checkpoint_interval = checkpoint_interval
+        self.resume = resume
+        self._processed: Set[Tuple[str, str]] = set()
+        self._buffer: List[Dict[str, Any]] = []
+        # Editions completed by earlier runs, handed back to the output on resume
+        self._resumed_editions: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if resume and self.path.exists():
+                for record in self._read_records():
+                    key = (record["provider"], record["book_id"])
+                    self._processed.add(key)
+                    self._resumed_editions[key] = record["editions"]
+                logger.info(f"Resuming from journal {self.path}: {len(self._processed)} row(s) already processed.")
+            else:
+                if self.path.exists():
+                    logger.info(f"Starting a new journal; discarding previous checkpoint at {self.path}")
+                self.path.write_text("", encoding="utf-8")
+        except OSError as e:
+            raise DataSourceError(f"Failed to prepare enrichment journal at {self.path}: {e}") from e
+
+    def _read_records(self) -> Iterable[Dict[str, Any]]:
+        """Yields the journal records, tolerating a truncated last line from a crash."""
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Ignoring corrupt journal line {line_number} in {self.path}")
+
+    def is_processed(self, provider: str, book_id: str) -> bool:
+        """Checks whether a row was already completed for the given provider."""
+        return (provider, book_id) in self._processed
+
+    def recorded_editions(self, provider: str, book_id: str) -> List[Dict[str, Any]]:
+        """Returns the editions an earlier run recorded for a row (empty if none)."""
+        return self._resumed_editions.get((provider, book_id), [])
+
+    @property
+    def processed_count(self) -> int:
+        """Number of (provider, Book_ID) pairs completed so far, including buffered ones."""
+        return len(self._processed)
+
+    def record(self, provider: str, book_id: str, editions: List[Dict[str, Any]]) -> None:
+        """Buffers the result of one processed row, flushing every `checkpoint_interval` rows."""
+        self._processed.add((provider, book_id))
+        self._buffer.append({"provider": provider, "book_id": book_id, "editions": editions})
+        if len(self._buffer) >= self.checkpoint_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """Appends all buffered records to the journal file."""
+        if not self._buffer:
+            return
+        try:
+            with open(self.path, "a", encoding="utf-8") as f:
+                for record in self._buffer:
+                    f.write(json.dumps(record, default=self._json_default) + "\n")
+                f.flush()
+        except OSError as e:
+            raise DataSourceError(f"Failed to append to enrichment journal {self.path}: {e}") from e
+        logger.debug(f"Checkpointed {len(self._buffer)} row(s) to {self.path} ({self.processed_count} total).")
+        self._buffer.clear()
+
+    @staticmethod
+    def _json_default(value: Any) -> Any:
+        """Serializes values json cannot handle natively (timestamps, numpy scalars)."""
+        if isinstance(value, pd.Timestamp):
+            return value.isoformat()
+        if hasattr(value, "item"):
+            return value.item()
+        return str(value)
+
+    def to_dataframe(self, book_id_order: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Assembles all journaled editions into a DataFrame.
+
+        Args:
+            book_id_order: Optional Book_IDs in input order; editions are sorted by it
+                           (stable, so editions of one row keep their order).
+
+        Returns:
+            DataFrame of editions (empty if nothing matched).
+        """
+        self.flush()
+        editions = [edition for record in self._read_records() for edition in record["editions"]]
+        df = pd.DataFrame(editions)
+        if df.empty:
+            return df
+
+        for field in self.TIMESTAMP_FIELDS:
+            if field in df.columns:
+                df[field] = pd.to_datetime(df[field], utc=True)
+
+        if book_id_order and "Book_ID" in df.columns:
+            position = {book_id: i for i, book_id in reversed(list(enumerate(book_id_order)))}
+            df = df.iloc[df["Book_ID"].map(position).fillna(len(position)).argsort(kind="stable")].reset_index(drop=True)
+        return df
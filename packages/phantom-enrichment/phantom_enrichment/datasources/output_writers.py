@@ -0,0 +1,288 @@
+# phantom_enrichment/datasources/output_writers.py
+
+import json
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Type
+import pandas as pd
+from loguru import logger
+
+from phantom_enrichment.utils.exceptions import DataSourceError
+
+# Logical column types understood by the writers
+LIST_TYPE = "list"          # list of strings (e.g. authors, subjects)
+JSON_TYPE = "json"          # free-form object whose keys vary between records
+TIMESTAMP_TYPE = "timestamp"
+STRING_TYPE = "string"
+NUMERIC_TYPES = ("int64", "float64")
+
+# Metadata columns added to every edition by the Orchestrator
+METADATA_COLUMN_TYPES = {
+    "Book_ID": STRING_TYPE,
+    "DataSource": STRING_TYPE,
+    "Fetched_Timestamp": TIMESTAMP_TYPE,
+    "Match_Details": JSON_TYPE,
+}
+
+
+def output_column_types(api_fields_config: Dict[str, Any], providers: List[str], media_type: str = "books") -> Dict[str, str]:
+    """
+    Derives the ordered output columns and their logical types from api_fields_config.
+
+    Provider list/object fields become list/json columns, explicit types come from the
+    media type's "output_types" section, and every other field is stored as a string.
+
+    Args:
+        api_fields_config: The loaded API fields configuration.
+        providers: Provider keys whose fields are part of the output.
+        media_type: Media type section to read (default "books").
+
+    Returns:
+        Ordered mapping of column name to logical type.
+    """
+    media_config = api_fields_config.get(media_type, {})
+    explicit_types = media_config.get("output_types", {})
+    column_types: Dict[str, str] = {}
+    for provider in providers:
+        provider_config = media_config.get(provider, {})
+        list_fields = set(provider_config.get("list_fields", []))
+        object_fields = set(provider_config.get("object_fields", []))
+        for output_name in provider_config.get("fields_to_extract", {}):
+            if output_name in column_types:
+                continue
+            if output_name in list_fields:
+                column_types[output_name] = LIST_TYPE
+            elif output_name in object_fields:
+                column_types[output_name] = JSON_TYPE
+            else:
+                column_types[output_name] = explicit_types.get(output_name, STRING_TYPE)
+    column_types.update(METADATA_COLUMN_TYPES)
+    return column_types
+
+
+def _to_json_text(value: Any) -> Optional[str]:
+    """Serializes a nested value to JSON text (None stays None)."""
+    if value is None or (isinstance(value, float) and value != value):
+        return None
+    if isinstance(value, str):
+        return value
+    return json.dumps(value, default=str)
+
+
+class OutputWriter(ABC):
+    """
+    Base class for chunked output writers.
+
+    Enriched editions are appended in chunks as input rows finish, so the cost of
+    each write is proportional to the new rows only. Use as a context manager (or
+    call `close()`) to finalize the file.
+    """
+
+    FORMAT = ""
+    EXTENSION = ""
+
+    def __init__(self, path: Path, column_types: Optional[Dict[str, str]] = None):
+        """
+        Initializes the writer. Any existing file at `path` is replaced.
+
+        Args:
+            path: Output file path.
+            column_types: Optional ordered mapping of output columns to logical types
+                          (see output_column_types). Chunks are aligned to these columns.
+        """
+        self.path = Path(path)
+        self.column_types = dict(column_types or {})
+        self.rows_written = 0
+        self.chunks_written = 0
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if self.path.exists():
+                self.path.unlink()
+        except OSError as e:
+            raise DataSourceError(f"Failed to prepare output file {self.path}: {e}") from e
+
+    def _align(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Reorders the chunk to the configured columns (missing ones become empty)."""
+        if not self.column_types:
+            return df
+        extra_columns = [column for column in df.columns if column not in self.column_types]
+        for column in extra_columns:
+            self.column_types[column] = STRING_TYPE
+        return df.reindex(columns=list(self.column_types))
+
+    def write(self, df: pd.DataFrame) -> None:
+        """Appends a chunk of editions to the output."""
+        if df.empty:
+            return
+        chunk = self._align(df)
+        try:
+            self._write_chunk(chunk)
+        except DataSourceError:
+            raise
+        except Exception as e:
+            msg = f"Failed to write {len(chunk)} rows to {self.FORMAT} output {self.path}: {e}"
+            logger.exception(msg)
+            raise DataSourceError(msg) from e
+        self.rows_written += len(chunk)
+        self.chunks_written += 1
+        logger.debug(f"Wrote chunk {self.chunks_written} ({len(chunk)} rows) to {self.path}")
+
+    @abstractmethod
+    def _write_chunk(self, df: pd.DataFrame) -> None:
+        """Format-specific append of one aligned chunk."""
+
+    def close(self) -> None:
+        """Finalizes the output file."""
+        logger.info(f"{self.FORMAT} output closed: {self.rows_written} rows in {self.chunks_written} chunk(s) at {self.path}")
+
+    def __enter__(self) -> "OutputWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class JsonlWriter(OutputWriter):
+    """Streams editions as JSON Lines; nested lists and objects are kept as JSON arrays/objects."""
+
+    FORMAT = "jsonl"
+    EXTENSION = ".jsonl"
+
+    def _write_chunk(self, df: pd.DataFrame) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            text = df.to_json(orient="records", lines=True, date_format="iso", force_ascii=False)
+            # pandas >= 1.5 already terminates the last record with a newline
+            f.write(text if text.endswith("\n") else text + "\n")
+
+
+class CsvWriter(OutputWriter):
+    """Appends editions to a CSV file; nested values are written as JSON text."""
+
+    FORMAT = "csv"
+    EXTENSION = ".csv"
+
+    def _write_chunk(self, df: pd.DataFrame) -> None:
+        df = df.copy()
+        for column in df.columns:
+            if df[column].dtype == object:
+                df[column] = df[column].map(lambda value: value if not isinstance(value, (list, dict)) else _to_json_text(value))
+        df.to_csv(self.path, mode="a", header=self.chunks_written == 0, index=False, encoding="utf-8")
+
+
+class ParquetWriter(OutputWriter):
+    """
+    Appends editions to a Parquet file, one row group per chunk.
+
+    List columns are stored as native list<string> columns. Parquet needs a single
+    schema for all row groups, so free-form objects whose keys vary per record
+    (e.g. Match_Details) are stored as JSON text, and scalar columns are coerced
+    to their configured type. Requires 'pyarrow'.
+    """
+
+    FORMAT = "parquet"
+    EXTENSION = ".parquet"
+
+    def __init__(self, path: Path, column_types: Optional[Dict[str, str]] = None, compression: str = "snappy"):
+        try:
+            import pyarrow # noqa: F401
+        except ImportError as e:
+            raise DataSourceError("Parquet output requires 'pyarrow'; install it or choose the csv/jsonl format.") from e
+        super().__init__(path, column_types)
+        self.compression = compression
+        self._writer = None
+        self._schema = None
+
+    def _arrow_type(self, logical_type: str):
+        import pyarrow as pa
+        return {
+            LIST_TYPE: pa.list_(pa.string()),
+            JSON_TYPE: pa.string(),
+            TIMESTAMP_TYPE: pa.timestamp("us", tz="UTC"),
+            "int64": pa.int64(),
+            "float64": pa.float64(),
+            "bool": pa.bool_(),
+        }.get(logical_type, pa.string())
+
+    def _coerce(self, series: pd.Series, logical_type: str) -> pd.Series:
+        """Coerces a column's values to the logical type so every chunk matches the schema."""
+        def as_list(value: Any) -> Optional[List[str]]:
+            if isinstance(value, str):
+                try:
+                    value = json.loads(value) # Lists serialized by older journals
+                except json.JSONDecodeError:
+                    return [value]
+            if isinstance(value, (list, tuple)):
+                return [str(item) for item in value if item is not None]
+            return None
+
+        if logical_type == LIST_TYPE:
+            return series.map(as_list)
+        if logical_type == JSON_TYPE:
+            return series.map(_to_json_text)
+        if logical_type == TIMESTAMP_TYPE:
+            return pd.to_datetime(series, utc=True, errors="coerce")
+        if logical_type in NUMERIC_TYPES:
+            numeric = pd.to_numeric(series, errors="coerce")
+            return numeric.astype("Int64") if logical_type == "int64" else numeric.astype("float64")
+        if logical_type == "bool":
+            return series.astype("boolean")
+        return series.map(lambda value: None if value is None or (isinstance(value, float) and value != value) else str(value))
+
+    def _write_chunk(self, df: pd.DataFrame) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        columns = list(self.column_types) or list(df.columns)
+        if self._schema is None:
+            self._schema = pa.schema([
+                pa.field(column, self._arrow_type(self.column_types.get(column, STRING_TYPE)))
+                for column in columns
+            ])
+            self._writer = pq.ParquetWriter(self.path, self._schema, compression=self.compression)
+
+        arrays = [
+            pa.array(self._coerce(df[field.name], self.column_types.get(field.name, STRING_TYPE)), type=field.type, from_pandas=True)
+            if field.name in df.columns else pa.nulls(len(df), type=field.type)
+            for field in self._schema
+        ]
+        self._writer.write_table(pa.Table.from_arrays(arrays, schema=self._schema))
+
+    def _align(self, df: pd.DataFrame) -> pd.DataFrame:
+        # The schema is fixed by the first chunk; later, unexpected columns cannot be added
+        if self._schema is not None:
+            unexpected = [column for column in df.columns if column not in self._schema.names]
+            if unexpected:
+                logger.warning(f"Dropping columns not present in the Parquet schema: {unexpected}")
+            return df.reindex(columns=self._schema.names)
+        return super()._align(df)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        super().close()
+
+
+OUTPUT_WRITERS: Dict[str, Type[OutputWriter]] = {
+    ParquetWriter.FORMAT: ParquetWriter,
+    CsvWriter.FORMAT: CsvWriter,
+    JsonlWriter.FORMAT: JsonlWriter,
+}
+
+
+def create_output_writer(output_format: str, path: Path, column_types: Optional[Dict[str, str]] = None) -> OutputWriter:
+    """
+    Creates the writer for an output format.
+
+    Args:
+        output_format: One of OUTPUT_WRITERS ('parquet', 'csv', 'jsonl').
+        path: Output file path (its suffix is replaced by the format's extension).
+        column_types: Optional ordered mapping of output columns to logical types.
+
+    Raises:
+        DataSourceError: If the format is unknown or its dependencies are missing.
+    """
+    writer_class = OUTPUT_WRITERS.get(output_format.lower())
+    if writer_class is None:
+        raise DataSourceError(f"Unknown output format '{output_format}'. Choose one of: {', '.join(OUTPUT_WRITERS)}")
+    return writer_class(Path(path).with_suffix(writer_class.EXTENSION), column_types)
@@ -0,0 +1,105 @@
+# phantom_enrichment/enrichment/edition_merger.py
+
+from typing import Any, Dict, List, Optional
+import pandas as pd
+from loguru import logger
+
+from phantom_enrichment.utils.helpers import to_isbn13
+
+
+class EditionMerger:
+    """
+    Merges the editions returned by several providers into one row per edition.
+
+    Editions are keyed by (Book_ID, ISBN-13). For every output field the value is
+    taken from the first provider, in precedence order, that has a non-empty value.
+    The default precedence and per-field overrides come from the "merge_policy"
+    section of api_fields_config; providers missing from a precedence list rank
+    last. Editions without an ISBN-13 cannot be matched across providers and are
+    kept as they are.
+    """
+
+    SOURCE_FIELD = "DataSource"
+    SOURCE_SEPARATOR = ", "
+
+    def __init__(self, provider_precedence: List[str], field_precedence: Optional[Dict[str, List[str]]] = None):
+        """
+        Initializes the merger.
+
+        Args:
+            provider_precedence: Provider keys (e.g. ["isbndb", "openlibrary"]), highest precedence first.
+            field_precedence: Optional per-output-field precedence overriding the default.
+        """
+        self.provider_precedence = [p.lower() for p in provider_precedence]
+        self.field_precedence = {
+            field: [p.lower() for p in providers]
+            for field, providers in (field_precedence or {}).items()
+        }
+
+    @classmethod
+    def from_config(cls, api_fields_config: Dict[str, Any], media_type: str = "books") -> "EditionMerger":
+        """Builds a merger from the media type's "merge_policy" in api_fields_config."""
+        media_config = api_fields_config.get(media_type, {})
+        policy = media_config.get("merge_policy", {})
+        default_precedence = policy.get("provider_precedence") or [
+            provider for provider, config in media_config.items()
+            if isinstance(config, dict) and "fields_to_extract" in config
+        ]
+        return cls(default_precedence, policy.get("field_precedence"))
+
+    def _rank(self, sources: pd.Series, precedence: List[str]) -> pd.Series:
+        """Ranks each row by its provider's position in the precedence list."""
+        ranks = {provider: i for i, provider in enumerate(precedence)}
+        return sources.map(ranks).fillna(len(ranks))
+
+    def merge(self, editions_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Merges duplicate editions (same Book_ID and ISBN-13) across providers.
+
+        Args:
+            editions_df: Editions from all providers, each tagged with its DataSource.
+
+        Returns:
+            DataFrame with one row per distinct edition, in first-seen order. The
+            DataSource column lists every provider that contributed to the row.
+        """
+        if editions_df.empty or "ISBN13" not in editions_df.columns or self.SOURCE_FIELD not in editions_df.columns:
+            return editions_df
+
+        df = editions_df.reset_index(drop=True)
+        isbn13 = df["ISBN13"].map(to_isbn13)
+        if "ISBN10" in df.columns:
+            isbn13 = isbn13.fillna(df["ISBN10"].map(to_isbn13))
+        # Editions without any ISBN get a unique key, i.e. they are never merged
+        unmatched_keys = pd.Series("#row" + df.index.astype(str), index=df.index)
+        merge_keys = df.get("Book_ID", pd.Series("", index=df.index)).astype(str) + "|" + isbn13.where(isbn13.notna(), unmatched_keys)
+        if not merge_keys.duplicated().any():
+            return editions_df
+
+        sources = df[self.SOURCE_FIELD].astype(str).str.lower()
+        key_order = merge_keys.drop_duplicates()
+
+        # Fields sharing the same precedence are resolved together
+        fields = [column for column in df.columns if column != self.SOURCE_FIELD]
+        fields_by_precedence: Dict[tuple, List[str]] = {}
+        for field in fields:
+            precedence = tuple(self.field_precedence.get(field, self.provider_precedence))
+            fields_by_precedence.setdefault(precedence, []).append(field)
+
+        merged_parts = []
+        for precedence, precedence_fields in fields_by_precedence.items():
+            rank = self._rank(sources, list(precedence))
+            ordered = df[precedence_fields].assign(_merge_key=merge_keys, _rank=rank).sort_values("_rank", kind="stable")
+            # first() skips missing values, so each field falls through to the next provider
+            merged_parts.append(ordered.groupby("_merge_key", sort=False)[precedence_fields].first())
+
+        rank = self._rank(sources, self.provider_precedence)
+        ordered_sources = df[self.SOURCE_FIELD].astype(str).to_frame().assign(_merge_key=merge_keys, _rank=rank).sort_values("_rank", kind="stable")
+        merged_sources = ordered_sources.groupby("_merge_key", sort=False)[self.SOURCE_FIELD].agg(
+            lambda values: self.SOURCE_SEPARATOR.join(dict.fromkeys(values))
+        )
+
+        merged = pd.concat(merged_parts + [merged_sources], axis=1).reindex(key_order.values)
+        merged = merged[list(editions_df.columns)].reset_index(drop=True)
+        logger.info(f"Merged {len(df)} edition records from {sources.nunique()} provider(s) into {len(merged)} distinct editions.")
+        return merged
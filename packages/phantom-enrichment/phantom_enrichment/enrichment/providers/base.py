@@ -0,0 +1,352 @@
+# phantom_enrichment/enrichment/providers/base.py
+
+import asyncio
+import httpx
+import time
+import json
+from abc import ABC, abstractmethod
+from email.utils import parsedate_to_datetime
+from urllib.parse import urljoin
+from loguru import logger
+from typing import Dict, Any, List, Optional
+
+from phantom_enrichment.utils.exceptions import ProviderApiError, ConfigurationError
+from phantom_enrichment.enrichment.rate_limiter import TokenBucket
+from phantom_enrichment.enrichment.response_cache import ResponseCache
+from phantom_enrichment.utils.metrics import EnrichmentMetrics, RequestSample
+
+
+class BaseProviderClient(ABC):
+    """
+    Common asynchronous interface and HTTP machinery for book metadata providers.
+
+    Every provider gets its own token-bucket limiter, a bounded number of in-flight
+    requests and a pooled keep-alive connection, so several providers can be queried
+    concurrently without sharing (or exceeding) each other's rate limits.
+
+    Subclasses implement the two operations the Orchestrator relies on:
+    - `search_books(query, page, page_size)` -> {"total": int, "books": [record, ...]}
+    - `get_books_by_isbns_bulk(isbns)` -> {"total": int, "requested": int, "data": [record, ...]}
+    where each record exposes at least 'title', 'authors' (list) and 'isbn13'.
+    """
+    PROVIDER_NAME = "PROVIDER"
+    DEFAULT_REQUESTS_PER_SECOND = 1.0
+    DEFAULT_MAX_CONCURRENCY = 5
+    DEFAULT_MAX_RETRIES = 3
+    DEFAULT_TIMEOUT = 30.0 # seconds
+    RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+    BACKOFF_BASE = 1.0 # seconds, doubled on every retry when no Retry-After is given
+    MAX_BACKOFF = 60.0 # seconds
+    DEFAULT_BULK_BATCH_SIZE = 100
+    MAX_PAGE_SIZE = 100
+
+    def __init__(
+        self,
+        base_url: str,
+        requests_per_second: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        timeout: Optional[float] = None,
+        bulk_batch_size: Optional[int] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        cache: Optional[ResponseCache] = None,
+    ):
+        """
+        Initializes the provider client.
+
+        Args:
+            base_url: The base URL of the provider API.
+            requests_per_second: Sustained request rate allowed by the provider.
+                                 Defaults to DEFAULT_REQUESTS_PER_SECOND.
+            burst: Maximum number of requests that may be sent back-to-back. Defaults to 1.
+            max_concurrency: Maximum number of requests in flight at once.
+                             Defaults to DEFAULT_MAX_CONCURRENCY.
+            max_retries: Retries for 429/5xx responses and transport errors.
+                         Defaults to DEFAULT_MAX_RETRIES.
+            timeout: Per-request timeout in seconds. Defaults to DEFAULT_TIMEOUT.
+            bulk_batch_size: Maximum ISBNs per bulk lookup call. Defaults to DEFAULT_BULK_BATCH_SIZE.
+            transport: Optional httpx transport (e.g. httpx.MockTransport for local testing).
+            cache: Optional persistent response cache.
+        """
+        if not base_url:
+            raise ConfigurationError(f"{self.PROVIDER_NAME}: Base URL is required.")
+
+        # Ensure base URL has a trailing slash for urljoin to work correctly
+        self.base_url = base_url.rstrip('/') + '/'
+        self.requests_per_second = requests_per_second or self.DEFAULT_REQUESTS_PER_SECOND
+        self.max_concurrency = max_concurrency or self.DEFAULT_MAX_CONCURRENCY
+        self.max_retries = max_retries if max_retries is not None else self.DEFAULT_MAX_RETRIES
+        self.timeout = timeout or self.DEFAULT_TIMEOUT
+        self.bulk_batch_size = bulk_batch_size or self.DEFAULT_BULK_BATCH_SIZE
+        self._transport = transport
+        self.cache = cache
+        # Set by the Orchestrator to collect per-request timings
+        self.metrics: Optional[EnrichmentMetrics] = None
+
+        # Shared by every request made through this client
+        self.rate_limiter = TokenBucket(
+            rate=self.requests_per_second,
+            capacity=burst or 1,
+            name=self.PROVIDER_NAME
+        )
+
+        # Loop-bound resources are created lazily in open()
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        logger.info(
+            f"{self.PROVIDER_NAME} client initialized. Base URL: {self.base_url}, "
+            f"Rate: {self.requests_per_second} req/s (burst {self.rate_limiter.capacity:g}), "
+            f"Max concurrency: {self.max_concurrency}, Max retries: {self.max_retries}"
+        )
+
+    def _get_headers(self) -> Dict[str, str]:
+        """Returns the default headers sent with every request."""
+        return {"Accept": "application/json"}
+
+    async def open(self) -> "BaseProviderClient":
+        """Creates the pooled HTTP client and concurrency guard for the running event loop."""
+        if self._client is None:
+            limits = httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency
+            )
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self._get_headers(),
+                timeout=self.timeout,
+                limits=limits,
+                transport=self._transport
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self.rate_limiter.reset()
+        return self
+
+    async def aclose(self) -> None:
+        """Closes the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+        self._client = None
+        self._semaphore = None
+
+    async def __aenter__(self) -> "BaseProviderClient":
+        return await self.open()
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    def _retry_delay(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """
+        Computes how long to wait before retrying.
+
+        Honors the Retry-After header (delta-seconds or HTTP-date) when present,
+        otherwise falls back to exponential backoff.
+        """
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    return min(max(float(retry_after), 0.0), self.MAX_BACKOFF)
+                except ValueError:
+                    try:
+                        retry_at = parsedate_to_datetime(retry_after)
+                        return min(max(retry_at.timestamp() - time.time(), 0.0), self.MAX_BACKOFF)
+                    except (TypeError, ValueError):
+                        logger.debug(f"{self.PROVIDER_NAME}: could not parse Retry-After header '{retry_after}'.")
+        return min(self.BACKOFF_BASE * (2 ** attempt), self.MAX_BACKOFF)
+
+    def _error_message(self, response: httpx.Response) -> str:
+        """Extracts a human-readable error message from an error response."""
+        try:
+            error_details = response.json()
+        except json.JSONDecodeError:
+            return response.text
+        if isinstance(error_details, dict):
+            return error_details.get('errorMessage') or error_details.get('error') or response.text
+        return response.text
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Any:
+        """
+        Makes an HTTP request to the provider API, handling rate limiting, retries and errors.
+
+        Args:
+            method: HTTP method (e.g., "GET", "POST").
+            endpoint: API endpoint path, relative to the base URL.
+            params: Dictionary of URL query parameters.
+            data: Request body data (for POST/PUT). Typically JSON string or dict.
+            headers: Optional per-request headers overriding the client defaults.
+
+        Returns:
+            The parsed JSON response.
+
+        Raises:
+            ProviderApiError: If the API returns an error or the request fails.
+        """
+        if self._client is None:
+            await self.open()
+
+        # Ensure endpoint doesn't start with '/' if base_url already ends with '/'
+        relative_endpoint = endpoint.lstrip('/')
+        full_url = urljoin(self.base_url, relative_endpoint)
+
+        logger.debug(f"Making {self.PROVIDER_NAME} request: {method} {full_url}")
+        if params:
+            logger.trace(f"Request Params: {params}")
+        if data:
+             # Avoid logging potentially large data bodies at debug level unless needed
+            logger.trace(f"Request Data Type: {type(data)}")
+
+        is_body_method = method.upper() in ['POST', 'PUT']
+        attempt = 0
+        # --- Instrumentation (recorded once per logical request, retries included) ---
+        request_start = time.perf_counter()
+        limiter_wait = 0.0
+        network_time = 0.0
+        failed = True
+        response = None
+        try:
+            while True:
+                response = None
+                try:
+                    async with self._semaphore:
+                        # --- Rate Limiting ---
+                        wait_start = time.perf_counter()
+                        await self.rate_limiter.acquire()
+                        network_start = time.perf_counter()
+                        limiter_wait += network_start - wait_start
+                        try:
+                            response = await self._client.request(
+                                method=method,
+                                url=relative_endpoint,
+                                params=params,
+                                json=data if is_body_method and isinstance(data, dict) else None,
+                                content=data if is_body_method and isinstance(data, str) else None,
+                                headers=headers,
+                            )
+                        finally:
+                            network_time += time.perf_counter() - network_start
+
+                    if response.status_code in self.RETRY_STATUS_CODES and attempt < self.max_retries:
+                        delay = self._retry_delay(attempt, response)
+                        attempt += 1
+                        logger.warning(f"{self.PROVIDER_NAME} HTTP {response.status_code} for {method} {full_url}. Retry {attempt}/{self.max_retries} in {delay:.1f}s.")
+                        await asyncio.sleep(delay)
+                        continue
+
+                    response.raise_for_status() # Raise HTTPStatusError for bad responses (4xx or 5xx)
+                    break
+
+                except httpx.HTTPStatusError as e:
+                    status_code = e.response.status_code
+                    error_message = self._error_message(e.response)
+                    logger.error(f"{self.PROVIDER_NAME} HTTP Error {status_code} for {method} {full_url}. Response: {error_message}")
+                    raise ProviderApiError(
+                        provider_name=self.PROVIDER_NAME,
+                        message=f"HTTP Error {status_code}: {error_message}",
+                        status_code=status_code
+                    ) from e
+
+                except httpx.TransportError as e:
+                    # Timeouts, connection resets, DNS failures, etc.
+                    if attempt < self.max_retries:
+                        delay = self._retry_delay(attempt)
+                        attempt += 1
+                        logger.warning(f"{self.PROVIDER_NAME} transport error for {method} {full_url}: {e!r}. Retry {attempt}/{self.max_retries} in {delay:.1f}s.")
+                        await asyncio.sleep(delay)
+                        continue
+                    if isinstance(e, httpx.TimeoutException):
+                        logger.error(f"{self.PROVIDER_NAME} request timed out for {method} {full_url}")
+                        raise ProviderApiError(provider_name=self.PROVIDER_NAME, message="Request timed out") from e
+                    logger.error(f"{self.PROVIDER_NAME} connection error for {method} {full_url}: {e}")
+                    raise ProviderApiError(provider_name=self.PROVIDER_NAME, message=f"Connection error: {e}") from e
+
+                except httpx.HTTPError as e:
+                    # Catch other potential httpx errors
+                    logger.error(f"{self.PROVIDER_NAME} request failed for {method} {full_url}: {e}")
+                    raise ProviderApiError(provider_name=self.PROVIDER_NAME, message=f"Request failed: {e}") from e
+
+            # If the request was successful (status code 2xx)
+            try:
+                response_json = response.json()
+                failed = False
+                logger.debug(f"{self.PROVIDER_NAME} request successful ({response.status_code}) for {method} {full_url}")
+                return response_json
+            except json.JSONDecodeError as e:
+                logger.error(f"{self.PROVIDER_NAME} failed to decode JSON response from {method} {full_url}. Status: {response.status_code}, Response: {response.text}")
+                raise ProviderApiError(
+                    provider_name=self.PROVIDER_NAME,
+                    message=f"Invalid JSON response received (Status: {response.status_code})",
+                    status_code=response.status_code
+                ) from e
+        finally:
+            self._record_request(method, relative_endpoint, response, time.perf_counter() - request_start,
+                                 limiter_wait, network_time, attempt, failed)
+
+    def _record_request(
+        self,
+        method: str,
+        endpoint: str,
+        response: Optional[httpx.Response],
+        latency: float,
+        limiter_wait: float,
+        network_time: float,
+        retries: int,
+        failed: bool
+    ) -> None:
+        """Reports one finished request to the attached metrics, if any."""
+        if self.metrics is None:
+            return
+        self.metrics.record_request(RequestSample(
+            provider=self.PROVIDER_NAME,
+            method=method.upper(),
+            endpoint=endpoint,
+            status_code=response.status_code if response is not None else None,
+            latency=latency,
+            limiter_wait=limiter_wait,
+            network_time=network_time,
+            retries=retries,
+            failed=failed,
+        ))
+
+    def _validate_search_params(self, query: str, page: int, page_size: int) -> None:
+        """Validates common search parameters."""
+        if page < 1:
+            raise ValueError("Page number must be 1 or greater.")
+        if not (1 <= page_size <= self.MAX_PAGE_SIZE):
+            raise ValueError(f"Page size must be between 1 and {self.MAX_PAGE_SIZE}.")
+        if not query:
+            logger.warning(f"Attempting {self.PROVIDER_NAME} search with an empty query.")
+
+    @abstractmethod
+    async def search_books(self, query: str, page: int = 1, page_size: int = 20) -> Dict[str, Any]:
+        """
+        Searches the provider for books matching a free-text query.
+
+        Returns:
+            {"total": int, "books": [record, ...]}
+
+        Raises:
+            ProviderApiError: If the API request fails.
+            ValueError: If page or page_size are invalid.
+        """
+
+    @abstractmethod
+    async def get_books_by_isbns_bulk(self, isbns: List[str]) -> Dict[str, Any]:
+        """
+        Looks up several ISBNs in as few calls as the provider allows.
+
+        Returns:
+            {"total": int, "requested": int, "data": [record, ...]}; ISBNs that
+            were not found are simply absent.
+
+        Raises:
+            ProviderApiError: If the API request fails.
+        """
@@ -1,50 +1,44 @@
 # phantom_enrichment/enrichment/providers/isbndb_client.py
 
-import requests
-import time
+import asyncio
 import json
-from urllib.parse import quote, urljoin
+from urllib.parse import quote
 from loguru import logger
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List
 
 # Assuming exceptions are defined in the utils module based on previous setup
 from phantom_enrichment.utils.exceptions import ProviderApiError, ConfigurationError
+from phantom_enrichment.enrichment.providers.base import BaseProviderClient
+from phantom_enrichment.enrichment.response_cache import ResponseCache
 
-class IsbnDbClient:
+class IsbnDbClient(BaseProviderClient):
     """
-    Client for interacting with the ISBNDB v2 REST API.
+    Asynchronous client for interacting with the ISBNDB v2 REST API.
 
-    Handles authentication, rate limiting, request execution, and error handling.
+    Handles authentication on top of the shared provider machinery (rate limiting,
+    pooled connections, retries and error handling in BaseProviderClient).
+    Use it as an async context manager (or call `aclose()`) so the connection
+    pool is released.
     """
     PROVIDER_NAME = "ISBNDB"
-    # Standard rate limit is 1 req/sec. Add buffer. Premium/Pro could adjust this.
-    DEFAULT_RATE_LIMIT_DELAY = 1.1 # seconds
+    # Standard rate limit is 1 req/sec. Premium/Pro plans allow more.
+    DEFAULT_REQUESTS_PER_SECOND = 1.0
+    # POST /books accepts up to 100 ISBNs per call on Basic plans (more on Premium/Pro)
+    DEFAULT_BULK_BATCH_SIZE = 100
 
-    def __init__(self, api_key: str, base_url: str, rate_limit_delay: Optional[float] = None):
+    def __init__(self, api_key: str, base_url: str, **kwargs: Any):
         """
         Initializes the ISBNDB client.
 
         Args:
             api_key: The ISBNDB REST API key.
             base_url: The base URL for the ISBNDB API (e.g., "https://api2.isbndb.com").
-            rate_limit_delay: Optional override for the delay between requests (in seconds).
-                              Defaults to DEFAULT_RATE_LIMIT_DELAY.
+            **kwargs: Throughput, transport and cache options (see BaseProviderClient).
         """
         if not api_key:
             raise ConfigurationError(f"{self.PROVIDER_NAME}: API key is required.")
-        if not base_url:
-            raise ConfigurationError(f"{self.PROVIDER_NAME}: Base URL is required.")
-
         self.api_key = api_key
-        # Ensure base URL doesn't have a trailing slash for urljoin to work correctly
-        self.base_url = base_url.rstrip('/') + '/'
-        self.rate_limit_delay = rate_limit_delay if rate_limit_delay is not None else self.DEFAULT_RATE_LIMIT_DELAY
-
-        # Use a session object for connection pooling and persistent headers
-        self.session = requests.Session()
-        self.session.headers.update(self._get_headers())
-
-        logger.info(f"{self.PROVIDER_NAME} client initialized. Base URL: {self.base_url}, Rate Limit Delay: {self.rate_limit_delay}s")
+        super().__init__(base_url=base_url, **kwargs)
 
     def _get_headers(self) -> Dict[str, str]:
         """Returns the required authentication headers."""
@@ -55,94 +49,7 @@ class IsbnDbClient:
             "Content-Type": "application/json"
         }
 
-    def _make_request(self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None, data: Optional[Any] = None) -> Dict[str, Any]:
-        """
-        Makes an HTTP request to the ISBNDB API, handling rate limiting and errors.
-
-        Args:
-            method: HTTP method (e.g., "GET", "POST").
-            endpoint: API endpoint path (e.g., "/books/query", "/book/isbn").
-            params: Dictionary of URL query parameters.
-            data: Request body data (for POST/PUT). Typically JSON string or dict.
-
-        Returns:
-            The parsed JSON response dictionary.
-
-        Raises:
-            ProviderApiError: If the API returns an error or the request fails.
-        """
-        # Ensure endpoint doesn't start with '/' if base_url already ends with '/'
-        relative_endpoint = endpoint.lstrip('/')
-        full_url = urljoin(self.base_url, relative_endpoint)
-
-        # --- Rate Limiting ---
-        logger.trace(f"Sleeping for {self.rate_limit_delay}s before API call.")
-        time.sleep(self.rate_limit_delay)
-
-        logger.debug(f"Making {self.PROVIDER_NAME} request: {method} {full_url}")
-        if params:
-            logger.trace(f"Request Params: {params}")
-        if data:
-             # Avoid logging potentially large data bodies at debug level unless needed
-            logger.trace(f"Request Data Type: {type(data)}")
-
-        try:
-            response = self.session.request(
-                method=method,
-                url=full_url,
-                params=params,
-                json=data if method.upper() in ['POST', 'PUT'] and isinstance(data, dict) else None,
-                data=data if method.upper() in ['POST', 'PUT'] and isinstance(data, str) else None,
-                timeout=30 # Set a reasonable timeout (e.g., 30 seconds)
-            )
-            response.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx)
-
-        except requests.exceptions.HTTPError as e:
-            status_code = e.response.status_code
-            try:
-                # Try to parse error details from JSON response
-                error_details = e.response.json()
-                error_message = error_details.get('errorMessage', e.response.text) # Use errorMessage if present
-                logger.error(f"{self.PROVIDER_NAME} HTTP Error {status_code} for {method} {full_url}. Response: {error_details}")
-            except json.JSONDecodeError:
-                # If response is not JSON
-                error_message = e.response.text
-                logger.error(f"{self.PROVIDER_NAME} HTTP Error {status_code} for {method} {full_url}. Response (non-JSON): {error_message}")
-
-            raise ProviderApiError(
-                provider_name=self.PROVIDER_NAME,
-                message=f"HTTP Error {status_code}: {error_message}",
-                status_code=status_code
-            ) from e
-
-        except requests.exceptions.Timeout:
-            logger.error(f"{self.PROVIDER_NAME} request timed out for {method} {full_url}")
-            raise ProviderApiError(provider_name=self.PROVIDER_NAME, message="Request timed out")
-
-        except requests.exceptions.ConnectionError as e:
-            logger.error(f"{self.PROVIDER_NAME} connection error for {method} {full_url}: {e}")
-            raise ProviderApiError(provider_name=self.PROVIDER_NAME, message=f"Connection error: {e}")
-
-        except requests.exceptions.RequestException as e:
-            # Catch other potential requests library errors
-            logger.error(f"{self.PROVIDER_NAME} request failed for {method} {full_url}: {e}")
-            raise ProviderApiError(provider_name=self.PROVIDER_NAME, message=f"Request failed: {e}")
-
-        # If the request was successful (status code 2xx)
-        try:
-            response_json = response.json()
-            logger.debug(f"{self.PROVIDER_NAME} request successful ({response.status_code}) for {method} {full_url}")
-            # logger.trace(f"Response JSON: {response_json}") # Be careful logging full response if large
-            return response_json
-        except json.JSONDecodeError as e:
-            logger.error(f"{self.PROVIDER_NAME} failed to decode JSON response from {method} {full_url}. Status: {response.status_code}, Response: {response.text}")
-            raise ProviderApiError(
-                provider_name=self.PROVIDER_NAME,
-                message=f"Invalid JSON response received (Status: {response.status_code})",
-                status_code=response.status_code
-            ) from e
-
-    def search_books(self, query: str, page: int = 1, page_size: int = 20) -> Dict[str, Any]:
+    async def search_books(self, query: str, page: int = 1, page_size: int = 20) -> Dict[str, Any]:
         """
         Searches for books using the GET /books/{query} endpoint.
 
@@ -158,25 +65,36 @@ class IsbnDbClient:
             ProviderApiError: If the API request fails.
             ValueError: If page or page_size are invalid.
         """
-        if page < 1:
-            raise ValueError("Page number must be 1 or greater.")
-        if not (1 <= page_size <= 100):
-             # Note: Free tier might have lower practical limits, but API doc implies 100 max for bulk
-             raise ValueError("Page size must be between 1 and 100.")
-
-        if not query:
-            logger.warning("Attempting ISBNDB search with an empty query.")
-            # Depending on API behavior, might return error or empty result set.
-            # Let the API handle it for now, but log warning.
+        # Note: Free tier might have lower practical limits, but API doc implies 100 max for bulk
+        self._validate_search_params(query, page, page_size)
 
         encoded_query = quote(query)
         endpoint = f"/books/{encoded_query}"
         params = {'page': page, 'pageSize': page_size}
 
-        logger.info(f"Searching {self.PROVIDER_NAME} for query='{query}', page={page}, pageSize={page_size}")
-        return self._make_request('GET', endpoint, params=params)
+        cache_key = ResponseCache.make_key('search', query=query, page=page, page_size=page_size)
+        if self.cache is not None:
+            hit, cached_response = self.cache.get(self.PROVIDER_NAME, cache_key)
+            if hit:
+                logger.debug(f"Cache hit for {self.PROVIDER_NAME} search query='{query}', page={page}, pageSize={page_size}")
+                return cached_response if cached_response is not None else {"total": 0, "books": []}
 
-    def get_book_by_isbn(self, isbn: str) -> Dict[str, Any]:
+        logger.info(f"Searching {self.PROVIDER_NAME} for query='{query}', page={page}, pageSize={page_size}")
+        try:
+            response = await self._make_request('GET', endpoint, params=params)
+        except ProviderApiError as e:
+            # ISBNDB answers 404 when a search has no results
+            if e.status_code != 404:
+                raise
+            logger.debug(f"{self.PROVIDER_NAME} search query='{query}', page={page} found no books.")
+            response = {"total": 0, "books": []}
+
+        if self.cache is not None:
+            is_negative = not response.get("books")
+            self.cache.set(self.PROVIDER_NAME, cache_key, None if is_negative else response, is_negative=is_negative)
+        return response
+
+    async def get_book_by_isbn(self, isbn: str) -> Dict[str, Any]:
         """
         Retrieves book details using the GET /book/{isbn} endpoint.
 
@@ -200,24 +118,61 @@ class IsbnDbClient:
              logger.warning(f"Provided ISBN '{isbn}' has unusual format. Proceeding anyway.")
 
         endpoint = f"/book/{isbn}"
+        cache_key = ResponseCache.make_key('book', isbn=isbn)
+        if self.cache is not None:
+            hit, cached_response = self.cache.get(self.PROVIDER_NAME, cache_key)
+            if hit:
+                logger.debug(f"Cache hit for {self.PROVIDER_NAME} ISBN: {isbn}")
+                if cached_response is None:
+                    raise ProviderApiError(provider_name=self.PROVIDER_NAME, message="Book not found (cached)", status_code=404)
+                return cached_response
+
         logger.info(f"Fetching book details from {self.PROVIDER_NAME} for ISBN: {isbn}")
         # A 404 here is a valid outcome (book not found), the caller should handle it.
-        return self._make_request('GET', endpoint)
-
-    # Potential future method for POST /books endpoint (bulk ISBN lookup)
-    # def get_books_by_isbns_bulk(self, isbns: list[str]) -> Dict[str, Any]:
-    #     """Retrieves multiple books using the POST /books endpoint."""
-    #     if not isbns:
-    #         return {"books": []} # Or handle as appropriate
-    #
-    #     endpoint = "/books"
-    #     # The docs show data format 'isbns=isbn1,isbn2,...'
-    #     # This is unusual for a JSON POST, usually expects a JSON body like {"isbns": ["...", "..."]}
-    #     # Double-check the docs/examples carefully. Let's assume the string format for now.
-    #     data_string = 'isbns=' + ','.join(isbns)
-    #     logger.info(f"Fetching bulk book details from {self.PROVIDER_NAME} for {len(isbns)} ISBNs.")
-    #     # Need to ensure _make_request handles string data correctly for POST if not sending JSON
-    #     return self._make_request('POST', endpoint, data=data_string)
+        try:
+            response = await self._make_request('GET', endpoint)
+        except ProviderApiError as e:
+            if e.status_code == 404 and self.cache is not None:
+                self.cache.set(self.PROVIDER_NAME, cache_key, None, is_negative=True)
+            raise
+
+        if self.cache is not None:
+            self.cache.set(self.PROVIDER_NAME, cache_key, response)
+        return response
+
+    async def get_books_by_isbns_bulk(self, isbns: List[str]) -> Dict[str, Any]:
+        """
+        Retrieves multiple books in one call using the POST /books endpoint.
+
+        Args:
+            isbns: ISBNs (10 or 13) to look up. Must not exceed the plan's bulk limit.
+
+        Returns:
+            The parsed JSON response dictionary. Found books are listed under 'data';
+            ISBNs that were not found are simply absent.
+
+        Raises:
+            ProviderApiError: If the API request fails.
+        """
+        if not isbns:
+            return {"total": 0, "requested": 0, "data": []}
+
+        # The endpoint expects a form-style body: 'isbns=isbn1,isbn2,...'
+        data_string = 'isbns=' + ','.join(isbns)
+        logger.info(f"Fetching bulk book details from {self.PROVIDER_NAME} for {len(isbns)} ISBNs.")
+        try:
+            return await self._make_request(
+                'POST',
+                '/books',
+                data=data_string,
+                headers={"Content-Type": "application/x-www-form-urlencoded"}
+            )
+        except ProviderApiError as e:
+            # ISBNDB answers 404 when none of the requested ISBNs exist
+            if e.status_code == 404:
+                logger.debug(f"{self.PROVIDER_NAME} bulk lookup found none of the {len(isbns)} ISBNs.")
+                return {"total": 0, "requested": len(isbns), "data": []}
+            raise
 
 if __name__ == "__main__":
     import sys
@@ -287,59 +242,59 @@ if __name__ == "__main__":
         sys.exit(1) # Exit cleanly
     else:
         # Client initialization and test calls
-        try:
-            client = IsbnDbClient(api_key=API_KEY, base_url=BASE_URL)
-            # ... (The actual test calls: Test 1, Test 2, Test 3 remain the same) ...
-
-            # --- Test 1: Search ---
-            logger.info("\n--- Testing Book Search ---")
-            search_query = "Designing Data-Intensive Applications"
-            try:
-                results = client.search_books(search_query, page_size=5)
-                logger.info(f"Search results for '{search_query}':")
-                logger.info(f"\n{json.dumps(results, indent=2)}") # Log the JSON directly
-                total_found = results.get('total')
-                if total_found is not None:
-                     logger.info(f"Total found: {total_found}")
-                if total_found and total_found > 5:
-                     # Test pagination
-                     logger.info("\n--- Testing Pagination (Page 2) ---")
-                     results_p2 = client.search_books(search_query, page=2, page_size=5)
-                     logger.info(f"Search results for '{search_query}' (Page 2):")
-                     logger.info(f"\n{json.dumps(results_p2, indent=2)}")
-
-            except ProviderApiError as e:
-                logger.error(f"Search failed: {e}")
-            except ValueError as e:
-                logger.error(f"Input validation error during search: {e}")
-
-
-            # --- Test 2: Get by ISBN ---
-            logger.info("\n--- Testing Get Book by ISBN ---")
-            test_isbn = "9781449373320"
-            try:
-                book_details = client.get_book_by_isbn(test_isbn)
-                logger.info(f"Details for ISBN {test_isbn}:")
-                logger.info(f"\n{json.dumps(book_details, indent=2)}")
-            except ProviderApiError as e:
-                 logger.error(f"Get by ISBN failed: {e}")
-                 if e.status_code == 404:
-                      logger.warning(f"ISBN {test_isbn} might not exist in ISBNDB.")
-            except ValueError as e:
-                logger.error(f"Input validation error during get by ISBN: {e}")
-
-             # --- Test 3: Get non-existent ISBN ---
-            logger.info("\n--- Testing Get Non-Existent ISBN ---")
-            test_isbn_bad = "0000000000"
-            try:
-                book_details_bad = client.get_book_by_isbn(test_isbn_bad)
-                logger.info(f"Details for ISBN {test_isbn_bad}: {book_details_bad}")
-            except ProviderApiError as e:
-                 logger.error(f"Get by ISBN failed as expected for {test_isbn_bad}: {e}")
-                 if e.status_code == 404:
-                      logger.success(f"Received 404 Not Found for non-existent ISBN {test_isbn_bad}, as expected.")
+        async def run_smoke_tests():
+            async with IsbnDbClient(api_key=API_KEY, base_url=BASE_URL) as client:
+                # --- Test 1: Search ---
+                logger.info("\n--- Testing Book Search ---")
+                search_query = "Designing Data-Intensive Applications"
+                try:
+                    results = await client.search_books(search_query, page_size=5)
+                    logger.info(f"Search results for '{search_query}':")
+                    logger.info(f"\n{json.dumps(results, indent=2)}") # Log the JSON directly
+                    total_found = results.get('total')
+                    if total_found is not None:
+                         logger.info(f"Total found: {total_found}")
+                    if total_found and total_found > 5:
+                         # Test pagination
+                         logger.info("\n--- Testing Pagination (Page 2) ---")
+                         results_p2 = await client.search_books(search_query, page=2, page_size=5)
+                         logger.info(f"Search results for '{search_query}' (Page 2):")
+                         logger.info(f"\n{json.dumps(results_p2, indent=2)}")
+
+                except ProviderApiError as e:
+                    logger.error(f"Search failed: {e}")
+                except ValueError as e:
+                    logger.error(f"Input validation error during search: {e}")
+
+
+                # --- Test 2: Get by ISBN ---
+                logger.info("\n--- Testing Get Book by ISBN ---")
+                test_isbn = "9781449373320"
+                try:
+                    book_details = await client.get_book_by_isbn(test_isbn)
+                    logger.info(f"Details for ISBN {test_isbn}:")
+                    logger.info(f"\n{json.dumps(book_details, indent=2)}")
+                except ProviderApiError as e:
+                     logger.error(f"Get by ISBN failed: {e}")
+                     if e.status_code == 404:
+                          logger.warning(f"ISBN {test_isbn} might not exist in ISBNDB.")
+                except ValueError as e:
+                    logger.error(f"Input validation error during get by ISBN: {e}")
+
+                 # --- Test 3: Get non-existent ISBN ---
+                logger.info("\n--- Testing Get Non-Existent ISBN ---")
+                test_isbn_bad = "0000000000"
+                try:
+                    book_details_bad = await client.get_book_by_isbn(test_isbn_bad)
+                    logger.info(f"Details for ISBN {test_isbn_bad}: {book_details_bad}")
+                except ProviderApiError as e:
+                     logger.error(f"Get by ISBN failed as expected for {test_isbn_bad}: {e}")
+                     if e.status_code == 404:
+                          logger.success(f"Received 404 Not Found for non-existent ISBN {test_isbn_bad}, as expected.")
 
+        try:
+            asyncio.run(run_smoke_tests())
         except ConfigurationError as e:
              logger.error(f"Client Initialization failed: {e}")
         except Exception as e:
-             logger.exception(f"An unexpected error occurred during testing:") # logger.exception includes traceback
\ No newline at end of file
+             logger.exception(f"An unexpected error occurred during testing:") # logger.exception includes traceback
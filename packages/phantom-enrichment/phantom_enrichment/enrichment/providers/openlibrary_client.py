@@ -0,0 +1,196 @@
+# phantom_enrichment/enrichment/providers/openlibrary_client.py
+
+import asyncio
+import json
+from loguru import logger
+from typing import Dict, Any, List, Optional
+
+from phantom_enrichment.enrichment.providers.base import BaseProviderClient
+from phantom_enrichment.enrichment.response_cache import ResponseCache
+from phantom_enrichment.utils.helpers import normalize_isbn, to_isbn13
+
+class OpenLibraryClient(BaseProviderClient):
+    """
+    Asynchronous client for the Open Library Search and Books APIs.
+
+    Open Library needs no API key, but asks clients to identify themselves with a
+    User-Agent and to keep the request rate low. Responses are flattened into
+    ISBNDB-like edition records ('title', 'authors', 'isbn13', 'publisher', ...)
+    so both providers share the Orchestrator's matching and extraction logic.
+    """
+    PROVIDER_NAME = "OPENLIBRARY"
+    DEFAULT_REQUESTS_PER_SECOND = 1.0
+    # Bibkeys are passed in the query string, so keep batches modest
+    DEFAULT_BULK_BATCH_SIZE = 50
+    MAX_PAGE_SIZE = 100
+    USER_AGENT = "phantom-enrichment (https://github.com/pabloagn/phantom)"
+    COVERS_URL = "https://covers.openlibrary.org/b/id/{cover_id}-{size}.jpg"
+
+    # Work-level fields plus the best-matching edition of each work
+    SEARCH_FIELDS = ",".join([
+        "key", "title", "subtitle", "author_name", "isbn", "publisher", "first_publish_year",
+        "number_of_pages_median", "language", "subject", "cover_i",
+        "editions", "editions.key", "editions.title", "editions.subtitle", "editions.isbn",
+        "editions.publisher", "editions.publish_date", "editions.language", "editions.cover_i",
+    ])
+
+    def _get_headers(self) -> Dict[str, str]:
+        """Returns the default headers, identifying the application."""
+        return {"Accept": "application/json", "User-Agent": self.USER_AGENT}
+
+    @staticmethod
+    def _first(values: Any) -> Optional[Any]:
+        """Returns the first element of a list value (or the value itself if scalar)."""
+        if isinstance(values, list):
+            return values[0] if values else None
+        return values
+
+    @staticmethod
+    def _split_isbns(isbns: Optional[List[str]]) -> tuple[Optional[str], Optional[str]]:
+        """Returns the first ISBN-13 and the first ISBN-10 from a list of ISBNs."""
+        isbn13 = isbn10 = None
+        for raw_isbn in isbns or []:
+            isbn = normalize_isbn(raw_isbn)
+            if isbn and len(isbn) == 13 and isbn13 is None:
+                isbn13 = isbn
+            elif isbn and len(isbn) == 10 and isbn10 is None:
+                isbn10 = isbn
+        return isbn13, isbn10
+
+    def _cover_urls(self, cover_id: Optional[int]) -> tuple[Optional[str], Optional[str]]:
+        """Builds medium and large cover URLs for a cover id."""
+        if not cover_id:
+            return None, None
+        return (self.COVERS_URL.format(cover_id=cover_id, size="M"),
+                self.COVERS_URL.format(cover_id=cover_id, size="L"))
+
+    def _search_doc_to_record(self, doc: Dict[str, Any]) -> Dict[str, Any]:
+        """Flattens a search result (a work and its best-matching edition) into an edition record."""
+        editions = (doc.get("editions") or {}).get("docs") or []
+        edition = editions[0] if editions else {}
+
+        title = edition.get("title") or doc.get("title")
+        subtitle = edition.get("subtitle") or doc.get("subtitle")
+        isbn13, isbn10 = self._split_isbns(edition.get("isbn") or doc.get("isbn"))
+        image, image_original = self._cover_urls(edition.get("cover_i") or doc.get("cover_i"))
+        return {
+            "key": edition.get("key") or doc.get("key"),
+            "work_key": doc.get("key"),
+            "title": title,
+            "title_long": f"{title}: {subtitle}" if title and subtitle else title,
+            "authors": doc.get("author_name") or [],
+            "isbn13": isbn13,
+            "isbn10": isbn10,
+            "publisher": self._first(edition.get("publisher") or doc.get("publisher")),
+            "date_published": self._first(edition.get("publish_date")) or doc.get("first_publish_year"),
+            "pages": doc.get("number_of_pages_median"),
+            "language": self._first(edition.get("language") or doc.get("language")),
+            "subjects": doc.get("subject") or [],
+            "image": image,
+            "image_original": image_original,
+        }
+
+    def _book_data_to_record(self, isbn13: str, book: Dict[str, Any]) -> Dict[str, Any]:
+        """Flattens a Books API (jscmd=data) entry into an edition record."""
+        identifiers = book.get("identifiers") or {}
+        record_isbn13, _ = self._split_isbns(identifiers.get("isbn_13"))
+        _, isbn10 = self._split_isbns(identifiers.get("isbn_10"))
+        title, subtitle = book.get("title"), book.get("subtitle")
+        cover = book.get("cover") or {}
+        return {
+            "key": book.get("key"),
+            "title": title,
+            "title_long": f"{title}: {subtitle}" if title and subtitle else title,
+            "authors": [author.get("name") for author in book.get("authors", []) if author.get("name")],
+            "isbn13": record_isbn13 or isbn13,
+            "isbn10": isbn10,
+            "publisher": self._first([publisher.get("name") for publisher in book.get("publishers", [])]),
+            "date_published": book.get("publish_date"),
+            "pages": book.get("number_of_pages"),
+            "subjects": [subject.get("name") for subject in book.get("subjects", []) if subject.get("name")],
+            "image": cover.get("medium"),
+            "image_original": cover.get("large"),
+        }
+
+    async def search_books(self, query: str, page: int = 1, page_size: int = 20) -> Dict[str, Any]:
+        """
+        Searches for books using the GET /search.json endpoint.
+
+        Args:
+            query: The search query string (e.g., "Title Author").
+            page: The page number to retrieve (1-based).
+            page_size: The number of works per page.
+
+        Returns:
+            {"total": int, "books": [record, ...]}, one record per matching work.
+
+        Raises:
+            ProviderApiError: If the API request fails.
+            ValueError: If page or page_size are invalid.
+        """
+        self._validate_search_params(query, page, page_size)
+
+        cache_key = ResponseCache.make_key('search', query=query, page=page, page_size=page_size)
+        if self.cache is not None:
+            hit, cached_response = self.cache.get(self.PROVIDER_NAME, cache_key)
+            if hit:
+                logger.debug(f"Cache hit for {self.PROVIDER_NAME} search query='{query}', page={page}, limit={page_size}")
+                return cached_response if cached_response is not None else {"total": 0, "books": []}
+
+        logger.info(f"Searching {self.PROVIDER_NAME} for query='{query}', page={page}, limit={page_size}")
+        params = {'q': query, 'page': page, 'limit': page_size, 'fields': self.SEARCH_FIELDS}
+        raw_response = await self._make_request('GET', '/search.json', params=params)
+
+        response = {
+            "total": raw_response.get("numFound", 0),
+            "books": [self._search_doc_to_record(doc) for doc in raw_response.get("docs", [])]
+        }
+        if self.cache is not None:
+            is_negative = not response["books"]
+            self.cache.set(self.PROVIDER_NAME, cache_key, None if is_negative else response, is_negative=is_negative)
+        return response
+
+    async def get_books_by_isbns_bulk(self, isbns: List[str]) -> Dict[str, Any]:
+        """
+        Retrieves multiple books in one call using the GET /api/books endpoint.
+
+        Args:
+            isbns: ISBNs (10 or 13) to look up.
+
+        Returns:
+            {"total": int, "requested": int, "data": [record, ...]}; ISBNs that
+            were not found are simply absent.
+
+        Raises:
+            ProviderApiError: If the API request fails.
+        """
+        if not isbns:
+            return {"total": 0, "requested": 0, "data": []}
+
+        bibkeys = ",".join(f"ISBN:{isbn}" for isbn in isbns)
+        logger.info(f"Fetching bulk book details from {self.PROVIDER_NAME} for {len(isbns)} ISBNs.")
+        raw_response = await self._make_request(
+            'GET',
+            '/api/books',
+            params={'bibkeys': bibkeys, 'format': 'json', 'jscmd': 'data'}
+        )
+
+        books = []
+        for bibkey, book in raw_response.items():
+            isbn13 = to_isbn13(bibkey.split(":", 1)[-1])
+            books.append(self._book_data_to_record(isbn13, book))
+        return {"total": len(books), "requested": len(isbns), "data": books}
+
+if __name__ == "__main__":
+    # --- Smoke test against the live API (no key required) ---
+    async def run_smoke_tests():
+        async with OpenLibraryClient(base_url="https://openlibrary.org") as client:
+            logger.info("\n--- Testing Book Search ---")
+            results = await client.search_books("Austerlitz Sebald", page_size=3)
+            logger.info(f"\n{json.dumps(results, indent=2)}")
+
+            logger.info("\n--- Testing Bulk ISBN Lookup ---")
+            results = await client.get_books_by_isbns_bulk(["9780375756566", "0000000000"])
+            logger.info(f"\n{json.dumps(results, indent=2)}")
+
+    asyncio.run(run_smoke_tests())
@@ -0,0 +1,81 @@
+# phantom_enrichment/enrichment/rate_limiter.py
+
+import asyncio
+import time
+from typing import Optional
+from loguru import logger
+
+
+class TokenBucket:
+    """
+    Asynchronous token-bucket rate limiter.
+
+    Tokens refill continuously at `rate` per second up to `capacity`. Each call to
+    `acquire` consumes tokens, waiting until enough are available. A single bucket
+    is meant to be shared by every concurrent task talking to the same provider.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None, name: str = "limiter"):
+        """
+        Initializes the token bucket.
+
+        Args:
+            rate: Tokens added per second (i.e. sustained requests per second).
+            capacity: Maximum number of tokens held (burst size). Defaults to max(1, rate).
+            name: Name used in log messages.
+        """
+        if rate <= 0:
+            raise ValueError("Rate must be greater than 0.")
+        self.rate = float(rate)
+        self.capacity = float(capacity) if capacity is not None else max(1.0, self.rate)
+        if self.capacity < 1:
+            raise ValueError("Capacity must be at least 1 token.")
+        self.name = name
+
+        # Start with a single token so the first request goes out immediately
+        # without allowing a full burst right at startup.
+        self._tokens = 1.0
+        self._last_refill = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _refill(self) -> None:
+        """Adds the tokens accrued since the last refill."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Waits until `tokens` are available and consumes them.
+
+        Args:
+            tokens: Number of tokens to consume.
+
+        Returns:
+            The number of seconds spent waiting.
+        """
+        if tokens > self.capacity:
+            raise ValueError(f"Cannot acquire {tokens} tokens from a bucket with capacity {self.capacity}.")
+
+        # Created lazily so the bucket binds to the running event loop
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        waited = 0.0
+        # The lock serializes waiters so tokens are handed out in FIFO order
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    break
+                delay = (tokens - self._tokens) / self.rate
+                logger.trace(f"{self.name}: waiting {delay:.3f}s for {tokens} token(s).")
+                await asyncio.sleep(delay)
+                waited += delay
+        return waited
+
+    def reset(self) -> None:
+        """Drops loop-bound state so the bucket can be reused from a new event loop."""
+        self._lock = None
@@ -0,0 +1,159 @@
+# phantom_enrichment/enrichment/response_cache.py
+
+import hashlib
+import json
+import sqlite3
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from loguru import logger
+
+from phantom_enrichment.utils.exceptions import DataSourceError
+from phantom_enrichment.utils.normalization import normalize_string
+
+
+class ResponseCache:
+    """
+    Persistent SQLite cache for provider API responses.
+
+    Entries are keyed by provider, operation and normalized request parameters.
+    Each provider has its own TTL, and empty/not-found results are cached
+    separately ("negative caching") with their own, usually shorter, TTL.
+    With `refresh=True` the cache is write-only: lookups always miss, but fresh
+    responses still replace the stored ones.
+    """
+
+    DEFAULT_TTL = 30 * 24 * 3600.0 # seconds
+    DEFAULT_NEGATIVE_TTL = 3 * 24 * 3600.0 # seconds
+
+    def __init__(
+        self,
+        db_path: Path,
+        ttls: Optional[Dict[str, float]] = None,
+        negative_ttls: Optional[Dict[str, float]] = None,
+        refresh: bool = False
+    ):
+        """
+        Initializes the response cache.
+
+        Args:
+            db_path: Path of the SQLite database file (created if missing).
+            ttls: Per-provider time-to-live in seconds for positive results.
+            negative_ttls: Per-provider time-to-live in seconds for empty/not-found results.
+            refresh: If True, ignore stored entries on read (but still write new ones).
+        """
+        self.db_path = Path(db_path)
+        self.ttls = ttls or {}
+        self.negative_ttls = negative_ttls or {}
+        self.refresh = refresh
+        self.stats: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Opens the database lazily and ensures the schema exists."""
+        if self._conn is None:
+            try:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    " provider TEXT NOT NULL,"
+                    " key TEXT NOT NULL,"
+                    " payload TEXT,"
+                    " is_negative INTEGER NOT NULL,"
+                    " created_at REAL NOT NULL,"
+                    " PRIMARY KEY (provider, key))"
+                )
+            except (OSError, sqlite3.Error) as e:
+                raise DataSourceError(f"Failed to open response cache at {self.db_path}: {e}") from e
+            logger.info(f"Response cache opened at {self.db_path}{' (refresh mode)' if self.refresh else ''}")
+        return self._conn
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    @staticmethod
+    def make_key(operation: str, **params: Any) -> str:
+        """
+        Builds a stable cache key from an operation name and its parameters.
+
+        String parameters are normalized so that trivially different queries
+        (case, accents, punctuation, spacing) share an entry.
+        """
+        normalized = {
+            name: normalize_string(value) if isinstance(value, str) else value
+            for name, value in params.items()
+        }
+        raw_key = json.dumps({"op": operation, **normalized}, sort_keys=True)
+        return hashlib.sha1(raw_key.encode("utf-8")).hexdigest()
+
+    def get(self, provider: str, key: str) -> Tuple[bool, Optional[Any]]:
+        """
+        Looks up a cached response.
+
+        Returns:
+            A tuple (hit, payload). On a negative hit the payload is None.
+        """
+        if self.refresh:
+            self.stats[provider]["misses"] += 1
+            return False, None
+
+        row = self._connect().execute(
+            "SELECT payload, is_negative, created_at FROM responses WHERE provider = ? AND key = ?",
+            (provider, key)
+        ).fetchone()
+
+        if row is not None:
+            payload, is_negative, created_at = row
+            ttl = (self.negative_ttls.get(provider, self.DEFAULT_NEGATIVE_TTL) if is_negative
+                   else self.ttls.get(provider, self.DEFAULT_TTL))
+            if time.time() - created_at <= ttl:
+                self.stats[provider]["negative_hits" if is_negative else "hits"] += 1
+                return True, None if is_negative else json.loads(payload)
+
+        self.stats[provider]["misses"] += 1
+        return False, None
+
+    def set(self, provider: str, key: str, payload: Optional[Any], is_negative: bool = False) -> None:
+        """Stores (or replaces) a response. Negative entries may have a None payload."""
+        try:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO responses (provider, key, payload, is_negative, created_at) VALUES (?, ?, ?, ?, ?)",
+                (provider, key, None if payload is None else json.dumps(payload), int(is_negative), time.time())
+            )
+            self.stats[provider]["writes"] += 1
+        except sqlite3.Error as e:
+            # A cache write failure must never fail the enrichment itself
+            logger.warning(f"Failed to write {provider} response to cache: {e}")
+
+    def purge_expired(self) -> int:
+        """Deletes entries older than their provider's TTL. Returns the number of rows removed."""
+        conn = self._connect()
+        now = time.time()
+        removed = 0
+        providers = [row[0] for row in conn.execute("SELECT DISTINCT provider FROM responses")]
+        for provider in providers:
+            ttl = self.ttls.get(provider, self.DEFAULT_TTL)
+            negative_ttl = self.negative_ttls.get(provider, self.DEFAULT_NEGATIVE_TTL)
+            cursor = conn.execute(
+                "DELETE FROM responses WHERE provider = ? AND "
+                "((is_negative = 0 AND created_at < ?) OR (is_negative = 1 AND created_at < ?))",
+                (provider, now - ttl, now - negative_ttl)
+            )
+            removed += cursor.rowcount
+        if removed:
+            logger.info(f"Purged {removed} expired response cache entries.")
+        return removed
+
+    def totals(self) -> Dict[str, int]:
+        """Aggregated statistics across all providers."""
+        totals: Dict[str, int] = defaultdict(int)
+        for provider_stats in self.stats.values():
+            for name, count in provider_stats.items():
+                totals[name] += count
+        return dict(totals)
@@ -0,0 +1,80 @@
+# phantom_enrichment/models/run_summary.py
+
+import time
+from loguru import logger
+from pydantic import BaseModel, Field
+
+
+class EnrichmentRunSummary(BaseModel):
+    """
+    Counters collected during one enrichment run and reported when it finishes.
+
+    Row and request counters are summed over all providers queried in the run.
+    """
+
+    requests_per_second: float = Field(1.0, gt=0, description="Provider rate limit used to estimate time savings.")
+    started_at: float = Field(default_factory=time.monotonic)
+
+    # --- Rows ---
+    rows_total: int = 0
+    rows_resumed: int = 0
+    rows_with_isbn: int = 0
+    rows_resolved_by_isbn: int = 0
+    rows_text_searched: int = 0
+
+    # --- Requests ---
+    bulk_requests: int = 0
+    search_requests: int = 0
+    search_pages_beyond_first: int = 0
+
+    # --- Response cache ---
+    cache_hits: int = 0
+    cache_negative_hits: int = 0
+    cache_misses: int = 0
+
+    # --- Multi-provider merge ---
+    editions_merged: int = 0
+
+    @property
+    def total_requests(self) -> int:
+        """Total provider requests issued (excluding retries)."""
+        return self.bulk_requests + self.search_requests
+
+    @property
+    def search_requests_per_row(self) -> float:
+        """Average search requests (pages) per text-searched row."""
+        return self.search_requests / self.rows_text_searched if self.rows_text_searched else 0.0
+
+    @property
+    def network_requests(self) -> int:
+        """Requests that actually reached the provider (cache hits excluded)."""
+        return self.total_requests - self.cache_hits - self.cache_negative_hits
+
+    @property
+    def requests_saved(self) -> int:
+        """Requests avoided by bulk ISBN lookups versus one text search per row."""
+        return max(self.rows_resolved_by_isbn - self.bulk_requests, 0)
+
+    @property
+    def estimated_time_saved(self) -> float:
+        """Rate-limited wall time (seconds) saved by the avoided requests."""
+        return self.requests_saved / self.requests_per_second
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the run started."""
+        return time.monotonic() - self.started_at
+
+    def log_summary(self) -> None:
+        """Logs the run summary."""
+        logger.info("--- Enrichment Run Summary ---")
+        logger.info(f"Rows: {self.rows_total} total, {self.rows_resumed} resumed from journal, {self.rows_with_isbn} with ISBN, "
+                    f"{self.rows_resolved_by_isbn} resolved by ISBN, {self.rows_text_searched} text-searched")
+        logger.info(f"Requests: {self.total_requests} total ({self.bulk_requests} bulk ISBN, {self.search_requests} search)")
+        logger.info(f"Search paging: {self.search_requests_per_row:.2f} requests per searched row "
+                    f"({self.search_pages_beyond_first} page(s) beyond the first)")
+        logger.info(f"Cache: {self.cache_hits} hits, {self.cache_negative_hits} negative hits, {self.cache_misses} misses "
+                    f"({self.network_requests} requests sent to the provider)")
+        logger.info(f"Merge: {self.editions_merged} duplicate edition record(s) combined across providers")
+        logger.info(f"Bulk lookups saved {self.requests_saved} requests (~{self.estimated_time_saved:.1f}s at {self.requests_per_second:g} req/s)")
+        logger.info(f"Elapsed: {self.elapsed:.1f}s")
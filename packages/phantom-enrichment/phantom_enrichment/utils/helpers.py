@@ -1,68 +1,71 @@
 # phantom_enrichment/utils/helpers.py
 
 import re
-import unicodedata
 from typing import Optional
 
-def normalize_string(text: Optional[str]) -> str:
+# normalize_string lives in the normalization module; re-exported here for existing callers
+from phantom_enrichment.utils.normalization import normalize_string, book_id_from_normalized
+
+def generate_book_id(title: Optional[str], author: Optional[str]) -> str:
     """
-    Normalizes a string for comparison:
-    - Converts to lowercase.
-    - Removes common punctuation.
-    - Normalizes unicode characters (e.g., accents).
-    - Collapses multiple whitespace characters.
-    - Handles potential None input.
+    Generates the standardized Book ID (B-TITLE|AUTHOR).
+
+    For whole input columns, prefer normalization.normalize_series together
+    with normalization.book_id_series.
 
     Args:
-        text: The input string or None.
+        title: The book title from the input source.
+        author: The book author from the input source.
 
     Returns:
-        The normalized string, or an empty string if input was None.
+        The generated Book ID string.
     """
-    if text is None:
-        return ""
-
-    # Normalize unicode characters (e.g., convert accented chars to base)
-    # NFKD decomposes characters, then encode/decode removes combining marks
-    try:
-        text = unicodedata.normalize('NFKD', str(text))
-        text = text.encode('ASCII', 'ignore').decode('ASCII')
-    except Exception:
-        # Fallback if complex unicode causes issues, just lowercase
-         pass # Keep original text if normalization fails catastrophically
-
-    # Convert to lowercase
-    text = text.lower()
-
-    # Remove common punctuation (keep spaces and alphanumeric)
-    # Allows basic characters, removes most symbols
-    text = re.sub(r'[^\w\s-]', '', text) # Keep word chars, whitespace, hyphens
+    return book_id_from_normalized(normalize_string(title), normalize_string(author))
 
-    # Replace multiple whitespace characters with a single space
-    text = re.sub(r'\s+', ' ', text).strip()
+def normalize_isbn(isbn: Optional[str]) -> Optional[str]:
+    """
+    Normalizes an ISBN-10 or ISBN-13 by stripping separators.
 
-    return text
+    Args:
+        isbn: The raw ISBN value (may contain hyphens/spaces, may be numeric from Excel).
 
-def generate_book_id(title: Optional[str], author: Optional[str]) -> str:
+    Returns:
+        The compact ISBN (digits, plus a trailing 'X' for ISBN-10), or None if the
+        value does not look like an ISBN.
     """
-    Generates the standardized Book ID (B-TITLE|AUTHOR).
+    if isbn is None:
+        return None
+    # Excel often yields floats for numeric ISBN cells (e.g. 9781449373320.0)
+    if isinstance(isbn, float):
+        if isbn != isbn: # NaN
+            return None
+        isbn = f"{isbn:.0f}"
+    compact = re.sub(r'[\s-]', '', str(isbn)).upper()
+    if re.fullmatch(r'\d{13}', compact) or re.fullmatch(r'\d{9}[\dX]', compact):
+        return compact
+    return None
+
+def isbn10_to_isbn13(isbn10: str) -> str:
+    """
+    Converts a compact ISBN-10 to its ISBN-13 form (978 prefix, recomputed check digit).
 
     Args:
-        title: The book title from the input source.
-        author: The book author from the input source.
+        isbn10: A normalized ISBN-10.
 
     Returns:
-        The generated Book ID string.
+        The equivalent ISBN-13.
     """
-    norm_title = re.sub(r'\s+', '', normalize_string(title)).upper()
-    # Special handling for author: maybe take only first part if "Surname, Name"
-    norm_author = normalize_string(author)
-    # Simple split on comma for "Surname, Name" format
-    if ',' in norm_author:
-         norm_author = norm_author.split(',')[0].strip()
-    norm_author = re.sub(r'\s+', '', norm_author).upper()
+    core = "978" + isbn10[:9]
+    total = sum(int(digit) * (1 if i % 2 == 0 else 3) for i, digit in enumerate(core))
+    check_digit = (10 - total % 10) % 10
+    return f"{core}{check_digit}"
 
-    return f"B-{norm_title}|{norm_author}"
+def to_isbn13(isbn: Optional[str]) -> Optional[str]:
+    """Normalizes an ISBN and returns its ISBN-13 form, or None if it is not a valid-looking ISBN."""
+    compact = normalize_isbn(isbn)
+    if compact is None:
+        return None
+    return compact if len(compact) == 13 else isbn10_to_isbn13(compact)
 
 
 if __name__ == '__main__':
@@ -78,4 +81,8 @@ if __name__ == '__main__':
 
     print(f"Book ID for ' Austerlitz ', ' Sebald, W.G. ': '{generate_book_id(' Austerlitz ', ' Sebald, W.G. ')}'")
     print(f"Book ID for 'J R', 'Gaddis, William': '{generate_book_id('J R', 'Gaddis, William')}'")
-    print(f"Book ID for 'JR', 'William Gaddis': '{generate_book_id('JR', 'William Gaddis')}'")
\ No newline at end of file
+    print(f"Book ID for 'JR', 'William Gaddis': '{generate_book_id('JR', 'William Gaddis')}'")
+
+    print(f"ISBN '978-1-4493-7332-0' -> '{normalize_isbn('978-1-4493-7332-0')}'")
+    print(f"ISBN 9781449373320.0 -> '{normalize_isbn(9781449373320.0)}'")
+    print(f"ISBN-10 '1449373321' -> ISBN-13 '{to_isbn13('1449373321')}'")
\ No newline at end of file
@@ -6,10 +6,18 @@ from phantom_enrichment.config.settings import settings
 
 # Flag to prevent duplicate setup if this module is imported multiple times
 _logging_configured = False
+# Handler id and level of the console sink, so it can be redirected (e.g. by the live dashboard)
+_console_handler_id = None
+_console_level = "INFO"
+CONSOLE_FORMAT = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
+    "<level>{level: <8}</level> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
+)
 
 def setup_logging():
     """Configures the Loguru logger with console and file sinks."""
-    global _logging_configured
+    global _logging_configured, _console_handler_id, _console_level
     if _logging_configured:
         # logger.trace("Logging already configured.") # Optional: trace log for debugging
         return
@@ -29,14 +37,11 @@ def setup_logging():
     logger.remove() # Remove default handler to avoid duplicates
 
     # Console Sink
-    logger.add(
+    _console_level = log_level
+    _console_handler_id = logger.add(
         sys.stderr,
         level=log_level,
-        format=(
-            "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
-            "<level>{level: <8}</level> | "
-            "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
-        ),
+        format=CONSOLE_FORMAT,
         colorize=True,
     )
 
@@ -57,6 +62,28 @@ def setup_logging():
     _logging_configured = True
     logger.info(f"Logging configured. Level: {log_level}. Outputting to console and file: {log_file}")
 
+def set_console_sink(sink=None, colorize: bool = True) -> None:
+    """
+    Redirects the console sink, keeping its level and format.
+
+    Args:
+        sink: Any Loguru sink (e.g. a callable printing above a live display).
+              None restores the default stderr sink.
+        colorize: Whether the sink receives colorized messages.
+    """
+    global _console_handler_id
+    if _console_handler_id is not None:
+        try:
+            logger.remove(_console_handler_id)
+        except ValueError:
+            pass # Already removed elsewhere
+    _console_handler_id = logger.add(
+        sink if sink is not None else sys.stderr,
+        level=_console_level,
+        format=CONSOLE_FORMAT,
+        colorize=colorize if sink is not None else True,
+    )
+
 # --- Configure logging when the module is first imported ---
 # This ensures it runs once when the application starts or settings are imported.
 try:
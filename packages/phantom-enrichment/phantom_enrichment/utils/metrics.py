@@ -0,0 +1,168 @@
+# phantom_enrichment/utils/metrics.py
+
+import json
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+import numpy as np
+from loguru import logger
+
+from phantom_enrichment.utils.exceptions import DataSourceError
+
+
+@dataclass(frozen=True)
+class RequestSample:
+    """Timing of one logical provider request (all of its retries included)."""
+    provider: str
+    method: str
+    endpoint: str
+    status_code: Optional[int]
+    latency: float          # seconds from the call until the result (or error)
+    limiter_wait: float     # seconds spent waiting for rate-limiter tokens
+    network_time: float     # seconds spent in HTTP round trips
+    retries: int
+    failed: bool
+
+
+class EnrichmentMetrics:
+    """
+    Structured instrumentation for one enrichment run.
+
+    Provider clients record every request (latency split into rate-limiter wait
+    and network time, retries, failures); the Orchestrator records finished rows,
+    candidate counts and stage timings. The live dashboard reads it while the run
+    is in progress, and `summary()` / `write_json()` report it at the end.
+    """
+
+    PERCENTILES = (50, 90, 99)
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self, total_rows: int = 0, providers: Optional[List[str]] = None) -> None:
+        """Clears all samples and starts a new run."""
+        self.total_rows = total_rows
+        self.providers: List[str] = list(providers or [])
+        self.started_at = time.monotonic()
+        self.started_at_wall = datetime.now(timezone.utc)
+        self.finished_at: Optional[float] = None
+        self.requests: List[RequestSample] = []
+        self.rows_done: Dict[str, int] = defaultdict(int)
+        self.rows_matched: Dict[str, int] = defaultdict(int)
+        self.rows_failed: Dict[str, int] = defaultdict(int)
+        self.rows_resumed: Dict[str, int] = defaultdict(int)
+        self.candidate_counts: Dict[str, List[int]] = defaultdict(list)
+        self.stage_seconds: Dict[str, float] = defaultdict(float)
+        self.stage_calls: Dict[str, int] = defaultdict(int)
+
+    def finish(self) -> None:
+        """Marks the end of the run."""
+        self.finished_at = time.monotonic()
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the run started (until it finished, if it did)."""
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    # --- Recording ---
+
+    def record_request(self, sample: RequestSample) -> None:
+        """Records one provider request."""
+        self.requests.append(sample)
+
+    def record_row(self, provider: str, matched: bool, failed: bool = False, resumed: bool = False) -> None:
+        """Records that a provider finished an input row."""
+        self.rows_done[provider] += 1
+        if matched:
+            self.rows_matched[provider] += 1
+        if failed:
+            self.rows_failed[provider] += 1
+        if resumed:
+            self.rows_resumed[provider] += 1
+
+    def record_candidates(self, provider: str, count: int) -> None:
+        """Records the number of candidates a search returned."""
+        self.candidate_counts[provider].append(count)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Accumulates the wall time spent inside the block under `name`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stage_seconds[name] += time.perf_counter() - start
+            self.stage_calls[name] += 1
+
+    # --- Reporting ---
+
+    @classmethod
+    def _distribution(cls, values: List[float], scale: float = 1.0) -> Dict[str, float]:
+        """Mean, percentiles and max of a list of values (scaled, e.g. seconds to ms)."""
+        if not values:
+            return {}
+        array = np.asarray(values, dtype=float) * scale
+        distribution = {"mean": round(float(array.mean()), 2)}
+        for percentile, value in zip(cls.PERCENTILES, np.percentile(array, cls.PERCENTILES)):
+            distribution[f"p{percentile}"] = round(float(value), 2)
+        distribution["max"] = round(float(array.max()), 2)
+        return distribution
+
+    def provider_stats(self, provider: str) -> Dict[str, Any]:
+        """Aggregated statistics for one provider."""
+        samples = [sample for sample in list(self.requests) if sample.provider == provider]
+        total_latency = sum(sample.latency for sample in samples)
+        total_wait = sum(sample.limiter_wait for sample in samples)
+        total_network = sum(sample.network_time for sample in samples)
+        processed = self.rows_done[provider] - self.rows_resumed[provider]
+        candidates = list(self.candidate_counts[provider])
+        return {
+            "rows_done": self.rows_done[provider],
+            "rows_resumed": self.rows_resumed[provider],
+            "rows_matched": self.rows_matched[provider],
+            "rows_failed": self.rows_failed[provider],
+            "match_rate": round(self.rows_matched[provider] / self.rows_done[provider], 4) if self.rows_done[provider] else None,
+            "rows_per_minute": round(processed / self.elapsed * 60, 2) if self.elapsed > 0 else None,
+            "requests": len(samples),
+            "failed_requests": sum(sample.failed for sample in samples),
+            "retries": sum(sample.retries for sample in samples),
+            "status_codes": dict(sorted(Counter(str(sample.status_code) for sample in samples).items())),
+            "latency_ms": self._distribution([sample.latency for sample in samples], 1000),
+            "limiter_wait_ms": self._distribution([sample.limiter_wait for sample in samples], 1000),
+            "network_ms": self._distribution([sample.network_time for sample in samples], 1000),
+            "limiter_wait_seconds": round(total_wait, 3),
+            "network_seconds": round(total_network, 3),
+            "limiter_wait_share": round(total_wait / total_latency, 4) if total_latency else None,
+            "network_share": round(total_network / total_latency, 4) if total_latency else None,
+            "candidates_per_search": {"searches": len(candidates), **self._distribution(candidates)},
+        }
+
+    def summary(self) -> Dict[str, Any]:
+        """Returns the run metrics as a JSON-serializable dictionary."""
+        providers = self.providers or sorted({sample.provider for sample in self.requests})
+        return {
+            "started_at": self.started_at_wall.isoformat(),
+            "elapsed_seconds": round(self.elapsed, 3),
+            "total_rows": self.total_rows,
+            "providers": {provider: self.provider_stats(provider) for provider in providers},
+            "stages": {
+                name: {"seconds": round(seconds, 3), "calls": self.stage_calls[name]}
+                for name, seconds in self.stage_seconds.items()
+            },
+        }
+
+    def write_json(self, path: Path, extra: Optional[Dict[str, Any]] = None) -> None:
+        """Writes the summary (plus optional extra sections) to a JSON file."""
+        report = self.summary()
+        if extra:
+            report.update(extra)
+        try:
+            Path(path).write_text(json.dumps(report, indent=2, default=str), encoding="utf-8")
+        except OSError as e:
+            raise DataSourceError(f"Failed to write metrics summary to {path}: {e}") from e
+        logger.info(f"Metrics summary written to {path}")
+
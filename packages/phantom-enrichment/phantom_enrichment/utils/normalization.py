@@ -0,0 +1,113 @@
+# phantom_enrichment/utils/normalization.py
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Any, Optional
+import pandas as pd
+
+# Precompiled patterns shared by the scalar and vectorized paths
+_PUNCTUATION_PATTERN = re.compile(r'[^\w\s-]') # Keep word chars, whitespace, hyphens
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Bounded so long runs over large sheets cannot grow memory without limit
+NORMALIZE_CACHE_SIZE = 65536
+
+
+def _is_missing(text: Any) -> bool:
+    """True for None and float NaN (empty Excel cells)."""
+    return text is None or (isinstance(text, float) and text != text)
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize_cached(text: str) -> str:
+    """Normalizes a non-missing string (see normalize_string)."""
+    # Normalize unicode characters (e.g., convert accented chars to base)
+    # NFKD decomposes characters, then encode/decode removes combining marks
+    try:
+        text = unicodedata.normalize('NFKD', text)
+        text = text.encode('ASCII', 'ignore').decode('ASCII')
+    except Exception:
+        # Fallback if complex unicode causes issues, just lowercase
+         pass # Keep original text if normalization fails catastrophically
+
+    # Convert to lowercase
+    text = text.lower()
+
+    # Remove common punctuation (keep spaces and alphanumeric)
+    text = _PUNCTUATION_PATTERN.sub('', text)
+
+    # Replace multiple whitespace characters with a single space
+    return _WHITESPACE_PATTERN.sub(' ', text).strip()
+
+
+def normalize_string(text: Optional[Any]) -> str:
+    """
+    Normalizes a string for comparison:
+    - Converts to lowercase.
+    - Removes common punctuation.
+    - Normalizes unicode characters (e.g., accents).
+    - Collapses multiple whitespace characters.
+    - Handles potential None/NaN input.
+
+    Results are memoized in a bounded LRU cache, so repeated titles and authors
+    (common across editions and input rows) are only normalized once.
+
+    Args:
+        text: The input string, None, or NaN.
+
+    Returns:
+        The normalized string, or an empty string if input was missing.
+    """
+    if _is_missing(text):
+        return ""
+    return _normalize_cached(str(text))
+
+
+def normalize_series(series: pd.Series) -> pd.Series:
+    """
+    Vectorized equivalent of normalize_string for a pandas column.
+
+    Distinct values are normalized once with pandas string methods and mapped
+    back, so heavily repeated columns (e.g. Author) cost one pass over the uniques.
+
+    Args:
+        series: Column of strings (missing values allowed).
+
+    Returns:
+        A Series of normalized strings with the same index.
+    """
+    text = series.astype(object).where(series.notna(), "").astype(str)
+    codes, uniques = pd.factorize(text)
+    normalized = (
+        pd.Series(uniques, dtype=object)
+        .str.normalize('NFKD')
+        .str.encode('ascii', 'ignore')
+        .str.decode('ascii')
+        .str.lower()
+        .str.replace(_PUNCTUATION_PATTERN, '', regex=True)
+        .str.replace(_WHITESPACE_PATTERN, ' ', regex=True)
+        .str.strip()
+    )
+    return pd.Series(normalized.to_numpy()[codes], index=series.index, dtype=object)
+
+
+def book_id_from_normalized(norm_title: str, norm_author: str) -> str:
+    """
+    Builds the standardized Book ID (B-TITLE|AUTHOR) from already normalized values.
+
+    Normalization strips commas, so "Surname, Name" input authors are used as a whole.
+    """
+    return f"B-{_WHITESPACE_PATTERN.sub('', norm_title).upper()}|{_WHITESPACE_PATTERN.sub('', norm_author).upper()}"
+
+
+def book_id_series(norm_titles: pd.Series, norm_authors: pd.Series) -> pd.Series:
+    """Vectorized book_id_from_normalized for normalized Title/Author columns."""
+    titles = norm_titles.str.replace(_WHITESPACE_PATTERN, '', regex=True).str.upper()
+    authors = norm_authors.str.replace(_WHITESPACE_PATTERN, '', regex=True).str.upper()
+    return "B-" + titles + "|" + authors
+
+
+def normalization_cache_info():
+    """Returns the LRU cache statistics of normalize_string."""
+    return _normalize_cached.cache_info()
@@ -6,6 +6,6 @@ with a primary focus on PDF to EPUB conversion.
 """
 
 from .pdf import PDFDocument, PDFPage
-from .pdf_extractor import PDFContentExtractor, TextBlock, TextBlockType, DocumentSection
+from .pdf_extractor import PDFContentExtractor, TextBlock, TextBlockType, DocumentSection, FontStatistics
 from .epub_generator import EPUBCreator, EPUBOptions, EPUBChapter
 from .converter import PDFToEPUBConverter, ConversionOptions, convert_pdf_to_epub
\ No newline at end of file
@@ -156,6 +156,106 @@ class DocumentSection:
     def __str__(self) -> str:
         return f"<Section level={self.level} title='{self.title}' subsections={len(self.subsections)}>"
 
+@dataclass
+class FontStatistics:
+    """
+    Character-weighted font histogram for a document.
+
+    Built incrementally while spans are extracted, so classification and heading
+    level assignment can query body size and heading tiers without further passes
+    over the text blocks.
+    """
+    size_precision: int = 1
+    tier_gap: float = 0.5
+    size_histogram: Dict[float, int] = field(default_factory=lambda: defaultdict(int))
+    font_name_counts: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    total_chars: int = 0
+    _body_size: Optional[float] = field(default=None, init=False, repr=False)
+    _tiers: Dict[float, List[Tuple[float, float]]] = field(default_factory=dict, init=False, repr=False)
+
+    def add(self, font_size: Optional[float], font_name: Optional[str], char_count: int) -> None:
+        """Record a run of characters set in the given font."""
+        if char_count <= 0:
+            return
+        if font_size:
+            self.size_histogram[round(font_size, self.size_precision)] += char_count
+        if font_name:
+            self.font_name_counts[font_name] += char_count
+        self.total_chars += char_count
+        # Invalidate derived values
+        self._body_size = None
+        self._tiers.clear()
+
+    @property
+    def body_size(self) -> float:
+        """The font size carrying the most characters (12.0 if nothing was recorded)."""
+        if self._body_size is None:
+            if self.size_histogram:
+                self._body_size = max(self.size_histogram.items(), key=lambda item: (item[1], -item[0]))[0]
+            else:
+                self._body_size = 12.0
+        return self._body_size
+
+    @property
+    def body_font(self) -> Optional[str]:
+        """The font name carrying the most characters."""
+        if not self.font_name_counts:
+            return None
+        return max(self.font_name_counts.items(), key=lambda item: item[1])[0]
+
+    def heading_tiers(self, min_size: float = 0.0) -> List[Tuple[float, float]]:
+        """
+        Group font sizes larger than the body size into heading tiers.
+
+        Args:
+            min_size: Sizes below this are never considered a heading tier
+
+        Returns:
+            List of (min_size, max_size) ranges, largest tier first
+        """
+        if min_size in self._tiers:
+            return self._tiers[min_size]
+
+        body = self.body_size
+        sizes = sorted((s for s in self.size_histogram if s > body and s >= min_size), reverse=True)
+
+        tiers = []
+        for size in sizes:
+            if tiers and tiers[-1][0] - size < self.tier_gap:
+                tiers[-1] = (size, tiers[-1][1])
+            else:
+                tiers.append((size, size))
+
+        self._tiers[min_size] = tiers
+        return tiers
+
+    def heading_level(self, font_size: Optional[float], min_size: float = 0.0) -> int:
+        """
+        Get the heading level for a font size (0 is the largest tier).
+
+        Sizes that fall below every tier (e.g. bold body-size headings) get the
+        level after the last tier.
+        """
+        tiers = self.heading_tiers(min_size)
+        if not font_size:
+            return len(tiers)
+        size = round(font_size, self.size_precision)
+        for level, (low, _high) in enumerate(tiers):
+            if size >= low:
+                return level
+        return len(tiers)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the statistics to a dictionary."""
+        return {
+            'body_size': self.body_size,
+            'body_font': self.body_font,
+            'total_chars': self.total_chars,
+            'heading_tiers': self.heading_tiers(),
+            'size_histogram': dict(sorted(self.size_histogram.items())),
+            'font_name_counts': dict(sorted(self.font_name_counts.items(), key=lambda item: item[1], reverse=True)),
+        }
+
 class PDFContentExtractor:
     """Advanced content extraction from PDF documents with structure analysis."""
     
@@ -171,6 +271,7 @@ class PDFContentExtractor:
         self.min_heading_size = min_heading_size
         self.text_blocks: List[TextBlock] = []
         self.document_sections: List[DocumentSection] = []
+        self.font_stats = FontStatistics()
         self._extracted = False
     
     def extract_content(self) -> None:
@@ -224,6 +325,10 @@ class PDFContentExtractor:
                             if not line_text.strip():
                                 continue
                             
+                            # Feed the document font histogram while the spans are at hand
+                            for span in spans:
+                                self.font_stats.add(span["size"], span["font"], len(span["text"].strip()))
+                            
                             # Extract bounding box
                             bbox = (line["bbox"][0], line["bbox"][1], line["bbox"][2], line["bbox"][3])
                             
@@ -260,9 +365,8 @@ class PDFContentExtractor:
         for block in self.text_blocks:
             pages_blocks[block.page_number].append(block)
         
-        # Calculate average font size across the document
-        font_sizes = [block.font_size for block in self.text_blocks if block.font_size]
-        avg_font_size = sum(font_sizes) / len(font_sizes) if font_sizes else 12.0
+        # Body size comes from the histogram built during extraction
+        body_font_size = self.font_stats.body_size
         
         # Process each page separately
         for page_num, blocks in pages_blocks.items():
@@ -287,23 +391,26 @@ class PDFContentExtractor:
                 
                 # Classifier logic
                 if is_header and block.word_count < 10:
-                    block.block_type = TextBlockType.HEADER
+                    block_type = TextBlockType.HEADER
                 elif is_footer and block.word_count < 10:
-                    block.block_type = TextBlockType.FOOTER
-                elif block.font_size >= self.min_heading_size and block.font_size > avg_font_size * 1.2:
-                    if i == 0 and block.font_size > avg_font_size * 1.5:
-                        block.block_type = TextBlockType.TITLE
+                    block_type = TextBlockType.FOOTER
+                elif block.font_size >= self.min_heading_size and block.font_size > body_font_size * 1.2:
+                    if i == 0 and block.font_size > body_font_size * 1.5:
+                        block_type = TextBlockType.TITLE
                     else:
-                        block.block_type = TextBlockType.HEADING
+                        block_type = TextBlockType.HEADING
                 elif block.is_bold and block.word_count < 20:
-                    block.block_type = TextBlockType.HEADING
+                    block_type = TextBlockType.HEADING
                 elif block.text.strip().startswith(('•', '-', '*', '◦', '▪', '○', '►', '→')) or re.match(r'^\d+\.', block.text.strip()):
-                    block.block_type = TextBlockType.LIST_ITEM
+                    block_type = TextBlockType.LIST_ITEM
                 elif block.width and block.width < page.width * 0.7 and i > 0 and i < len(blocks) - 1:
                     # Blocks significantly narrower than the page width might be captions
-                    block.block_type = TextBlockType.CAPTION
+                    block_type = TextBlockType.CAPTION
                 else:
-                    block.block_type = TextBlockType.PARAGRAPH
+                    block_type = TextBlockType.PARAGRAPH
+                
+                # TextBlock is frozen, so set the field the same way __post_init__ does
+                object.__setattr__(block, "block_type", block_type)
     
     def _build_document_structure(self) -> None:
         """Build document structure by organizing text blocks into hierarchical sections."""
@@ -327,42 +434,13 @@ class PDFContentExtractor:
         # Sort headings by page number and position
         heading_blocks.sort(key=lambda b: (b.page_number, b.bbox[1] if b.bbox else 0))
         
-        # Determine heading levels based on font size
-        heading_sizes = [(b, b.font_size) for b in heading_blocks if b.font_size]
-        if heading_sizes:
-            # Sort by font size descending
-            heading_sizes.sort(key=lambda x: x[1], reverse=True)
-            
-            # Group similar font sizes
-            size_groups = []
-            current_group = [heading_sizes[0]]
-            
-            for i in range(1, len(heading_sizes)):
-                current, current_size = heading_sizes[i]
-                previous, previous_size = heading_sizes[i-1]
-                
-                # If sizes are close, group them
-                if abs(current_size - previous_size) < 0.5:
-                    current_group.append(heading_sizes[i])
-                else:
-                    size_groups.append(current_group)
-                    current_group = [heading_sizes[i]]
-            
-            size_groups.append(current_group)
-            
-            # Assign levels to heading blocks based on font size groups
-            level_map = {}
-            for level, group in enumerate(size_groups):
-                for block, _ in group:
-                    level_map[block] = level
-            
-            # Assign levels to all heading blocks
-            for block in heading_blocks:
-                if block in level_map:
-                    block.block_type = TextBlockType.TITLE if level_map[block] == 0 else TextBlockType.HEADING
-                else:
-                    # Fallback for headings without font size
-                    block.block_type = TextBlockType.HEADING
+        # Determine heading levels from the document's font size tiers
+        level_map = {}
+        for block in heading_blocks:
+            level = self.font_stats.heading_level(block.font_size, self.min_heading_size)
+            level_map[id(block)] = level
+            block_type = TextBlockType.TITLE if level == 0 and block.font_size else TextBlockType.HEADING
+            object.__setattr__(block, "block_type", block_type)
         
         # Create sections from headings
         current_sections = []
@@ -372,7 +450,7 @@ class PDFContentExtractor:
         for block in sorted(self.text_blocks, key=lambda b: (b.page_number, b.bbox[1] if b.bbox else 0)):
             if block.block_type in (TextBlockType.TITLE, TextBlockType.HEADING):
                 # Start a new section
-                level = level_map.get(block, 0) if heading_sizes else 0
+                level = level_map.get(id(block), 0)
                 
                 # Create section for accumulated blocks if any
                 if current_blocks and not current_sections:
@@ -541,6 +619,9 @@ class PDFContentExtractor:
         
         metadata['block_types'] = dict(block_type_counts)
         
+        # Font statistics gathered during extraction
+        metadata['font_stats'] = self.font_stats.to_dict()
+        
         # Count total words
         metadata['word_count'] = sum(block.word_count for block in self.text_blocks)
         
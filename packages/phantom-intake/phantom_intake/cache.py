@@ -0,0 +1,150 @@
+"""
+On-disk page cache for the LibGen Downloader.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from phantom_intake.config import AppConfig
+
+
+# Bump when the page parsers change, so cached extractions are redone from the cached pages
+PARSER_VERSION = 1
+
+
+class PageCache:
+    """
+    Fetched pages and the data extracted from them, keyed by URL.
+    
+    Each URL gets two files named by the SHA-256 of the URL: the gzipped page
+    (<key>.html.gz) and a JSON entry (<key>.json) holding the fetch time and
+    one extraction per parser kind (e.g. "book" for download links, title and
+    author). Entries older than the TTL are ignored. An extraction made by an
+    older PARSER_VERSION is redone from the cached page without refetching it.
+    
+    Usage:
+        cached = cache.get_extracted(url, "book")
+        if cached is None:
+            content = cache.get_page(url) or fetch(url)
+            cached = parse(content)
+            cache.put(url, "book", cached, content)
+    """
+    
+    def __init__(self, directory: Path, ttl_seconds: float):
+        """
+        Initialize page cache.
+        
+        Args:
+            directory: Directory holding the cache files (created on first write)
+            ttl_seconds: How long entries stay valid; 0 or less disables the cache
+        """
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+    
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache is in use."""
+        return self.ttl_seconds > 0
+    
+    def _paths(self, url: str) -> Dict[str, Path]:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return {"entry": self.directory / f"{key}.json", "page": self.directory / f"{key}.html.gz"}
+    
+    def _load_entry(self, url: str) -> Optional[Dict[str, Any]]:
+        """Load the URL's entry if it exists and is fresh."""
+        if not self.enabled:
+            return None
+        path = self._paths(url)["entry"]
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get("url") != url or time.time() - entry.get("fetched_at", 0) > self.ttl_seconds:
+            return None
+        return entry
+    
+    def get_extracted(self, url: str, kind: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the data extracted from the URL's page by the current parser.
+        
+        Args:
+            url: Page URL
+            kind: Parser kind
+        
+        Returns:
+            The extracted data, or None if missing, expired or made by an older parser
+        """
+        entry = self._load_entry(url)
+        if entry is None:
+            return None
+        extracted = entry.get("extracted", {}).get(kind)
+        if not extracted or extracted.get("parser_version") != PARSER_VERSION:
+            return None
+        return extracted["data"]
+    
+    def get_page(self, url: str) -> Optional[bytes]:
+        """Return the cached page content, or None if missing or expired."""
+        if self._load_entry(url) is None:
+            return None
+        try:
+            with gzip.open(self._paths(url)["page"], "rb") as f:
+                return f.read()
+        except (OSError, EOFError):
+            return None
+    
+    def put(self, url: str, kind: str, data: Dict[str, Any], content: Optional[bytes] = None) -> None:
+        """
+        Store an extraction (and the page it came from).
+        
+        Args:
+            url: Page URL
+            kind: Parser kind
+            data: JSON-serializable extracted data
+            content: Page content; if omitted, the cached page and its fetch time are kept
+        """
+        if not self.enabled:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        paths = self._paths(url)
+        entry = self._load_entry(url) if content is None else None
+        if entry is None:
+            entry = {"url": url, "fetched_at": time.time(), "extracted": {}}
+        if content is not None:
+            tmp_page = paths["page"].with_name(paths["page"].name + ".tmp")
+            with gzip.open(tmp_page, "wb", compresslevel=6) as f:
+                f.write(content)
+            os.replace(tmp_page, paths["page"])
+        entry["extracted"][kind] = {"parser_version": PARSER_VERSION, "data": data}
+        tmp_entry = paths["entry"].with_name(paths["entry"].name + ".tmp")
+        with open(tmp_entry, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp_entry, paths["entry"])
+    
+    def clear(self) -> int:
+        """Delete every cache file; returns the number of files removed."""
+        removed = 0
+        if self.directory.exists():
+            for path in self.directory.iterdir():
+                if path.suffix in (".json", ".gz", ".tmp"):
+                    path.unlink(missing_ok=True)
+                    removed += 1
+        return removed
+
+
+def create_page_cache(config: AppConfig) -> PageCache:
+    """
+    Create the page cache configured in AppConfig.
+    
+    Args:
+        config: Application configuration (page_cache_dir lives in input_dir)
+    
+    Returns:
+        PageCache instance (disabled when page_cache_ttl_hours is 0)
+    """
+    return PageCache(config.input_dir / config.page_cache_dir, config.page_cache_ttl_hours * 3600)
@@ -7,13 +7,24 @@ import logging
 import yaml
 from dataclasses import dataclass, asdict, field
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 
 # Constants
 DEFAULT_TIMEOUT = 30
 DEFAULT_MAX_RETRIES = 3
 DEFAULT_REQUEST_DELAY = 2
+DEFAULT_MAX_CONCURRENT_DOWNLOADS = 4
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 2
+DEFAULT_CHUNK_SIZE_BYTES = 1024 * 1024
+DEFAULT_STATE_FILE = "download_state.json"
+DEFAULT_MIRROR_STATS_FILE = "mirror_stats.json"
+DEFAULT_PAGE_CACHE_DIR = ".page_cache"
+DEFAULT_PAGE_CACHE_TTL_HOURS = 24
+DEFAULT_MIRROR_PROBE_BYTES = 64 * 1024
+DEFAULT_MIRROR_RACE_GRACE = 0.5
+DEFAULT_LIBGEN_DOMAINS = ["libgen.is", "libgen.li", "libgen.rs"]
+DEFAULT_IPFS_GATEWAY_URLS = ["https://ipfs.io/ipfs/", "https://dweb.link/ipfs/"]
 DEFAULT_CONFIG_FILE = "config.yaml"
 
 
@@ -28,6 +39,25 @@ class AppConfig:
     timeout_seconds: int
     delay_seconds: int
     user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/100.0.4896.127 Safari/537.36"
+    # Concurrency settings (delay_seconds is the politeness delay between requests to the same host)
+    max_concurrent_downloads: int = DEFAULT_MAX_CONCURRENT_DOWNLOADS
+    max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST
+    chunk_size_bytes: int = DEFAULT_CHUNK_SIZE_BYTES
+    # Resume settings (state_file lives in input_dir and records completed URLs)
+    state_file: str = DEFAULT_STATE_FILE
+    verify_hashes: bool = True
+    # Mirror racing (mirror_stats_file lives in input_dir and keeps per-host latency across runs)
+    race_mirrors: bool = True
+    mirror_probe_bytes: int = DEFAULT_MIRROR_PROBE_BYTES
+    mirror_race_grace_seconds: float = DEFAULT_MIRROR_RACE_GRACE
+    mirror_stats_file: str = DEFAULT_MIRROR_STATS_FILE
+    # Page cache (page_cache_dir lives in input_dir; a TTL of 0 disables the cache)
+    page_cache_dir: str = DEFAULT_PAGE_CACHE_DIR
+    page_cache_ttl_hours: float = DEFAULT_PAGE_CACHE_TTL_HOURS
+    # LibGen and IPFS settings
+    libgen_domains: List[str] = field(default_factory=lambda: list(DEFAULT_LIBGEN_DOMAINS))
+    use_ipfs_gateway: bool = True
+    ipfs_gateway_urls: List[str] = field(default_factory=lambda: list(DEFAULT_IPFS_GATEWAY_URLS))
 
 
 def setup_logging(log_dir: Path, log_level: int = logging.INFO) -> logging.Logger:
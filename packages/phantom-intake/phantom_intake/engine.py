@@ -0,0 +1,423 @@
+"""
+Concurrent download engine for the LibGen Downloader.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+import httpx
+from rich.console import Console
+from rich.progress import (
+    BarColumn,
+    DownloadColumn,
+    Progress,
+    Task,
+    TaskID,
+    TextColumn,
+    TimeElapsedColumn,
+    TransferSpeedColumn,
+)
+from rich.text import Text
+
+from phantom_intake.cache import PageCache
+from phantom_intake.config import AppConfig
+from phantom_intake.mirrors import MirrorSelector, MirrorStats
+from phantom_intake.scraper import cached_book_page, parse_book_page
+from phantom_intake.transfer import DownloadState, IncompleteDownloadError, PartialDownload, md5_from_url
+from phantom_intake.utils import FileHelpers
+
+
+class _SizeColumn(DownloadColumn):
+    """Downloaded bytes, or finished/total books for the books row."""
+    
+    def render(self, task: Task) -> Text:
+        if task.fields.get("unit") == "books":
+            return Text(f"{int(task.completed)}/{int(task.total or 0)} books", style="progress.download")
+        return super().render(task)
+
+
+class _SpeedColumn(TransferSpeedColumn):
+    """Transfer speed (left empty for the books row)."""
+    
+    def render(self, task: Task) -> Text:
+        if task.fields.get("unit") == "books":
+            return Text("")
+        return super().render(task)
+
+
+class HostLimiter:
+    """Per-host connection limit and politeness delay."""
+    
+    def __init__(self, max_per_host: int, delay_seconds: float):
+        """
+        Initialize host limiter.
+        
+        Args:
+            max_per_host: Maximum simultaneous requests to one host
+            delay_seconds: Minimum interval between request starts on one host
+        """
+        self.max_per_host = max(1, max_per_host)
+        self.delay_seconds = max(0.0, delay_seconds)
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._next_start: Dict[str, float] = {}
+    
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        """
+        Hold one of the URL host's connection slots for the duration of the block.
+        
+        Requests to the same host are spaced by the politeness delay; requests to
+        different hosts never wait for each other.
+        
+        Args:
+            url: URL about to be requested
+        """
+        host = urlsplit(url).netloc.lower()
+        semaphore = self._semaphores.setdefault(host, asyncio.Semaphore(self.max_per_host))
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        
+        async with semaphore:
+            async with lock:
+                wait = self._next_start.get(host, 0.0) - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                self._next_start[host] = time.monotonic() + self.delay_seconds
+            yield
+
+
+class DownloadEngine:
+    """
+    Asynchronous download engine.
+    
+    Books are processed concurrently (up to max_concurrent_downloads at once).
+    Every HTTP request goes through a HostLimiter, so different mirrors and IPFS
+    gateways proceed in parallel while each single host gets at most
+    max_connections_per_host connections, spaced by delay_seconds. Files are
+    streamed to disk in chunk_size_bytes chunks, and the aggregate progress of
+    all downloads is shown in one rich display.
+    
+    Transfers are resumable: data goes to a .part file, interrupted transfers
+    are retried from where they stopped with a Range request, and finished
+    files are verified and renamed atomically (see PartialDownload). Completed
+    books are recorded in the DownloadState, if one is given.
+    
+    When a book has several links, they are raced first (see MirrorSelector)
+    and tried fastest first.
+    """
+    
+    def __init__(
+        self,
+        config: AppConfig,
+        logger: logging.Logger,
+        console: Optional[Console] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        state: Optional[DownloadState] = None,
+        mirror_stats: Optional[MirrorStats] = None,
+        page_cache: Optional[PageCache] = None
+    ):
+        """
+        Initialize download engine.
+        
+        Args:
+            config: Application configuration
+            logger: Logger instance
+            console: Console for the progress display
+            transport: Optional httpx transport (e.g. a mock transport for tests)
+            state: Optional record of completed downloads, updated as books finish
+            mirror_stats: Optional per-host latency statistics used to rank mirrors
+            page_cache: Optional cache of fetched book pages and their links
+        """
+        self.config = config
+        self.logger = logger
+        self.console = console or Console()
+        self.transport = transport
+        self.state = state
+        self.host_limiter = HostLimiter(config.max_connections_per_host, config.delay_seconds)
+        self.mirror_selector = MirrorSelector(config, logger, mirror_stats, self.host_limiter)
+        self.page_cache = page_cache
+        
+        self._progress: Optional[Progress] = None
+        self._bytes_task: Optional[TaskID] = None
+    
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create the pooled HTTP client shared by all downloads."""
+        return httpx.AsyncClient(
+            headers={"User-Agent": self.config.user_agent},
+            timeout=httpx.Timeout(self.config.timeout_seconds),
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=self.config.max_concurrent_downloads * max(1, self.config.max_connections_per_host),
+                max_keepalive_connections=self.config.max_concurrent_downloads
+            ),
+            transport=self.transport
+        )
+    
+    def _create_progress(self) -> Progress:
+        """Create the progress display shared by all downloads."""
+        return Progress(
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+            _SizeColumn(),
+            _SpeedColumn(),
+            TimeElapsedColumn(),
+            console=self.console
+        )
+    
+    def run(
+        self,
+        urls: List[str],
+        output_dir: Path,
+        on_result: Optional[Callable[[str, bool], None]] = None
+    ) -> Dict[str, bool]:
+        """
+        Download the books of all URLs concurrently.
+        
+        Args:
+            urls: URLs of the book pages
+            output_dir: Directory to save the downloaded files
+            on_result: Optional callback called with (url, success) as each book finishes
+        
+        Returns:
+            Mapping of URL to download success, in input order
+        """
+        return asyncio.run(self.download_all(urls, output_dir, on_result))
+    
+    async def download_all(
+        self,
+        urls: List[str],
+        output_dir: Path,
+        on_result: Optional[Callable[[str, bool], None]] = None
+    ) -> Dict[str, bool]:
+        """
+        Download the books of all URLs concurrently.
+        
+        Args:
+            urls: URLs of the book pages
+            output_dir: Directory to save the downloaded files
+            on_result: Optional callback called with (url, success) as each book finishes
+        
+        Returns:
+            Mapping of URL to download success, in input order
+        """
+        FileHelpers.ensure_directory_exists(output_dir)
+        book_semaphore = asyncio.Semaphore(max(1, self.config.max_concurrent_downloads))
+        
+        with self._create_progress() as progress:
+            self._progress = progress
+            books_task = progress.add_task("[bold]Books", total=len(urls), unit="books")
+            # Grows as the sizes of the started downloads become known
+            self._bytes_task = progress.add_task("[bold]Total", total=None)
+            
+            async with self._create_client() as client:
+                async def process(url: str) -> bool:
+                    async with book_semaphore:
+                        try:
+                            success = await self.download_book(client, url, output_dir)
+                        except Exception as e:
+                            self.logger.error(f"Unexpected error downloading {url}: {e}")
+                            success = False
+                    progress.advance(books_task)
+                    if on_result is not None:
+                        on_result(url, success)
+                    return success
+                
+                try:
+                    results = await asyncio.gather(*(process(url) for url in urls))
+                finally:
+                    self.mirror_selector.stats.save()
+            
+            self._progress = None
+            self._bytes_task = None
+        
+        return dict(zip(urls, results))
+    
+    async def extract_download_links(self, client: httpx.AsyncClient, page_url: str) -> Tuple[List[str], str, str]:
+        """
+        Fetch a book page and extract its download links, title and author.
+        
+        Args:
+            client: HTTP client
+            page_url: URL of the book page
+        
+        Returns:
+            Tuple of (download_links, title, author); links are made absolute
+        """
+        try:
+            # Pages seen within the cache TTL are not fetched again
+            if self.page_cache is not None:
+                cached = await asyncio.to_thread(cached_book_page, self.page_cache, page_url)
+                if cached is not None:
+                    self.logger.info(f"Using cached page for {page_url}: {cached[1]} ({len(cached[0])} download link(s))")
+                    return cached
+            
+            self.logger.info(f"Accessing page: {page_url}")
+            async with self.host_limiter.slot(page_url):
+                response = await client.get(page_url)
+            response.raise_for_status()
+            
+            download_links, title, author = parse_book_page(response.content)
+            download_links = [urljoin(str(response.url), link) for link in download_links]
+            self.logger.info(f"Found book: {title} ({len(download_links)} download link(s))")
+            if self.page_cache is not None and download_links:
+                await asyncio.to_thread(
+                    self.page_cache.put,
+                    page_url,
+                    "book",
+                    {"links": download_links, "title": title, "author": author},
+                    response.content
+                )
+            return download_links, title, author
+        
+        except Exception as e:
+            self.logger.error(f"Error extracting download links from {page_url}: {e}")
+            return [], "Unknown_Title", "Unknown_Author"
+    
+    async def download_book(self, client: httpx.AsyncClient, url: str, output_dir: Path) -> bool:
+        """
+        Download a book, trying its download links in turn.
+        
+        Args:
+            client: HTTP client
+            url: URL of the book page
+            output_dir: Directory to save the downloaded file
+        
+        Returns:
+            True if download was successful, False otherwise
+        """
+        download_links, title, author = await self.extract_download_links(client, url)
+        
+        if not download_links:
+            self.logger.error(f"No download links found for {url}")
+            return False
+        
+        # Race the mirrors and gateways so the fastest one is tried first
+        download_links = await self.mirror_selector.rank(client, download_links)
+        
+        # LibGen identifies files by MD5, so the page (or link) URL usually tells us the expected hash
+        expected_md5 = None
+        if self.config.verify_hashes:
+            expected_md5 = md5_from_url(url)
+        
+        for download_url in download_links:
+            file_path = output_dir / FileHelpers.build_book_filename(title, author, download_url)
+            try:
+                partial = await self.download_file(
+                    client,
+                    download_url,
+                    file_path,
+                    expected_md5=expected_md5 or (md5_from_url(download_url) if self.config.verify_hashes else None)
+                )
+                self.logger.info(f"Download completed: {file_path.name}")
+                if self.state is not None:
+                    self.state.mark_complete(url, file_path, file_path.stat().st_size, partial.md5, download_url)
+                return True
+            except Exception as e:
+                self.logger.warning(f"Download failed from {download_url}: {e}")
+        
+        self.logger.error(f"All download attempts failed for {url}")
+        return False
+    
+    async def download_file(
+        self,
+        client: httpx.AsyncClient,
+        download_url: str,
+        file_path: Path,
+        expected_md5: Optional[str] = None
+    ) -> PartialDownload:
+        """
+        Download one file, resuming interrupted transfers.
+        
+        Connection errors and truncated bodies are retried up to max_retries
+        times with exponential backoff; every retry (and every later run)
+        continues from the bytes already in the .part file.
+        
+        Args:
+            client: HTTP client
+            download_url: URL of the file
+            file_path: Destination path
+            expected_md5: Optional MD5 the finished file must match
+        
+        Returns:
+            The finished PartialDownload (size and MD5 of the file)
+        
+        Raises:
+            httpx.HTTPError: If the request fails for good
+            DownloadError: If the transfer stays incomplete or fails verification
+        """
+        partial = PartialDownload(file_path, expected_md5)
+        attempts = max(1, self.config.max_retries)
+        
+        self.logger.info(f"Downloading from {download_url}")
+        self.logger.info(f"Saving to {file_path}")
+        
+        for attempt in range(attempts):
+            try:
+                await self._transfer(client, download_url, partial)
+                return partial
+            except (httpx.TransportError, IncompleteDownloadError) as e:
+                if attempt + 1 >= attempts:
+                    raise
+                wait_time = 2 ** attempt
+                self.logger.warning(
+                    f"Transfer from {download_url} interrupted ({e}). "
+                    f"Retry {attempt + 1}/{attempts - 1} in {wait_time}s, resuming from the .part file"
+                )
+                await asyncio.sleep(wait_time)
+        
+        return partial
+    
+    async def _transfer(self, client: httpx.AsyncClient, download_url: str, partial: PartialDownload) -> None:
+        """
+        Run one request for a partial download and finish it.
+        
+        Chunks are written (and hashed) from a worker thread, so slow disks do not
+        stall the other transfers.
+        """
+        progress = self._progress
+        task_id: Optional[TaskID] = None
+        headers = partial.request_headers()
+        if partial.offset:
+            self.logger.info(f"Resuming {partial.file_path.name} from byte {partial.offset}")
+        
+        def write_chunk(f, chunk: bytes) -> None:
+            f.write(chunk)
+            partial.update(chunk)
+        
+        async with self.host_limiter.slot(download_url):
+            async with client.stream("GET", download_url, headers=headers) as response:
+                if response.status_code != 416:
+                    response.raise_for_status()
+                mode = await asyncio.to_thread(partial.begin, response.status_code, response.headers)
+                
+                if progress is not None:
+                    already = partial.offset if mode != "wb" else 0
+                    task_id = progress.add_task(
+                        f"[cyan]{partial.file_path.name[:40]}",
+                        total=partial.expected_size,
+                        completed=already
+                    )
+                    if partial.expected_size:
+                        bytes_total = progress.tasks[self._bytes_task].total or 0
+                        progress.update(self._bytes_task, total=bytes_total + partial.expected_size)
+                        progress.advance(self._bytes_task, already)
+                
+                try:
+                    if mode is not None:
+                        with open(partial.part_path, mode) as f:
+                            async for chunk in response.aiter_bytes(self.config.chunk_size_bytes):
+                                await asyncio.to_thread(write_chunk, f, chunk)
+                                if progress is not None:
+                                    progress.advance(task_id, len(chunk))
+                                    progress.advance(self._bytes_task, len(chunk))
+                finally:
+                    if progress is not None and task_id is not None:
+                        progress.remove_task(task_id)
+        
+        await asyncio.to_thread(partial.finish)
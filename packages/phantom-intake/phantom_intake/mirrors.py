@@ -0,0 +1,289 @@
+"""
+Mirror selection for the LibGen Downloader.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from phantom_intake.config import AppConfig
+
+
+# Weight of the newest observation in the per-host moving averages
+STATS_SMOOTHING = 0.5
+# Transfer size used to turn TTFB and throughput into one expected duration
+REFERENCE_BYTES = 4 * 1024 * 1024
+# Expected duration assumed for hosts without a measured TTFB or throughput
+UNKNOWN_HOST_SECONDS = 10.0
+
+
+def host_of(url: str) -> str:
+    """Return the lower-case host (and port) of a URL."""
+    return urlsplit(url).netloc.lower()
+
+
+@dataclass
+class ProbeResult:
+    """Outcome of one probe request."""
+    url: str
+    ttfb: Optional[float] = None
+    throughput: Optional[float] = None
+    bytes_received: int = 0
+    error: Optional[str] = None
+    
+    @property
+    def ok(self) -> bool:
+        """Whether the probe received data."""
+        return self.error is None and self.ttfb is not None
+
+
+class MirrorStats:
+    """
+    Per-host latency statistics, kept across runs.
+    
+    Every probe updates an exponential moving average of the host's
+    time-to-first-byte and throughput, plus success and failure counts.
+    The expected duration of a transfer (TTFB plus REFERENCE_BYTES at the
+    average throughput, inflated by the failure rate) orders the hosts, so
+    gateways that were slow or unreliable in earlier runs are tried last.
+    """
+    
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Initialize mirror statistics.
+        
+        Args:
+            path: Optional JSON file the statistics are loaded from and saved to
+        """
+        self.path = path
+        self.hosts: Dict[str, Dict[str, Any]] = {}
+        if path is not None and path.exists():
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self.hosts = json.load(f).get("hosts", {})
+            except (OSError, ValueError):
+                # Damaged statistics only cost the ordering of the first races
+                self.hosts = {}
+    
+    def _entry(self, host: str) -> Dict[str, Any]:
+        return self.hosts.setdefault(host, {"ttfb": None, "throughput": None, "successes": 0, "failures": 0})
+    
+    @staticmethod
+    def _smooth(previous: Optional[float], value: float) -> float:
+        if previous is None:
+            return value
+        return (1 - STATS_SMOOTHING) * previous + STATS_SMOOTHING * value
+    
+    def record_success(self, host: str, ttfb: float, throughput: Optional[float]) -> None:
+        """Record a probe that received data."""
+        entry = self._entry(host)
+        entry["ttfb"] = self._smooth(entry["ttfb"], ttfb)
+        if throughput:
+            entry["throughput"] = self._smooth(entry["throughput"], throughput)
+        entry["successes"] += 1
+        entry["updated_at"] = time.strftime("%Y-%m-%d %H:%M:%S")
+    
+    def record_slow(self, host: str, elapsed: float) -> None:
+        """Record a probe cancelled after `elapsed` seconds without data (a lower bound on its TTFB)."""
+        entry = self._entry(host)
+        entry["ttfb"] = self._smooth(entry["ttfb"], max(elapsed, entry["ttfb"] or 0.0))
+        entry["updated_at"] = time.strftime("%Y-%m-%d %H:%M:%S")
+    
+    def record_failure(self, host: str) -> None:
+        """Record a probe that failed."""
+        entry = self._entry(host)
+        entry["failures"] += 1
+        entry["updated_at"] = time.strftime("%Y-%m-%d %H:%M:%S")
+    
+    def expected_seconds(self, host: str) -> float:
+        """Expected duration of a REFERENCE_BYTES transfer from the host (lower is better)."""
+        entry = self.hosts.get(host)
+        if not entry or entry.get("ttfb") is None:
+            seconds = UNKNOWN_HOST_SECONDS
+        else:
+            # Hosts whose probes never finished have no throughput yet; assume the worst
+            seconds = entry["ttfb"] + (REFERENCE_BYTES / entry["throughput"] if entry.get("throughput") else UNKNOWN_HOST_SECONDS)
+        if entry:
+            attempts = entry.get("successes", 0) + entry.get("failures", 0)
+            if attempts:
+                seconds *= 1 + 4 * entry.get("failures", 0) / attempts
+        return seconds
+    
+    def save(self) -> None:
+        """Write the statistics file atomically (no-op without a path)."""
+        if self.path is None:
+            return
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"hosts": self.hosts}, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+class MirrorSelector:
+    """
+    Race candidate links and order them fastest first.
+    
+    All candidates get a small probe at the same time: a ranged GET for the
+    first mirror_probe_bytes bytes. The first probe to finish starts a grace
+    period (mirror_race_grace_seconds); probes still running when it ends are
+    cancelled. Finished probes are ranked by their measured time-to-first-byte
+    and throughput, smoothed with the host's history from MirrorStats, and
+    followed by the cancelled and failed candidates as fallbacks.
+    
+    Usage:
+        links = await selector.rank(client, links)
+        links = selector.rank_sync(links)  # from synchronous code
+    """
+    
+    def __init__(
+        self,
+        config: AppConfig,
+        logger: logging.Logger,
+        stats: Optional[MirrorStats] = None,
+        host_limiter: Optional[Any] = None
+    ):
+        """
+        Initialize mirror selector.
+        
+        Args:
+            config: Application configuration
+            logger: Logger instance
+            stats: Per-host statistics (in-memory only if not given)
+            host_limiter: Optional HostLimiter the probes go through
+        """
+        self.config = config
+        self.logger = logger
+        self.stats = stats if stats is not None else MirrorStats()
+        self.host_limiter = host_limiter
+    
+    async def _probe(self, client: httpx.AsyncClient, url: str) -> ProbeResult:
+        """Fetch the first bytes of a URL and time them."""
+        result = ProbeResult(url)
+        headers = {"Range": f"bytes=0-{max(1, self.config.mirror_probe_bytes) - 1}"}
+        try:
+            if self.host_limiter is not None:
+                async with self.host_limiter.slot(url):
+                    await self._timed_fetch(client, url, headers, result)
+            else:
+                await self._timed_fetch(client, url, headers, result)
+        except (httpx.HTTPError, OSError) as e:
+            result.error = str(e).splitlines()[0] if str(e) else type(e).__name__
+        return result
+    
+    async def _timed_fetch(self, client: httpx.AsyncClient, url: str, headers: Dict[str, str], result: ProbeResult) -> None:
+        start = time.perf_counter()
+        first_byte = None
+        async with client.stream("GET", url, headers=headers) as response:
+            response.raise_for_status()
+            # Servers that ignore Range send the whole file; stop after the probe size
+            async for chunk in response.aiter_raw():
+                if first_byte is None:
+                    first_byte = time.perf_counter()
+                result.bytes_received += len(chunk)
+                if result.bytes_received >= self.config.mirror_probe_bytes:
+                    break
+        end = time.perf_counter()
+        first_byte = first_byte or end
+        result.ttfb = first_byte - start
+        # Throughput over the body; tiny bodies that arrive in one chunk fall back to the whole request
+        body_seconds = end - first_byte if end - first_byte > 1e-3 else end - start
+        result.throughput = result.bytes_received / body_seconds if result.bytes_received and body_seconds > 0 else None
+    
+    async def rank(self, client: httpx.AsyncClient, urls: List[str]) -> List[str]:
+        """
+        Race the candidate URLs and return them fastest first.
+        
+        Args:
+            client: HTTP client
+            urls: Candidate links for the same file (or page)
+        
+        Returns:
+            The same URLs, best candidate first
+        """
+        urls = list(dict.fromkeys(urls))
+        if len(urls) < 2 or not self.config.race_mirrors:
+            return urls
+        
+        # Historical order breaks ties and orders the fallbacks
+        urls.sort(key=lambda url: self.stats.expected_seconds(host_of(url)))
+        start = time.perf_counter()
+        tasks = {asyncio.create_task(self._probe(client, url)): url for url in urls}
+        finished: List[ProbeResult] = []
+        failed: List[str] = []
+        pending = set(tasks)
+        deadline = None
+        
+        try:
+            while pending:
+                timeout = None if deadline is None else max(0.0, deadline - time.perf_counter())
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    break
+                for task in done:
+                    result = task.result()
+                    if result.ok:
+                        finished.append(result)
+                    else:
+                        failed.append(result.url)
+                        self.stats.record_failure(host_of(result.url))
+                        self.logger.info(f"Mirror probe failed for {result.url}: {result.error}")
+                if finished and deadline is None:
+                    deadline = time.perf_counter() + self.config.mirror_race_grace_seconds
+        finally:
+            # Losers still running are cancelled and remembered as slow
+            elapsed = time.perf_counter() - start
+            for task in pending:
+                task.cancel()
+                self.stats.record_slow(host_of(tasks[task]), elapsed)
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        
+        for result in finished:
+            self.stats.record_success(host_of(result.url), result.ttfb, result.throughput)
+        
+        finished.sort(key=lambda result: self.stats.expected_seconds(host_of(result.url)))
+        cancelled = [tasks[task] for task in tasks if task in pending]
+        cancelled.sort(key=lambda url: self.stats.expected_seconds(host_of(url)))
+        ranked = [result.url for result in finished] + cancelled + failed
+        
+        if finished:
+            best = finished[0]
+            throughput = f"{best.throughput / 1024:.0f} KiB/s" if best.throughput else "n/a"
+            self.logger.info(
+                f"Fastest mirror: {host_of(best.url)} (TTFB {best.ttfb * 1000:.0f} ms, {throughput}; "
+                f"{len(finished)} finished, {len(cancelled)} cancelled, {len(failed)} failed)"
+            )
+        return ranked
+    
+    def rank_sync(self, urls: List[str]) -> List[str]:
+        """
+        Race the candidate URLs from synchronous code.
+        
+        Args:
+            urls: Candidate links for the same file (or page)
+        
+        Returns:
+            The same URLs, best candidate first
+        """
+        if len(set(urls)) < 2 or not self.config.race_mirrors:
+            return list(dict.fromkeys(urls))
+        
+        async def race() -> List[str]:
+            async with httpx.AsyncClient(
+                headers={"User-Agent": self.config.user_agent},
+                timeout=httpx.Timeout(self.config.timeout_seconds),
+                follow_redirects=True
+            ) as client:
+                return await self.rank(client, urls)
+        
+        ranked = asyncio.run(race())
+        self.stats.save()
+        return ranked
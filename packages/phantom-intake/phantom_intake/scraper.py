@@ -5,13 +5,176 @@ Web scraping functionality for the LibGen Downloader.
 import time
 import logging
 import random
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Union
 
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from urllib.parse import urljoin
 
 from phantom_intake.utils import FileHelpers
+from phantom_intake.cache import PageCache, create_page_cache
 from phantom_intake.config import AppConfig
+from phantom_intake.mirrors import MirrorSelector
+
+
+# Targeted XPath selectors, compiled once (evaluated by libxml2 instead of walking the tree in Python)
+_FIRST_H1 = etree.XPath("(//h1)[1]")
+_FIRST_TITLE = etree.XPath("(//title)[1]")
+_AUTHOR_PARAGRAPH = etree.XPath("(//p[starts-with(., 'Author')])[1]")
+_H2_LINKS = etree.XPath("//h2/descendant::a[1]/@href")
+# First <ul> after the start of the first <div> mentioning IPFS (its own descendants included)
+_IPFS_LIST_LINKS = etree.XPath(
+    "((//div[contains(., 'IPFS')])[1]/descendant::ul | (//div[contains(., 'IPFS')])[1]/following::ul)[1]"
+    "//li/descendant::a[1]/@href"
+)
+_ALL_HREFS = etree.XPath("//a/@href")
+_FORMAT_PARAGRAPH = etree.XPath("(//p[contains(., 'Format:')])[1]")
+_FORMAT_CELL = etree.XPath("(//td[contains(., 'Format')])[1]")
+
+
+def _parse_html(content: Union[bytes, str]) -> Optional[lxml.html.HtmlElement]:
+    """
+    Parse a page with lxml.
+    
+    Args:
+        content: Raw HTML (decoded as UTF-8, falling back to cp1252)
+        
+    Returns:
+        Document root, or None if the page is empty or unparsable
+    """
+    if isinstance(content, bytes):
+        try:
+            content = content.decode('utf-8')
+        except UnicodeDecodeError:
+            content = content.decode('cp1252', errors='replace')
+    if not content.strip():
+        return None
+    try:
+        return lxml.html.document_fromstring(content)
+    except (etree.ParserError, ValueError):
+        return None
+
+
+def _first_text(root: lxml.html.HtmlElement, *selectors: etree.XPath) -> Optional[str]:
+    """Text of the first element matched by the first selector that matches."""
+    for selector in selectors:
+        found = selector(root)
+        if found:
+            return found[0].text_content()
+    return None
+
+
+def parse_book_page(content: Union[bytes, str]) -> Tuple[List[str], str, str]:
+    """
+    Parse download links, title and author from a LibGen book page.
+    
+    Args:
+        content: Raw HTML of the book page
+        
+    Returns:
+        Tuple of (download_links, title, author); the primary GET link comes first,
+        followed by the IPFS links
+    """
+    root = _parse_html(content)
+    if root is None:
+        return [], "Unknown_Title", "Unknown_Author"
+    
+    # Extract title
+    title = _first_text(root, _FIRST_H1)
+    title = title.strip() if title is not None else "Unknown_Title"
+    
+    # Extract author
+    author = "Unknown_Author"
+    author_text = _first_text(root, _AUTHOR_PARAGRAPH)
+    if author_text:
+        if ':' in author_text:
+            author = author_text.split(':', 1)[1].strip()
+        else:
+            author = author_text.replace('Author(s)', '').strip()
+    
+    # The main GET links come first (primary method), then the IPFS links (Cloudflare, IPFS.io, etc.)
+    download_links = [str(href) for href in _H2_LINKS(root) if href]
+    download_links.extend(str(href) for href in _IPFS_LIST_LINKS(root) if href)
+    
+    return download_links, title, author
+
+
+def cached_book_page(cache: PageCache, page_url: str) -> Optional[Tuple[List[str], str, str]]:
+    """
+    Look up a book page's download links, title and author in the page cache.
+    
+    Extractions made by an older parser are redone from the cached page.
+    
+    Args:
+        cache: Page cache
+        page_url: URL of the book page
+        
+    Returns:
+        Tuple of (absolute download_links, title, author), or None on a cache miss
+    """
+    data = cache.get_extracted(page_url, "book")
+    if data is None:
+        content = cache.get_page(page_url)
+        if content is None:
+            return None
+        download_links, title, author = parse_book_page(content)
+        if not download_links:
+            return None
+        data = {"links": [urljoin(page_url, link) for link in download_links], "title": title, "author": author}
+        cache.put(page_url, "book", data)
+    return data["links"], data["title"], data["author"]
+
+
+def parse_ipfs_page(
+    content: Union[bytes, str],
+    use_ipfs_gateway: bool = True,
+    ipfs_gateway_urls: Optional[List[str]] = None
+) -> Tuple[List[str], str]:
+    """
+    Parse IPFS links and the title with format from a LibGen page.
+    
+    Args:
+        content: Raw HTML of the page
+        use_ipfs_gateway: Whether relative /ipfs/ paths are expanded with the gateways
+        ipfs_gateway_urls: Gateway URL prefixes
+        
+    Returns:
+        Tuple of (ipfs_links, title_with_format)
+    """
+    root = _parse_html(content)
+    if root is None:
+        return [], "Unknown_Title.pdf"
+    
+    # Extract IPFS links
+    ipfs_links = []
+    for href in _ALL_HREFS(root):
+        href = str(href)
+        if 'ipfs' in href:
+            ipfs_links.append(href)
+        elif use_ipfs_gateway and '/ipfs/' in href:
+            # Extract IPFS hash if it's a relative path
+            ipfs_hash = href.split('/ipfs/', 1)[1].split('/', 1)[0]
+            if ipfs_hash:
+                for gateway_url in ipfs_gateway_urls or []:
+                    ipfs_links.append(f"{gateway_url}{ipfs_hash}")
+    
+    # Extract title
+    title = _first_text(root, _FIRST_H1, _FIRST_TITLE)
+    title = title.strip() if title is not None else 'Unknown_Title'
+    
+    # Extract format (a "Format:" paragraph, or a table cell as the alternative)
+    book_format = 'pdf'  # Default format
+    format_text = _first_text(root, _FORMAT_PARAGRAPH, _FORMAT_CELL)
+    if format_text:
+        if "Format:" in format_text:
+            book_format = format_text.split("Format:")[-1].strip()
+        elif ":" in format_text:
+            book_format = format_text.split(":", 1)[1].strip()
+    
+    # Sanitize filename
+    title = FileHelpers.sanitize_filename(title)
+    return ipfs_links, f"{title}.{book_format}"
 
 
 class LibgenScraper:
@@ -21,7 +184,9 @@ class LibgenScraper:
         self, 
         session: requests.Session, 
         config: AppConfig,
-        logger: logging.Logger
+        logger: logging.Logger,
+        mirror_selector: Optional[MirrorSelector] = None,
+        page_cache: Optional[PageCache] = None
     ):
         """
         Initialize LibGen scraper.
@@ -30,10 +195,14 @@ class LibgenScraper:
             session: Requests session for making HTTP requests
             config: Application configuration
             logger: Logger instance
+            mirror_selector: Optional selector used to race the LibGen domains
+            page_cache: Optional cache of fetched pages (the configured one if not given)
         """
         self.session = session
         self.config = config
         self.logger = logger
+        self.mirror_selector = mirror_selector or MirrorSelector(config, logger)
+        self.page_cache = page_cache or create_page_cache(config)
         
         # Configure the session with user agent
         self.session.headers.update({"User-Agent": config.user_agent})
@@ -59,8 +228,9 @@ class LibgenScraper:
                 if "/" in path:
                     path = "/" + path.split("/", 1)[1]
             
-            # Add all configured domains
+            # Add all configured domains, fastest first
             urls_to_try = [f"https://{domain}{path}" for domain in self.config.libgen_domains]
+            urls_to_try = self.mirror_selector.rank_sync(urls_to_try)
             self.logger.info(f"Will try multiple domains: {urls_to_try}")
         
         # Try each URL
@@ -83,49 +253,34 @@ class LibgenScraper:
         Returns:
             A tuple containing a list of IPFS links and the title with format
         """
+        # Pages seen within the cache TTL are not fetched again
+        cached = self.page_cache.get_extracted(url, "ipfs")
+        if cached is not None:
+            self.logger.info(f"Using cached page for {url}")
+            return cached["links"], cached["title"]
+        content = self.page_cache.get_page(url)
+        if content is not None:
+            ipfs_links, title_with_format = parse_ipfs_page(
+                content,
+                self.config.use_ipfs_gateway,
+                self.config.ipfs_gateway_urls
+            )
+            if ipfs_links:
+                self.page_cache.put(url, "ipfs", {"links": ipfs_links, "title": title_with_format})
+                return ipfs_links, title_with_format
+        
         for attempt in range(self.config.max_retries):
             try:
                 response = self.session.get(url, timeout=self.config.timeout_seconds)
                 response.raise_for_status()
                 
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Extract IPFS links
-                ipfs_links = []
-                for a in soup.find_all('a', href=True):
-                    href = a['href']
-                    if 'ipfs' in href:
-                        ipfs_links.append(href)
-                    elif self.config.use_ipfs_gateway and '/ipfs/' in href:
-                        # Extract IPFS hash if it's a relative path
-                        ipfs_hash = href.split('/ipfs/', 1)[1].split('/', 1)[0]
-                        if ipfs_hash:
-                            for gateway_url in self.config.ipfs_gateway_urls:
-                                ipfs_links.append(f"{gateway_url}{ipfs_hash}")
-                
-                # Extract title
-                title_tag = soup.find('h1')
-                if not title_tag:
-                    title_tag = soup.find('title')
-                title = title_tag.text.strip() if title_tag else 'Unknown_Title'
-                
-                # Extract format
-                format_tag = soup.find(lambda tag: tag.name == "p" and "Format:" in tag.text)
-                if not format_tag:
-                    # Try alternative format detection methods
-                    format_tag = soup.find(lambda tag: tag.name == "td" and "Format" in tag.text)
-                
-                book_format = 'pdf'  # Default format
-                if format_tag:
-                    format_text = format_tag.text
-                    if "Format:" in format_text:
-                        book_format = format_text.split("Format:")[-1].strip()
-                    elif ":" in format_text:
-                        book_format = format_text.split(":", 1)[1].strip()
-                
-                # Sanitize filename
-                title = FileHelpers.sanitize_filename(title)
-                title_with_format = f"{title}.{book_format}"
+                ipfs_links, title_with_format = parse_ipfs_page(
+                    response.content,
+                    self.config.use_ipfs_gateway,
+                    self.config.ipfs_gateway_urls
+                )
+                if ipfs_links:
+                    self.page_cache.put(url, "ipfs", {"links": ipfs_links, "title": title_with_format}, response.content)
                 
                 return ipfs_links, title_with_format
                 
@@ -0,0 +1,264 @@
+"""
+Resumable transfer helpers for the LibGen Downloader.
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+
+PART_SUFFIX = ".part"
+HASH_READ_SIZE = 1024 * 1024
+
+
+class DownloadError(Exception):
+    """Base class for transfer errors."""
+
+
+class IncompleteDownloadError(DownloadError):
+    """The transfer ended before Content-Length bytes arrived; the .part file is kept for resuming."""
+
+
+class DownloadVerificationError(DownloadError):
+    """The finished file does not match its expected hash; the .part file is discarded."""
+
+
+def md5_from_url(url: str) -> Optional[str]:
+    """
+    Extract the MD5 a LibGen URL identifies its file by (e.g. ads.php?md5=...).
+    
+    Args:
+        url: Book page or download URL
+    
+    Returns:
+        Lower-case MD5 hex digest, or None if the URL carries none
+    """
+    query = parse_qs(urlsplit(url).query)
+    for key in ("md5", "MD5"):
+        for value in query.get(key, []):
+            if re.fullmatch(r"[0-9a-fA-F]{32}", value):
+                return value.lower()
+    match = re.search(r"/(?:md5/)?([0-9a-fA-F]{32})(?:[/.?]|$)", urlsplit(url).path)
+    return match.group(1).lower() if match else None
+
+
+def parse_content_range(header: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Parse a Content-Range header.
+    
+    Args:
+        header: Header value, e.g. "bytes 100-199/1000" or "bytes */1000"
+    
+    Returns:
+        Tuple of (first byte position, complete length); each is None if unknown
+    """
+    if not header:
+        return None, None
+    match = re.match(r"\s*bytes\s+(?:(\d+)-\d+|\*)/(\d+|\*)", header, flags=re.IGNORECASE)
+    if not match:
+        return None, None
+    start = int(match.group(1)) if match.group(1) is not None else None
+    total = int(match.group(2)) if match.group(2) != "*" else None
+    return start, total
+
+
+class PartialDownload:
+    """
+    One file being downloaded into a .part file next to its final path.
+    
+    The .part file survives failures, so the next attempt (or the next run) can
+    ask the server for the remaining bytes with a Range header. When the transfer
+    is done its size is checked against Content-Length, its MD5 against the
+    expected hash (if one is known), and it is renamed atomically to the final
+    path.
+    
+    Usage:
+        partial = PartialDownload(file_path, expected_md5)
+        response = get(url, headers=partial.request_headers())
+        mode = partial.begin(response.status_code, response.headers)
+        if mode:
+            with open(partial.part_path, mode) as f:
+                for chunk in response: f.write(chunk); partial.update(chunk)
+        partial.finish()
+    """
+    
+    def __init__(self, file_path: Path, expected_md5: Optional[str] = None):
+        """
+        Initialize partial download.
+        
+        Args:
+            file_path: Final path of the file
+            expected_md5: Optional MD5 hex digest the finished file must match
+        """
+        self.file_path = file_path
+        self.part_path = file_path.with_name(file_path.name + PART_SUFFIX)
+        self.expected_md5 = expected_md5.lower() if expected_md5 else None
+        self.offset = self.part_path.stat().st_size if self.part_path.exists() else 0
+        self.expected_size: Optional[int] = None
+        self.resumed = False
+        self._hasher = None
+    
+    def request_headers(self) -> Dict[str, str]:
+        """Headers for the next request (a Range header when the .part file holds data)."""
+        self.offset = self.part_path.stat().st_size if self.part_path.exists() else 0
+        return {"Range": f"bytes={self.offset}-"} if self.offset else {}
+    
+    def begin(self, status_code: int, headers: Mapping[str, str]) -> Optional[str]:
+        """
+        Inspect the response and prepare the .part file.
+        
+        Args:
+            status_code: HTTP status of the response
+            headers: Response headers
+        
+        Returns:
+            File mode to write the body with ('ab' to append, 'wb' to start over),
+            or None if the .part file already holds the whole file
+        
+        Raises:
+            DownloadError: If the server answered a Range request inconsistently
+        """
+        if status_code == 416 and self.offset:
+            # Nothing left to send: the .part file is complete if its size matches
+            _, total = parse_content_range(headers.get("content-range"))
+            if total is not None and total == self.offset:
+                self.expected_size = total
+                self.resumed = True
+                self._start_hash(resume=True)
+                return None
+            self.discard()
+            raise IncompleteDownloadError("Server rejected the resume range; restarting from scratch")
+        
+        if status_code == 206 and self.offset:
+            start, total = parse_content_range(headers.get("content-range"))
+            if start != self.offset:
+                self.discard()
+                raise IncompleteDownloadError(f"Server resumed at byte {start} instead of {self.offset}; restarting")
+            self.expected_size = total
+            self.resumed = True
+            self._start_hash(resume=True)
+            return "ab"
+        
+        # Full response (no Range sent, or the server ignores Range)
+        self.offset = 0
+        length = headers.get("content-length")
+        self.expected_size = int(length) if length and length.isdigit() else None
+        self.resumed = False
+        self._start_hash(resume=False)
+        return "wb"
+    
+    def _start_hash(self, resume: bool) -> None:
+        """Start hashing (over the bytes already on disk when resuming)."""
+        if not self.expected_md5:
+            return
+        self._hasher = hashlib.md5()
+        if resume:
+            with open(self.part_path, "rb") as f:
+                for block in iter(lambda: f.read(HASH_READ_SIZE), b""):
+                    self._hasher.update(block)
+    
+    def update(self, chunk: bytes) -> None:
+        """Feed a written chunk to the running hash."""
+        if self._hasher is not None:
+            self._hasher.update(chunk)
+    
+    def finish(self) -> int:
+        """
+        Verify the .part file and move it to the final path.
+        
+        Returns:
+            Size of the finished file in bytes
+        
+        Raises:
+            IncompleteDownloadError: If fewer bytes than expected arrived (.part is kept)
+            DownloadVerificationError: If the MD5 does not match (.part is removed)
+        """
+        size = self.part_path.stat().st_size if self.part_path.exists() else 0
+        if self.expected_size is not None and size != self.expected_size:
+            self.offset = size
+            raise IncompleteDownloadError(f"Received {size} of {self.expected_size} bytes")
+        
+        if self._hasher is not None and self._hasher.hexdigest() != self.expected_md5:
+            digest = self._hasher.hexdigest()
+            self.discard()
+            raise DownloadVerificationError(f"MD5 mismatch: expected {self.expected_md5}, got {digest}")
+        
+        os.replace(self.part_path, self.file_path)
+        return size
+    
+    @property
+    def md5(self) -> Optional[str]:
+        """MD5 of the finished file, if it was hashed."""
+        return self._hasher.hexdigest() if self._hasher is not None else None
+    
+    def discard(self) -> None:
+        """Delete the .part file so the next attempt starts from scratch."""
+        self.part_path.unlink(missing_ok=True)
+        self.offset = 0
+
+
+class DownloadState:
+    """
+    Persistent record of completed downloads, keyed by book page URL.
+    
+    Stored as JSON and rewritten atomically after every change, so a rerun can
+    skip URLs that are already complete (as long as their file still exists).
+    """
+    
+    def __init__(self, path: Path):
+        """
+        Initialize download state.
+        
+        Args:
+            path: Path of the JSON state file
+        """
+        self.path = path
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        if path.exists():
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self.entries = json.load(f).get("downloads", {})
+            except (OSError, ValueError):
+                # A damaged state file only means completed URLs are downloaded again
+                self.entries = {}
+    
+    def is_complete(self, url: str) -> bool:
+        """Whether the URL was downloaded completely and its file is still present."""
+        entry = self.entries.get(url)
+        if not entry or entry.get("status") != "complete":
+            return False
+        file_path = Path(entry.get("file", ""))
+        return file_path.is_file() and (entry.get("size") is None or file_path.stat().st_size == entry["size"])
+    
+    def mark_complete(self, url: str, file_path: Path, size: int, md5: Optional[str] = None, source: Optional[str] = None) -> None:
+        """
+        Record a finished download.
+        
+        Args:
+            url: Book page URL
+            file_path: Path of the downloaded file
+            size: File size in bytes
+            md5: MD5 of the file, if known
+            source: Link the file was downloaded from
+        """
+        self.entries[url] = {
+            "status": "complete",
+            "file": str(file_path),
+            "size": size,
+            "md5": md5,
+            "source": source,
+            "completed_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        self.save()
+    
+    def save(self) -> None:
+        """Write the state file atomically."""
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"downloads": self.entries}, f, indent=2)
+        os.replace(tmp_path, self.path)
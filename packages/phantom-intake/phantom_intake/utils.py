@@ -61,6 +61,26 @@ class FileHelpers:
             
         return sanitized
     
+    @staticmethod
+    def build_book_filename(title: str, author: str, download_url: str) -> str:
+        """
+        Build a clean "Author - Title.ext" filename for a download link.
+        
+        Args:
+            title: Book title
+            author: Book author
+            download_url: Link the file is downloaded from (its extension is kept)
+            
+        Returns:
+            Sanitized filename (extension defaults to pdf)
+        """
+        extension = "pdf"  # Default
+        url_basename = os.path.basename(download_url.split('?')[0])
+        if "." in url_basename:
+            extension = url_basename.split('.')[-1]
+        
+        return FileHelpers.sanitize_filename(f"{author} - {title}.{extension}")
+    
     @staticmethod
     def ensure_directory_exists(directory: Path) -> None:
         """
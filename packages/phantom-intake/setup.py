@@ -38,7 +38,8 @@ setup(
     python_requires=">=3.7",
     install_requires=[
         "requests>=2.28.1",
-        "beautifulsoup4>=4.11.1",
+        "httpx>=0.27.0",
+        "lxml>=4.9.0",
         "rich>=12.0.0",
         "pyyaml>=6.0",
     ],
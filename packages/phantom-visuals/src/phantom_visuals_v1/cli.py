@@ -147,6 +147,11 @@ def transform_images(
         "-B",
         help="Process multiple images using a glob pattern",
     ),
+    cache_fields: bool = typer.Option(
+        False,
+        "--cache-fields",
+        help="Keep flow fields, grain and vignette masks under <output>/.field_cache for later runs (batch only)",
+    ),
     log_level: str = typer.Option(
         "INFO",
         "--log-level",
@@ -174,6 +179,7 @@ def transform_images(
             "output_format": output_format,
             "seed": seed,
             "batch": batch,
+            "cache_fields": cache_fields,
             "save_config": save_config,
             "load_config": load_config,
         }
@@ -241,7 +247,9 @@ def transform_images(
                 task = progress.add_task(
                     "[phantom]Transforming images...[/phantom]", total=None
                 )
-                results = transformer.batch_transform(input_path, output_dir, style)
+                results = transformer.batch_transform(
+                    input_path, output_dir, style, cache_fields=cache_fields
+                )
                 progress.update(task, completed=len(results), total=len(results))
 
             # Log success
@@ -1034,6 +1042,22 @@ def explore_styles(
     height: int = typer.Option(
         1600, "--height", "-H", help="Height for abstract compositions"
     ),
+    cache_fields: bool = typer.Option(
+        False,
+        "--cache-fields",
+        help="Keep flow fields, grain and vignette masks under <output>/.field_cache for later runs",
+    ),
+    workers: Optional[int] = typer.Option(
+        None,
+        "--workers",
+        "-j",
+        help="Grid cells processed in parallel (defaults to the CPU count; 1 = no pool)",
+    ),
+    cell_timeout: float = typer.Option(
+        600.0,
+        "--cell-timeout",
+        help="Seconds after which a single style/image cell is abandoned (0 = no limit)",
+    ),
     log_level: str = typer.Option("INFO", "--log-level", help="Logging level"),
 ) -> None:
     """Explore style variations using default mode OR predefined 'best flavor' parameters."""
@@ -1104,6 +1128,9 @@ def explore_styles(
                 "output_format": output_format,
                 "seed": seed,
                 "abstract": abstract,
+                "cache_fields": cache_fields,
+                "workers": workers,
+                "cell_timeout": cell_timeout,
                 "width": width,
                 "height": height,
             }
@@ -1131,9 +1158,9 @@ def explore_styles(
             if abstract:
                 # --- Abstract Exploration ---
                 if not styles:
-                    log_info(logger, "Generating abstract for all styles.")
+                    logger.info("Generating abstract for all styles.")
                 if not color_schemes:
-                    log_info(logger, "Using default color scheme for abstract.")
+                    logger.info("Using default color scheme for abstract.")
 
                 results = explorer.explore_abstract_styles(
                     width=width,
@@ -1152,9 +1179,9 @@ def explore_styles(
             else:
                 # --- Author Image Exploration ---
                 if not styles:
-                    log_info(logger, "Exploring all styles on images.")
+                    logger.info("Exploring all styles on images.")
                 if not color_schemes:
-                    log_info(logger, "Using default color scheme for exploration.")
+                    logger.info("Using default color scheme for exploration.")
 
                 # Call the original exploration method, passing overrides
                 results = explorer.explore_author_styles(
@@ -1169,8 +1196,18 @@ def explore_styles(
                     vignette=vignette,
                     seed=seed,
                     output_format=output_format,
+                    cache_fields=cache_fields,
+                    workers=workers,
+                    cell_timeout=cell_timeout or None,
                 )
                 summary_title = "Image Style Exploration Summary"
+                run = explorer.last_run
+                console.print(
+                    f"[bold green]✓[/] {run['completed']}/{run['cells']} cells in {run['seconds']:.1f}s "
+                    f"on {run['workers']} worker(s): [cyan]{run['cells_per_minute']:.1f} cells/min[/]"
+                    + (f", {run['failed']} failed" if run["failed"] else "")
+                    + (f", {run['timed_out']} timed out" if run["timed_out"] else "")
+                )
                 # Output dir structure is now <output_dir>/<image_name>/<image>_<style>[_color].png
                 output_location_msg = f"Open the subdirectories within {explorer.output_dir} to compare styles per image."
 
@@ -0,0 +1,240 @@
+# packages/phantom-visuals/phantom_visuals/core/analysis.py
+
+"""Per-image analysis shared by the Phantom Visuals styles.
+
+Most styles start from the same derived maps of their input: grayscale,
+CLAHE-enhanced grayscale, blurred versions, Sobel gradients, the structure
+tensor and good features to track. ImageAnalysis computes each map lazily,
+once per set of parameters, and the analyses themselves are memoized by
+image content, so applying several styles to one image does this work once.
+
+Returned maps are read-only; styles that modify a map must copy it first.
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+
+import cv2
+import numpy as np
+from skimage.feature import structure_tensor as _structure_tensor
+
+# Number of recent images whose analyses are kept
+MAX_CACHED_ANALYSES = 2
+
+
+def _content_key(image: np.ndarray) -> str:
+    """Hash of an image's shape, dtype and pixels."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((image.shape, image.dtype.str)).encode("ascii"))
+    digest.update(np.ascontiguousarray(image).data)
+    return digest.hexdigest()
+
+
+def _read_only(value: Any) -> Any:
+    """Mark an array (or a tuple of arrays) read-only."""
+    if isinstance(value, np.ndarray):
+        value.setflags(write=False)
+    elif isinstance(value, tuple):
+        for item in value:
+            _read_only(item)
+    return value
+
+
+class ImageAnalysis:
+    """Lazily computed, memoized derived maps of one input image.
+
+    Usage:
+        analysis = ImageAnalysis.of(img)
+        gray = analysis.gray()
+        Axx, Axy, Ayy = analysis.structure_tensor(sigma=3.0, blur_ksize=5, source="clahe")
+    """
+
+    _cache: "OrderedDict[str, ImageAnalysis]" = OrderedDict()
+
+    def __init__(self, image: np.ndarray, key: Optional[str] = None):
+        """Initialize the analysis.
+
+        Args:
+            image: Input image (RGB or grayscale); writable images are copied
+            key: Content hash of the image, if already known
+        """
+        if image.flags.writeable:
+            image = image.copy()
+            image.setflags(write=False)
+        self.image = image
+        self.key = key or _content_key(image)
+        self._maps: dict[Tuple[Any, ...], Any] = {}
+
+    @classmethod
+    def of(cls, image: np.ndarray) -> "ImageAnalysis":
+        """Return the memoized analysis of an image, creating it if needed.
+
+        Read-only arrays are matched by identity first, which skips hashing
+        when the same decoded image is processed repeatedly.
+        """
+        if not image.flags.writeable:
+            for analysis in cls._cache.values():
+                if analysis.image is image:
+                    return analysis
+        key = _content_key(image)
+        analysis = cls._cache.get(key)
+        if analysis is None:
+            analysis = cls(image, key)
+            cls._cache[key] = analysis
+            while len(cls._cache) > MAX_CACHED_ANALYSES:
+                cls._cache.popitem(last=False)
+        else:
+            cls._cache.move_to_end(key)
+        return analysis
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget all memoized analyses."""
+        cls._cache.clear()
+
+    def matches(self, image: np.ndarray) -> bool:
+        """Whether `image` has exactly the analysed content."""
+        return image is self.image or (
+            image.shape == self.image.shape
+            and image.dtype == self.image.dtype
+            and np.array_equal(image, self.image)
+        )
+
+    def _memo(self, key: Tuple[Any, ...], compute: Callable[[], Any]) -> Any:
+        value = self._maps.get(key)
+        if value is None:
+            value = _read_only(compute())
+            self._maps[key] = value
+        return value
+
+    def gray(self) -> np.ndarray:
+        """Grayscale version (uint8, cv2.COLOR_RGB2GRAY weights)."""
+        return self._memo(
+            ("gray",),
+            lambda: cv2.cvtColor(self.image, cv2.COLOR_RGB2GRAY)
+            if self.image.ndim == 3
+            else self.image.copy(),
+        )
+
+    def clahe(
+        self, clip_limit: float = 2.0, tile_grid_size: Tuple[int, int] = (8, 8)
+    ) -> np.ndarray:
+        """CLAHE-enhanced grayscale."""
+        return self._memo(
+            ("clahe", float(clip_limit), tuple(tile_grid_size)),
+            lambda: cv2.createCLAHE(
+                clipLimit=clip_limit, tileGridSize=tuple(tile_grid_size)
+            ).apply(self.gray()),
+        )
+
+    def _source(self, source: str, clip_limit: float) -> np.ndarray:
+        """Base map a derived map starts from ("gray" or "clahe")."""
+        if source == "clahe":
+            return self.clahe(clip_limit)
+        if source == "gray":
+            return self.gray()
+        raise ValueError(f"Unknown analysis source: {source}")
+
+    @staticmethod
+    def _source_key(source: str, clip_limit: float) -> Tuple[Any, ...]:
+        return (source, float(clip_limit)) if source == "clahe" else (source,)
+
+    def blurred(
+        self, ksize: int, source: str = "gray", clip_limit: float = 2.0
+    ) -> np.ndarray:
+        """Gaussian blur with a (ksize, ksize) kernel; ksize <= 1 returns the source."""
+        if ksize <= 1:
+            return self._source(source, clip_limit)
+        return self._memo(
+            ("blurred", int(ksize), *self._source_key(source, clip_limit)),
+            lambda: cv2.GaussianBlur(
+                self._source(source, clip_limit), (int(ksize), int(ksize)), 0
+            ),
+        )
+
+    def gradients(
+        self,
+        ksize: int = 3,
+        blur_ksize: int = 5,
+        source: str = "gray",
+        clip_limit: float = 2.0,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Float32 Sobel gradients (grad_x, grad_y) of the blurred source."""
+
+        def compute() -> Tuple[np.ndarray, np.ndarray]:
+            smooth = self.blurred(blur_ksize, source, clip_limit)
+            return (
+                cv2.Sobel(smooth, cv2.CV_32F, 1, 0, ksize=ksize),
+                cv2.Sobel(smooth, cv2.CV_32F, 0, 1, ksize=ksize),
+            )
+
+        key = ("gradients", int(ksize), int(blur_ksize))
+        return self._memo(key + self._source_key(source, clip_limit), compute)
+
+    def gradient_magnitude(self, ksize: int = 3, blur_ksize: int = 5) -> np.ndarray:
+        """Gradient magnitude of the grayscale image, scaled to [0, 1] (0 = smooth, 1 = edge)."""
+
+        def compute() -> np.ndarray:
+            # Even kernel sizes are rounded up, as GaussianBlur requires odd sizes
+            blur = blur_ksize if blur_ksize <= 0 or blur_ksize % 2 else blur_ksize + 1
+            grad_x, grad_y = self.gradients(ksize, blur)
+            magnitude = cv2.magnitude(grad_x, grad_y)
+            min_val, max_val = np.min(magnitude), np.max(magnitude)
+            if max_val > min_val:
+                return (magnitude - min_val) / (max_val - min_val)
+            return np.zeros_like(magnitude, dtype=np.float32)
+
+        return self._memo(("gradient_magnitude", int(ksize), int(blur_ksize)), compute)
+
+    def structure_tensor(
+        self,
+        sigma: float,
+        blur_ksize: int = 5,
+        source: str = "gray",
+        clip_limit: float = 2.0,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Structure tensor (Axx, Axy, Ayy) of the blurred source (mode="reflect", order="xy")."""
+        key = ("structure_tensor", float(sigma), int(blur_ksize))
+        return self._memo(
+            key + self._source_key(source, clip_limit),
+            lambda: tuple(
+                _structure_tensor(
+                    self.blurred(blur_ksize, source, clip_limit),
+                    sigma=sigma,
+                    mode="reflect",
+                    order="xy",
+                )
+            ),
+        )
+
+    def good_features(
+        self,
+        max_corners: int,
+        quality_level: float,
+        min_distance: float,
+        block_size: int = 7,
+        source: str = "gray",
+        clip_limit: float = 2.0,
+    ) -> Optional[np.ndarray]:
+        """cv2.goodFeaturesToTrack corners (N x 1 x 2 float32) of the source, or None."""
+        key = (
+            "good_features",
+            int(max_corners),
+            float(quality_level),
+            float(min_distance),
+            int(block_size),
+            *self._source_key(source, clip_limit),
+        )
+        if key in self._maps:
+            return self._maps[key]
+        corners = cv2.goodFeaturesToTrack(
+            self._source(source, clip_limit),
+            max_corners,
+            quality_level,
+            min_distance,
+            blockSize=block_size,
+            useHarrisDetector=False,
+        )
+        self._maps[key] = _read_only(corners)
+        return corners
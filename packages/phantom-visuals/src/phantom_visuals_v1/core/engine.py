@@ -13,8 +13,10 @@ import random
 import numpy as np
 from PIL import Image
 
+from phantom_visuals.core.analysis import ImageAnalysis
 from phantom_visuals.core.config import Configuration, StyleVariant, ColorScheme
 from phantom_visuals.core.palette import ColorPalette
+from phantom_visuals.utils.buffers import frame_pool, is_frame, run_pipeline
 
 
 class StyleEngine:
@@ -29,6 +31,8 @@ class StyleEngine:
         self.config = config or Configuration()
         self.palette = ColorPalette.from_scheme(self.config.color_scheme)
         self._transformations: List[Callable] = []
+        self.analysis: Optional[ImageAnalysis] = None
+        self._input_image: Optional[np.ndarray] = None
 
     def set_config(self, config: Configuration) -> "StyleEngine":
         """Update the engine configuration."""
@@ -71,7 +75,8 @@ class StyleEngine:
         """Save a numpy array as an image.
 
         Args:
-            image: Numpy array representing the image
+            image: Numpy array representing the image, or a working frame
+                returned by process_image(quantize=False) (consumed)
             path: Path where the image should be saved
 
         Returns:
@@ -80,6 +85,10 @@ class StyleEngine:
         path = Path(path)
         os.makedirs(path.parent, exist_ok=True)
 
+        # Working frames are quantized to uint8 once, here
+        if is_frame(image) and frame_pool.owns(image):
+            image = frame_pool.quantize(image)
+
         # Convert the numpy array back to PIL Image
         img = Image.fromarray(image.astype(np.uint8))
 
@@ -96,27 +105,68 @@ class StyleEngine:
 
         return path
 
-    def process_image(self, image: np.ndarray) -> np.ndarray:
+    def process_image(
+        self,
+        image: np.ndarray,
+        analysis: Optional[ImageAnalysis] = None,
+        quantize: bool = True,
+    ) -> np.ndarray:
         """Apply all transformations in the pipeline to the image.
 
+        Transformations can reuse derived maps of the input (grayscale, CLAHE,
+        gradients, structure tensor...) through analysis_for; the input's
+        ImageAnalysis is looked up (memoized per image content) the first
+        time one asks for it.
+
+        Effect chains pass their float32 working frame on to the next chain
+        (see utils.buffers); other transformations get a uint8 image, and the
+        input image itself is never modified.
+
         Args:
             image: Numpy array representing the input image
+            analysis: Analysis of the input image (looked up lazily if not given)
+            quantize: If False, the result may be a float32 working frame, to
+                be quantized by save_image
 
         Returns:
             The processed image as a numpy array
         """
+        self._input_image = image
+        self.analysis = analysis
+
         # Set the random seed for reproducible results
         if self.config.effect_params.seed is not None:
             random.seed(self.config.effect_params.seed)
             np.random.seed(self.config.effect_params.seed)
 
-        result = image.copy()
-
         # Apply each transformation in sequence
-        for transform in self._transformations:
-            result = transform(result, self.config, self.palette)
+        return run_pipeline(
+            self._transformations, image, self.config, self.palette, quantize
+        )
 
-        return result
+    def analysis_for(self, image: np.ndarray) -> ImageAnalysis:
+        """Return the analysis of an image seen by a transformation.
+
+        This is the input's analysis while the image is unchanged (e.g. in the
+        first transformation); images modified by earlier transformations get
+        their own memoized analysis.
+
+        Args:
+            image: Image passed to the transformation
+
+        Returns:
+            ImageAnalysis of the image
+        """
+        if self.analysis is None and self._input_image is not None:
+            if image is self._input_image or (
+                image.shape == self._input_image.shape
+                and np.array_equal(image, self._input_image)
+            ):
+                self.analysis = ImageAnalysis.of(self._input_image)
+                return self.analysis
+        if self.analysis is not None and self.analysis.matches(image):
+            return self.analysis
+        return ImageAnalysis.of(image)
 
     def transform(
         self, input_path: Union[str, Path], output_path: Union[str, Path]
@@ -131,7 +181,7 @@ class StyleEngine:
             The path where the transformed image was saved
         """
         image = self.load_image(input_path)
-        processed = self.process_image(image)
+        processed = self.process_image(image, quantize=False)
         return self.save_image(processed, output_path)
 
     def batch_transform(
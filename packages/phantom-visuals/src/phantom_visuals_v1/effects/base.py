@@ -8,10 +8,12 @@ image effects together.
 """
 
 from typing import List, Callable, Dict, Any, Optional
+import functools
 import numpy as np
 
 from phantom_visuals.core.config import Configuration
 from phantom_visuals.core.palette import ColorPalette
+from phantom_visuals.utils.buffers import CHAIN, run_pipeline
 
 
 EffectFunction = Callable[[np.ndarray, Configuration, ColorPalette], np.ndarray]
@@ -23,42 +25,59 @@ class EffectChain:
 
     This class allows for a fluent interface to build up a sequence of
     image processing effects that can be applied to an image.
+
+    Effects declared with utils.buffers.buffer_effect share one float32
+    working frame across the chain instead of converting the image to
+    float and back at every step; the frame is quantized to uint8 only
+    before undeclared effects and at the end (or, for chains run by the
+    StyleEngine, when the result is saved).
     """
 
+    # Chains take over working frames from an enclosing pipeline
+    buffer_mode = CHAIN
+
     def __init__(self):
         """Initialize an empty effect chain."""
         self._effects: List[EffectFunction] = []
 
-    def add(self, effect: EffectFunction) -> "EffectChain":
+    def add(self, effect: EffectFunction, **params: Any) -> "EffectChain":
         """
         Add an effect to the chain.
 
         Args:
             effect: A function that takes an image array, config, and palette
                    and returns a processed image array
+            **params: Keyword arguments bound to the effect; unlike a wrapping
+                   lambda, this keeps the effect's buffer mode visible
 
         Returns:
             The EffectChain instance for method chaining
         """
-        self._effects.append(effect)
+        self._effects.append(functools.partial(effect, **params) if params else effect)
         return self
 
-    def apply(self, image: np.ndarray, config: Configuration, palette: ColorPalette) -> np.ndarray:
+    def apply(
+        self,
+        image: np.ndarray,
+        config: Configuration,
+        palette: ColorPalette,
+        quantize: bool = True
+    ) -> np.ndarray:
         """
         Apply all effects in the chain to the image.
 
         Args:
-            image: The input image as a numpy array
+            image: The input image as a numpy array (not modified), or a
+                   working frame handed over by an enclosing pipeline
             config: The configuration object
             palette: The color palette to use
+            quantize: If False, the float32 working frame may be returned
+                   instead of a uint8 image (see utils.buffers)
 
         Returns:
             The processed image as a numpy array
         """
-        result = image.copy()
-        for effect in self._effects:
-            result = effect(result, config, palette)
-        return result
+        return run_pipeline(self._effects, image, config, palette, quantize)
 
     def reset(self) -> "EffectChain":
         """
@@ -93,12 +112,10 @@ def compose_effects(*effects: EffectFunction) -> EffectFunction:
         *effects: One or more effect functions to compose
 
     Returns:
-        A single effect function that applies all the input effects in sequence
+        A single effect function (an EffectChain) that applies all the input
+        effects in sequence
     """
-    def composed_effect(image: np.ndarray, config: Configuration, palette: ColorPalette) -> np.ndarray:
-        result = image.copy()
-        for effect in effects:
-            result = effect(result, config, palette)
-        return result
-
-    return composed_effect
+    chain = EffectChain()
+    for effect in effects:
+        chain.add(effect)
+    return chain
@@ -15,13 +15,16 @@ import cv2
 
 from phantom_visuals.core.config import Configuration
 from phantom_visuals.core.palette import ColorPalette
+from phantom_visuals.utils.buffers import SCRATCH, buffer_effect
 
 
+@buffer_effect(SCRATCH)
 def gaussian_blur(
     image: np.ndarray,
     config: Configuration,
     palette: ColorPalette,
-    radius: Optional[float] = None
+    radius: Optional[float] = None,
+    out: Optional[np.ndarray] = None
 ) -> np.ndarray:
     """
     Apply Gaussian blur to an image.
@@ -31,6 +34,7 @@ def gaussian_blur(
         config: Configuration settings
         palette: Color palette (not used in this effect)
         radius: Blur radius (defaults to config.effect_params.blur_radius)
+        out: Optional array of the image's shape and type to write the result to
 
     Returns:
         Blurred image as numpy array
@@ -50,6 +54,7 @@ def gaussian_blur(
         (0, 0),
         sigmaX=radius,
         sigmaY=radius,
+        dst=out,
         borderType=cv2.BORDER_REFLECT
     )
 
@@ -13,8 +13,16 @@ import cv2
 
 from phantom_visuals.core.config import Configuration
 from phantom_visuals.core.palette import ColorPalette, RGBColor
+from phantom_visuals.utils.buffers import (
+    INPLACE,
+    buffer_effect,
+    finish_frame,
+    float_frame,
+    is_frame,
+)
 
 
+@buffer_effect(INPLACE)
 def adjust_contrast(
     image: np.ndarray,
     config: Configuration,
@@ -36,19 +44,24 @@ def adjust_contrast(
     if amount is None:
         amount = config.effect_params.contrast
 
-    # Convert to float for calculation
-    img_float = image.astype(np.float32) / 255.0
+    # Convert to float for calculation (working frames are adjusted in place)
+    result = float_frame(image)
+    result /= 255.0
 
     # Apply contrast adjustment: f(x) = (x - 0.5) * amount + 0.5
-    result = (img_float - 0.5) * amount + 0.5
+    result -= 0.5
+    result *= amount
+    result += 0.5
 
     # Clip values to valid range
-    result = np.clip(result, 0.0, 1.0)
+    np.clip(result, 0.0, 1.0, out=result)
 
     # Convert back to uint8
-    return (result * 255.0).astype(np.uint8)
+    result *= 255.0
+    return finish_frame(result, image)
 
 
+@buffer_effect(INPLACE)
 def adjust_brightness(
     image: np.ndarray,
     config: Configuration,
@@ -70,17 +83,19 @@ def adjust_brightness(
     if amount is None:
         amount = config.effect_params.brightness
 
-    # Convert to float for calculation
-    img_float = image.astype(np.float32) / 255.0
+    # Convert to float for calculation (working frames are adjusted in place)
+    result = float_frame(image)
+    result /= 255.0
 
     # Apply brightness adjustment: f(x) = x * amount
-    result = img_float * amount
+    result *= amount
 
     # Clip values to valid range
-    result = np.clip(result, 0.0, 1.0)
+    np.clip(result, 0.0, 1.0, out=result)
 
     # Convert back to uint8
-    return (result * 255.0).astype(np.uint8)
+    result *= 255.0
+    return finish_frame(result, image)
 
 
 def adjust_saturation(
@@ -148,6 +163,7 @@ def color_shift(
     return cv2.cvtColor(hsv.astype(np.uint8), cv2.COLOR_HSV2RGB)
 
 
+@buffer_effect(INPLACE)
 def invert_colors(
     image: np.ndarray,
     config: Configuration,
@@ -165,6 +181,8 @@ def invert_colors(
         Color-inverted image as numpy array
     """
     # Simple inversion: 255 - pixel value
+    if is_frame(image):
+        return np.subtract(255.0, image, out=image)
     return 255 - image
 
 
@@ -76,17 +76,108 @@ def wave_distortion(
     return result
 
 
+# Sort keys of pixel_sort that reorder whole pixels, as RGB channel indices
+_CHANNEL_KEYS = {"red": 0, "green": 1, "blue": 2}
+
+
+def _sort_key_values(image: np.ndarray, sort_key: str) -> np.ndarray:
+    """
+    Per-pixel values that pixel_sort orders whole pixels by.
+
+    Args:
+        image: Input image as numpy array
+        sort_key: "luminance", "hue", "red", "green" or "blue"
+
+    Returns:
+        HxW array of sort keys
+    """
+    if image.ndim == 2:
+        return image
+    if sort_key == "luminance":
+        return cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
+    if sort_key == "hue":
+        return cv2.cvtColor(image, cv2.COLOR_RGB2HSV_FULL)[:, :, 0]
+    return image[:, :, _CHANNEL_KEYS[sort_key]]
+
+
+def _sort_runs(
+    lines: np.ndarray,
+    mask: np.ndarray,
+    key: Optional[np.ndarray],
+    reverse: bool
+) -> None:
+    """
+    Sort every contiguous masked run of every line at once, in place.
+
+    Runs start and end where np.diff of the mask changes sign; a False
+    separator after each line keeps runs from spanning two lines. All runs
+    are sorted together by a segmented lexsort on (run id, key).
+
+    Args:
+        lines: C-contiguous NxL or NxLxC array of N lines of L pixels
+        mask: NxL boolean mask of the pixels to sort
+        key: NxL sort key of whole pixels, or None to sort each channel
+            of the pixels separately
+        reverse: If True, sort in descending order
+    """
+    count, length = mask.shape
+    padded = np.zeros((count, length + 1), dtype=bool)
+    padded[:, :length] = mask
+    padded = padded.ravel()
+
+    # Run ids number the runs in order of their first pixel
+    starts = np.diff(padded.view(np.int8), prepend=np.int8(0)) == 1
+    run_id = np.cumsum(starts, dtype=np.int64)
+    index = np.flatnonzero(padded)
+    if len(index) == 0:
+        return
+    run_id = run_id[index]
+    # Flat pixel index: drop the separators before each position
+    pixels = index - index // (length + 1)
+
+    def ordered(values: np.ndarray) -> np.ndarray:
+        # Negating the key sorts descending while keeping ties in place
+        if reverse:
+            widened = np.int32 if values.dtype.kind in "ub" else values.dtype
+            values = -values.astype(widened)
+        if values.dtype.kind not in "iub":
+            return np.lexsort((values, run_id))
+        # Integer keys pack (run id, key) into one int64, which a stable
+        # argsort orders the same way as lexsort, several times faster
+        low = int(values.min())
+        packed = run_id * (int(values.max()) - low + 1) + (values - low)
+        return np.argsort(packed, kind="stable")
+
+    # Gathering one channel at a time with flat indices is much faster than
+    # indexing whole pixels
+    channels = lines.reshape(count * length, -1).T
+    if key is not None:
+        sources = pixels[ordered(key.ravel()[pixels])]
+        for channel in channels:
+            channel[pixels] = channel[sources]
+    else:
+        for channel in channels:
+            values = channel[pixels]
+            channel[pixels] = values[ordered(values)]
+
+
 def pixel_sort(
     image: np.ndarray,
     config: Configuration,
     palette: ColorPalette,
     threshold: float = 0.5,
     sort_direction: str = "horizontal",
-    reverse: bool = False
+    reverse: bool = False,
+    sort_key: str = "channels"
 ) -> np.ndarray:
     """
     Apply pixel sorting effect to create glitchy streaks.
 
+    Contiguous runs of pixels brighter than the threshold are sorted along
+    rows, columns or both (rows first). With sort_key="channels" each color
+    channel of a run is sorted on its own, which smears colors apart; the
+    other keys reorder whole pixels, so every pixel keeps its color.
+
     Args:
         image: Input image as numpy array
         config: Configuration settings
@@ -94,123 +185,39 @@ def pixel_sort(
         threshold: Brightness threshold for sorting (0-1)
         sort_direction: Direction to sort ("horizontal", "vertical", "both")
         reverse: If True, sort in descending order
+        sort_key: What to sort by ("channels", "luminance", "hue", "red",
+            "green", "blue")
 
     Returns:
         Pixel-sorted image as numpy array
     """
-    # Convert to float for intensity calculations
-    img_float = image.astype(np.float32) / 255.0
-
-    # Get image dimensions
-    height, width = image.shape[:2]
+    if sort_key not in ("channels", "luminance", "hue", *_CHANNEL_KEYS):
+        raise ValueError(f"Unknown sort key: {sort_key}")
 
     # Create a grayscale version for thresholding
     if image.ndim == 3:
-        gray = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY) / 255.0
+        gray = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
     else:
-        gray = img_float.copy()
+        gray = image
 
     # Create mask of pixels to sort (above threshold)
-    mask = gray > threshold
+    mask = gray / 255.0 > threshold
 
     # Copy the image for the result
     result = image.copy()
 
     # Horizontal sorting
     if sort_direction in ["horizontal", "both"]:
-        for y in range(height):
-            # Get row and corresponding mask
-            row = result[y, :].copy()
-            row_mask = mask[y, :]
-
-            # Skip if all pixels are below threshold
-            if not np.any(row_mask):
-                continue
-
-            # Find contiguous regions to sort
-            regions = []
-            start = None
-
-            for x in range(width):
-                if row_mask[x] and start is None:
-                    start = x
-                elif not row_mask[x] and start is not None:
-                    regions.append((start, x))
-                    start = None
-
-            # Add the last region if it exists
-            if start is not None:
-                regions.append((start, width))
-
-            # Sort each region
-            for start, end in regions:
-                if end - start < 2:
-                    continue
-
-                if image.ndim == 3:
-                    # Sort each color channel separately
-                    for c in range(image.shape[2]):
-                        sorted_region = np.sort(row[start:end, c])
-                        if reverse:
-                            sorted_region = sorted_region[::-1]
-                        row[start:end, c] = sorted_region
-                else:
-                    # Sort grayscale image
-                    sorted_region = np.sort(row[start:end])
-                    if reverse:
-                        sorted_region = sorted_region[::-1]
-                    row[start:end] = sorted_region
-
-            # Update the result
-            result[y, :] = row
-
-    # Vertical sorting
+        key = None if sort_key == "channels" else _sort_key_values(result, sort_key)
+        _sort_runs(result, mask, key, reverse)
+
+    # Vertical sorting: sort the rows of the transposed image (the same mask
+    # applies after horizontal sorting; keys follow the moved pixels)
     if sort_direction in ["vertical", "both"]:
-        for x in range(width):
-            # Get column and corresponding mask
-            col = result[:, x].copy()
-            col_mask = mask[:, x]
-
-            # Skip if all pixels are below threshold
-            if not np.any(col_mask):
-                continue
-
-            # Find contiguous regions to sort
-            regions = []
-            start = None
-
-            for y in range(height):
-                if col_mask[y] and start is None:
-                    start = y
-                elif not col_mask[y] and start is not None:
-                    regions.append((start, y))
-                    start = None
-
-            # Add the last region if it exists
-            if start is not None:
-                regions.append((start, height))
-
-            # Sort each region
-            for start, end in regions:
-                if end - start < 2:
-                    continue
-
-                if image.ndim == 3:
-                    # Sort each color channel separately
-                    for c in range(image.shape[2]):
-                        sorted_region = np.sort(col[start:end, c])
-                        if reverse:
-                            sorted_region = sorted_region[::-1]
-                        col[start:end, c] = sorted_region
-                else:
-                    # Sort grayscale image
-                    sorted_region = np.sort(col[start:end])
-                    if reverse:
-                        sorted_region = sorted_region[::-1]
-                    col[start:end] = sorted_region
-
-            # Update the result
-            result[:, x] = col
+        columns = np.ascontiguousarray(result.swapaxes(0, 1))
+        key = None if sort_key == "channels" else _sort_key_values(columns, sort_key)
+        _sort_runs(columns, np.ascontiguousarray(mask.T), key, reverse)
+        result = np.ascontiguousarray(columns.swapaxes(0, 1))
 
     return result
 
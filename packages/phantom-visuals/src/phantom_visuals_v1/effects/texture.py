@@ -15,8 +15,17 @@ from scipy import ndimage
 
 from phantom_visuals.core.config import Configuration
 from phantom_visuals.core.palette import ColorPalette
+from phantom_visuals.utils.buffers import (
+    INPLACE,
+    buffer_effect,
+    finish_frame,
+    float_frame,
+    is_frame,
+)
+from phantom_visuals.utils.field_cache import cached_fields
 
 
+@buffer_effect(INPLACE)
 def add_noise(
     image: np.ndarray,
     config: Configuration,
@@ -43,8 +52,8 @@ def add_noise(
     if amount <= 0:
         return image
 
-    # Make a copy of the input image
-    result = image.copy().astype(np.float32)
+    # Make a float copy of the input image (working frames are modified in place)
+    result = float_frame(image)
 
     # Set random seed if specified
     if config.effect_params.seed is not None:
@@ -55,7 +64,7 @@ def add_noise(
         # Apply Gaussian noise
         sigma = amount * 25.0
         noise = np.random.normal(0, sigma, image.shape).astype(np.float32)
-        result = result + noise
+        result += noise
 
     elif noise_type == "salt_pepper":
         # Apply salt & pepper noise
@@ -80,26 +89,77 @@ def add_noise(
     elif noise_type == "poisson":
         # Apply Poisson noise (good for simulating sensor noise)
         # First normalize to 0-1
-        result = result / 255.0
+        normalized = result / 255.0
 
         # Apply noise and scale
         noise_scale = amount * 40.0
-        result = np.random.poisson(result * noise_scale) / noise_scale
+        noisy = np.random.poisson(normalized * noise_scale) / noise_scale
 
         # Scale back to 0-255
-        result = result * 255.0
+        noisy = noisy * 255.0
+        if is_frame(image):
+            np.copyto(result, noisy, casting="same_kind")
+        else:
+            result = noisy
 
     elif noise_type == "speckle":
         # Apply speckle noise (multiplicative noise)
         sigma = amount * 0.5
         noise = np.random.normal(0, sigma, image.shape).astype(np.float32)
-        result = result * (1 + noise)
+        result *= 1 + noise
 
     # Clip values to valid range
-    return np.clip(result, 0, 255).astype(np.uint8)
+    return finish_frame(result, image)
+
+
+
+def _grain_noise(height: int, width: int, grain_size: float, channels: int) -> np.ndarray:
+    """Generate blurred grain noise layers with unit standard deviation.
 
+    Returns:
+        Float32 array of shape (channels, height, width)
+    """
+    # Calculate noise dimensions based on grain size
+    noise_h = max(1, int(height / grain_size))
+    noise_w = max(1, int(width / grain_size))
+    sigma = max(0.1, 0.5 / grain_size)
+
+    layers = []
+    for _ in range(channels):
+        # Generate noise and blur it to create more organic grain
+        noise = np.random.normal(0, 1, (noise_h, noise_w)).astype(np.float32)
+        noise = cv2.GaussianBlur(noise, (0, 0), sigma)
+
+        # Resize noise to match image dimensions and normalize it
+        noise = cv2.resize(noise, (width, height), interpolation=cv2.INTER_LINEAR)
+        layers.append(noise / np.std(noise))
+    return np.stack(layers)
+
+
+def _seeded_grain_noise(
+    seed: int, height: int, width: int, grain_size: float, channels: int
+) -> np.ndarray:
+    """Grain noise for a seed, from the field cache when available.
+
+    The global NumPy random state after generation is cached with the noise and
+    restored on a hit, so effects drawing random numbers later in the chain see
+    the same sequence as without the cache.
+    """
 
+    def generate() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        np.random.seed(seed)
+        noise = _grain_noise(height, width, grain_size, channels)
+        _, keys, pos, has_gauss, cached_gaussian = np.random.get_state()
+        return noise, keys.copy(), np.array([pos, has_gauss, cached_gaussian])
 
+    noise, keys, state = cached_fields(
+        "grain", (seed, height, width, float(grain_size), channels), generate
+    )
+    np.random.set_state(("MT19937", keys, int(state[0]), int(state[1]), float(state[2])))
+    return noise
+
+
+@buffer_effect(INPLACE)
 def add_grain(
     image: np.ndarray,
     config: Configuration,
@@ -128,77 +188,72 @@ def add_grain(
     if amount <= 0:
         return image
 
-    # Set random seed if specified
-    if config.effect_params.seed is not None:
-        np.random.seed(config.effect_params.seed)
-
     # Get image dimensions
     height, width = image.shape[:2]
 
-    # Create grain noise
-    if monochrome or image.ndim < 3:
-        # Calculate noise dimensions based on grain size
-        noise_h = max(1, int(height / grain_size))
-        noise_w = max(1, int(width / grain_size))
-
-        # Generate noise
-        noise = np.random.normal(0, 1, (noise_h, noise_w)).astype(np.float32)
-
-        # Apply Gaussian blur to create more organic grain
-        sigma = max(0.1, 0.5 / grain_size)
-        noise = cv2.GaussianBlur(noise, (0, 0), sigma)
-
-        # Resize noise to match image dimensions
-        noise = cv2.resize(noise, (width, height), interpolation=cv2.INTER_LINEAR)
-
-        # Normalize noise to have a specific standard deviation
-        noise = noise / np.std(noise) * amount * 25.0
+    # Create grain noise (one layer, or one per channel), normalized to unit deviation
+    channels = 1 if monochrome or image.ndim < 3 else image.shape[2]
+    seed = config.effect_params.seed
+    if seed is not None:
+        # Seeded grain only depends on the image size, so it is shared across images
+        noise_layers = _seeded_grain_noise(seed, height, width, grain_size, channels)
+    else:
+        noise_layers = _grain_noise(height, width, grain_size, channels)
 
-        # Convert to float for calculations
-        result = image.astype(np.float32)
+    # Convert to float for calculations (working frames are modified in place)
+    result = float_frame(image)
 
-        # Apply grain
+    if channels == 1:
+        # Apply the same noise to all channels
+        noise = noise_layers[0] * amount * 25.0
         if image.ndim == 3:
-            # Apply the same noise to all channels
             for c in range(image.shape[2]):
                 result[:, :, c] = result[:, :, c] + noise
         else:
-            result = result + noise
-
+            result += noise
     else:
         # Apply different grain to each channel
-        result = image.astype(np.float32)
+        for c in range(channels):
+            result[:, :, c] = result[:, :, c] + noise_layers[c] * amount * 25.0
 
-        for c in range(image.shape[2]):
-            # Calculate noise dimensions based on grain size
-            noise_h = max(1, int(height / grain_size))
-            noise_w = max(1, int(width / grain_size))
+    # Clip values to valid range
+    return finish_frame(result, image)
 
-            # Generate noise for this channel
-            channel_noise = np.random.normal(0, 1, (noise_h, noise_w)).astype(
-                np.float32
-            )
 
-            # Apply Gaussian blur
-            sigma = max(0.1, 0.5 / grain_size)
-            channel_noise = cv2.GaussianBlur(channel_noise, (0, 0), sigma)
 
-            # Resize noise
-            channel_noise = cv2.resize(
-                channel_noise, (width, height), interpolation=cv2.INTER_LINEAR
-            )
+def _vignette_mask(
+    height: int,
+    width: int,
+    center: tuple[float, float],
+    amount: float,
+    strength: float,
+) -> np.ndarray:
+    """Create a vignette mask (1 in the center, 0 at the edges)."""
+    # Calculate center coordinates in pixels
+    center_x = int(center[0] * width)
+    center_y = int(center[1] * height)
 
-            # Normalize noise
-            channel_noise = channel_noise / np.std(channel_noise) * amount * 25.0
+    # Create a radial gradient for the vignette
+    y, x = np.mgrid[0:height, 0:width]
+
+    # Calculate distance from center
+    dist_x = (x - center_x) / width
+    dist_y = (y - center_y) / height
 
-            # Apply to this channel
-            result[:, :, c] = result[:, :, c] + channel_noise
+    # Create normalized distance map (0-1)
+    dist_map = np.sqrt(dist_x**2 + dist_y**2)
 
-    # Clip values to valid range
-    return np.clip(result, 0, 255).astype(np.uint8)
+    # Normalize by the maximum distance from center to corner
+    max_dist = np.sqrt(
+        max(center[0], 1 - center[0]) ** 2 + max(center[1], 1 - center[1]) ** 2
+    )
+    dist_map = dist_map / max_dist
 
+    # Adjust the curve with the amount parameter (higher = smaller vignette)
+    return 1 - np.clip(dist_map * amount * 2, 0, 1) ** strength
 
 
+@buffer_effect(INPLACE)
 def add_vignette(
     image: np.ndarray,
     config: Configuration,
@@ -236,29 +291,12 @@ def add_vignette(
     if center is None:
         center = (0.5, 0.5)
 
-    # Calculate center coordinates in pixels
-    center_x = int(center[0] * width)
-    center_y = int(center[1] * height)
-
-    # Create a radial gradient for the vignette
-    y, x = np.mgrid[0:height, 0:width]
-
-    # Calculate distance from center
-    dist_x = (x - center_x) / width
-    dist_y = (y - center_y) / height
-
-    # Create normalized distance map (0-1)
-    dist_map = np.sqrt(dist_x**2 + dist_y**2)
-
-    # Normalize by the maximum distance from center to corner
-    max_dist = np.sqrt(
-        max(center[0], 1 - center[0]) ** 2 + max(center[1], 1 - center[1]) ** 2
-    )
-    dist_map = dist_map / max_dist
-
-    # Create vignette mask (1 in center, 0 at edges)
-    # Adjust the curve with the amount parameter (higher = smaller vignette)
-    vignette_mask = 1 - np.clip(dist_map * amount * 2, 0, 1) ** strength
+    # The mask only depends on the image size and shape parameters
+    vignette_mask = cached_fields(
+        "vignette",
+        (height, width, tuple(float(c) for c in center), float(amount), float(strength)),
+        lambda: _vignette_mask(height, width, center, amount, strength),
+    )[0]
 
     # Set vignette color
     if color is None:
@@ -269,8 +307,8 @@ def add_vignette(
             # Default to black
             color = (0, 0, 0)
 
-    # Apply vignette effect
-    result = image.copy().astype(np.float32)
+    # Apply vignette effect (working frames are modified in place)
+    result = float_frame(image)
 
     if image.ndim == 3:
         # For color images
@@ -289,14 +327,129 @@ def add_vignette(
         if isinstance(color, tuple):
             # Convert color to grayscale
             color_value = sum(color) / len(color)
-            result = result * vignette_mask + color_value * (1 - vignette_mask)
+            vignetted = result * vignette_mask + color_value * (1 - vignette_mask)
         else:
             # Darken only
-            result = result * vignette_mask
+            vignetted = result * vignette_mask
+        if is_frame(image):
+            np.copyto(result, vignetted, casting="same_kind")
+        else:
+            result = vignetted
 
     # Clip values to valid range
-    return np.clip(result, 0, 255).astype(np.uint8)
+    return finish_frame(result, image)
+
+
+
+# Screen angles of the CMYK inks relative to the black screen, in degrees
+_CMYK_ANGLE_OFFSETS = {"cyan": -30.0, "magenta": 30.0, "yellow": -45.0, "black": 0.0}
+
+
+def _dot_templates(method: str, dot_size: int) -> np.ndarray:
+    """Brightness of one screen cell holding a dot of each of 256 darkness levels.
+
+    A distance function of each pixel's offset from the cell center decides
+    whether it is inside the dot; dot edges are anti-aliased over one pixel.
+    A fully dark cell gets a dot of radius half a cell, as cv2.circle drew.
+    """
+    offsets = (np.arange(dot_size, dtype=np.float32) + 0.5) / dot_size - 0.5
+    u = offsets[np.newaxis, :]
+    v = offsets[:, np.newaxis]
+    if method == "circles":
+        distance = np.sqrt(u * u + v * v)
+    elif method == "lines":
+        distance = np.broadcast_to(np.abs(v), (dot_size, dot_size))
+    else:
+        distance = np.abs(u) + np.abs(v)
+
+    darkness = np.arange(256, dtype=np.float32)[:, np.newaxis, np.newaxis] / 255.0
+    coverage = np.clip((darkness / 2 - distance) * dot_size + 0.5, 0.0, 1.0)
+    return np.round((1.0 - coverage) * 255.0).astype(np.uint8)
+
+
+def _halftone_screen(
+    tone: np.ndarray,
+    height: int,
+    width: int,
+    dot_size: int,
+    angle: float,
+    method: str,
+) -> np.ndarray:
+    """Render one halftone screen rotated by the angle.
+
+    The screen is built axis-aligned in rotated coordinates, where its cells
+    fall on whole pixels: the darkness of every cell is sampled from the
+    block-reduced tone map at the cell center, each cell is filled with the
+    dot template of its darkness level in one gather, and a single
+    cv2.warpAffine rotates the screen back onto the image.
+
+    Args:
+        tone: Block-reduced darkness map (0-1), one value per dot_size block
+        height: Output height
+        width: Output width
+        dot_size: Cell size in pixels
+        angle: Screen angle in degrees
+        method: Dot shape ("circles", "lines", "diamonds")
 
+    Returns:
+        HxW uint8 screen (255 where there is no ink)
+    """
+    angle_rad = math.radians(angle)
+    cos_angle, sin_angle = math.cos(angle_rad), math.sin(angle_rad)
+
+    # Cells of the rotated frame (u, v) covering the image, anchored at its origin
+    corners_x = np.array([0, width, 0, width])
+    corners_y = np.array([0, 0, height, height])
+    u = corners_x * cos_angle + corners_y * sin_angle
+    v = corners_y * cos_angle - corners_x * sin_angle
+    u0 = math.floor(u.min() / dot_size) * dot_size
+    v0 = math.floor(v.min() / dot_size) * dot_size
+    cells_u = max(1, math.ceil((u.max() - u0) / dot_size))
+    cells_v = max(1, math.ceil((v.max() - v0) / dot_size))
+
+    # Darkness at every cell center, rotated back into tone-map pixels
+    scale_x = tone.shape[1] / width
+    scale_y = tone.shape[0] / height
+    center_u = u0 + dot_size / 2
+    center_v = v0 + dot_size / 2
+    to_tone = np.float32([
+        [
+            cos_angle * dot_size * scale_x,
+            -sin_angle * dot_size * scale_x,
+            (center_u * cos_angle - center_v * sin_angle) * scale_x - 0.5,
+        ],
+        [
+            sin_angle * dot_size * scale_y,
+            cos_angle * dot_size * scale_y,
+            (center_u * sin_angle + center_v * cos_angle) * scale_y - 0.5,
+        ],
+    ])
+    darkness = cv2.warpAffine(
+        tone,
+        to_tone,
+        (cells_u, cells_v),
+        flags=cv2.INTER_LINEAR | cv2.WARP_INVERSE_MAP,
+        borderMode=cv2.BORDER_REPLICATE,
+    )
+    levels = np.clip(darkness * 255.0 + 0.5, 0, 255).astype(np.uint8)
+
+    # Fill every cell with its dot, then rotate the screen onto the image
+    templates = cached_fields(
+        "halftone_dots", (method, dot_size), lambda: (_dot_templates(method, dot_size),)
+    )[0]
+    screen = templates[levels].swapaxes(1, 2)
+    screen = screen.reshape(cells_v * dot_size, cells_u * dot_size)
+    to_screen = np.float32([
+        [cos_angle, sin_angle, (cos_angle + sin_angle) / 2 - u0 - 0.5],
+        [-sin_angle, cos_angle, (cos_angle - sin_angle) / 2 - v0 - 0.5],
+    ])
+    return cv2.warpAffine(
+        screen,
+        to_screen,
+        (width, height),
+        flags=cv2.INTER_LINEAR | cv2.WARP_INVERSE_MAP,
+        borderMode=cv2.BORDER_REPLICATE,
+    )
 
 
 def add_halftone(
@@ -307,9 +460,13 @@ def add_halftone(
     angle: float = 45.0,
     method: str = "circles",
     blend: float = 0.5,
+    cmyk: bool = False,
 ) -> np.ndarray:
     """Apply halftone effect to an image, simulating printed material.
 
+    Cell tones come from one block reduction of the image; the dots of all
+    cells are then rendered at once on a screen rotated by the angle.
+
     Args:
         image: Input image as numpy array
         config: Configuration settings
@@ -318,137 +475,59 @@ def add_halftone(
         angle: Angle of halftone pattern in degrees
         method: Halftone method ("circles", "lines", "diamonds")
         blend: Blend factor with original image (0-1)
+        cmyk: Screen color images as cyan, magenta, yellow and black inks at
+            the traditional angles (black at the given angle, cyan and
+            magenta 30 degrees either side, yellow 45 degrees off)
 
     Returns:
         Halftone image as numpy array
     """
+    if method not in ("circles", "lines", "diamonds"):
+        raise ValueError(f"Unknown halftone method: {method}")
+
     # Get image dimensions
     height, width = image.shape[:2]
 
-    # Convert to grayscale if color image
-    gray = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY) if image.ndim == 3 else image.copy()
-
     # Calculate dot size in pixels
     dot_size = max(1, int(min(height, width) / (dots_per_inch * 3)))
 
-    # Create a new blank canvas
-    halftone = np.ones((height, width), dtype=np.uint8) * 255
-
-    # Calculate the number of dots in each dimension
-    num_dots_y = height // dot_size
-    num_dots_x = width // dot_size
-
-    # Create the halftone pattern
-    if method == "circles":
-        for y in range(num_dots_y):
-            for x in range(num_dots_x):
-                # Calculate coordinates for this cell
-                y_start = y * dot_size
-                x_start = x * dot_size
-
-                # Get the average brightness in this cell
-                y_end = min(y_start + dot_size, height)
-                x_end = min(x_start + dot_size, width)
-                cell = gray[y_start:y_end, x_start:x_end]
-                avg_brightness = np.mean(cell)
-
-                # Calculate circle radius based on brightness
-                radius = (255 - avg_brightness) / 255 * dot_size / 2
-
-                if radius > 0:
-                    # Calculate circle center
-                    cy = y_start + dot_size // 2
-                    cx = x_start + dot_size // 2
-
-                    # Draw the circle
-                    cv2.circle(
-                        halftone,
-                        (cx, cy),
-                        int(radius),
-                        0,  # Black
-                        -1,  # Filled
-                    )
-
-    elif method == "lines":
-        # Convert angle to radians
-        angle_rad = np.deg2rad(angle)
-        cos_angle = np.cos(angle_rad)
-        sin_angle = np.sin(angle_rad)
-
-        for y in range(num_dots_y):
-            for x in range(num_dots_x):
-                # Calculate coordinates for this cell
-                y_start = y * dot_size
-                x_start = x * dot_size
-
-                # Get the average brightness in this cell
-                y_end = min(y_start + dot_size, height)
-                x_end = min(x_start + dot_size, width)
-                cell = gray[y_start:y_end, x_start:x_end]
-                avg_brightness = np.mean(cell)
-
-                # Calculate line thickness based on brightness
-                thickness = int((255 - avg_brightness) / 255 * dot_size)
-
-                if thickness > 0:
-                    # Calculate line endpoints
-                    cx = x_start + dot_size // 2
-                    cy = y_start + dot_size // 2
-                    half_len = dot_size // 2
-
-                    x1 = int(cx - half_len * cos_angle)
-                    y1 = int(cy - half_len * sin_angle)
-                    x2 = int(cx + half_len * cos_angle)
-                    y2 = int(cy + half_len * sin_angle)
-
-                    # Draw the line
-                    cv2.line(
-                        halftone,
-                        (x1, y1),
-                        (x2, y2),
-                        0,  # Black
-                        thickness,
-                    )
-
-    elif method == "diamonds":
-        for y in range(num_dots_y):
-            for x in range(num_dots_x):
-                # Calculate coordinates for this cell
-                y_start = y * dot_size
-                x_start = x * dot_size
-
-                # Get the average brightness in this cell
-                y_end = min(y_start + dot_size, height)
-                x_end = min(x_start + dot_size, width)
-                cell = gray[y_start:y_end, x_start:x_end]
-                avg_brightness = np.mean(cell)
-
-                # Calculate diamond size based on brightness
-                size = (255 - avg_brightness) / 255 * dot_size
-
-                if size > 0:
-                    # Calculate diamond center and corners
-                    cx = x_start + dot_size // 2
-                    cy = y_start + dot_size // 2
-                    half_size = int(size / 2)
-
-                    # Draw the diamond
-                    points = np.array(
-                        [
-                            [cx, cy - half_size],  # Top
-                            [cx + half_size, cy],  # Right
-                            [cx, cy + half_size],  # Bottom
-                            [cx - half_size, cy],  # Left
-                        ]
-                    )
-
-                    cv2.fillPoly(halftone, [points], 0)
+    # Block-reduce the image to one tone per cell
+    cells = (max(1, round(width / dot_size)), max(1, round(height / dot_size)))
+    reduced = cv2.resize(image, cells, interpolation=cv2.INTER_AREA)
+    reduced = reduced.astype(np.float32) / 255.0
+
+    if cmyk and image.ndim == 3:
+        # Convert the cell tones to CMYK inks and screen each at its own angle
+        black = 1.0 - reduced.max(axis=2)
+        white = np.maximum(1.0 - black, 1e-6)
+        inks = {
+            name: (1.0 - reduced[:, :, c] - black) / white
+            for c, name in enumerate(("cyan", "magenta", "yellow"))
+        }
+        inks["black"] = black
+        screens = {
+            name: _halftone_screen(
+                tone, height, width, dot_size, angle + _CMYK_ANGLE_OFFSETS[name], method
+            )
+            for name, tone in inks.items()
+        }
+
+        # Subtractive mixing: each ink absorbs its complementary channel
+        halftone = cv2.merge([
+            cv2.multiply(screens[name], screens["black"], scale=1 / 255.0)
+            for name in ("cyan", "magenta", "yellow")
+        ])
+    else:
+        if reduced.ndim == 3:
+            reduced = cv2.cvtColor(reduced, cv2.COLOR_RGB2GRAY)
+        halftone = _halftone_screen(
+            1.0 - reduced, height, width, dot_size, angle, method
+        )
+        if image.ndim == 3:
+            halftone = cv2.cvtColor(halftone, cv2.COLOR_GRAY2RGB)
 
     # If blend is 0, return just the halftone pattern
     if blend <= 0:
-        # Convert halftone to RGB if the input was RGB
-        if image.ndim == 3:
-            return cv2.cvtColor(halftone, cv2.COLOR_GRAY2RGB)
         return halftone
 
     # If blend is 1, return the original image
@@ -456,14 +535,4 @@ def add_halftone(
         return image
 
     # Blend the halftone with the original image
-    if image.ndim == 3:
-        # Convert halftone to RGB
-        halftone_rgb = cv2.cvtColor(halftone, cv2.COLOR_GRAY2RGB)
-
-        # Blend
-        result = cv2.addWeighted(image, blend, halftone_rgb, 1 - blend, 0)
-    else:
-        # Blend grayscale images
-        result = cv2.addWeighted(image, blend, halftone, 1 - blend, 0)
-
-    return result
+    return cv2.addWeighted(image, blend, halftone, 1 - blend, 0)
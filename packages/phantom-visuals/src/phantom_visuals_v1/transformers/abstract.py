@@ -101,7 +101,7 @@ class AbstractComposer:
             self._add_phantom_style()
 
         # Process the canvas
-        result = self.engine.process_image(canvas)
+        result = self.engine.process_image(canvas, quantize=False)
 
         # Save and return the result
         return self.engine.save_image(result, output_path)
@@ -408,15 +408,15 @@ class AbstractComposer:
         effects = EffectChain()
 
         # Add contrast adjustment
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 1.2))
+        effects.add(adjust_contrast, amount=1.2)
 
         # Add subtle grain
         grain_amount = self.config.effect_params.intensity * 0.2
-        effects.add(lambda img, cfg, pal: add_grain(img, cfg, pal, grain_amount))
+        effects.add(add_grain, amount=grain_amount)
 
         # Add subtle vignette
         vignette_amount = 0.9 + self.config.effect_params.intensity * 0.2
-        effects.add(lambda img, cfg, pal: add_vignette(img, cfg, pal, vignette_amount))
+        effects.add(add_vignette, amount=vignette_amount)
 
         # Add the effect chain to the engine
         self.engine.add_transformation(effects)
@@ -427,18 +427,18 @@ class AbstractComposer:
         effects = EffectChain()
 
         # Add contrast adjustment
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 1.4))
+        effects.add(adjust_contrast, amount=1.4)
 
         # Apply duotone effect
         effects.add(duotone)
 
         # Add grain
         grain_amount = self.config.effect_params.intensity * 0.4
-        effects.add(lambda img, cfg, pal: add_grain(img, cfg, pal, grain_amount))
+        effects.add(add_grain, amount=grain_amount)
 
         # Add vignette
         vignette_amount = 0.8 + self.config.effect_params.intensity * 0.4
-        effects.add(lambda img, cfg, pal: add_vignette(img, cfg, pal, vignette_amount))
+        effects.add(add_vignette, amount=vignette_amount)
 
         # Add the effect chain to the engine
         self.engine.add_transformation(effects)
@@ -470,11 +470,11 @@ class AbstractComposer:
 
         # Add grain
         grain_amount = self.config.effect_params.intensity * 0.5
-        effects.add(lambda img, cfg, pal: add_grain(img, cfg, pal, grain_amount))
+        effects.add(add_grain, amount=grain_amount)
 
         # Add vignette
         vignette_amount = 0.7 + self.config.effect_params.intensity * 0.5
-        effects.add(lambda img, cfg, pal: add_vignette(img, cfg, pal, vignette_amount))
+        effects.add(add_vignette, amount=vignette_amount)
 
         # Add the effect chain to the engine
         self.engine.add_transformation(effects)
@@ -485,11 +485,11 @@ class AbstractComposer:
         effects = EffectChain()
 
         # Add brightness adjustment
-        effects.add(lambda img, cfg, pal: adjust_brightness(img, cfg, pal, 1.2))
+        effects.add(adjust_brightness, amount=1.2)
 
         # Apply gaussian blur
         blur_amount = self.config.effect_params.blur_radius * 5
-        effects.add(lambda img, cfg, pal: gaussian_blur(img, cfg, pal, blur_amount))
+        effects.add(gaussian_blur, radius=blur_amount)
 
         # Apply gradient mapping with ethereal colors
         effects.add(lambda img, cfg, pal: gradient_map(img, cfg, pal))
@@ -508,7 +508,7 @@ class AbstractComposer:
 
         # Add grain
         grain_amount = self.config.effect_params.intensity * 0.3
-        effects.add(lambda img, cfg, pal: add_grain(img, cfg, pal, grain_amount))
+        effects.add(add_grain, amount=grain_amount)
 
         # Add the effect chain to the engine
         self.engine.add_transformation(effects)
@@ -519,7 +519,7 @@ class AbstractComposer:
         effects = EffectChain()
 
         # Add contrast adjustment for bold shapes
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 1.8))
+        effects.add(adjust_contrast, amount=1.8)
 
         # Apply threshold for strong shapes
         def modernist_threshold(img, cfg, pal):
@@ -531,7 +531,7 @@ class AbstractComposer:
 
         # Apply subtle grain
         grain_amount = self.config.effect_params.intensity * 0.2
-        effects.add(lambda img, cfg, pal: add_grain(img, cfg, pal, grain_amount))
+        effects.add(add_grain, amount=grain_amount)
 
         # Add the effect chain to the engine
         self.engine.add_transformation(effects)
@@ -553,15 +553,15 @@ class AbstractComposer:
 
         # Apply gaussian blur for ethereal look
         blur_amount = self.config.effect_params.blur_radius * 2
-        effects.add(lambda img, cfg, pal: gaussian_blur(img, cfg, pal, blur_amount))
+        effects.add(gaussian_blur, radius=blur_amount)
 
         # Add grain
         grain_amount = self.config.effect_params.intensity * 0.5
-        effects.add(lambda img, cfg, pal: add_grain(img, cfg, pal, grain_amount))
+        effects.add(add_grain, amount=grain_amount)
 
         # Add vignette
         vignette_amount = 0.7 + self.config.effect_params.intensity * 0.5
-        effects.add(lambda img, cfg, pal: add_vignette(img, cfg, pal, vignette_amount))
+        effects.add(add_vignette, amount=vignette_amount)
 
         # Add the effect chain to the engine
         self.engine.add_transformation(effects)
@@ -572,8 +572,8 @@ class AbstractComposer:
         effects = EffectChain()
 
         # Add contrast adjustment for dramatic look
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 1.6))
-        effects.add(lambda img, cfg, pal: adjust_brightness(img, cfg, pal, 0.8))
+        effects.add(adjust_contrast, amount=1.6)
+        effects.add(adjust_brightness, amount=0.8)
 
         # Apply lens distortion
         effects.add(
@@ -587,15 +587,11 @@ class AbstractComposer:
 
         # Add grain
         grain_amount = self.config.effect_params.intensity * 0.6
-        effects.add(lambda img, cfg, pal: add_grain(img, cfg, pal, grain_amount))
+        effects.add(add_grain, amount=grain_amount)
 
         # Add heavy vignette
         vignette_amount = 0.5 + self.config.effect_params.intensity * 0.5
-        effects.add(
-            lambda img, cfg, pal: add_vignette(
-                img, cfg, pal, vignette_amount, strength=1.5
-            )
-        )
+        effects.add(add_vignette, amount=vignette_amount, strength=1.5)
 
         # Add the effect chain to the engine
         self.engine.add_transformation(effects)
@@ -606,7 +602,7 @@ class AbstractComposer:
         effects = EffectChain()
 
         # Add contrast adjustment
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 1.3))
+        effects.add(adjust_contrast, amount=1.3)
 
         # Ensure symmetry is applied
         symmetry_axis = random.choice(["both", "radial"])
@@ -614,11 +610,11 @@ class AbstractComposer:
 
         # Apply gaussian blur for smoother look
         blur_amount = self.config.effect_params.blur_radius * 1.5
-        effects.add(lambda img, cfg, pal: gaussian_blur(img, cfg, pal, blur_amount))
+        effects.add(gaussian_blur, radius=blur_amount)
 
         # Add grain
         grain_amount = self.config.effect_params.intensity * 0.3
-        effects.add(lambda img, cfg, pal: add_grain(img, cfg, pal, grain_amount))
+        effects.add(add_grain, amount=grain_amount)
 
         # Add the effect chain to the engine
         self.engine.add_transformation(effects)
@@ -13,9 +13,7 @@ from pathlib import Path
 from typing import List, Optional, Tuple, Union
 
 import cv2
-import noise
 import numpy as np
-from skimage.feature import structure_tensor
 
 # Assuming these are correctly defined and importable:
 from phantom_visuals.core.config import Configuration
@@ -45,6 +43,22 @@ from phantom_visuals.effects import (
     wave_distortion,
 )
 from phantom_visuals.effects.artistic import create_glitch_blocks
+from phantom_visuals.utils.field_cache import (
+    CACHE_DIR_NAME,
+    cached_fields,
+    field_cache,
+)
+from phantom_visuals.utils.logging import get_logger, log_success
+from phantom_visuals.utils.particles import ParticleSystem, deposit_segments
+from phantom_visuals.utils.perlin import perlin_flow_field
+from phantom_visuals.utils.raster import draw_lines
+from phantom_visuals.utils.warp import (
+    Displacement,
+    Wave,
+    scale_field,
+    sine_field,
+    warp,
+)
 
 
 # Helper Functions
@@ -100,45 +114,6 @@ def _create_motion_blur_kernel(kernel_size: int, angle_degrees: float) -> np.nda
     return kernel
 
 
-def _normalized_gradient_magnitude(
-    gray_img: np.ndarray, ksize: int = 3, blur_ksize: int = 5
-) -> np.ndarray:
-    """Calculates normalized gradient magnitude (0=smooth, 1=edge)."""
-    if not isinstance(gray_img, np.ndarray) or gray_img.ndim != 2:
-        raise ValueError("Input must be a 2D NumPy array (grayscale image).")
-
-    # Apply Gaussian blur to reduce noise before gradient calculation
-    if blur_ksize > 0:
-        # Ensure kernel size is odd
-        blur_ksize_odd = blur_ksize if blur_ksize % 2 != 0 else blur_ksize + 1
-        gray_smooth = cv2.GaussianBlur(gray_img, (blur_ksize_odd, blur_ksize_odd), 0)
-    else:
-        gray_smooth = gray_img
-
-    # Calculate gradients using Sobel operator (more robust to noise than Scharr with blur)
-    # Use 32-bit float for gradients to avoid overflow/loss of precision
-    grad_x = cv2.Sobel(gray_smooth, cv2.CV_32F, 1, 0, ksize=ksize)
-    grad_y = cv2.Sobel(gray_smooth, cv2.CV_32F, 0, 1, ksize=ksize)
-
-    # Calculate magnitude
-    magnitude = cv2.magnitude(grad_x, grad_y)
-
-    # Normalize magnitude robustly: use min-max scaling
-    min_val, max_val = np.min(magnitude), np.max(magnitude)
-    if max_val > min_val:
-        # Standard min-max normalization to [0, 1]
-        norm_mag = (magnitude - min_val) / (max_val - min_val)
-    else:
-        # Handle flat image case (no gradient)
-        norm_mag = np.zeros_like(magnitude, dtype=np.float32)
-
-    # Optional: Enhance contrast of magnitude map slightly to sharpen distinction
-    # Be careful not to over-saturate edges
-    # norm_mag = np.clip(norm_mag**0.8, 0.0, 1.0)
-
-    return norm_mag
-
-
 def _generate_perlin_flow_field(
     width: int,
     height: int,
@@ -148,57 +123,142 @@ def _generate_perlin_flow_field(
     lacunarity: float,
     seed: int,
 ) -> Tuple[np.ndarray, np.ndarray]:
-    """Generates a flow field using Perlin noise. Returns (flow_x, flow_y)."""
-    flow_x = np.zeros((height, width), dtype=np.float32)
-    flow_y = np.zeros((height, width), dtype=np.float32)
-    # Use different seeds/offsets for x and y flow for less correlated movement
-    seed_x = seed
-    seed_y = seed + 1
-
-    for i in range(height):
-        for j in range(width):
-            # Generate noise values for x and y directions separately
-            # Scale coordinates before passing to noise function
-            scaled_x = j / width * scale
-            scaled_y = i / height * scale
-            # noise.pnoise3 adds depth, which we map to angle or use 2 independent 2D noises
-            # Option 1: Use 3D noise, z=0 for flow_x, z=1 for flow_y angle components? Less intuitive.
-            # Option 2: Two independent 2D noises for x and y magnitudes/angles. Simpler.
-            angle_rad = (
-                noise.pnoise2(
-                    scaled_x,
-                    scaled_y,
-                    octaves=octaves,
-                    persistence=persistence,
-                    lacunarity=lacunarity,
-                    base=seed_x,
-                )
-                * math.pi
-                * 2.0
-            )  # Noise value maps to angle (-pi to pi roughly)
-
-            magnitude = (
-                0.5
-                + (
-                    noise.pnoise2(
-                        scaled_x,
-                        scaled_y,  # Use different noise seed/instance for magnitude
-                        octaves=octaves,
-                        persistence=persistence,
-                        lacunarity=lacunarity,
-                        base=seed_y,
-                    )
-                    + 1.0
-                )
-                / 2.0
-            )  # Normalize noise approx -1 to 1 -> 0 to 1 for magnitude scale
-
-            flow_x[i, j] = math.cos(angle_rad) * magnitude
-            flow_y[i, j] = math.sin(angle_rad) * magnitude
+    """Generates a flow field using Perlin noise. Returns (flow_x, flow_y).
 
+    Noise for the angle (seed) and magnitude (seed + 1) is evaluated over the
+    whole grid at once by the vectorized generator in utils.perlin, on a reduced
+    grid with bilinear upsampling when the field is smooth enough. The field does
+    not depend on the image, so it comes from the field cache when the same
+    parameters were used before; the returned arrays are read-only.
+    """
+    params = (
+        int(width),
+        int(height),
+        float(scale),
+        int(octaves),
+        float(persistence),
+        float(lacunarity),
+        int(seed),
+    )
+    flow_x, flow_y = cached_fields(
+        "flow_field", params, lambda: perlin_flow_field(*params)
+    )
     return flow_x, flow_y
 
 
+def _subtle_wave_field(height: int, width: int, intensity: float) -> Displacement:
+    """Whole-pixel displacement of the gothic styles' subtle wave distortion.
+
+    Three wave patterns (scales 6, 12 and 24 pixels) summed per axis and
+    truncated to whole pixels. The field comes from the field cache.
+    """
+
+    def compute() -> Displacement:
+        scales = (6, 12, 24)
+        waves_x = [
+            Wave(intensity * 2, kx=1 / (scale * 1.5), ky=1 / scale) for scale in scales
+        ]
+        waves_y = [
+            Wave(intensity * 2, kx=1 / scale, ky=1 / (scale * 1.2), func="cos")
+            for scale in scales
+        ]
+        dx, dy = sine_field(height, width, waves_x, waves_y)
+        return np.trunc(dx), np.trunc(dy)
+
+    params = (int(height), int(width), float(intensity))
+    dx, dy = cached_fields("subtle_wave_field", params, compute)
+    return dx, dy
+
+
+def _organic_flow_field(
+    height: int, width: int, scale: float, octaves: int = 4
+) -> Displacement:
+    """Displacement of phantom_flow's organic flow: octaves of crossed sine waves.
+
+    Each octave doubles the frequency and halves the amplitude of a sine and a
+    cosine wave; the vertical component swaps the roles of x and y. The field
+    comes from the field cache.
+    """
+
+    def compute() -> Displacement:
+        waves_x, waves_y = [], []
+        for octave in range(octaves):
+            amplitude = scale * 0.5**octave
+            along_x = 2.0**octave / width * 6.28
+            along_y = 2.0**octave / height * 6.28
+            waves_x += [
+                Wave(amplitude, kx=along_x, ky=along_y * 0.7),
+                Wave(amplitude, kx=along_x * 0.5, ky=along_y, func="cos"),
+            ]
+            waves_y += [
+                Wave(amplitude, kx=along_y * 0.7, ky=along_x),
+                Wave(amplitude, kx=along_y, ky=along_x * 0.5, func="cos"),
+            ]
+        return sine_field(height, width, waves_x, waves_y)
+
+    params = (int(height), int(width), float(scale), int(octaves))
+    dx, dy = cached_fields("organic_flow_field", params, compute)
+    return dx, dy
+
+
+def _occlude_ridge(
+    columns: np.ndarray, rows: np.ndarray, horizon: np.ndarray
+) -> np.ndarray:
+    """Visible points of one ridge line of a mesh, raising the horizon in place.
+
+    Same result as walking the points left to right: a point is visible when
+    it is on screen and above the horizon at its column, and every visible
+    point raises the horizon there. Points sharing a column are resolved in
+    order with a running minimum per column.
+    """
+    order = np.argsort(columns, kind="stable")
+    sorted_columns = columns[order]
+    sorted_rows = rows[order].astype(np.int64)
+    new_column = np.empty(len(order), dtype=bool)
+    new_column[:1] = True
+    new_column[1:] = sorted_columns[1:] != sorted_columns[:-1]
+    group = np.cumsum(new_column)
+
+    # Highest on-screen point so far in each column (offset per column so
+    # the running minimum cannot leak across columns)
+    unbounded = np.int64(1) << 32
+    on_screen = np.where(sorted_rows >= 0, sorted_rows, unbounded)
+    seen = np.minimum.accumulate(on_screen - group * (unbounded << 1))
+    seen += group * (unbounded << 1)
+    before = np.empty_like(seen)
+    before[:1] = unbounded
+    before[1:] = np.where(new_column[1:], unbounded, seen[:-1])
+
+    limit = np.minimum(horizon[sorted_columns], before)
+    visible = np.empty(len(order), dtype=bool)
+    visible[order] = (sorted_rows >= 0) & (sorted_rows < limit)
+    np.minimum.at(horizon, columns[visible], rows[visible].astype(horizon.dtype))
+    return visible
+
+
+def _ridge_segments(
+    x: np.ndarray,
+    y: np.ndarray,
+    visible: np.ndarray,
+    weights: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, ...]:
+    """Polyline segments joining consecutive visible points of a ridge line.
+
+    Returns:
+        x0, y0, x1, y1 of each segment and, when weights are given, its
+        thickness: the rounded mean weight of its run of visible points
+    """
+    start = np.flatnonzero(visible[:-1] & visible[1:])
+    segments = (x[start], y[start], x[start + 1], y[start + 1])
+    if weights is None:
+        return segments
+    run = np.cumsum(~visible)
+    mean = np.bincount(run, weights * visible) / np.maximum(
+        np.bincount(run, visible), 1
+    )
+    return segments + (np.maximum(1, np.round(mean[run[start]])),)
+
+
 class AuthorTransformer:
     """Specialized transformer for author portraits.
 
@@ -231,6 +291,39 @@ class AuthorTransformer:
         Returns:
             Path where the transformed image was saved
         """
+        self._build_pipeline(style)
+
+        # Process the image
+        return self.engine.transform(input_path, output_path)
+
+    def transform_image(
+        self,
+        image: np.ndarray,
+        output_path: Union[str, Path],
+        style: Optional[str] = None,
+    ) -> Path:
+        """Apply author image transformation to a decoded image and save the result.
+
+        Lets callers that apply many styles to one image decode it only once.
+
+        Args:
+            image: Input author image as an RGB numpy array (not modified)
+            output_path: Path where the result should be saved
+            style: Style variant to apply (defaults to config.style_variant)
+
+        Returns:
+            Path where the transformed image was saved
+        """
+        self._build_pipeline(style)
+        processed = self.engine.process_image(image, quantize=False)
+        return self.engine.save_image(processed, output_path)
+
+    def _build_pipeline(self, style: Optional[str] = None) -> None:
+        """Set up the engine's transformation pipeline for a style variant.
+
+        Args:
+            style: Style variant to apply (defaults to config.style_variant)
+        """
         # Use specified style or default from config
         style_variant = style or str(self.config.style_variant.value)
 
@@ -346,9 +439,6 @@ class AuthorTransformer:
             )
             self._add_phantom_style()
 
-        # Process the image
-        return self.engine.transform(input_path, output_path)
-
     def _add_mesh_overlay_fusion_style(self) -> None:
         """Combines Plotter Mesh with the original image using advanced techniques."""
         effects = EffectChain()
@@ -366,15 +456,9 @@ class AuthorTransformer:
 
             params = cfg.effect_params
             height, width = img.shape[:2]
-            is_color_input = img.ndim == 3
 
-            if is_color_input:
-                gray_base = cv2.cvtColor(img, cv2.COLOR_RGB2GRAY)
-            else:
-                gray_base = img.copy()
-
-            clahe = cv2.createCLAHE(clipLimit=2.5, tileGridSize=(8, 8))
-            gray_enhanced = clahe.apply(gray_base)
+            analysis = self.engine.analysis_for(img)
+            gray_enhanced = analysis.clahe(clip_limit=2.5)
             alpha_contrast = 1.5 + params.intensity * 0.5
             beta_contrast = -alpha_contrast * 127 + 127
             gray_enhanced = cv2.convertScaleAbs(
@@ -393,8 +477,8 @@ class AuthorTransformer:
             mesh_bg_color = (5, 5, 10)
             mesh_line_color = (230, 230, 255)
 
-            mesh_canvas = np.full((height, width, 3), mesh_bg_color, dtype=np.uint8)
-            gray_shape_mesh = cv2.GaussianBlur(gray_base, (mesh_blur_k, mesh_blur_k), 0)
+            mesh_canvas = np.full((height, width, 3), mesh_bg_color, dtype=np.float32)
+            gray_shape_mesh = analysis.blurred(mesh_blur_k)
             start_y_mesh = int(height * (1.0 - mesh_vert_focus) / 2.0)
             end_y_mesh = int(height * (1.0 + mesh_vert_focus) / 2.0)
             total_draw_height = end_y_mesh - start_y_mesh
@@ -404,51 +488,42 @@ class AuthorTransformer:
 
             np.random.seed(seed_base + 1)
             random.seed(seed_base + 1)
+            columns = np.arange(width)
+            segments = []
             for i in range(mesh_line_count - 1, -1, -1):
                 y_base = start_y_mesh + int(round(i * line_spacing_mesh))
                 if y_base >= height:
                     continue
                 sample_y = min(y_base, height - 1)
-                brightness_wave_row = gray_shape_mesh[sample_y, :]
-                segment_points: List[Tuple[int, int]] = []
-                for x in range(width):
-                    brightness_s = brightness_wave_row[x] / 255.0
-                    displacement = (brightness_s**1.6) * mesh_amplitude
-                    y_disp_f = y_base - displacement
-                    mesh_displacement_map[min(y_base, height - 1), x] = displacement
-                    x_noise, y_noise = np.random.randn(2) * mesh_noise_pos
-                    x_rnd, y_rnd = (
-                        int(round(x + x_noise)),
-                        int(round(y_disp_f + y_noise)),
-                    )
-                    x_clamped, y_clamped = (
-                        min(max(0, x_rnd), width - 1),
-                        min(max(0, y_rnd), height - 1),
-                    )
-                    is_visible = 0 <= y_rnd < horizon_line[x_clamped]
-                    if is_visible:
-                        segment_points.append((x_clamped, y_clamped))
-                        horizon_line[x_clamped] = min(horizon_line[x_clamped], y_rnd)
-                    else:
-                        if len(segment_points) > 1:
-                            cv2.polylines(
-                                mesh_canvas,
-                                [np.array(segment_points, dtype=np.int32)],
-                                False,
-                                mesh_line_color,
-                                mesh_thickness,
-                                cv2.LINE_AA,
-                            )
-                        segment_points = []
-                if len(segment_points) > 1:
-                    cv2.polylines(
-                        mesh_canvas,
-                        [np.array(segment_points, dtype=np.int32)],
-                        False,
-                        mesh_line_color,
-                        mesh_thickness,
-                        cv2.LINE_AA,
+                brightness_s = gray_shape_mesh[sample_y, :] / 255.0
+                displacement = (brightness_s**1.6) * mesh_amplitude
+                y_disp_f = y_base - displacement
+                mesh_displacement_map[min(y_base, height - 1), :] = displacement
+                noise = np.random.randn(width, 2) * mesh_noise_pos
+                x_f = columns + noise[:, 0]
+                y_f = y_disp_f + noise[:, 1]
+                x_clamped = np.clip(np.round(x_f).astype(np.int64), 0, width - 1)
+                y_rnd = np.round(y_f).astype(np.int64)
+                is_visible = _occlude_ridge(x_clamped, y_rnd, horizon_line)
+                segments.append(
+                    _ridge_segments(
+                        np.clip(x_f, 0, width - 1),
+                        np.clip(y_f, 0, height - 1),
+                        is_visible,
                     )
+                )
+            x0, y0, x1, y1 = (np.concatenate(part) for part in zip(*segments))
+            draw_lines(
+                mesh_canvas,
+                x0,
+                y0,
+                x1,
+                y1,
+                [mesh_line_color],
+                mesh_thickness,
+                mode="over",
+            )
+            mesh_canvas = np.clip(np.round(mesh_canvas), 0, 255).astype(np.uint8)
 
             mesh_canvas_float = mesh_canvas.astype(np.float32)
 
@@ -508,20 +583,12 @@ class AuthorTransformer:
         # Add final grain/vignette
         if self.config.effect_params.grain > 0:
             effects.add(
-                lambda img, cfg, pal: add_grain(
-                    img,
-                    cfg,
-                    pal,
-                    amount=cfg.effect_params.grain * 0.25,
-                    monochrome=True,
-                )
+                add_grain,
+                amount=self.config.effect_params.grain * 0.25,
+                monochrome=True,
             )
         if self.config.effect_params.vignette > 0:
-            effects.add(
-                lambda img, cfg, pal: add_vignette(
-                    img, cfg, pal, amount=cfg.effect_params.vignette * 0.3
-                )
-            )
+            effects.add(add_vignette, amount=self.config.effect_params.vignette * 0.3)
         self.engine.add_transformation(effects)
 
     def _add_enhanced_particle_weave_style(self) -> None:
@@ -544,7 +611,8 @@ class AuthorTransformer:
                 color_img = cv2.cvtColor(img, cv2.COLOR_GRAY2RGB)
             else:
                 color_img = img.copy()
-            gray = cv2.cvtColor(color_img, cv2.COLOR_RGB2GRAY)
+            analysis = self.engine.analysis_for(img)
+            gray = analysis.gray()
             current_frame_float = color_img.astype(np.float32)
             height, width = gray.shape
             params = cfg.effect_params
@@ -561,27 +629,19 @@ class AuthorTransformer:
             initial_brightness_boost = 1.8
             brightness_fade_factor = 0.980
             min_brightness_render = 12
-            thickness_base = 1.0  # <<< *** DEFINED HERE ***
-            max_thickness_factor = 2.5
             bloom_strength = 0.15 + params.intensity * 0.2
             bloom_radius = 4 + int(params.blur_radius * 0.4)
             final_gamma = 0.85
             color_tint_strength = 0.1 + params.distortion * 0.2  # Example tint factor
 
-            # --- Pre-processing for Features/Flow ---
-            clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-            gray_clahe = clahe.apply(gray)
-            gray_smooth_flow = cv2.GaussianBlur(gray_clahe, (5, 5), 0)
-
             # --- Particle Seeding ---
             seed_brightness_threshold = 20
-            corners = cv2.goodFeaturesToTrack(
-                gray_clahe,
+            corners = analysis.good_features(
                 max_particles,
                 quality_level,
                 min_particle_distance,
-                blockSize=7,
-                useHarrisDetector=False,
+                block_size=7,
+                source="clahe",
             )  # Use CLAHE version for seeding
             if corners is None or len(corners) == 0:
                 return img
@@ -596,20 +656,17 @@ class AuthorTransformer:
             initial_brightness_val = initial_brightness_raw[valid_mask]
             if len(initial_x) == 0:
                 return img
-            initial_color = current_frame_float[initial_y, initial_x]
-            num_particles = len(initial_x)
-            current_brightness = initial_brightness_val * initial_brightness_boost
-            current_color = initial_color.copy()
-            current_x, current_y = (
-                initial_x.astype(np.float32),
-                initial_y.astype(np.float32),
+            particles = ParticleSystem(
+                initial_x,
+                initial_y,
+                initial_brightness_val * initial_brightness_boost,
+                current_frame_float[initial_y, initial_x],
             )
-            active_particles = np.ones(num_particles, dtype=bool)
 
             # --- Calculate Flow Field ---
             sigma_structure = 3 + params.distortion * 3
-            Axx, Axy, Ayy = structure_tensor(
-                gray_smooth_flow, sigma=sigma_structure, mode="reflect", order="xy"
+            Axx, Axy, Ayy = analysis.structure_tensor(
+                sigma_structure, blur_ksize=5, source="clahe"
             )
             structure_angle_rad = np.arctan2(2 * Axy, Ayy - Axx + 1e-6) / 2.0
             np.random.seed(seed_base + 1)
@@ -623,105 +680,61 @@ class AuthorTransformer:
                 lacunarity=2.0,
                 seed=seed_base + 1,
             )
+            # Per-pixel flow: structure orientation blended with Perlin noise
+            flow_x = (
+                np.cos(structure_angle_rad) * structure_alignment_factor
+                + perlin_flow_x * (1.0 - structure_alignment_factor)
+            ).astype(np.float32)
+            flow_y = (
+                -np.sin(structure_angle_rad) * structure_alignment_factor
+                + perlin_flow_y * (1.0 - structure_alignment_factor)
+            ).astype(np.float32)
 
             # --- Accumulation Canvas ---
-            accumulator = np.zeros_like(current_frame_float, dtype=np.float64)
+            accumulator = np.zeros_like(current_frame_float)
             accent_color_np = np.array(
                 _calculate_rgb_color(pal.accent, 1.0), dtype=np.float32
             )
 
             # --- Simulation Loop ---
             for step in range(num_steps):
-                if not np.any(active_particles):
+                if not len(particles):
                     break
-                active_idx = np.where(active_particles)[0]
-                x_t, y_t, brightness_t, color_t = (
-                    current_x[active_idx],
-                    current_y[active_idx],
-                    current_brightness[active_idx],
-                    current_color[active_idx],
-                )
-
-                x_int, y_int = (
-                    np.clip(np.round(x_t), 0, width - 1).astype(int),
-                    np.clip(np.round(y_t), 0, height - 1).astype(int),
-                )
-                particle_struct_angle = structure_angle_rad[y_int, x_int]
-                particle_noise_x, particle_noise_y = (
-                    perlin_flow_x[y_int, x_int],
-                    perlin_flow_y[y_int, x_int],
-                )
-                struct_flow_x, struct_flow_y = (
-                    np.cos(particle_struct_angle),
-                    -np.sin(particle_struct_angle),
-                )
-                step_flow_x = (
-                    struct_flow_x * structure_alignment_factor
-                    + particle_noise_x * (1.0 - structure_alignment_factor)
-                )
-                step_flow_y = (
-                    struct_flow_y * structure_alignment_factor
-                    + particle_noise_y * (1.0 - structure_alignment_factor)
-                )
+                step_flow_x, step_flow_y = particles.sample(flow_x, flow_y)
                 flow_mag = np.sqrt(step_flow_x**2 + step_flow_y**2) + 1e-6
                 speed_brightness_norm = (
-                    np.clip(brightness_t / initial_brightness_boost, 0, 255) / 255.0
+                    np.clip(particles.brightness / initial_brightness_boost, 0, 255)
+                    / 255.0
                 )
                 speed = flow_strength * (0.5 + speed_brightness_norm**0.8)
-                step_vx = (step_flow_x / flow_mag) * speed
-                step_vy = (step_flow_y / flow_mag) * speed
-
-                x_next, y_next = x_t + step_vx, y_t + step_vy
-
-                for k in range(len(active_idx)):
-                    render_brightness = brightness_t[k]
-                    if render_brightness < min_brightness_render:
-                        continue
-                    x1_rnd, y1_rnd = int(round(x_t[k])), int(round(y_t[k]))
-                    x2_rnd, y2_rnd = int(round(x_next[k])), int(round(y_next[k]))
-                    if not (0 <= x1_rnd < width and 0 <= y1_rnd < height):
-                        continue
-
-                    current_speed = np.sqrt(step_vx[k] ** 2 + step_vy[k] ** 2)
-                    norm_speed = np.clip(current_speed / (flow_strength * 1.5), 0, 1)
-                    thickness = max(
-                        1.0,
-                        thickness_base
-                        + norm_speed * (max_thickness_factor - thickness_base),
-                    )  # Use thickness_base
-
-                    color_alpha = np.clip(
-                        render_brightness / (255.0 * initial_brightness_boost), 0.0, 1.0
-                    )
-                    base_particle_color = color_t[k] * color_alpha
-                    tinted_color = (
-                        base_particle_color * (1.0 - color_tint_strength)
-                        + accent_color_np * color_tint_strength * color_alpha
-                    )
-                    line_color_float = np.clip(tinted_color, 0, 255)
-
-                    # Manual MAX blending using line coordinates
-                    rr, cc, val = line_aa_custom(y1_rnd, x1_rnd, y2_rnd, x2_rnd)
-                    valid_idx = (rr >= 0) & (rr < height) & (cc >= 0) & (cc < width)
-                    if not np.any(valid_idx):
-                        continue
-                    rr_v, cc_v, val_v = rr[valid_idx], cc[valid_idx], val[valid_idx]
-                    current_acc_val = accumulator[rr_v, cc_v]
-                    new_val = np.outer(val_v, line_color_float)
-                    accumulator[rr_v, cc_v] = np.maximum(current_acc_val, new_val)
+                x_prev, y_prev = particles.advect(
+                    (step_flow_x / flow_mag) * speed, (step_flow_y / flow_mag) * speed
+                )
 
-                # Update Particle State
-                current_x[active_idx] = x_next
-                current_y[active_idx] = y_next
-                current_brightness[active_idx] *= brightness_fade_factor
-                current_color[active_idx] *= brightness_fade_factor
-                off_screen = (
-                    (x_next < 0) | (x_next >= width) | (y_next < 0) | (y_next >= height)
+                # Tinted line colors, MAX-blended into the accumulator
+                visible = particles.brightness >= min_brightness_render
+                color_alpha = np.clip(
+                    particles.brightness[visible] / (255.0 * initial_brightness_boost),
+                    0.0,
+                    1.0,
+                )[:, None]
+                tinted_color = (
+                    particles.color[visible] * color_alpha * (1.0 - color_tint_strength)
+                    + accent_color_np * color_tint_strength * color_alpha
                 )
-                too_faint = current_brightness[active_idx] < (
-                    min_brightness_render * 0.5
+                deposit_segments(
+                    accumulator,
+                    x_prev[visible],
+                    y_prev[visible],
+                    particles.x[visible],
+                    particles.y[visible],
+                    np.clip(tinted_color, 0, 255),
+                    mode="max",
                 )
-                active_particles[active_idx[off_screen | too_faint]] = False
+
+                # Update Particle State
+                particles.fade(brightness_fade_factor)
+                particles.cull(width, height, min_brightness_render * 0.5)
 
             # --- Post-Process Accumulator ---
             min_acc, max_acc = np.min(accumulator), np.max(accumulator)
@@ -762,24 +775,16 @@ class AuthorTransformer:
 
         effects.add(apply_enhanced_particle_weave)
         if self.config.effect_params.grain > 0:
-            effects.add(
-                lambda img, cfg, pal: add_grain(
-                    img, cfg, pal, amount=cfg.effect_params.grain * 0.2
-                )
-            )
+            effects.add(add_grain, amount=self.config.effect_params.grain * 0.2)
         if self.config.effect_params.vignette > 0:
-            effects.add(
-                lambda img, cfg, pal: add_vignette(
-                    img, cfg, pal, amount=cfg.effect_params.vignette * 0.3
-                )
-            )
+            effects.add(add_vignette, amount=self.config.effect_params.vignette * 0.3)
         self.engine.add_transformation(effects)
 
     def _add_flow_field_blur_style(self) -> None:
         """(V5) Simulate motion/smudging using iterative flow-guided directional blur."""
         effects = EffectChain()
         # Initial subtle adjustments
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 1.1))
+        effects.add(adjust_contrast, amount=1.1)
         effects.add(
             lambda img, cfg, pal: adjust_saturation(img, cfg, pal, 0.0)
         )  # Force B&W
@@ -915,16 +920,10 @@ class AuthorTransformer:
         effects.add(apply_flow_blur)
         if self.config.effect_params.grain > 0:
             effects.add(
-                lambda img, cfg, pal: add_grain(
-                    img, cfg, pal, amount=cfg.effect_params.grain * 0.3, monochrome=True
-                )
+                add_grain, amount=self.config.effect_params.grain * 0.3, monochrome=True
             )
         if self.config.effect_params.vignette > 0:
-            effects.add(
-                lambda img, cfg, pal: add_vignette(
-                    img, cfg, pal, amount=cfg.effect_params.vignette * 0.4
-                )
-            )
+            effects.add(add_vignette, amount=self.config.effect_params.vignette * 0.4)
         self.engine.add_transformation(effects)
 
     def _add_masked_diffusion_smear_style(self) -> None:
@@ -933,7 +932,7 @@ class AuthorTransformer:
         effects.add(
             lambda img, cfg, pal: adjust_saturation(img, cfg, pal, 0.0)
         )  # B&W often works best
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 1.3))
+        effects.add(adjust_contrast, amount=1.3)
 
         def apply_masked_diffusion(
             img: np.ndarray, cfg: Configuration, pal: ColorPalette
@@ -943,10 +942,8 @@ class AuthorTransformer:
                 np.random.seed(seed)
                 random.seed(seed)
 
-            if img.ndim == 3:
-                gray = cv2.cvtColor(img, cv2.COLOR_RGB2GRAY)
-            else:
-                gray = img.copy()
+            analysis = self.engine.analysis_for(img)
+            gray = analysis.gray()
             current_result = gray.astype(np.float32)
             height, width = gray.shape
             params = cfg.effect_params
@@ -970,8 +967,8 @@ class AuthorTransformer:
             # --- Structure Mask (Edge Map) ---
             print("[MDS V5] Calculating structure mask...")
             # Low value = Edge/Detail = Preserve ; High value = Smooth = Smear
-            norm_mag = _normalized_gradient_magnitude(
-                gray, ksize=structure_ksize, blur_ksize=structure_blur
+            norm_mag = analysis.gradient_magnitude(
+                ksize=structure_ksize, blur_ksize=structure_blur
             )
             # Invert and threshold: pixels below threshold are edges (value 0), above are smooth (value 1)
             smear_area_mask = (norm_mag < edge_threshold).astype(np.float32)
@@ -1049,22 +1046,16 @@ class AuthorTransformer:
         effects.add(apply_masked_diffusion)
         if self.config.effect_params.grain > 0:
             effects.add(
-                lambda img, cfg, pal: add_grain(
-                    img, cfg, pal, amount=cfg.effect_params.grain * 0.4, monochrome=True
-                )
+                add_grain, amount=self.config.effect_params.grain * 0.4, monochrome=True
             )
         if self.config.effect_params.vignette > 0:
-            effects.add(
-                lambda img, cfg, pal: add_vignette(
-                    img, cfg, pal, amount=cfg.effect_params.vignette * 0.5
-                )
-            )
+            effects.add(add_vignette, amount=self.config.effect_params.vignette * 0.5)
         self.engine.add_transformation(effects)
 
     def _add_topo_streak_weave_style(self) -> None:
         """(NEW - Fixed IndexError) Combines plotter mesh structure with particle streaks."""
         effects = EffectChain()
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 2.2))
+        effects.add(adjust_contrast, amount=2.2)
 
         def apply_topo_streak_weave(
             img: np.ndarray, cfg: Configuration, pal: ColorPalette
@@ -1080,7 +1071,8 @@ class AuthorTransformer:
                 color_img = cv2.cvtColor(img, cv2.COLOR_GRAY2RGB)
             else:
                 color_img = img.copy()
-            gray = cv2.cvtColor(color_img, cv2.COLOR_RGB2GRAY)
+            analysis = self.engine.analysis_for(img)
+            gray = analysis.gray()
             height, width = gray.shape
             params = cfg.effect_params
 
@@ -1114,7 +1106,7 @@ class AuthorTransformer:
             ]
             all_mesh_points = []  # Store all valid, visible points here
 
-            gray_shape = cv2.GaussianBlur(gray, (mesh_blur_k, mesh_blur_k), 0)
+            gray_shape = analysis.blurred(mesh_blur_k)
             start_y = int(height * (1.0 - mesh_vert_focus) / 2.0)
             end_y_for_spacing = int(height * (1.0 + mesh_vert_focus) / 2.0)
             total_draw_height = end_y_for_spacing - start_y
@@ -1185,20 +1177,17 @@ class AuthorTransformer:
                 np.float32
             )
             initial_color = color_img.astype(np.float32)[initial_y_int, initial_x_int]
-            current_brightness = initial_gray_brightness * 1.5
-            current_color = initial_color.copy()
-            current_x = initial_x_int.astype(
-                np.float32
-            )  # Start simulation with integer coords
-            current_y = initial_y_int.astype(np.float32)
-            active_particles = np.ones(num_particles, dtype=bool)
+            # Start simulation with integer coords
+            particles = ParticleSystem(
+                initial_x_int,
+                initial_y_int,
+                initial_gray_brightness * 1.5,
+                initial_color,
+            )
 
             # === Calculate Flow Field (Perlin + Structure) (Same as before) ===
             print("[topo_streak_weave] Calculating flow field...")
-            gray_smooth_flow = cv2.GaussianBlur(gray, (5, 5), 0)
-            Axx, Axy, Ayy = structure_tensor(
-                gray_smooth_flow, sigma=3, mode="reflect", order="xy"
-            )
+            Axx, Axy, Ayy = analysis.structure_tensor(3, blur_ksize=5)
             structure_angle_rad = np.arctan2(2 * Axy, Ayy - Axx + 1e-6) / 2.0
             np.random.seed(seed_base + 2)
             random.seed(seed_base + 2)
@@ -1211,87 +1200,54 @@ class AuthorTransformer:
                 lacunarity=2.0,
                 seed=seed_base + 2,
             )
-
-            # === Particle Advection & Streak Accumulation (Same as before) ===
+            flow_x = (
+                np.cos(structure_angle_rad) * streak_struct_align
+                + perlin_flow_x * (1.0 - streak_struct_align)
+            ).astype(np.float32)
+            flow_y = (
+                -np.sin(structure_angle_rad) * streak_struct_align
+                + perlin_flow_y * (1.0 - streak_struct_align)
+            ).astype(np.float32)
+
+            # === Particle Advection & Streak Accumulation ===
             print("[topo_streak_weave] Simulating particle streaks...")
             streak_accumulator = np.zeros(
-                (height, width, 3), dtype=np.float64
+                (height, width, 3), dtype=np.float32
             )  # Color accumulator
             for step in range(streak_steps):
-                if not np.any(active_particles):
+                if not len(particles):
                     break
-                active_idx = np.where(active_particles)[0]
-                x_t, y_t = current_x[active_idx], current_y[active_idx]
-                brightness_t = current_brightness[active_idx]
-                color_t = current_color[active_idx]
-
-                # *** Ensure indexing uses clamped integers ***
-                x_int = np.clip(np.round(x_t), 0, width - 1).astype(int)
-                y_int = np.clip(np.round(y_t), 0, height - 1).astype(int)
-                # (Rest of flow calculation is the same...)
-                particle_struct_angle = structure_angle_rad[y_int, x_int]
-                particle_noise_x, particle_noise_y = (
-                    perlin_flow_x[y_int, x_int],
-                    perlin_flow_y[y_int, x_int],
-                )
-                struct_flow_x, struct_flow_y = (
-                    np.cos(particle_struct_angle),
-                    -np.sin(particle_struct_angle),
-                )
-                step_flow_x = struct_flow_x * streak_struct_align + particle_noise_x * (
-                    1.0 - streak_struct_align
-                )
-                step_flow_y = struct_flow_y * streak_struct_align + particle_noise_y * (
-                    1.0 - streak_struct_align
-                )
+                step_flow_x, step_flow_y = particles.sample(flow_x, flow_y)
                 flow_mag = np.sqrt(step_flow_x**2 + step_flow_y**2) + 1e-6
                 speed = streak_flow_strength * (
-                    0.6 + (brightness_t / (1.5 * 255)) ** 0.7
+                    0.6 + (particles.brightness / (1.5 * 255)) ** 0.7
+                )
+                x_prev, y_prev = particles.advect(
+                    (step_flow_x / flow_mag) * speed, (step_flow_y / flow_mag) * speed
                 )
-                step_vx = (step_flow_x / flow_mag) * speed
-                step_vy = (step_flow_y / flow_mag) * speed
-
-                x_next, y_next = x_t + step_vx, y_t + step_vy
-
-                # Draw Streaks (Uses rounded integers, cv2.line clips internally)
-                for k in range(len(active_idx)):
-                    render_brightness = brightness_t[k]
-                    if render_brightness < streak_min_bright:
-                        continue
-                    # Round before passing to cv2.line
-                    x1_rnd, y1_rnd = int(round(x_t[k])), int(round(y_t[k]))
-                    x2_rnd, y2_rnd = int(round(x_next[k])), int(round(y_next[k]))
-
-                    # Minimal bound check needed only if cv2.line behavior is suspect
-                    # if not (0 <= x1_rnd < width and 0 <= y1_rnd < height): continue
-
-                    norm_brightness = render_brightness / (1.5 * 255)
-                    thickness = max(
-                        1.0,
-                        streak_thick_base
-                        + norm_brightness * (streak_thick_mult - streak_thick_base),
-                    )
-                    line_color_float = color_t[k] * (render_brightness / (1.5 * 255))
-
-                    cv2.line(
-                        streak_accumulator,
-                        (x1_rnd, y1_rnd),
-                        (x2_rnd, y2_rnd),
-                        line_color_float.tolist(),
-                        thickness=max(1, int(round(thickness))),
-                        lineType=cv2.LINE_AA,
-                    )
 
-                # Update Particle State (Same logic)
-                current_x[active_idx] = x_next
-                current_y[active_idx] = y_next
-                current_brightness[active_idx] *= streak_fade
-                current_color[active_idx] *= streak_fade
-                off_screen = (
-                    (x_next < 0) | (x_next >= width) | (y_next < 0) | (y_next >= height)
+                # Draw Streaks (brighter particles draw thicker lines)
+                visible = particles.brightness >= streak_min_bright
+                norm_brightness = particles.brightness[visible] / (1.5 * 255)
+                thickness = np.maximum(
+                    1.0,
+                    streak_thick_base
+                    + norm_brightness * (streak_thick_mult - streak_thick_base),
+                )
+                deposit_segments(
+                    streak_accumulator,
+                    x_prev[visible],
+                    y_prev[visible],
+                    particles.x[visible],
+                    particles.y[visible],
+                    particles.color[visible] * norm_brightness[:, None],
+                    thickness=thickness,
+                    mode="over",
                 )
-                too_faint = current_brightness[active_idx] < (streak_min_bright * 0.5)
-                active_particles[active_idx[off_screen | too_faint]] = False
+
+                # Update Particle State
+                particles.fade(streak_fade)
+                particles.cull(width, height, streak_min_bright * 0.5)
 
             # === Post-Process Streaks (Same logic) ===
             print("[topo_streak_weave] Post-processing streaks...")
@@ -1343,24 +1299,16 @@ class AuthorTransformer:
 
         effects.add(apply_topo_streak_weave)
         if self.config.effect_params.grain > 0:
-            effects.add(
-                lambda img, cfg, pal: add_grain(
-                    img, cfg, pal, amount=cfg.effect_params.grain * 0.2
-                )
-            )
+            effects.add(add_grain, amount=self.config.effect_params.grain * 0.2)
         if self.config.effect_params.vignette > 0:
-            effects.add(
-                lambda img, cfg, pal: add_vignette(
-                    img, cfg, pal, amount=cfg.effect_params.vignette * 0.3
-                )
-            )
+            effects.add(add_vignette, amount=self.config.effect_params.vignette * 0.3)
         self.engine.add_transformation(effects)
 
     def _add_plotter_mesh_v3b_style(self) -> None:
         """(V3b) Plotter/Topographic style with CORRECTED depth (bright=peak)."""
         effects = EffectChain()
         # Keep pre-processing contrast boost
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 2.5))
+        effects.add(adjust_contrast, amount=2.5)
 
         def apply_plotter_mesh_fixed_depth(
             img: np.ndarray, cfg: Configuration, pal: ColorPalette
@@ -1370,10 +1318,8 @@ class AuthorTransformer:
                 np.random.seed(seed)
                 random.seed(seed)
 
-            if img.ndim == 3:
-                gray = cv2.cvtColor(img, cv2.COLOR_RGB2GRAY)
-            else:
-                gray = img.copy()
+            analysis = self.engine.analysis_for(img)
+            gray = analysis.gray()
             height, width = gray.shape
             params = cfg.effect_params
 
@@ -1391,120 +1337,83 @@ class AuthorTransformer:
             # --- Blurring (same as original v3) ---
             blur_k_shape = int(5 + params.blur_radius * 1.0) * 2 + 1
             blur_k_detail = 7
-            gray_shape = cv2.GaussianBlur(gray, (blur_k_shape, blur_k_shape), 0)
-            gray_detail = cv2.GaussianBlur(gray, (blur_k_detail, blur_k_detail), 0)
+            gray_shape = analysis.blurred(blur_k_shape)
+            gray_detail = analysis.blurred(blur_k_detail)
 
             # --- Colors (same as original v3) ---
             bg_color_tuple = _calculate_rgb_color(pal.primary, 0.02, "darken")
             line_color_tuple = _calculate_rgb_color(pal.accent, 1.9, "lighten")
 
             # --- Canvas & Occlusion (same as original v3) ---
-            canvas = np.full((height, width, 3), bg_color_tuple, dtype=np.uint8)
+            canvas = np.full((height, width, 3), bg_color_tuple, dtype=np.float32)
             start_y = int(height * vertical_focus_start)
             end_y_for_spacing = int(height * vertical_focus_end)
             total_draw_height = end_y_for_spacing - start_y
             line_count = max(1, line_count)
             line_spacing = max(1.0, total_draw_height / float(line_count))
             horizon_line = np.full(width, height + 100, dtype=np.int32)
+            columns = np.arange(width)
 
-            # --- Wave Generation (Back to Front) ---
+            # --- Wave Generation (Back to Front, one row at a time) ---
+            segments = []
             for i in range(line_count - 1, -1, -1):
                 y_base = start_y + int(round(i * line_spacing))
                 if y_base >= height:
                     continue
                 sample_y = min(y_base, height - 1)
-                brightness_wave_row = gray_shape[sample_y, :]
-                brightness_detail_row = gray_detail[sample_y, :]
-                segment_points: List[Tuple[int, int]] = []
-                segment_weights: List[float] = []
-
-                for x in range(width):
-                    brightness_s = (
-                        brightness_wave_row[x] / 255.0
-                    )  # For displacement (shape)
-                    brightness_d = (
-                        brightness_detail_row[x] / 255.0
-                    )  # For thickness (detail)
-                    amp_noise = 1.0 + (random.random() - 0.5) * noise_amp_scale
-                    displacement = (
-                        (brightness_s**1.6) * amplitude_factor * amp_noise
-                    )  # NEW (bright = peak)
-                    y_disp_f = (
-                        y_base - displacement
-                    )  # Still subtract: larger displacement means higher UP the canvas
-
-                    # Thickness modulation: Brighter details = thicker
-                    # Keep this logic, as higher displacement now correlates with brightness
-                    thickness_norm_disp = np.clip(
-                        displacement / amplitude_factor if amplitude_factor > 0 else 0,
-                        0,
-                        1,
-                    )
-                    thickness_norm_bright = brightness_d**0.7
-                    # Blend brightness and displacement contribution to thickness
-                    thickness_mod = (
-                        thickness_norm_bright * 0.6 + thickness_norm_disp * 0.4
-                    )
-                    thickness = base_thickness * (
-                        thickness_multiplier_low
-                        + thickness_mod
-                        * (thickness_multiplier_high - thickness_multiplier_low)
-                    )
-
-                    # Positional noise (same as before)
-                    x_noise, y_noise = np.random.randn(2) * noise_pos_scale
-                    x_rnd, y_rnd = (
-                        int(round(x + x_noise)),
-                        int(round(y_disp_f + y_noise)),
-                    )
-
-                    # Occlusion & Segment Handling (same as before)
-                    x_check = min(max(0, x_rnd), width - 1)
-                    is_visible = 0 <= y_rnd < horizon_line[x_check]
-                    if is_visible:
-                        segment_points.append((x_rnd, y_rnd))
-                        segment_weights.append(thickness)
-                        horizon_line[x_check] = min(horizon_line[x_check], y_rnd)
-                    else:
-                        if len(segment_points) > 1:
-                            avg_thick = max(1, int(round(np.mean(segment_weights))))
-                            cv2.polylines(
-                                canvas,
-                                [np.array(segment_points, dtype=np.int32)],
-                                False,
-                                line_color_tuple,
-                                avg_thick,
-                                cv2.LINE_AA,
-                            )
-                        segment_points, segment_weights = [], []
-
-                # Draw final segment (same as before)
-                if len(segment_points) > 1:
-                    avg_thick = max(1, int(round(np.mean(segment_weights))))
-                    cv2.polylines(
-                        canvas,
-                        [np.array(segment_points, dtype=np.int32)],
-                        False,
-                        line_color_tuple,
-                        avg_thick,
-                        cv2.LINE_AA,
-                    )
+                # Shape drives the displacement, detail the thickness
+                brightness_s = gray_shape[sample_y, :] / 255.0
+                brightness_d = gray_detail[sample_y, :] / 255.0
+                amp_noise = (
+                    1.0
+                    + (np.array([random.random() for _ in columns]) - 0.5)
+                    * noise_amp_scale
+                )
+                displacement = (
+                    (brightness_s**1.6) * amplitude_factor * amp_noise
+                )  # NEW (bright = peak)
+                y_disp_f = (
+                    y_base - displacement
+                )  # Still subtract: larger displacement means higher UP the canvas
+
+                # Thickness modulation: Brighter details = thicker
+                thickness_norm_disp = np.clip(
+                    displacement / amplitude_factor if amplitude_factor > 0 else 0,
+                    0,
+                    1,
+                )
+                thickness_norm_bright = brightness_d**0.7
+                # Blend brightness and displacement contribution to thickness
+                thickness_mod = thickness_norm_bright * 0.6 + thickness_norm_disp * 0.4
+                thickness = base_thickness * (
+                    thickness_multiplier_low
+                    + thickness_mod
+                    * (thickness_multiplier_high - thickness_multiplier_low)
+                )
 
-            return canvas
+                # Positional noise (same as before)
+                noise = np.random.randn(width, 2) * noise_pos_scale
+                x_f = columns + noise[:, 0]
+                y_f = y_disp_f + noise[:, 1]
+
+                # Occlusion on the rounded points; lines go through the exact ones
+                x_check = np.clip(np.round(x_f).astype(np.int64), 0, width - 1)
+                y_rnd = np.round(y_f).astype(np.int64)
+                is_visible = _occlude_ridge(x_check, y_rnd, horizon_line)
+                segments.append(_ridge_segments(x_f, y_f, is_visible, thickness))
+
+            # cv2 drew these anti-aliased polylines about 2t - 1 pixels wide
+            x0, y0, x1, y1, thick = (np.concatenate(part) for part in zip(*segments))
+            draw_lines(
+                canvas, x0, y0, x1, y1, [line_color_tuple], 2 * thick - 1, mode="over"
+            )
+            return np.clip(np.round(canvas), 0, 255).astype(np.uint8)
 
         effects.add(apply_plotter_mesh_fixed_depth)
         if self.config.effect_params.grain > 0:
-            effects.add(
-                lambda img, cfg, pal: add_grain(
-                    img, cfg, pal, amount=cfg.effect_params.grain * 0.08
-                )
-            )
+            effects.add(add_grain, amount=self.config.effect_params.grain * 0.08)
         if self.config.effect_params.vignette > 0:
-            effects.add(
-                lambda img, cfg, pal: add_vignette(
-                    img, cfg, pal, amount=cfg.effect_params.vignette * 0.15
-                )
-            )
+            effects.add(add_vignette, amount=self.config.effect_params.vignette * 0.15)
         self.engine.add_transformation(effects)
 
     def _add_celestial_drift_v4_style(self) -> None:
@@ -1512,7 +1421,7 @@ class AuthorTransformer:
         effects = EffectChain()
 
         # Pre-processing
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 1.8))
+        effects.add(adjust_contrast, amount=1.8)
         # Keep color info for now
 
         def apply_celestial_drift(
@@ -1523,11 +1432,11 @@ class AuthorTransformer:
                 np.random.seed(seed)
                 random.seed(seed)
 
+            analysis = self.engine.analysis_for(img)
+            gray = analysis.gray()
             if img.ndim == 2:
-                gray = img
                 current_frame_color = cv2.cvtColor(img, cv2.COLOR_GRAY2RGB)
             else:
-                gray = cv2.cvtColor(img, cv2.COLOR_RGB2GRAY)
                 current_frame_color = img.copy()
 
             current_frame_float = current_frame_color.astype(np.float32)
@@ -1555,8 +1464,8 @@ class AuthorTransformer:
             final_gamma = 0.8
 
             # --- Particle Seeding ---
-            corners = cv2.goodFeaturesToTrack(
-                gray, max_particles, quality_level, min_particle_distance, blockSize=5
+            corners = analysis.good_features(
+                max_particles, quality_level, min_particle_distance, block_size=5
             )
             if corners is None or len(corners) == 0:
                 return img
@@ -1571,21 +1480,15 @@ class AuthorTransformer:
             if len(initial_x) == 0:
                 return img
             initial_color = current_frame_float[initial_y, initial_x]
-            current_brightness = (
-                np.mean(initial_color, axis=1) * initial_brightness_boost
-            )
-            current_color = initial_color.copy()
-            current_x, current_y = (
-                initial_x.astype(np.float32),
-                initial_y.astype(np.float32),
+            particles = ParticleSystem(
+                initial_x,
+                initial_y,
+                np.mean(initial_color, axis=1) * initial_brightness_boost,
             )
-            active_particles = np.ones(len(initial_x), dtype=bool)
 
             # --- Flow Field Calculation ---
             sigma_structure = 3 + params.distortion * 3
-            Axx, Axy, Ayy = structure_tensor(
-                gray, sigma=sigma_structure, mode="reflect", order="xy"
-            )
+            Axx, Axy, Ayy = analysis.structure_tensor(sigma_structure, blur_ksize=0)
             structure_angle_rad = (
                 np.arctan2(2 * Axy, Ayy - Axx + 1e-6) / 2.0
             )  # Add epsilon
@@ -1598,95 +1501,56 @@ class AuthorTransformer:
                 lacunarity=2.0,
                 seed=seed + 1,
             )
+            flow_x = (
+                np.cos(structure_angle_rad) * structure_alignment_factor
+                + perlin_flow_x * noise_influence
+            ).astype(np.float32)
+            flow_y = (
+                -np.sin(structure_angle_rad) * structure_alignment_factor
+                + perlin_flow_y * noise_influence
+            ).astype(np.float32)
 
             # --- Accumulation Canvas ---
-            accumulator = np.zeros_like(current_frame_float, dtype=np.float64)
+            # Streaks are gray, so one channel holds what the RGB canvas would
+            accumulator = np.zeros((height, width), dtype=np.float32)
 
             # --- Simulation Loop ---
             for step in range(num_steps):
-                if not np.any(active_particles):
+                if not len(particles):
                     break
-                active_idx = np.where(active_particles)[0]
-                x_t, y_t, brightness_t, color_t = (
-                    current_x[active_idx],
-                    current_y[active_idx],
-                    current_brightness[active_idx],
-                    current_color[active_idx],
-                )
-
-                # Calculate Flow
-                x_int, y_int = (
-                    np.clip(np.round(x_t), 0, width - 1).astype(int),
-                    np.clip(np.round(y_t), 0, height - 1).astype(int),
-                )
-                particle_struct_angle = structure_angle_rad[y_int, x_int]
-                particle_noise_x, particle_noise_y = (
-                    perlin_flow_x[y_int, x_int],
-                    perlin_flow_y[y_int, x_int],
-                )
-                struct_flow_x, struct_flow_y = (
-                    np.cos(particle_struct_angle),
-                    -np.sin(particle_struct_angle),
-                )
-                step_flow_x = (
-                    struct_flow_x * structure_alignment_factor
-                    + particle_noise_x * noise_influence
-                )
-                step_flow_y = (
-                    struct_flow_y * structure_alignment_factor
-                    + particle_noise_y * noise_influence
-                )
+                step_flow_x, step_flow_y = particles.sample(flow_x, flow_y)
                 flow_mag = np.sqrt(step_flow_x**2 + step_flow_y**2) + 1e-6
                 speed = flow_strength * (
-                    0.5 + (brightness_t / (initial_brightness_boost * 255)) ** 0.5
+                    0.5
+                    + (particles.brightness / (initial_brightness_boost * 255)) ** 0.5
+                )
+                x_prev, y_prev = particles.advect(
+                    (step_flow_x / flow_mag) * speed, (step_flow_y / flow_mag) * speed
                 )
-                step_vx = (step_flow_x / flow_mag) * speed
-                step_vy = (step_flow_y / flow_mag) * speed
-
-                # Update Positions
-                x_next, y_next = x_t + step_vx, y_t + step_vy
 
                 # Draw Streaks
-                for k in range(len(active_idx)):
-                    render_brightness = brightness_t[k]
-                    if render_brightness < min_brightness_render:
-                        continue
-                    x1_rnd, y1_rnd = int(round(x_t[k])), int(round(y_t[k]))
-                    x2_rnd, y2_rnd = int(round(x_next[k])), int(round(y_next[k]))
-                    if not (0 <= x1_rnd < width and 0 <= y1_rnd < height):
-                        continue
-                    norm_brightness = render_brightness / (
-                        initial_brightness_boost * 255
-                    )
-                    thickness = max(
-                        1.0,
-                        base_thickness
-                        + norm_brightness * (max_thickness_factor - base_thickness),
-                    )
-                    line_value = np.array([render_brightness] * 3, dtype=np.float32)
-                    cv2.line(
-                        accumulator,
-                        (x1_rnd, y1_rnd),
-                        (x2_rnd, y2_rnd),
-                        line_value.tolist(),
-                        thickness=max(1, int(round(thickness))),
-                        lineType=cv2.LINE_AA,
-                    )
-
-                # Update Particle State
-                current_x[active_idx] = x_next
-                current_y[active_idx] = y_next
-                # --- V4 Variable Name Used ---
-                current_brightness[
-                    active_idx
-                ] *= brightness_fade_factor  # <<< USED HERE (V4 NAME) <<<
-                off_screen = (
-                    (x_next < 0) | (x_next >= width) | (y_next < 0) | (y_next >= height)
+                visible = particles.brightness >= min_brightness_render
+                render_brightness = particles.brightness[visible]
+                norm_brightness = render_brightness / (initial_brightness_boost * 255)
+                thickness = np.maximum(
+                    1.0,
+                    base_thickness
+                    + norm_brightness * (max_thickness_factor - base_thickness),
                 )
-                too_faint = current_brightness[active_idx] < (
-                    min_brightness_render * 0.5
+                deposit_segments(
+                    accumulator,
+                    x_prev[visible],
+                    y_prev[visible],
+                    particles.x[visible],
+                    particles.y[visible],
+                    render_brightness,
+                    thickness=thickness,
+                    mode="over",
                 )
-                active_particles[active_idx[off_screen | too_faint]] = False
+
+                # Update Particle State
+                particles.fade(brightness_fade_factor)
+                particles.cull(width, height, min_brightness_render * 0.5)
 
             # --- Post-Process Accumulator ---
             min_acc, max_acc = np.min(accumulator), np.max(accumulator)
@@ -1722,26 +1586,18 @@ class AuthorTransformer:
         effects.add(apply_celestial_drift)
         if self.config.effect_params.grain > 0:
             effects.add(
-                lambda img, cfg, pal: add_grain(
-                    img,
-                    cfg,
-                    pal,
-                    amount=cfg.effect_params.grain * 0.25,
-                    monochrome=True,
-                )
+                add_grain,
+                amount=self.config.effect_params.grain * 0.25,
+                monochrome=True,
             )
         if self.config.effect_params.vignette > 0:
-            effects.add(
-                lambda img, cfg, pal: add_vignette(
-                    img, cfg, pal, amount=cfg.effect_params.vignette * 0.35
-                )
-            )
+            effects.add(add_vignette, amount=self.config.effect_params.vignette * 0.35)
         self.engine.add_transformation(effects)
 
     def _add_plotter_mesh_v3_style(self) -> None:
         """(V3) Plotter/Topographic style aiming for weighted mesh look."""
         effects = EffectChain()
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 2.5))
+        effects.add(adjust_contrast, amount=2.5)
 
         def apply_plotter_mesh(
             img: np.ndarray, cfg: Configuration, pal: ColorPalette
@@ -1755,10 +1611,8 @@ class AuthorTransformer:
                 np.random.seed(seed)
                 random.seed(seed)
 
-            if img.ndim == 3:
-                gray = cv2.cvtColor(img, cv2.COLOR_RGB2GRAY)
-            else:
-                gray = img.copy()
+            analysis = self.engine.analysis_for(img)
+            gray = analysis.gray()
             height, width = gray.shape
             params = cfg.effect_params
 
@@ -1775,107 +1629,78 @@ class AuthorTransformer:
 
             # Blurring
             blur_k_shape = int(5 + params.blur_radius * 1.0) * 2 + 1
-            blur_k_detail = 7
-            gray_shape = cv2.GaussianBlur(gray, (blur_k_shape, blur_k_shape), 0)
-            gray_detail = cv2.GaussianBlur(gray, (blur_k_detail, blur_k_detail), 0)
+            gray_shape = analysis.blurred(blur_k_shape)
 
             # Colors
             bg_color_tuple = _calculate_rgb_color(pal.primary, 0.02, "darken")
             line_color_tuple = _calculate_rgb_color(pal.accent, 1.9, "lighten")
 
             # Canvas & Occlusion
-            canvas = np.full((height, width, 3), bg_color_tuple, dtype=np.uint8)
+            canvas = np.full((height, width, 3), bg_color_tuple, dtype=np.float32)
             start_y = int(height * vertical_focus_start)
             end_y_for_spacing = int(height * vertical_focus_end)
             total_draw_height = end_y_for_spacing - start_y
             line_count = max(1, line_count)
             line_spacing = max(1.0, total_draw_height / float(line_count))
             horizon_line = np.full(width, height + 100, dtype=np.int32)
+            columns = np.arange(width)
 
-            # Wave Generation
+            # Wave Generation: whole rows at a time, segments drawn at the end
+            segments = []
             for i in range(line_count - 1, -1, -1):
                 y_base = start_y + int(round(i * line_spacing))
                 if y_base >= height:
                     continue
                 sample_y = min(y_base, height - 1)
-                brightness_wave_row = gray_shape[sample_y, :]
-                brightness_detail_row = gray_detail[sample_y, :]
-                segment_points: List[Tuple[int, int]] = []
-                segment_weights: List[float] = []
-                for x in range(width):
-                    brightness_s = brightness_wave_row[x] / 255.0
-                    brightness_d = brightness_detail_row[x] / 255.0
-                    amp_noise = 1.0 + (random.random() - 0.5) * noise_amp_scale
-                    displacement = (
-                        ((1.0 - brightness_s) ** 1.6) * amplitude_factor * amp_noise
-                    )
-                    y_disp_f = y_base - displacement
-                    thickness_norm = np.clip(
-                        displacement / amplitude_factor if amplitude_factor > 0 else 0,
-                        0,
-                        1,
-                    )
-                    thickness = base_thickness * (
-                        thickness_multiplier_low
-                        + thickness_norm
-                        * (thickness_multiplier_high - thickness_multiplier_low)
-                    )
-                    x_noise, y_noise = np.random.randn(2) * noise_pos_scale
-                    x_rnd, y_rnd = (
-                        int(round(x + x_noise)),
-                        int(round(y_disp_f + y_noise)),
-                    )
-                    x_check = min(max(0, x_rnd), width - 1)
-                    is_visible = 0 <= y_rnd < horizon_line[x_check]
-                    if is_visible:
-                        segment_points.append((x_rnd, y_rnd))
-                        segment_weights.append(thickness)
-                        horizon_line[x_check] = min(horizon_line[x_check], y_rnd)
-                    else:
-                        if len(segment_points) > 1:
-                            avg_thick = max(1, int(round(np.mean(segment_weights))))
-                            cv2.polylines(
-                                canvas,
-                                [np.array(segment_points, dtype=np.int32)],
-                                False,
-                                line_color_tuple,
-                                avg_thick,
-                                cv2.LINE_AA,
-                            )
-                        segment_points, segment_weights = [], []
-                if len(segment_points) > 1:
-                    avg_thick = max(1, int(round(np.mean(segment_weights))))
-                    cv2.polylines(
-                        canvas,
-                        [np.array(segment_points, dtype=np.int32)],
-                        False,
-                        line_color_tuple,
-                        avg_thick,
-                        cv2.LINE_AA,
-                    )
-            return canvas
+                brightness_s = gray_shape[sample_y, :] / 255.0
+                amp_noise = (
+                    1.0
+                    + (np.array([random.random() for _ in columns]) - 0.5)
+                    * noise_amp_scale
+                )
+                displacement = (
+                    ((1.0 - brightness_s) ** 1.6) * amplitude_factor * amp_noise
+                )
+                y_disp_f = y_base - displacement
+                thickness_norm = np.clip(
+                    displacement / amplitude_factor if amplitude_factor > 0 else 0,
+                    0,
+                    1,
+                )
+                thickness = base_thickness * (
+                    thickness_multiplier_low
+                    + thickness_norm
+                    * (thickness_multiplier_high - thickness_multiplier_low)
+                )
+                noise = np.random.randn(width, 2) * noise_pos_scale
+                x_f = columns + noise[:, 0]
+                y_f = y_disp_f + noise[:, 1]
+                x_check = np.clip(np.round(x_f).astype(np.int64), 0, width - 1)
+                y_rnd = np.round(y_f).astype(np.int64)
+                is_visible = _occlude_ridge(x_check, y_rnd, horizon_line)
+                # Lines go through the unrounded points, so they stay smooth
+                segments.append(_ridge_segments(x_f, y_f, is_visible, thickness))
+
+            # cv2 drew these anti-aliased polylines about 2t - 1 pixels wide
+            x0, y0, x1, y1, thick = (np.concatenate(part) for part in zip(*segments))
+            draw_lines(
+                canvas, x0, y0, x1, y1, [line_color_tuple], 2 * thick - 1, mode="over"
+            )
+            return np.clip(np.round(canvas), 0, 255).astype(np.uint8)
 
         # --- End apply_plotter_mesh ---
 
         effects.add(apply_plotter_mesh)
         if self.config.effect_params.grain > 0:
-            effects.add(
-                lambda img, cfg, pal: add_grain(
-                    img, cfg, pal, amount=cfg.effect_params.grain * 0.08
-                )
-            )
+            effects.add(add_grain, amount=self.config.effect_params.grain * 0.08)
         if self.config.effect_params.vignette > 0:
-            effects.add(
-                lambda img, cfg, pal: add_vignette(
-                    img, cfg, pal, amount=cfg.effect_params.vignette * 0.15
-                )
-            )
+            effects.add(add_vignette, amount=self.config.effect_params.vignette * 0.15)
         self.engine.add_transformation(effects)
 
     def _add_streak_accumulate_v3_style(self) -> None:
         """(V3) Simulates long exposure streaks via particle advection/accumulation."""
         effects = EffectChain()
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 3.0))
+        effects.add(adjust_contrast, amount=3.0)
         effects.add(lambda img, cfg, pal: adjust_saturation(img, cfg, pal, 0.0))
 
         def apply_temporal_streak(
@@ -1890,10 +1715,8 @@ class AuthorTransformer:
                 np.random.seed(seed)
                 random.seed(seed)
 
-            if img.ndim == 3:
-                gray = cv2.cvtColor(img, cv2.COLOR_RGB2GRAY)
-            else:
-                gray = img.copy()
+            analysis = self.engine.analysis_for(img)
+            gray = analysis.gray()
             height, width = gray.shape
             params = cfg.effect_params
 
@@ -1917,18 +1740,15 @@ class AuthorTransformer:
             if len(particle_coords) == 0:
                 return img
             initial_y, initial_x = particle_coords[:, 0], particle_coords[:, 1]
-            initial_brightness = (
-                gray[initial_y, initial_x].astype(np.float32) * initial_brightness_scale
+            particles = ParticleSystem(
+                initial_x,
+                initial_y,
+                gray[initial_y, initial_x].astype(np.float32)
+                * initial_brightness_scale,
             )
-            current_x = initial_x.astype(np.float32)
-            current_y = initial_y.astype(np.float32)
-            current_brightness = initial_brightness.copy()
-            active_particles = np.ones(len(initial_x), dtype=bool)
 
             # Flow Field
-            gray_smooth = cv2.GaussianBlur(gray, (7, 7), 0)
-            grad_x = cv2.Sobel(gray_smooth, cv2.CV_32F, 1, 0, ksize=5)
-            grad_y = cv2.Sobel(gray_smooth, cv2.CV_32F, 0, 1, ksize=5)
+            grad_x, grad_y = analysis.gradients(ksize=5, blur_ksize=7)
             base_angle_rad = math.radians(base_angle)
             grad_angle_rad = np.arctan2(-grad_x, grad_y)
             # Ensure _generate_perlin_flow_field is available in the scope
@@ -1941,68 +1761,54 @@ class AuthorTransformer:
                 lacunarity=2.0,
                 seed=seed + 1,
             )
+            # Static part of the streak angle, stored as a unit vector so it
+            # can be interpolated across the wrap-around of the angle
+            field_angle_rad = (
+                base_angle_rad
+                + grad_angle_rad * params.distortion
+                + flow_noise_y * flow_noise_strength * 2.0
+            )
+            field_cos = np.cos(field_angle_rad).astype(np.float32)
+            field_sin = np.sin(field_angle_rad).astype(np.float32)
 
             # Accumulation Canvas
-            accumulator = np.zeros((height, width), dtype=np.float64)
+            accumulator = np.zeros((height, width), dtype=np.float32)
 
             # Simulation Loop
             for step in range(num_steps):
-                if not np.any(active_particles):
+                if not len(particles):
                     break
-                active_idx = np.where(active_particles)[0]
-                x_t, y_t = current_x[active_idx], current_y[active_idx]
-                brightness_t = current_brightness[active_idx]
-
-                # Calculate Flow
-                x_int, y_int = (
-                    np.clip(np.round(x_t), 0, width - 1).astype(int),
-                    np.clip(np.round(y_t), 0, height - 1).astype(int),
-                )
-                particle_grad_angle = grad_angle_rad[y_int, x_int]
-                particle_noise_x = flow_noise_x[y_int, x_int]
-                particle_noise_y = flow_noise_y[y_int, x_int]
+
+                # Calculate Flow: field angle plus a random per-particle turn
+                angle_cos, angle_sin = particles.sample(field_cos, field_sin)
+                angle_norm = np.sqrt(angle_cos**2 + angle_sin**2) + 1e-6
                 step_random_angle = np.random.uniform(
-                    -angle_variation, angle_variation, size=len(active_idx)
+                    -angle_variation, angle_variation, size=len(particles)
                 ) * (math.pi / 180.0)
-                step_angle_rad = (
-                    base_angle_rad
-                    + particle_grad_angle * params.distortion
-                    + particle_noise_y * flow_noise_strength * 2.0
-                    + step_random_angle
+                random_cos = np.cos(step_random_angle)
+                random_sin = np.sin(step_random_angle)
+                step_cos = angle_cos * random_cos - angle_sin * random_sin
+                step_sin = angle_sin * random_cos + angle_cos * random_sin
+
+                step_flow_mag = flow_strength * random.uniform(0.8, 1.2) / angle_norm
+                x_prev, y_prev = particles.advect(
+                    step_cos * step_flow_mag, -step_sin * step_flow_mag
                 )
 
-                step_flow_mag = flow_strength * random.uniform(0.8, 1.2)
-                step_vx = np.cos(step_angle_rad) * step_flow_mag
-                step_vy = -np.sin(step_angle_rad) * step_flow_mag
-
-                # Update Positions
-                x_next = x_t + step_vx
-                y_next = y_t + step_vy
-
                 # Draw Streaks
-                for k in range(len(active_idx)):
-                    x1, y1 = int(round(x_t[k])), int(round(y_t[k]))
-                    x2, y2 = int(round(x_next[k])), int(round(y_next[k]))
-                    color_val = brightness_t[k]
-                    if 0 <= x1 < width and 0 <= y1 < height:
-                        cv2.line(
-                            accumulator,
-                            (x1, y1),
-                            (x2, y2),
-                            float(color_val),
-                            thickness=1,
-                            lineType=cv2.LINE_AA,
-                        )
+                deposit_segments(
+                    accumulator,
+                    x_prev,
+                    y_prev,
+                    particles.x,
+                    particles.y,
+                    particles.brightness,
+                    mode="over",
+                )
 
                 # Update Particle State
-                current_x[active_idx] = x_next
-                current_y[active_idx] = y_next
-                current_brightness[active_idx] *= streak_fade_factor
-                off_screen = (
-                    (x_next < 0) | (x_next >= width) | (y_next < 0) | (y_next >= height)
-                )
-                too_faint = current_brightness[active_idx] < min_brightness
-                active_particles[active_idx[off_screen | too_faint]] = False
+                particles.fade(streak_fade_factor)
+                particles.cull(width, height, min_brightness)
 
             # Post-Process Accumulator
             final_blur_ksize = int(1 + params.blur_radius * 0.3) * 2 + 1
@@ -2028,24 +1834,16 @@ class AuthorTransformer:
 
         effects.add(apply_temporal_streak)
         if self.config.effect_params.grain > 0:
-            effects.add(
-                lambda img, cfg, pal: add_grain(
-                    img, cfg, pal, amount=cfg.effect_params.grain * 0.3
-                )
-            )
+            effects.add(add_grain, amount=self.config.effect_params.grain * 0.3)
         if self.config.effect_params.vignette > 0:
-            effects.add(
-                lambda img, cfg, pal: add_vignette(
-                    img, cfg, pal, amount=cfg.effect_params.vignette * 0.4
-                )
-            )
+            effects.add(add_vignette, amount=self.config.effect_params.vignette * 0.4)
         self.engine.add_transformation(effects)
 
     def _add_flow_smudge_v3_style(self) -> None:
         """(V3) Fluid smudge using iterative warping based on Perlin noise flow fields."""
         effects = EffectChain()
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 1.2))
-        effects.add(lambda img, cfg, pal: adjust_brightness(img, cfg, pal, 1.1))
+        effects.add(adjust_contrast, amount=1.2)
+        effects.add(adjust_brightness, amount=1.1)
         effects.add(lambda img, cfg, pal: adjust_saturation(img, cfg, pal, 0.1))
 
         def apply_flow_smudge(
@@ -2078,13 +1876,8 @@ class AuthorTransformer:
             step_opacity = 0.1 + params.intensity * 0.2
 
             # Structure Mask
-            if is_color:
-                gray = cv2.cvtColor(img, cv2.COLOR_RGB2GRAY)
-            else:
-                gray = img.copy()
-            structure_map = _normalized_gradient_magnitude(
-                gray, ksize=3, blur_ksize=1
-            )  # Uses helper
+            analysis = self.engine.analysis_for(img)
+            structure_map = analysis.gradient_magnitude(ksize=3, blur_ksize=1)  # Uses helper
             effect_mask = (
                 1.0 - structure_map ** (0.8 + structure_preservation * 1.0)
             ) ** 1.2
@@ -2164,21 +1957,13 @@ class AuthorTransformer:
         effects.add(apply_flow_smudge)
         if self.config.effect_params.grain > 0:
             effects.add(
-                lambda img, cfg, pal: add_grain(
-                    img,
-                    cfg,
-                    pal,
-                    amount=cfg.effect_params.grain * 0.5,
-                    monochrome=True,
-                    grain_size=0.9,
-                )
+                add_grain,
+                amount=self.config.effect_params.grain * 0.5,
+                monochrome=True,
+                grain_size=0.9,
             )
         if self.config.effect_params.vignette > 0:
-            effects.add(
-                lambda img, cfg, pal: add_vignette(
-                    img, cfg, pal, amount=cfg.effect_params.vignette * 0.5
-                )
-            )
+            effects.add(add_vignette, amount=self.config.effect_params.vignette * 0.5)
         self.engine.add_transformation(effects)
 
     # V2
@@ -2194,10 +1979,8 @@ class AuthorTransformer:
                 np.random.seed(seed)
                 random.seed(seed)
 
-            if img.ndim == 3:
-                gray = cv2.cvtColor(img, cv2.COLOR_RGB2GRAY)
-            else:
-                gray = img.copy()
+            analysis = self.engine.analysis_for(img)
+            gray = analysis.gray()
             height, width = gray.shape
             params = cfg.effect_params
 
@@ -2219,8 +2002,8 @@ class AuthorTransformer:
                 int(5 + params.blur_radius * 1.0) * 2 + 1
             )  # Blur for wave shape
             blur_k_detail = 5  # Constant small blur for thickness modulation
-            gray_shape = cv2.GaussianBlur(gray, (blur_k_shape, blur_k_shape), 0)
-            gray_detail = cv2.GaussianBlur(gray, (blur_k_detail, blur_k_detail), 0)
+            gray_shape = analysis.blurred(blur_k_shape)
+            gray_detail = analysis.blurred(blur_k_detail)
 
             # --- Colors ---
             bg_color_tuple = _calculate_rgb_color(
@@ -2231,7 +2014,7 @@ class AuthorTransformer:
             )  # Bright lines
 
             # --- Canvas & Occlusion ---
-            canvas = np.full((height, width, 3), bg_color_tuple, dtype=np.uint8)
+            canvas = np.full((height, width, 3), bg_color_tuple, dtype=np.float32)
             start_y = int(height * vertical_focus_start)
             end_y_for_spacing = int(height * vertical_focus_end)
             total_draw_height = end_y_for_spacing - start_y
@@ -2240,124 +2023,75 @@ class AuthorTransformer:
             line_spacing = max(
                 1, total_draw_height / line_count
             )  # Allow float spacing for base calc
-            horizon_line = np.full(
-                width, height + 100, dtype=np.int32
-            )  # Horizon starts well below screen
-
-            # --- Wave Generation (Back to Front) ---
-            for i in range(line_count - 1, -1, -1):
-                y_base = start_y + int(i * line_spacing)  # Use int for base pixel row
-                if y_base >= height:
-                    continue
-
-                sample_y = min(y_base, height - 1)
-                brightness_wave_row = gray_shape[sample_y, :]
-                brightness_detail_row = gray_detail[sample_y, :]
-
-                current_segment_points: List[Tuple[int, int]] = []
-                current_segment_weights: List[
-                    float
-                ] = []  # Store displacement or brightness for thickness avg
-
-                for x in range(width):
-                    # Displacement based on smooth shape
-                    brightness_shape = brightness_wave_row[x] / 255.0
-                    amp_noise = 1.0 + (random.random() - 0.5) * noise_amp_scale
-                    displacement = (
-                        ((1.0 - brightness_shape) ** 1.6) * amplitude_factor * amp_noise
-                    )
-                    y_displaced_float = y_base - displacement
-
-                    # Thickness modulation based on detail brightness & displacement
-                    brightness_detail = brightness_detail_row[x] / 255.0
-                    # Higher brightness (lighter) OR higher displacement (peak) -> thicker line
-                    thickness_mod = (
-                        brightness_detail**0.7
-                        + (
-                            displacement / amplitude_factor
-                            if amplitude_factor > 0
-                            else 0
-                        )
-                        ** 0.5
-                    ) / 2.0
-                    thickness = base_thickness * (
-                        thickness_multiplier_low
-                        + thickness_mod
-                        * (thickness_multiplier_high - thickness_multiplier_low)
-                    )
+            horizon_line = np.full(
+                width, height + 100, dtype=np.int32
+            )  # Horizon starts well below screen
+            columns = np.arange(width)
 
-                    # Positional noise
-                    x_noise = (random.random() - 0.5) * noise_pos_scale
-                    y_noise = (random.random() - 0.5) * noise_pos_scale
-                    x_perturbed_rnd = int(round(x + x_noise))
-                    y_displaced_rnd = int(round(y_displaced_float + y_noise))
+            # --- Wave Generation (Back to Front, one row at a time) ---
+            segments = []
+            for i in range(line_count - 1, -1, -1):
+                y_base = start_y + int(i * line_spacing)  # Use int for base pixel row
+                if y_base >= height:
+                    continue
 
-                    # Visibility & Occlusion Check (more robust index check)
-                    x_check = min(max(0, x_perturbed_rnd), width - 1)
-                    is_visible = (
-                        y_displaced_rnd >= 0 and y_displaced_rnd < horizon_line[x_check]
-                    )
+                sample_y = min(y_base, height - 1)
+                # Amplitude noise and positional noise (x, y) per point, in order
+                draws = np.array([random.random() for _ in range(3 * width)])
+                draws = draws.reshape(width, 3) - 0.5
+
+                # Displacement based on smooth shape
+                brightness_shape = gray_shape[sample_y, :] / 255.0
+                amp_noise = 1.0 + draws[:, 0] * noise_amp_scale
+                displacement = (
+                    ((1.0 - brightness_shape) ** 1.6) * amplitude_factor * amp_noise
+                )
+                y_displaced_float = y_base - displacement
+
+                # Thickness modulation based on detail brightness & displacement
+                brightness_detail = gray_detail[sample_y, :] / 255.0
+                # Higher brightness (lighter) OR higher displacement (peak) -> thicker line
+                thickness_mod = (
+                    brightness_detail**0.7
+                    + (displacement / amplitude_factor if amplitude_factor > 0 else 0)
+                    ** 0.5
+                ) / 2.0
+                thickness = base_thickness * (
+                    thickness_multiplier_low
+                    + thickness_mod
+                    * (thickness_multiplier_high - thickness_multiplier_low)
+                )
 
-                    # Segment Handling
-                    if is_visible:
-                        current_segment_points.append(
-                            (x_perturbed_rnd, y_displaced_rnd)
-                        )
-                        current_segment_weights.append(thickness)
-                        # Update horizon smoothly
-                        horizon_line[x_check] = min(
-                            horizon_line[x_check], y_displaced_rnd
-                        )
-                        # Optional wider horizon update:
-                        # hw=1; update_slice = slice(max(0, x_check - hw), min(width, x_check + hw + 1))
-                        # horizon_line[update_slice] = np.minimum(horizon_line[update_slice], y_displaced_rnd)
-                    else:  # Point occluded or off screen
-                        if len(current_segment_points) > 1:
-                            avg_thickness = max(
-                                1, int(round(np.mean(current_segment_weights)))
-                            )
-                            pts_np = np.array(current_segment_points, dtype=np.int32)
-                            cv2.polylines(
-                                canvas,
-                                [pts_np],
-                                isClosed=False,
-                                color=line_color_tuple,
-                                thickness=avg_thickness,
-                                lineType=cv2.LINE_AA,
-                            )
-                        current_segment_points = []
-                        current_segment_weights = []
+                # Positional noise
+                x_perturbed = columns + draws[:, 1] * noise_pos_scale
+                y_perturbed = y_displaced_float + draws[:, 2] * noise_pos_scale
 
-                # Draw final segment for this line
-                if len(current_segment_points) > 1:
-                    avg_thickness = max(1, int(round(np.mean(current_segment_weights))))
-                    pts_np = np.array(current_segment_points, dtype=np.int32)
-                    cv2.polylines(
-                        canvas,
-                        [pts_np],
-                        isClosed=False,
-                        color=line_color_tuple,
-                        thickness=avg_thickness,
-                        lineType=cv2.LINE_AA,
-                    )
+                # Visibility & Occlusion Check on the rounded points
+                x_check = np.clip(np.round(x_perturbed).astype(np.int64), 0, width - 1)
+                y_displaced_rnd = np.round(y_perturbed).astype(np.int64)
+                is_visible = _occlude_ridge(x_check, y_displaced_rnd, horizon_line)
 
-            return canvas
+                # Runs of visible points become polylines through the exact points
+                segments.append(
+                    _ridge_segments(x_perturbed, y_perturbed, is_visible, thickness)
+                )
+
+            # cv2 drew these anti-aliased polylines about 2t - 1 pixels wide
+            x0, y0, x1, y1, thick = (np.concatenate(part) for part in zip(*segments))
+            draw_lines(
+                canvas, x0, y0, x1, y1, [line_color_tuple], 2 * thick - 1, mode="over"
+            )
+            return np.clip(np.round(canvas), 0, 255).astype(np.uint8)
 
         # --- End apply_topographic_mesh ---
 
         effects.add(apply_topographic_mesh)
         if self.config.effect_params.grain > 0:
             effects.add(
-                lambda img, cfg, pal: add_grain(
-                    img, cfg, pal, amount=cfg.effect_params.grain * 0.1, monochrome=True
-                )
+                add_grain, amount=self.config.effect_params.grain * 0.1, monochrome=True
             )
         if self.config.effect_params.vignette > 0:
-            effects.add(
-                lambda img, cfg, pal: add_vignette(
-                    img, cfg, pal, amount=cfg.effect_params.vignette * 0.2
-                )
-            )
+            effects.add(add_vignette, amount=self.config.effect_params.vignette * 0.2)
 
         self.engine.add_transformation(effects)
 
@@ -2367,9 +2101,7 @@ class AuthorTransformer:
 
         # Pre-processing: High contrast, B&W is common for the reference look
         effects.add(
-            lambda img, cfg, pal: adjust_contrast(
-                img, cfg, pal, 2.0 + cfg.effect_params.intensity * 0.5
-            )
+            adjust_contrast, amount=2.0 + self.config.effect_params.intensity * 0.5
         )
         effects.add(
             lambda img, cfg, pal: adjust_saturation(img, cfg, pal, 0.0)
@@ -2499,20 +2231,12 @@ class AuthorTransformer:
         effects.add(apply_temporal_streak)
         if self.config.effect_params.grain > 0:
             effects.add(
-                lambda img, cfg, pal: add_grain(
-                    img,
-                    cfg,
-                    pal,
-                    amount=cfg.effect_params.grain * 0.35,
-                    monochrome=True,
-                )
+                add_grain,
+                amount=self.config.effect_params.grain * 0.35,
+                monochrome=True,
             )
         if self.config.effect_params.vignette > 0:
-            effects.add(
-                lambda img, cfg, pal: add_vignette(
-                    img, cfg, pal, amount=cfg.effect_params.vignette * 0.45
-                )
-            )
+            effects.add(add_vignette, amount=self.config.effect_params.vignette * 0.45)
 
         self.engine.add_transformation(effects)
 
@@ -2522,9 +2246,7 @@ class AuthorTransformer:
 
         # Pre-processing: Generally less contrast initially, allow smudge to create it
         effects.add(
-            lambda img, cfg, pal: adjust_contrast(
-                img, cfg, pal, 1.1 + cfg.effect_params.intensity * 0.2
-            )
+            adjust_contrast, amount=1.1 + self.config.effect_params.intensity * 0.2
         )
         effects.add(
             lambda img, cfg, pal: adjust_saturation(img, cfg, pal, 0.1)
@@ -2560,12 +2282,9 @@ class AuthorTransformer:
             step_opacity = 0.1 + params.intensity * 0.2
 
             # --- Calculate Structure Mask ---
-            if is_color:
-                gray = cv2.cvtColor(img, cv2.COLOR_RGB2GRAY)
-            else:
-                gray = img.copy()
+            analysis = self.engine.analysis_for(img)
             # Higher value = edge/detail = LESS smudging
-            structure_map = _normalized_gradient_magnitude(gray, ksize=3, blur_ksize=3)
+            structure_map = analysis.gradient_magnitude(ksize=3, blur_ksize=3)
             # Invert and scale to create the mask where smudging occurs
             # Power sharpens transition: higher power = preserve edges more strictly
             smear_mask = (
@@ -2663,16 +2382,10 @@ class AuthorTransformer:
         effects.add(apply_ethereal_smudge)
         if self.config.effect_params.grain > 0:
             effects.add(
-                lambda img, cfg, pal: add_grain(
-                    img, cfg, pal, amount=cfg.effect_params.grain * 0.4, monochrome=True
-                )
+                add_grain, amount=self.config.effect_params.grain * 0.4, monochrome=True
             )
         if self.config.effect_params.vignette > 0:
-            effects.add(
-                lambda img, cfg, pal: add_vignette(
-                    img, cfg, pal, amount=cfg.effect_params.vignette * 0.5
-                )
-            )
+            effects.add(add_vignette, amount=self.config.effect_params.vignette * 0.5)
 
         self.engine.add_transformation(effects)
 
@@ -2691,10 +2404,8 @@ class AuthorTransformer:
                 np.random.seed(seed)
                 random.seed(seed)
 
-            if img.ndim == 3:
-                gray = cv2.cvtColor(img, cv2.COLOR_RGB2GRAY)
-            else:
-                gray = img.copy()
+            analysis = self.engine.analysis_for(img)
+            gray = analysis.gray()
 
             height, width = gray.shape
             params = cfg.effect_params
@@ -2711,10 +2422,10 @@ class AuthorTransformer:
             # More significant blur for very smooth, flowing lines
             blur_radius_px = int(3 + params.blur_radius * 1.0)
             ksize = blur_radius_px * 2 + 1
-            gray_smooth = cv2.GaussianBlur(gray, (ksize, ksize), 0)
+            gray_smooth = analysis.blurred(ksize)
             # Also keep less blurred version for brightness modulation if needed
             gray_detail = (
-                cv2.GaussianBlur(gray, (5, 5), 0) if ksize > 5 else gray_smooth
+                analysis.blurred(5) if ksize > 5 else gray_smooth
             )
 
             # --- Colors (Using helper) ---
@@ -2872,16 +2583,10 @@ class AuthorTransformer:
         # Add final subtle grain/vignette if desired
         if self.config.effect_params.grain > 0:
             effects.add(
-                lambda img, cfg, pal: add_grain(
-                    img, cfg, pal, amount=cfg.effect_params.grain * 0.1, monochrome=True
-                )
+                add_grain, amount=self.config.effect_params.grain * 0.1, monochrome=True
             )
         if self.config.effect_params.vignette > 0:
-            effects.add(
-                lambda img, cfg, pal: add_vignette(
-                    img, cfg, pal, amount=cfg.effect_params.vignette * 0.2
-                )
-            )
+            effects.add(add_vignette, amount=self.config.effect_params.vignette * 0.2)
 
         self.engine.add_transformation(effects)
 
@@ -2891,9 +2596,7 @@ class AuthorTransformer:
 
         # Start with contrast and desaturation
         effects.add(
-            lambda img, cfg, pal: adjust_contrast(
-                img, cfg, pal, 1.6 + cfg.effect_params.intensity * 0.4
-            )
+            adjust_contrast, amount=1.6 + self.config.effect_params.intensity * 0.4
         )
         effects.add(
             lambda img, cfg, pal: adjust_saturation(img, cfg, pal, 0.05)
@@ -2926,14 +2629,9 @@ class AuthorTransformer:
             )  # How much original shows through
 
             # --- Calculate Base Flow Field (Gradient-based) ---
-            if img.ndim == 3:
-                gray = cv2.cvtColor(img, cv2.COLOR_RGB2GRAY)
-            else:
-                gray = img.copy()
+            analysis = self.engine.analysis_for(img)
             # Smooth before gradient calculation
-            gray_smooth = cv2.GaussianBlur(gray, (5, 5), 0)
-            grad_x = cv2.Sobel(gray_smooth, cv2.CV_32F, 1, 0, ksize=3)
-            grad_y = cv2.Sobel(gray_smooth, cv2.CV_32F, 0, 1, ksize=3)
+            grad_x, grad_y = analysis.gradients(ksize=3, blur_ksize=5)
             # Calculate magnitude and angle of gradient
             magnitude = cv2.magnitude(grad_x, grad_y)
             # Normalize magnitude (0 to 1)
@@ -3047,16 +2745,10 @@ class AuthorTransformer:
         # Add grain/vignette after the main effect
         if self.config.effect_params.grain > 0:
             effects.add(
-                lambda img, cfg, pal: add_grain(
-                    img, cfg, pal, amount=cfg.effect_params.grain * 0.3, monochrome=True
-                )
+                add_grain, amount=self.config.effect_params.grain * 0.3, monochrome=True
             )
         if self.config.effect_params.vignette > 0:
-            effects.add(
-                lambda img, cfg, pal: add_vignette(
-                    img, cfg, pal, amount=cfg.effect_params.vignette * 0.4
-                )
-            )
+            effects.add(add_vignette, amount=self.config.effect_params.vignette * 0.4)
 
         self.engine.add_transformation(effects)
 
@@ -3066,9 +2758,7 @@ class AuthorTransformer:
 
         # Initial toning - Desaturated, maybe cool tint
         effects.add(
-            lambda img, cfg, pal: adjust_contrast(
-                img, cfg, pal, 1.4 + cfg.effect_params.intensity * 0.3
-            )
+            adjust_contrast, amount=1.4 + self.config.effect_params.intensity * 0.3
         )
         effects.add(lambda img, cfg, pal: adjust_saturation(img, cfg, pal, 0.05))
         # Example cool tint (adjust B channel)
@@ -3101,13 +2791,8 @@ class AuthorTransformer:
             )  # Lower intensity = more structure preserved
 
             # --- Calculate Structure/Gradient Mask ---
-            if is_color:
-                gray = cv2.cvtColor(img, cv2.COLOR_RGB2GRAY)
-            else:
-                gray = img.copy()
-            gray_smooth = cv2.GaussianBlur(gray, (5, 5), 0)
-            grad_x = cv2.Sobel(gray_smooth, cv2.CV_32F, 1, 0, ksize=3)
-            grad_y = cv2.Sobel(gray_smooth, cv2.CV_32F, 0, 1, ksize=3)
+            analysis = self.engine.analysis_for(img)
+            grad_x, grad_y = analysis.gradients(ksize=3, blur_ksize=5)
             magnitude = cv2.magnitude(grad_x, grad_y)
             # Normalize magnitude (0=low detail, 1=high detail/edge)
             mag_norm = cv2.normalize(magnitude, None, 0.0, 1.0, cv2.NORM_MINMAX)
@@ -3206,21 +2891,13 @@ class AuthorTransformer:
         if self.config.effect_params.grain > 0:
             # Grain adds to the analog/ghostly feel
             effects.add(
-                lambda img, cfg, pal: add_grain(
-                    img,
-                    cfg,
-                    pal,
-                    amount=cfg.effect_params.grain * 0.45,
-                    monochrome=True,
-                    grain_size=1.0,
-                )
+                add_grain,
+                amount=self.config.effect_params.grain * 0.45,
+                monochrome=True,
+                grain_size=1.0,
             )
         if self.config.effect_params.vignette > 0:
-            effects.add(
-                lambda img, cfg, pal: add_vignette(
-                    img, cfg, pal, amount=cfg.effect_params.vignette * 0.5
-                )
-            )
+            effects.add(add_vignette, amount=self.config.effect_params.vignette * 0.5)
 
         self.engine.add_transformation(effects)
 
@@ -3237,10 +2914,8 @@ class AuthorTransformer:
                 np.random.seed(seed)
                 random.seed(seed)
 
-            if img.ndim == 3:
-                gray = cv2.cvtColor(img, cv2.COLOR_RGB2GRAY)
-            else:
-                gray = img.copy()
+            analysis = self.engine.analysis_for(img)
+            gray = analysis.gray()
 
             height, width = gray.shape
             params = cfg.effect_params
@@ -3264,7 +2939,7 @@ class AuthorTransformer:
                 2 + params.blur_radius * 1.5
             )  # More base blur, slightly less scaling
             ksize = blur_radius_px * 2 + 1
-            gray = cv2.GaussianBlur(gray, (ksize, ksize), 0)
+            gray = analysis.blurred(ksize)
 
             # --- Colors ---
             primary_tuple = pal.primary.as_tuple
@@ -3368,17 +3043,10 @@ class AuthorTransformer:
 
         effects.add(apply_refined_topographic_wave)
         if self.config.effect_params.grain > 0:
-            effects.add(
-                lambda img, cfg, pal: add_grain(
-                    img, cfg, pal, amount=cfg.effect_params.grain * 0.05
-                )
-            )  # Even more subtle grain
+            # Even more subtle grain
+            effects.add(add_grain, amount=self.config.effect_params.grain * 0.05)
         if self.config.effect_params.vignette > 0:
-            effects.add(
-                lambda img, cfg, pal: add_vignette(
-                    img, cfg, pal, amount=cfg.effect_params.vignette * 0.15
-                )
-            )
+            effects.add(add_vignette, amount=self.config.effect_params.vignette * 0.15)
 
         self.engine.add_transformation(effects)
 
@@ -3391,7 +3059,7 @@ class AuthorTransformer:
         effects = EffectChain()
 
         # Apply initial high-contrast B&W conversion, similar to reference images
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 1.8))
+        effects.add(adjust_contrast, amount=1.8)
         effects.add(
             lambda img, cfg, pal: adjust_saturation(img, cfg, pal, 0.05)
         )  # Near B&W
@@ -3544,16 +3212,10 @@ class AuthorTransformer:
         if self.config.effect_params.grain > 0:
             # Grain suits this style well
             effects.add(
-                lambda img, cfg, pal: add_grain(
-                    img, cfg, pal, amount=cfg.effect_params.grain * 0.4, monochrome=True
-                )
+                add_grain, amount=self.config.effect_params.grain * 0.4, monochrome=True
             )
         if self.config.effect_params.vignette > 0:
-            effects.add(
-                lambda img, cfg, pal: add_vignette(
-                    img, cfg, pal, amount=cfg.effect_params.vignette * 0.5
-                )
-            )
+            effects.add(add_vignette, amount=self.config.effect_params.vignette * 0.5)
 
         self.engine.add_transformation(effects)
 
@@ -3567,9 +3229,7 @@ class AuthorTransformer:
 
         # Initial contrast/toning - often B&W or heavily desaturated
         effects.add(
-            lambda img, cfg, pal: adjust_contrast(
-                img, cfg, pal, 1.5 + cfg.effect_params.intensity * 0.5
-            )
+            adjust_contrast, amount=1.5 + self.config.effect_params.intensity * 0.5
         )
         effects.add(
             lambda img, cfg, pal: adjust_saturation(img, cfg, pal, 0.1)
@@ -3718,22 +3378,14 @@ class AuthorTransformer:
         if self.config.effect_params.grain > 0:
             # Authentic film grain fits well
             effects.add(
-                lambda img, cfg, pal: add_grain(
-                    img,
-                    cfg,
-                    pal,
-                    amount=cfg.effect_params.grain * 0.5,
-                    monochrome=True,
-                    grain_size=0.8,
-                )
+                add_grain,
+                amount=self.config.effect_params.grain * 0.5,
+                monochrome=True,
+                grain_size=0.8,
             )
         if self.config.effect_params.vignette > 0:
             # Vignette enhances the mood
-            effects.add(
-                lambda img, cfg, pal: add_vignette(
-                    img, cfg, pal, amount=cfg.effect_params.vignette * 0.6
-                )
-            )
+            effects.add(add_vignette, amount=self.config.effect_params.vignette * 0.6)
 
         self.engine.add_transformation(effects)
 
@@ -3742,48 +3394,19 @@ class AuthorTransformer:
         effects = EffectChain()
 
         # Base adjustment with high contrast
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 1.3))
-        effects.add(lambda img, cfg, pal: adjust_brightness(img, cfg, pal, 0.85))
+        effects.add(adjust_contrast, amount=1.3)
+        effects.add(adjust_brightness, amount=0.85)
 
         # Apply subtle pervasive distortion
         def subtle_wave_distortion(img, cfg, pal):
             height, width = img.shape[:2]
-            result = img.copy()
-
-            # Create displacement map
-            displacement_x = np.zeros((height, width), dtype=np.float32)
-            displacement_y = np.zeros((height, width), dtype=np.float32)
 
             # Create distortion with multiple frequencies
             intensity = cfg.effect_params.intensity * 0.4  # More subtle than standard
+            field = _subtle_wave_field(height, width, intensity)
 
-            # Add several subtle wave patterns
-            for scale in [6, 12, 24]:
-                for y in range(height):
-                    for x in range(width):
-                        # Apply subtle wave patterns with varying frequencies
-                        displacement_x[y, x] += (
-                            intensity * math.sin(y / scale + x / (scale * 1.5)) * 2
-                        )
-                        displacement_y[y, x] += (
-                            intensity * math.cos(x / scale + y / (scale * 1.2)) * 2
-                        )
-
-            # Apply displacement map
-            for y in range(height):
-                for x in range(width):
-                    # Calculate source coordinates with displacement
-                    src_x = x + int(displacement_x[y, x])
-                    src_y = y + int(displacement_y[y, x])
-
-                    # Ensure we stay within bounds
-                    src_x = max(0, min(width - 1, src_x))
-                    src_y = max(0, min(height - 1, src_y))
-
-                    # Copy pixel
-                    result[y, x] = img[src_y, src_x]
-
-            return result
+            # Copy pixels from the displaced positions, clamped to the image
+            return warp(img, field, interpolation="nearest", border="replicate")
 
         effects.add(subtle_wave_distortion)
 
@@ -3812,7 +3435,7 @@ class AuthorTransformer:
         )
 
         # Add subtle grain for texture
-        effects.add(lambda img, cfg, pal: add_grain(img, cfg, pal, 0.15))
+        effects.add(add_grain, amount=0.15)
 
         self.engine.add_transformation(effects)
 
@@ -3821,7 +3444,7 @@ class AuthorTransformer:
         effects = EffectChain()
 
         # Base adjustments
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 1.1))
+        effects.add(adjust_contrast, amount=1.1)
         effects.add(lambda img, cfg, pal: adjust_saturation(img, cfg, pal, 0.7))
 
         # Spectral glow effect
@@ -3952,7 +3575,7 @@ class AuthorTransformer:
         effects = EffectChain()
 
         # Base adjustments
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 1.1))
+        effects.add(adjust_contrast, amount=1.1)
 
         # Add controlled RGB shift
         def controlled_rgb_shift(img, cfg, pal):
@@ -4068,11 +3691,7 @@ class AuthorTransformer:
         effects.add(controlled_block_glitches)
 
         # Add subtle noise for texture
-        effects.add(
-            lambda img, cfg, pal: add_noise(
-                img, cfg, pal, amount=0.03, noise_type="gaussian"
-            )
-        )
+        effects.add(add_noise, amount=0.03, noise_type="gaussian")
 
         self.engine.add_transformation(effects)
 
@@ -4081,7 +3700,7 @@ class AuthorTransformer:
         effects = EffectChain()
 
         # Base adjustments
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 1.15))
+        effects.add(adjust_contrast, amount=1.15)
         effects.add(lambda img, cfg, pal: adjust_saturation(img, cfg, pal, 0.8))
 
         # Create spectral veil effect
@@ -4089,26 +3708,22 @@ class AuthorTransformer:
             height, width = img.shape[:2]
             result = img.copy().astype(np.float32)
 
-            # Create base veil layer
-            veil = np.zeros_like(result)
-
-            # Create gradient for veil
-            for y in range(height):
-                # Calculate gradient based on position
-                v = (1 + math.sin(y / height * math.pi * 3)) / 2
-
-                # Create undulating pattern across width
-                for x in range(width):
-                    h = (1 + math.sin(x / width * math.pi * 2 + y / 50)) / 2
+            # Create gradient for veil: vertical bands times an undulating
+            # pattern across the width
+            y = np.arange(height)[:, np.newaxis]
+            x = np.arange(width)[np.newaxis, :]
+            v = (1 + np.sin(y / height * math.pi * 3)) / 2
+            h = (1 + np.sin(x / width * math.pi * 2 + y / 50)) / 2
 
-                    # Combine for final opacity
-                    opacity = v * h * (0.3 + cfg.effect_params.intensity * 0.3)
+            # Combine for final opacity
+            opacity = v * h * (0.3 + cfg.effect_params.intensity * 0.3)
 
-                    # Fill with color from palette
-                    if img.ndim == 3:
-                        veil[y, x] = np.array(pal.accent.as_normalized) * 255 * opacity
-                    else:
-                        veil[y, x] = 220 * opacity
+            # Create the veil layer with color from palette
+            if img.ndim == 3:
+                color = np.array(pal.accent.as_normalized) * 255
+                veil = (color * opacity[:, :, np.newaxis]).astype(np.float32)
+            else:
+                veil = (220 * opacity).astype(np.float32)
 
             # Apply Gaussian blur to the veil for softness
             veil = cv2.GaussianBlur(veil, (0, 0), 15)
@@ -4170,21 +3785,16 @@ class AuthorTransformer:
                 # Calculate opacity - fade out for further ghosts
                 opacity = 0.3 * (1 - i / num_ghosts)
 
-                # Apply the ghost with displacement
-                for y in range(height):
-                    for x in range(width):
-                        # Calculate source coordinates
-                        src_x = x + shift_x
-                        src_y = y + shift_y
-
-                        # Skip if out of bounds
-                        if src_x < 0 or src_x >= width or src_y < 0 or src_y >= height:
-                            continue
-
-                        # Blend ghost pixel
-                        result[y, x] = (
-                            result[y, x] * (1 - opacity) + ghost[src_y, src_x] * opacity
-                        )
+                # Apply the ghost with displacement: pixel (x, y) blends in
+                # ghost pixel (x + shift_x, y + shift_y) where that exists
+                rows = slice(max(0, -shift_y), min(height, height - shift_y))
+                cols = slice(max(0, -shift_x), min(width, width - shift_x))
+                src_rows = slice(rows.start + shift_y, rows.stop + shift_y)
+                src_cols = slice(cols.start + shift_x, cols.stop + shift_x)
+                result[rows, cols] = (
+                    result[rows, cols] * (1 - opacity)
+                    + ghost[src_rows, src_cols] * opacity
+                )
 
             return np.clip(result, 0, 255).astype(np.uint8)
 
@@ -4201,15 +3811,7 @@ class AuthorTransformer:
         effects.add(dreamy_glow)
 
         # Add vignette
-        effects.add(
-            lambda img, cfg, pal: add_vignette(
-                img,
-                cfg,
-                pal,
-                amount=0.4,
-                color=(220, 225, 255),  # Light blue vignette
-            )
-        )
+        effects.add(add_vignette, amount=0.4, color=(220, 225, 255))
 
         self.engine.add_transformation(effects)
 
@@ -4218,8 +3820,8 @@ class AuthorTransformer:
         effects = EffectChain()
 
         # Base adjustments
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 1.1))
-        effects.add(lambda img, cfg, pal: adjust_brightness(img, cfg, pal, 0.95))
+        effects.add(adjust_contrast, amount=1.1)
+        effects.add(adjust_brightness, amount=0.95)
 
         # Create multi-directional ghost trails
         def multi_directional_trails(img, cfg, pal):
@@ -4348,11 +3950,7 @@ class AuthorTransformer:
         effects.add(subtle_color_shift)
 
         # Add slight vignette
-        effects.add(
-            lambda img, cfg, pal: add_vignette(
-                img, cfg, pal, amount=0.3, center=None, strength=1.2
-            )
-        )
+        effects.add(add_vignette, amount=0.3, center=None, strength=1.2)
 
         self.engine.add_transformation(effects)
 
@@ -4361,13 +3959,19 @@ class AuthorTransformer:
         input_pattern: Union[str, Path],
         output_dir: Union[str, Path],
         style: Optional[str] = None,
+        cache_fields: bool = False,
     ) -> list[Path]:
         """Process multiple author images with the same style.
 
+        Flow fields, grain and vignette masks are shared across the images
+        through the field cache; its statistics are logged at the end.
+
         Args:
             input_pattern: Glob pattern for input files
             output_dir: Directory where the results should be saved
             style: Style variant to apply (defaults to config.style_variant)
+            cache_fields: Also keep the fields as .npy files under
+                output_dir/.field_cache, memory-mapped by later runs
 
         Returns:
             List of paths where the transformed images were saved
@@ -4375,6 +3979,11 @@ class AuthorTransformer:
         # Get list of input files
         input_files = glob.glob(str(input_pattern))
 
+        previous_cache_dir = field_cache.directory
+        if cache_fields:
+            field_cache.configure(directory=Path(output_dir) / CACHE_DIR_NAME)
+        field_cache.reset_stats()
+
         # Process each file
         results = []
         for input_file in input_files:
@@ -4388,6 +3997,8 @@ class AuthorTransformer:
             except Exception as e:
                 print(f"Error processing {input_path}: {e}")
 
+        log_success(get_logger(), "Field cache statistics", field_cache.stats.as_dict())
+        field_cache.configure(directory=previous_cache_dir)
         return results
 
     def _create_contour_map(
@@ -4547,16 +4158,12 @@ class AuthorTransformer:
         effects = EffectChain()
 
         # Add higher contrast and sharp edges
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 2.0))
+        effects.add(adjust_contrast, amount=2.0)
         effects.add(lambda img, cfg, pal: enhance_edges(img, cfg, pal, 1.5))
 
         # Add distinct grain texture for a film-like appearance
         grain_amount = 0.6 + self.config.effect_params.intensity * 0.4
-        effects.add(
-            lambda img, cfg, pal: add_grain(
-                img, cfg, pal, amount=grain_amount, grain_size=1.0, monochrome=True
-            )
-        )
+        effects.add(add_grain, amount=grain_amount, grain_size=1.0, monochrome=True)
 
         # Subtle threshold effect
         effects.add(
@@ -4574,7 +4181,7 @@ class AuthorTransformer:
         effects = EffectChain()
 
         # Add strong contrast adjustment
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 1.7))
+        effects.add(adjust_contrast, amount=1.7)
 
         # Convert to true duotone with refined palette
         def refined_duotone(img, cfg, pal):
@@ -4587,7 +4194,7 @@ class AuthorTransformer:
 
         # Add elegant grain texture
         grain_amount = 0.25 + self.config.effect_params.intensity * 0.15
-        effects.add(lambda img, cfg, pal: add_grain(img, cfg, pal, grain_amount))
+        effects.add(add_grain, amount=grain_amount)
 
         # Add the effect chain to the engine
         self.engine.add_transformation(effects)
@@ -4598,7 +4205,7 @@ class AuthorTransformer:
         effects = EffectChain()
 
         # Add contrast and reduce saturation for more refined look
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 1.5))
+        effects.add(adjust_contrast, amount=1.5)
         effects.add(lambda img, cfg, pal: adjust_saturation(img, cfg, pal, 0.5))
 
         # Create flowing, warped displacement effect inspired by reference images
@@ -4639,7 +4246,7 @@ class AuthorTransformer:
 
         # Add subtle grain
         grain_amount = 0.2 + self.config.effect_params.intensity * 0.1
-        effects.add(lambda img, cfg, pal: add_grain(img, cfg, pal, grain_amount))
+        effects.add(add_grain, amount=grain_amount)
 
         # Add the effect chain to the engine
         self.engine.add_transformation(effects)
@@ -4650,7 +4257,7 @@ class AuthorTransformer:
         effects = EffectChain()
 
         # Add contrast adjustment
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 1.4))
+        effects.add(adjust_contrast, amount=1.4)
 
         # RGB channel shift with monochromatic palette
         effects.add(
@@ -4727,7 +4334,7 @@ class AuthorTransformer:
 
         # Add digital noise instead of grain
         noise_amount = 0.15 + self.config.effect_params.intensity * 0.2
-        effects.add(lambda img, cfg, pal: add_noise(img, cfg, pal, noise_amount))
+        effects.add(add_noise, amount=noise_amount)
 
         # Add the effect chain to the engine
         self.engine.add_transformation(effects)
@@ -4738,10 +4345,8 @@ class AuthorTransformer:
         effects = EffectChain()
 
         # Add dreamlike contrast and brightness
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 1.2))
-        effects.add(
-            lambda img, cfg, pal: adjust_brightness(img, cfg, pal, 0.9)
-        )  # Slightly darker
+        effects.add(adjust_contrast, amount=1.2)
+        effects.add(adjust_brightness, amount=0.9)  # Slightly darker
 
         # Create ghostly double exposure effect
         def ghost_double_exposure(img, cfg, pal):
@@ -4802,7 +4407,7 @@ class AuthorTransformer:
 
         # Add subtle grain
         grain_amount = 0.2
-        effects.add(lambda img, cfg, pal: add_grain(img, cfg, pal, grain_amount))
+        effects.add(add_grain, amount=grain_amount)
 
         # Add the effect chain to the engine
         self.engine.add_transformation(effects)
@@ -4813,7 +4418,7 @@ class AuthorTransformer:
         effects = EffectChain()
 
         # Add high contrast and low saturation for brutalist look
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 2.0))
+        effects.add(adjust_contrast, amount=2.0)
         effects.add(
             lambda img, cfg, pal: adjust_saturation(img, cfg, pal, 0.1)
         )  # Almost monochrome
@@ -4875,7 +4480,7 @@ class AuthorTransformer:
 
         # Add subtle grain
         grain_amount = 0.15
-        effects.add(lambda img, cfg, pal: add_grain(img, cfg, pal, grain_amount))
+        effects.add(add_grain, amount=grain_amount)
 
         # Add the effect chain to the engine
         self.engine.add_transformation(effects)
@@ -4886,7 +4491,7 @@ class AuthorTransformer:
         effects = EffectChain()
 
         # Add contrast and reduce saturation
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 1.7))
+        effects.add(adjust_contrast, amount=1.7)
         effects.add(lambda img, cfg, pal: adjust_saturation(img, cfg, pal, 0.3))
 
         # Apply selective blur with increased intensity
@@ -4951,7 +4556,7 @@ class AuthorTransformer:
 
         # Add grain
         grain_amount = self.config.effect_params.intensity * 0.4
-        effects.add(lambda img, cfg, pal: add_grain(img, cfg, pal, grain_amount))
+        effects.add(add_grain, amount=grain_amount)
 
         # Add the effect chain to the engine
         self.engine.add_transformation(effects)
@@ -4962,8 +4567,8 @@ class AuthorTransformer:
         effects = EffectChain()
 
         # Add dramatic contrast and darken the image
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 2.0))
-        effects.add(lambda img, cfg, pal: adjust_brightness(img, cfg, pal, 0.7))
+        effects.add(adjust_contrast, amount=2.0)
+        effects.add(adjust_brightness, amount=0.7)
         effects.add(lambda img, cfg, pal: adjust_saturation(img, cfg, pal, 0.2))
 
         # Apply duotone with dark palette
@@ -5006,11 +4611,7 @@ class AuthorTransformer:
 
         # Add grain
         grain_amount = self.config.effect_params.intensity * 0.6
-        effects.add(
-            lambda img, cfg, pal: add_grain(
-                img, cfg, pal, grain_amount, monochrome=True
-            )
-        )
+        effects.add(add_grain, amount=grain_amount, monochrome=True)
 
         # Add the effect chain to the engine
         self.engine.add_transformation(effects)
@@ -5021,7 +4622,7 @@ class AuthorTransformer:
         effects = EffectChain()
 
         # Add refined contrast adjustment
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 1.5))
+        effects.add(adjust_contrast, amount=1.5)
         effects.add(lambda img, cfg, pal: adjust_saturation(img, cfg, pal, 0.5))
 
         # Create more refined symmetry by blending with original
@@ -5063,7 +4664,7 @@ class AuthorTransformer:
 
         # Add subtle grain
         grain_amount = 0.2
-        effects.add(lambda img, cfg, pal: add_grain(img, cfg, pal, grain_amount))
+        effects.add(add_grain, amount=grain_amount)
 
         # Add the effect chain to the engine
         self.engine.add_transformation(effects)
@@ -5074,7 +4675,7 @@ class AuthorTransformer:
         effects = EffectChain()
 
         # Add contrast adjustment for better contour definition
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 1.5))
+        effects.add(adjust_contrast, amount=1.5)
 
         # Create contour map effect
         def apply_contour(img, cfg, pal):
@@ -5122,7 +4723,7 @@ class AuthorTransformer:
 
         # Add subtle grain
         grain_amount = 0.1
-        effects.add(lambda img, cfg, pal: add_grain(img, cfg, pal, grain_amount))
+        effects.add(add_grain, amount=grain_amount)
 
         # Add the effect chain to the engine
         self.engine.add_transformation(effects)
@@ -5133,7 +4734,7 @@ class AuthorTransformer:
         effects = EffectChain()
 
         # Add contrast adjustment
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 1.7))
+        effects.add(adjust_contrast, amount=1.7)
         effects.add(
             lambda img, cfg, pal: adjust_saturation(img, cfg, pal, 0.1)
         )  # Almost monochrome
@@ -5209,7 +4810,7 @@ class AuthorTransformer:
 
         # Add subtle grain
         grain_amount = 0.15
-        effects.add(lambda img, cfg, pal: add_grain(img, cfg, pal, grain_amount))
+        effects.add(add_grain, amount=grain_amount)
 
         # Add the effect chain to the engine
         self.engine.add_transformation(effects)
@@ -5220,19 +4821,10 @@ class AuthorTransformer:
         effects = EffectChain()
 
         # Add refined contrast for cleaner look
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 1.8))
+        effects.add(adjust_contrast, amount=1.8)
 
         # Add fine-grained texture rather than pixelation
-        effects.add(
-            lambda img, cfg, pal: add_grain(
-                img,
-                cfg,
-                pal,
-                amount=0.4,
-                grain_size=0.5,  # Finer grain for more subtle texture
-                monochrome=True,
-            )
-        )
+        effects.add(add_grain, amount=0.4, grain_size=0.5, monochrome=True)
 
         # Add subtle edge enhancement for structure
         effects.add(lambda img, cfg, pal: enhance_edges(img, cfg, pal, 0.7))
@@ -5258,7 +4850,7 @@ class AuthorTransformer:
         effects = EffectChain()
 
         # Add higher contrast for more defined shapes
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 2.0))
+        effects.add(adjust_contrast, amount=2.0)
 
         # Add dramatic solarization
         threshold_val = random.randint(70, 140)
@@ -5349,7 +4941,7 @@ class AuthorTransformer:
 
         # Add grain for texture
         grain_amount = 0.3
-        effects.add(lambda img, cfg, pal: add_grain(img, cfg, pal, grain_amount))
+        effects.add(add_grain, amount=grain_amount)
 
         # Add the effect chain to the engine
         self.engine.add_transformation(effects)
@@ -5360,7 +4952,7 @@ class AuthorTransformer:
         effects = EffectChain()
 
         # Apply contrast adjustment but preserve tonality
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 1.3))
+        effects.add(adjust_contrast, amount=1.3)
 
         # Replace harsh RGB channel shift with more refined monochromatic shift
         def refined_channel_shift(img, cfg, pal):
@@ -5457,16 +5049,7 @@ class AuthorTransformer:
 
         # Add film-like grain instead of digital noise
         grain_amount = 0.25
-        effects.add(
-            lambda img, cfg, pal: add_grain(
-                img,
-                cfg,
-                pal,
-                amount=grain_amount,
-                grain_size=0.7,  # More film-like
-                monochrome=True,
-            )
-        )
+        effects.add(add_grain, amount=grain_amount, grain_size=0.7, monochrome=True)
 
         # Add the effect chain to the engine
         self.engine.add_transformation(effects)
@@ -5477,8 +5060,8 @@ class AuthorTransformer:
         effects = EffectChain()
 
         # Add soft contrast and slightly reduce brightness for dreaminess
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 1.1))
-        effects.add(lambda img, cfg, pal: adjust_brightness(img, cfg, pal, 0.85))
+        effects.add(adjust_contrast, amount=1.1)
+        effects.add(adjust_brightness, amount=0.85)
 
         # Apply organic displacement using fluid patterns
         def fluid_displacement(img, cfg, pal):
@@ -5609,15 +5192,7 @@ class AuthorTransformer:
 
         # Add organic texture with film grain
         grain_amount = 0.2
-        effects.add(
-            lambda img, cfg, pal: add_grain(
-                img,
-                cfg,
-                pal,
-                amount=grain_amount,
-                grain_size=0.8,  # Larger grain for more natural look
-            )
-        )
+        effects.add(add_grain, amount=grain_amount, grain_size=0.8)
 
         # Add the effect chain to the engine
         self.engine.add_transformation(effects)
@@ -5628,7 +5203,7 @@ class AuthorTransformer:
         effects = EffectChain()
 
         # Add strong contrast for graphic look but reduce saturation
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 1.8))
+        effects.add(adjust_contrast, amount=1.8)
         effects.add(lambda img, cfg, pal: adjust_saturation(img, cfg, pal, 0.2))
 
         # Create organic grid pattern with natural variations
@@ -5729,7 +5304,7 @@ class AuthorTransformer:
 
         # Add film-like grain for texture
         grain_amount = 0.15
-        effects.add(lambda img, cfg, pal: add_grain(img, cfg, pal, grain_amount))
+        effects.add(add_grain, amount=grain_amount)
 
         # Add the effect chain to the engine
         self.engine.add_transformation(effects)
@@ -5740,7 +5315,7 @@ class AuthorTransformer:
         effects = EffectChain()
 
         # Add increased contrast and reduced saturation
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 2.0))
+        effects.add(adjust_contrast, amount=2.0)
         effects.add(lambda img, cfg, pal: adjust_saturation(img, cfg, pal, 0.25))
 
         # Apply selective blur with increased intensity
@@ -5845,7 +5420,7 @@ class AuthorTransformer:
 
         # Add grain
         grain_amount = self.config.effect_params.intensity * 0.4
-        effects.add(lambda img, cfg, pal: add_grain(img, cfg, pal, grain_amount))
+        effects.add(add_grain, amount=grain_amount)
 
         # Add the effect chain to the engine
         self.engine.add_transformation(effects)
@@ -5855,48 +5430,19 @@ class AuthorTransformer:
         effects = EffectChain()
 
         # Base adjustment with high contrast
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 1.3))
-        effects.add(lambda img, cfg, pal: adjust_brightness(img, cfg, pal, 0.85))
+        effects.add(adjust_contrast, amount=1.3)
+        effects.add(adjust_brightness, amount=0.85)
 
         # Apply subtle pervasive distortion
         def subtle_wave_distortion(img, cfg, pal):
             height, width = img.shape[:2]
-            result = img.copy()
-
-            # Create displacement map
-            displacement_x = np.zeros((height, width), dtype=np.float32)
-            displacement_y = np.zeros((height, width), dtype=np.float32)
 
             # Create distortion with multiple frequencies
             intensity = cfg.effect_params.intensity * 0.4  # More subtle than standard
+            field = _subtle_wave_field(height, width, intensity)
 
-            # Add several subtle wave patterns
-            for scale in [6, 12, 24]:
-                for y in range(height):
-                    for x in range(width):
-                        # Apply subtle wave patterns with varying frequencies
-                        displacement_x[y, x] += (
-                            intensity * math.sin(y / scale + x / (scale * 1.5)) * 2
-                        )
-                        displacement_y[y, x] += (
-                            intensity * math.cos(x / scale + y / (scale * 1.2)) * 2
-                        )
-
-            # Apply displacement map
-            for y in range(height):
-                for x in range(width):
-                    # Calculate source coordinates with displacement
-                    src_x = x + int(displacement_x[y, x])
-                    src_y = y + int(displacement_y[y, x])
-
-                    # Ensure we stay within bounds
-                    src_x = max(0, min(width - 1, src_x))
-                    src_y = max(0, min(height - 1, src_y))
-
-                    # Copy pixel
-                    result[y, x] = img[src_y, src_x]
-
-            return result
+            # Copy pixels from the displaced positions, clamped to the image
+            return warp(img, field, interpolation="nearest", border="replicate")
 
         effects.add(subtle_wave_distortion)
 
@@ -5925,7 +5471,7 @@ class AuthorTransformer:
         )
 
         # Add subtle grain for texture
-        effects.add(lambda img, cfg, pal: add_grain(img, cfg, pal, 0.15))
+        effects.add(add_grain, amount=0.15)
 
         self.engine.add_transformation(effects)
 
@@ -5982,15 +5528,11 @@ class AuthorTransformer:
                 edges, 1, np.pi / 180, threshold=80, minLineLength=40, maxLineGap=10
             )
 
-            # Create a directional flow map
-            flow_map = np.zeros((height, width, 2), dtype=np.float32)
-
             # If lines were detected, use them to determine flow direction
             dominant_angle = None
             if lines is not None:
                 angles = []
-                for line in lines:
-                    x1, y1, x2, y2 = line[0]
+                for x1, y1, x2, y2 in lines.reshape(-1, 4):
                     if x2 != x1:  # Avoid division by zero
                         angle = np.arctan2(y2 - y1, x2 - x1)
                         angles.append(angle)
@@ -6012,18 +5554,18 @@ class AuthorTransformer:
                 edges.astype(np.float32) / 255.0, (0, 0), 3
             )
 
-            # Create variable strength flow based on image content
-            for y in range(height):
-                for x in range(width):
-                    # Scale flow by local edge strength and intensity
-                    local_strength = (
-                        edge_strength[y, x]
-                        * (1.0 + gray[y, x] / 255.0)
-                        * cfg.effect_params.intensity
-                        * 35
-                    )
-                    flow_map[y, x, 0] = flow_x * local_strength
-                    flow_map[y, x, 1] = flow_y * local_strength
+            # Create variable strength flow based on image content: scale flow by
+            # local edge strength and intensity
+            local_strength = (
+                edge_strength
+                * (1.0 + gray / 255.0)
+                * cfg.effect_params.intensity
+                * 35
+            )
+            flow_map = (
+                (flow_x * local_strength).astype(np.float32),
+                (flow_y * local_strength).astype(np.float32),
+            )
 
             # Apply directional blur following the flow map
             num_steps = 15  # Number of steps for the flow
@@ -6037,27 +5579,11 @@ class AuthorTransformer:
                 # Weight decreases slightly over steps
                 weight = step_weight * (1.0 - step / (num_steps * 1.2))
 
-                # Create a sampling map for this step
-                map_x = np.zeros((height, width), dtype=np.float32)
-                map_y = np.zeros((height, width), dtype=np.float32)
-
-                for y in range(height):
-                    for x in range(width):
-                        # Sample position, modulated by step
-                        sample_x = x + flow_map[y, x, 0] * step / 3.0
-                        sample_y = y + flow_map[y, x, 1] * step / 3.0
-
-                        # Store sampling coordinates
-                        map_x[y, x] = np.clip(sample_x, 0, width - 1)
-                        map_y[y, x] = np.clip(sample_y, 0, height - 1)
-
-                # Remap image using the sampling map
-                if img.ndim == 3:
-                    remapped = cv2.remap(img, map_x, map_y, cv2.INTER_LINEAR)
-                    accumulated += remapped.astype(np.float32) * weight
-                else:
-                    remapped = cv2.remap(img, map_x, map_y, cv2.INTER_LINEAR)
-                    accumulated += remapped.astype(np.float32) * weight
+                # Sample positions modulated by step, clamped to the image
+                remapped = warp(
+                    img, scale_field(flow_map, step / 3.0), border="replicate"
+                )
+                accumulated += remapped.astype(np.float32) * weight
 
             # Final normalization and conversion
             result = np.clip(accumulated, 0, 255).astype(np.uint8)
@@ -6102,61 +5628,14 @@ class AuthorTransformer:
         # Add swirling, flowing effect to emulate the smooth motion in the image
         def flowing_distortion(img, cfg, pal):
             height, width = img.shape[:2]
-            result = img.copy()
-
-            # Create displacement maps with organic flow
-            displacement_x = np.zeros((height, width), dtype=np.float32)
-            displacement_y = np.zeros((height, width), dtype=np.float32)
-
-            # Create perlin-like noise functions for organic flow
-            def organic_flow(x, y, scale=1.0, octaves=3):
-                value = 0
-                amplitude = 1.0
-                frequency = 1.0
-
-                for _ in range(octaves):
-                    # Add sine waves at different frequencies and orientations
-                    value += amplitude * math.sin(
-                        (x * frequency / width * 6.28)
-                        + (y * frequency / height * 6.28 * 0.7)
-                    )
-                    value += amplitude * math.cos(
-                        (y * frequency / height * 6.28)
-                        + (x * frequency / width * 6.28 * 0.5)
-                    )
-
-                    # Adjust parameters for next octave
-                    amplitude *= 0.5
-                    frequency *= 2.0
 
-                return value * scale
-
-            # Generate the displacement map with organic flow
+            # Generate the displacement map with organic flow (perlin-like
+            # octaves of sine waves)
             intensity = cfg.effect_params.intensity * 12.0
+            field = _organic_flow_field(height, width, intensity, octaves=4)
 
-            for y in range(height):
-                for x in range(width):
-                    # Create varied flow patterns
-                    displacement_x[y, x] = organic_flow(
-                        x, y, scale=intensity, octaves=4
-                    )
-                    displacement_y[y, x] = organic_flow(
-                        y, x, scale=intensity, octaves=4
-                    )
-
-            # Apply displacement to create flow effect
-            map_x = np.zeros((height, width), dtype=np.float32)
-            map_y = np.zeros((height, width), dtype=np.float32)
-
-            for y in range(height):
-                for x in range(width):
-                    map_x[y, x] = np.clip(x + displacement_x[y, x], 0, width - 1)
-                    map_y[y, x] = np.clip(y + displacement_y[y, x], 0, height - 1)
-
-            # Apply the flow displacement
-            result = cv2.remap(img, map_x, map_y, cv2.INTER_LINEAR)
-
-            return result
+            # Apply the flow displacement, clamped to the image
+            return warp(img, field, interpolation="linear", border="replicate")
 
         effects.add(flowing_distortion)
 
@@ -6290,8 +5769,10 @@ class AuthorTransformer:
                 grain_mask = grain * (1.0 - luminance * 0.5) * grain_amount * 30
                 result = np.clip(result + grain_mask, 0, 255)
 
-            # Apply slight grain-based texture enhancement
+            # Apply slight grain-based texture enhancement (to every channel)
             texture_mask = np.abs(grain) * luminance * 20
+            if img.ndim == 3:
+                texture_mask = texture_mask[:, :, np.newaxis]
             result = np.clip(result + texture_mask, 0, 255).astype(np.uint8)
 
             return result
@@ -6355,14 +5836,11 @@ class AuthorTransformer:
             center_x, center_y = width / 2, height / 2
             max_dist = np.sqrt(center_x**2 + center_y**2)
 
-            vignette = np.zeros((height, width), dtype=np.float32)
-
-            for y in range(height):
-                for x in range(width):
-                    # Calculate distance from center
-                    dist = np.sqrt((x - center_x) ** 2 + (y - center_y) ** 2)
-                    # Create smooth falloff
-                    vignette[y, x] = 1 - np.power(dist / max_dist, 2)
+            # Create smooth falloff with the distance from center
+            y = np.arange(height)[:, np.newaxis]
+            x = np.arange(width)[np.newaxis, :]
+            dist = np.sqrt((x - center_x) ** 2 + (y - center_y) ** 2)
+            vignette = 1 - np.power(dist / max_dist, 2)
 
             # Apply non-uniform vignette for more organic feel
             vignette = np.power(vignette, 1.5)
@@ -6407,10 +5885,8 @@ class AuthorTransformer:
                 random.seed(current_seed)
 
             # Convert to grayscale for brightness mapping
-            if img.ndim == 3:
-                gray = cv2.cvtColor(img, cv2.COLOR_RGB2GRAY)
-            else:
-                gray = img.copy()
+            analysis = self.engine.analysis_for(img)
+            gray = analysis.gray()
 
             height, width = gray.shape
             params = cfg.effect_params
@@ -6448,7 +5924,7 @@ class AuthorTransformer:
             if blur_radius_px >= 1:
                 # Gaussian kernel size must be odd
                 ksize = blur_radius_px * 2 + 1
-                gray = cv2.GaussianBlur(gray, (ksize, ksize), 0)
+                gray = analysis.blurred(ksize)
                 # print(f"Applying Gaussian blur with ksize={ksize}") # Debug print
 
             # --- Wave Generation Logic ---
@@ -6527,19 +6003,11 @@ class AuthorTransformer:
         # Optional: Add subtle overall grain AFTER the main effect if configured
         if self.config.effect_params.grain > 0:
             # Keep grain very subtle for this style
-            effects.add(
-                lambda img, cfg, pal: add_grain(
-                    img, cfg, pal, amount=cfg.effect_params.grain * 0.1
-                )
-            )
+            effects.add(add_grain, amount=self.config.effect_params.grain * 0.1)
 
         # Optional: Add a very faint vignette AFTER the main effect if configured
         if self.config.effect_params.vignette > 0:
-            effects.add(
-                lambda img, cfg, pal: add_vignette(
-                    img, cfg, pal, amount=cfg.effect_params.vignette * 0.2
-                )
-            )
+            effects.add(add_vignette, amount=self.config.effect_params.vignette * 0.2)
 
         # Add the configured effects chain to the engine for processing
         self.engine.add_transformation(effects)
@@ -6652,9 +6120,7 @@ class AuthorTransformer:
 
         # Add initial contrast/brightness adjustments
         effects.add(
-            lambda img, cfg, pal: adjust_contrast(
-                img, cfg, pal, 1.0 + cfg.effect_params.intensity * 0.3
-            )
+            adjust_contrast, amount=1.0 + self.config.effect_params.intensity * 0.3
         )
         effects.add(
             lambda img, cfg, pal: adjust_saturation(
@@ -6686,18 +6152,10 @@ class AuthorTransformer:
         effects.add(apply_post_motion_blur)
 
         # Optional: Add grain for texture
-        effects.add(
-            lambda img, cfg, pal: add_grain(
-                img, cfg, pal, amount=cfg.effect_params.grain * 0.3
-            )
-        )
+        effects.add(add_grain, amount=self.config.effect_params.grain * 0.3)
 
         # Optional: Add vignette
-        effects.add(
-            lambda img, cfg, pal: add_vignette(
-                img, cfg, pal, amount=cfg.effect_params.vignette * 0.4
-            )
-        )
+        effects.add(add_vignette, amount=self.config.effect_params.vignette * 0.4)
 
         self.engine.add_transformation(effects)
 
@@ -6830,9 +6288,7 @@ class AuthorTransformer:
 
         # Initial adjustments
         effects.add(
-            lambda img, cfg, pal: adjust_contrast(
-                img, cfg, pal, 1.0 + cfg.effect_params.intensity * 0.2
-            )
+            adjust_contrast, amount=1.0 + self.config.effect_params.intensity * 0.2
         )
         effects.add(
             lambda img, cfg, pal: adjust_saturation(
@@ -6851,49 +6307,10 @@ class AuthorTransformer:
         )
 
         # Optional: Add grain
-        effects.add(
-            lambda img, cfg, pal: add_grain(
-                img, cfg, pal, amount=cfg.effect_params.grain * 0.35
-            )
-        )
+        effects.add(add_grain, amount=self.config.effect_params.grain * 0.35)
 
         # Optional: Add vignette
-        effects.add(
-            lambda img, cfg, pal: add_vignette(
-                img, cfg, pal, amount=cfg.effect_params.vignette * 0.4
-            )
-        )
+        effects.add(add_vignette, amount=self.config.effect_params.vignette * 0.4)
 
         self.engine.add_transformation(effects)
 
-
-def line_aa_custom(r0, c0, r1, c1):
-    """Generate anti-aliased pixel coordinates for a line using Wu's algorithm or similar."""
-    # Placeholder - using basic Bresenham for now, AA is complex
-    # This part is non-trivial to implement correctly and efficiently with numpy broadcasting
-    # Consider using skimage.draw.line_aa or adapting online implementations carefully
-    # Basic Bresenham:
-    dr, dc = abs(r1 - r0), abs(c1 - c0)
-    sr = 1 if r1 > r0 else -1
-    sc = 1 if c1 > c0 else -1
-    err = dr - dc
-    rr, cc = [], []
-    r, c = r0, c0
-    while True:
-        rr.append(r)
-        cc.append(c)
-        if r == r1 and c == c1:
-            break
-        e2 = 2 * err
-        if e2 > -dc:
-            err -= dc
-            r += sr
-        if e2 < dr:
-            err += dr
-            c += sc
-    # Return coordinates and uniform weight 1.0 (no AA)
-    return (
-        np.array(rr, dtype=int),
-        np.array(cc, dtype=int),
-        np.ones(len(rr), dtype=float),
-    )
@@ -7,11 +7,21 @@ and for running predefined 'best flavor' parameter sets for selected styles.
 """
 
 import glob
+import json
 import os
+import signal
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field, fields
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
+import numpy as np
 import tomllib  # For TOML parsing (Python 3.11+)
+from PIL import Image
 
 # Assuming these are correctly defined and importable:
 from phantom_visuals.core.config import (
@@ -22,6 +32,11 @@ from phantom_visuals.core.config import (
     StyleVariant,
 )
 from phantom_visuals.transformers.author import AuthorTransformer
+from phantom_visuals.utils.field_cache import (
+    CACHE_DIR_NAME,
+    FieldCacheStats,
+    field_cache,
+)
 from phantom_visuals.utils.logging import (
     create_progress_bar,
     get_logger,
@@ -33,6 +48,182 @@ from phantom_visuals.utils.logging import (
 
 logger = get_logger()  # Assuming logger is configured elsewhere (e.g., cli.py or utils)
 
+# Per-style durations of earlier explore runs, kept in the exploration output directory
+STYLE_TIMINGS_FILE = ".style_timings.json"
+# Seconds per megapixel assumed for styles never timed, so they are scheduled first
+UNKNOWN_STYLE_SECONDS_PER_MP = 60.0
+# Weight of the newest measurement in the per-style moving average
+TIMING_SMOOTHING = 0.5
+# Decoded images each worker keeps for later cells
+WORKER_IMAGE_CACHE_SIZE = 4
+
+
+class CellTimeoutError(Exception):
+    """A grid cell ran longer than its timeout."""
+
+
+class StyleTimings:
+    """Per-style processing time, in seconds per megapixel, kept across runs.
+
+    Used to schedule the exploration grid longest-first; styles that were
+    never timed are assumed to be slow so they start early.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.seconds_per_mp: dict[str, float] = {}
+        if path.exists():
+            try:
+                with open(path, encoding="utf-8") as f:
+                    self.seconds_per_mp = json.load(f).get("seconds_per_megapixel", {})
+            except (OSError, ValueError):
+                # Damaged timings only cost scheduling quality
+                self.seconds_per_mp = {}
+
+    def estimate(self, style: str, megapixels: float) -> float:
+        """Expected seconds for one cell of a style."""
+        rate = self.seconds_per_mp.get(style, UNKNOWN_STYLE_SECONDS_PER_MP)
+        return rate * max(megapixels, 0.01)
+
+    def record(self, style: str, seconds: float, megapixels: float) -> None:
+        """Fold a measured cell duration into the style's moving average."""
+        rate = seconds / max(megapixels, 0.01)
+        previous = self.seconds_per_mp.get(style)
+        self.seconds_per_mp[style] = (
+            rate
+            if previous is None
+            else (1 - TIMING_SMOOTHING) * previous + TIMING_SMOOTHING * rate
+        )
+
+    def save(self) -> None:
+        """Write the timings file atomically."""
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"seconds_per_megapixel": self.seconds_per_mp}, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            log_warning(logger, f"Could not save style timings to {self.path}: {e}")
+
+
+@dataclass
+class ExploreCell:
+    """One (image, style, color scheme) combination of the exploration grid."""
+
+    image_path: Path
+    output_path: Path
+    style_key: str
+    style_value: str
+    config: Configuration
+    estimated_seconds: float = 0.0
+
+
+@dataclass
+class CellResult:
+    """Outcome of one grid cell."""
+
+    image_path: Path
+    style_key: str
+    style_value: str
+    output_path: Optional[Path] = None
+    seconds: float = 0.0
+    error: Optional[str] = None
+    timed_out: bool = False
+    worker_pid: int = 0
+    field_cache_stats: dict[str, int] = field(default_factory=dict)
+
+
+# Decoded images of the current worker process, most recently used last
+_worker_images: "OrderedDict[Path, np.ndarray]" = OrderedDict()
+
+
+def _init_explore_worker(cache_dir: Optional[Path]) -> None:
+    """Set up a worker process (or the main process for in-process runs)."""
+    _worker_images.clear()
+    field_cache.configure(directory=cache_dir)
+    field_cache.reset_stats()
+
+
+def _image_megapixels(path: Path) -> float:
+    """Image size in megapixels, read from the file header only."""
+    try:
+        with Image.open(path) as img:
+            width, height = img.size
+        return width * height / 1e6
+    except OSError:
+        return 1.0
+
+
+def _load_worker_image(path: Path) -> np.ndarray:
+    """Decode an image once per worker and reuse it for later cells."""
+    image = _worker_images.get(path)
+    if image is None:
+        with Image.open(path) as img:
+            image = np.array(img.convert("RGB"))
+        image.setflags(write=False)
+        _worker_images[path] = image
+        while len(_worker_images) > WORKER_IMAGE_CACHE_SIZE:
+            _worker_images.popitem(last=False)
+    else:
+        _worker_images.move_to_end(path)
+    return image
+
+
+@contextmanager
+def _cell_deadline(seconds: Optional[float]) -> Iterator[None]:
+    """Raise CellTimeoutError in the block after `seconds` (POSIX main thread only)."""
+    if (
+        not seconds
+        or not hasattr(signal, "SIGALRM")
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        yield
+        return
+
+    def on_alarm(signum: int, frame: Any) -> None:
+        raise CellTimeoutError(f"timed out after {seconds:g}s")
+
+    previous_handler = signal.signal(signal.SIGALRM, on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+
+
+def _run_explore_cell(cell: ExploreCell, timeout: Optional[float]) -> CellResult:
+    """Process one grid cell (runs in a worker process)."""
+    result = CellResult(
+        image_path=cell.image_path,
+        style_key=cell.style_key,
+        style_value=cell.style_value,
+        worker_pid=os.getpid(),
+    )
+    start = time.perf_counter()
+    try:
+        image = _load_worker_image(cell.image_path)
+        with _cell_deadline(timeout):
+            transformer = AuthorTransformer(cell.config)
+            result.output_path = transformer.transform_image(image, cell.output_path)
+    except CellTimeoutError as e:
+        result.error = str(e)
+        result.timed_out = True
+    except Exception as e:
+        result.error = str(e)
+    result.seconds = time.perf_counter() - start
+    result.field_cache_stats = asdict(field_cache.stats)
+    return result
+
+
+def _sum_cache_stats(stats_by_worker: dict[int, dict[str, int]]) -> dict[str, Any]:
+    """Add up the field cache statistics last reported by each worker."""
+    total = FieldCacheStats()
+    for stats in stats_by_worker.values():
+        for stat in fields(FieldCacheStats):
+            setattr(total, stat.name, getattr(total, stat.name) + stats.get(stat.name, 0))
+    return total.as_dict()
+
 
 class StyleExplorer:
     """Explorer for applying styles to images."""
@@ -52,6 +243,8 @@ class StyleExplorer:
             or self.base_config.effect_params is None
         ):
             self.base_config.effect_params = EffectParameters()
+        # Summary of the last explore_author_styles run (cells, timing, throughput)
+        self.last_run: dict[str, Any] = {}
 
     # --- KEEP Existing explore_author_styles ---
     # Allows applying one set of params (from CLI or base_config) to many styles
@@ -68,9 +261,44 @@ class StyleExplorer:
         vignette: Optional[float] = None,
         seed: Optional[int] = None,
         output_format: str = "png",
+        cache_fields: bool = False,
+        workers: Optional[int] = None,
+        cell_timeout: Optional[float] = None,
         # create_comparison: bool = True, # Not used, remove?
     ) -> dict[str, list[Path]]:
-        """Apply multiple styles with the SAME parameters to author images."""
+        """Apply multiple styles with the SAME parameters to author images.
+
+        Every (image, style, color scheme) cell of the grid runs on a process
+        pool. Workers decode each image once and reuse it for later cells;
+        cells are scheduled longest-first using the style durations recorded
+        by earlier runs (see StyleTimings), so slow styles do not end up
+        running alone at the end. Throughput is kept in self.last_run.
+
+        Flow fields, grain and vignette masks are shared across the grid through
+        the field cache (kept as .npy files under <output_dir>/.field_cache when
+        cache_fields is set, so all workers map the same files); its statistics
+        are logged at the end.
+
+        Args:
+            input_path: Image file, directory or glob pattern
+            styles: Style variants to apply (all if None)
+            color_schemes: Color schemes to apply (base config scheme if None)
+            intensity: Override for the intensity parameter
+            blur_radius: Override for the blur radius parameter
+            distortion: Override for the distortion parameter
+            noise_level: Override for the noise level parameter
+            grain: Override for the grain parameter
+            vignette: Override for the vignette parameter
+            seed: Override for the random seed
+            output_format: Output file format
+            cache_fields: Keep the field cache on disk under the output directory
+            workers: Cells processed at the same time (defaults to the CPU count;
+                1 runs the grid in this process)
+            cell_timeout: Seconds after which a cell is abandoned (None for no limit)
+
+        Returns:
+            Dictionary mapping style keys to the output paths, in input image order
+        """
         input_paths = self._get_input_paths(input_path)
         if not input_paths:
             raise ValueError(f"No valid images found at {input_path}")
@@ -88,19 +316,17 @@ class StyleExplorer:
             self.output_dir
         )  # Use the directory passed to __init__
         os.makedirs(exploration_output_dir, exist_ok=True)
-        results: dict[str, list[Path]] = {}
 
         base_params = self.base_config.effect_params
+        timings = StyleTimings(exploration_output_dir / STYLE_TIMINGS_FILE)
 
+        # Build the grid of cells
+        cells: list[ExploreCell] = []
         for img_path in input_paths:
             img_name = Path(img_path).stem
             img_output_dir = exploration_output_dir / img_name  # Subdir per image
             os.makedirs(img_output_dir, exist_ok=True)
-            log_processing_step(
-                logger,
-                "Processing Image for Style Comparison",
-                f"Image: {img_path.name}",
-            )
+            megapixels = _image_megapixels(img_path)
 
             for style_name, style_value in style_variants.items():
                 for scheme_name, scheme_value in color_scheme_variants.items():
@@ -146,33 +372,135 @@ class StyleExplorer:
                         else style_name.lower()
                     )
                     output_filename = f"{img_name}_{style_key}.{output_format}"
-                    output_file_path = img_output_dir / output_filename
-
-                    log_processing_step(
-                        logger,
-                        f"Applying Style: {style_name}",
-                        f"Color: {scheme_name}, Output: {output_file_path}",
+                    cells.append(
+                        ExploreCell(
+                            image_path=Path(img_path),
+                            output_path=img_output_dir / output_filename,
+                            style_key=style_key,
+                            style_value=style_value,
+                            config=config,
+                            estimated_seconds=timings.estimate(style_value, megapixels),
+                        )
                     )
-                    try:
-                        # Reuse transformer instance? Maybe not necessary unless huge overhead
-                        transformer = AuthorTransformer(config)
-                        result_path = transformer.transform(img_path, output_file_path)
-                        if style_key not in results:
-                            results[style_key] = []
-                        results[style_key].append(result_path)
-                    except Exception as e:
-                        log_error(
-                            logger,
-                            f"Failed processing {img_path.name} with style {style_key}: {e}",
-                        )  # Less verbose errors in batch
 
-            log_success(
-                logger,
-                f"Completed style comparison for {img_name}",
-                {"output_directory": str(img_output_dir)},
+        # Longest-first: the slowest cells start while the rest fill in around them
+        cells.sort(key=lambda cell: cell.estimated_seconds, reverse=True)
+        workers = max(1, min(workers or os.cpu_count() or 1, len(cells) or 1))
+        cache_dir = exploration_output_dir / CACHE_DIR_NAME if cache_fields else None
+
+        log_processing_step(
+            logger,
+            "Exploring Style Grid",
+            f"{len(cells)} cells ({len(input_paths)} images) on {workers} worker(s)",
+        )
+
+        results_by_image: dict[str, dict[Path, Path]] = {}
+        cache_stats: dict[int, dict[str, int]] = {}
+        failed = timed_out = 0
+        start = time.perf_counter()
+
+        progress = create_progress_bar("Exploring styles", total=len(cells))
+        with progress:
+            task_id = progress.add_task(
+                "[cyan]Processing cells...", total=len(cells)
             )
+            for result in self._run_cells(cells, workers, cell_timeout, cache_dir):
+                progress.update(
+                    task_id,
+                    advance=1,
+                    description=f"[cyan]Done: [yellow]{result.image_path.stem}[/yellow] | Style: [green]{result.style_key}[/green]",
+                )
+                if result.field_cache_stats:
+                    cache_stats[result.worker_pid] = result.field_cache_stats
+                if result.output_path is not None:
+                    results_by_image.setdefault(result.style_key, {})[
+                        result.image_path
+                    ] = result.output_path
+                    timings.record(
+                        result.style_value,
+                        result.seconds,
+                        _image_megapixels(result.image_path),
+                    )
+                    continue
+                if result.timed_out:
+                    timed_out += 1
+                else:
+                    failed += 1
+                log_error(
+                    logger,
+                    f"Failed processing {result.image_path.name} with style {result.style_key}: {result.error}",
+                )  # Less verbose errors in batch
+
+        elapsed = time.perf_counter() - start
+        timings.save()
+
+        # Same layout as a sequential run: style key -> outputs in input image order
+        results: dict[str, list[Path]] = {}
+        for style_key, outputs in results_by_image.items():
+            results[style_key] = [
+                outputs[Path(path)] for path in input_paths if Path(path) in outputs
+            ]
+
+        completed = sum(len(paths) for paths in results.values())
+        self.last_run = {
+            "cells": len(cells),
+            "completed": completed,
+            "failed": failed,
+            "timed_out": timed_out,
+            "workers": workers,
+            "seconds": round(elapsed, 2),
+            "cells_per_minute": round(completed / elapsed * 60, 1) if elapsed > 0 else 0.0,
+        }
+        log_success(
+            logger,
+            "Completed style comparison",
+            {"output_directory": str(exploration_output_dir), **self.last_run},
+        )
+        log_success(logger, "Field cache statistics", _sum_cache_stats(cache_stats))
         return results
 
+    def _run_cells(
+        self,
+        cells: list["ExploreCell"],
+        workers: int,
+        cell_timeout: Optional[float],
+        cache_dir: Optional[Path],
+    ) -> Iterator["CellResult"]:
+        """Run grid cells and yield their results as they finish."""
+        if workers == 1:
+            # In-process run (same worker code, easier to debug)
+            previous_cache_dir = field_cache.directory
+            _init_explore_worker(cache_dir)
+            try:
+                for cell in cells:
+                    yield _run_explore_cell(cell, cell_timeout)
+            finally:
+                field_cache.configure(directory=previous_cache_dir)
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_explore_worker,
+            initargs=(cache_dir,),
+        ) as executor:
+            # The pool starts tasks in submission order, so the longest cells go first
+            futures = {
+                executor.submit(_run_explore_cell, cell, cell_timeout): cell
+                for cell in cells
+            }
+            for future in as_completed(futures):
+                cell = futures[future]
+                try:
+                    yield future.result()
+                except Exception as e:
+                    # The worker itself died (e.g. out of memory); the pool reports it per cell
+                    yield CellResult(
+                        image_path=cell.image_path,
+                        style_key=cell.style_key,
+                        style_value=cell.style_value,
+                        error=f"worker failed: {e}",
+                    )
+
     # --- KEEP explore_abstract_styles (or remove if not used) ---
     def explore_abstract_styles(  # [...] Add parameter overrides similar to explore_author_styles if needed
         self,
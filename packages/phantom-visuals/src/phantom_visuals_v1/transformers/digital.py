@@ -191,7 +191,7 @@ class DigitalArtist:
             self._add_glitch_style()
 
         # Process the canvas
-        result = self.engine.process_image(canvas)
+        result = self.engine.process_image(canvas, quantize=False)
 
         # Save and return the result
         return self.engine.save_image(result, output_path)
@@ -410,7 +410,7 @@ class DigitalArtist:
         effects = EffectChain()
 
         # Add contrast adjustment
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 1.2))
+        effects.add(adjust_contrast, amount=1.2)
 
         # Apply RGB channel shift
         effects.add(lambda img, cfg, pal: glitch(
@@ -436,11 +436,11 @@ class DigitalArtist:
         ))
 
         # Add noise
-        effects.add(lambda img, cfg, pal: add_noise(
-            img, cfg, pal,
-            cfg.effect_params.noise_level * 0.7,
-            "salt_pepper"
-        ))
+        effects.add(
+            add_noise,
+            amount=self.config.effect_params.noise_level * 0.7,
+            noise_type="salt_pepper",
+        )
 
         # Add the effect chain to the engine
         self.engine.add_transformation(effects)
@@ -451,7 +451,7 @@ class DigitalArtist:
         effects = EffectChain()
 
         # Add contrast and saturation adjustments
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 1.4))
+        effects.add(adjust_contrast, amount=1.4)
         effects.add(lambda img, cfg, pal: adjust_saturation(img, cfg, pal, 1.2))
 
         # Apply pixelation
@@ -463,7 +463,7 @@ class DigitalArtist:
 
         # Add subtle noise
         noise_amount = self.config.effect_params.noise_level * 0.3
-        effects.add(lambda img, cfg, pal: add_noise(img, cfg, pal, noise_amount))
+        effects.add(add_noise, amount=noise_amount)
 
         # Add the effect chain to the engine
         self.engine.add_transformation(effects)
@@ -532,7 +532,7 @@ class DigitalArtist:
 
         # Add subtle noise
         noise_amount = self.config.effect_params.noise_level * 0.4
-        effects.add(lambda img, cfg, pal: add_noise(img, cfg, pal, noise_amount))
+        effects.add(add_noise, amount=noise_amount)
 
         # Add the effect chain to the engine
         self.engine.add_transformation(effects)
@@ -543,8 +543,8 @@ class DigitalArtist:
         effects = EffectChain()
 
         # Increase contrast dramatically
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 1.8))
-        effects.add(lambda img, cfg, pal: adjust_brightness(img, cfg, pal, 1.1))
+        effects.add(adjust_contrast, amount=1.8)
+        effects.add(adjust_brightness, amount=1.1)
 
         # Apply halftone effect
         effects.add(lambda img, cfg, pal: add_halftone(
@@ -575,11 +575,11 @@ class DigitalArtist:
 
         # Add noise to simulate paper texture
         noise_amount = self.config.effect_params.noise_level * 0.6
-        effects.add(lambda img, cfg, pal: add_noise(img, cfg, pal, noise_amount))
+        effects.add(add_noise, amount=noise_amount)
 
         # Add vignette to simulate scanner issues
         vignette_amount = 0.6 + self.config.effect_params.intensity * 0.4
-        effects.add(lambda img, cfg, pal: add_vignette(img, cfg, pal, vignette_amount))
+        effects.add(add_vignette, amount=vignette_amount)
 
         # Add the effect chain to the engine
         self.engine.add_transformation(effects)
@@ -591,7 +591,7 @@ class DigitalArtist:
 
         # Adjust saturation and hue
         effects.add(lambda img, cfg, pal: adjust_saturation(img, cfg, pal, 1.5))
-        effects.add(lambda img, cfg, pal: adjust_brightness(img, cfg, pal, 1.1))
+        effects.add(adjust_brightness, amount=1.1)
 
         # Apply color shift (pink/blue/purple)
         def vaporwave_color_shift(img, cfg, pal):
@@ -645,7 +645,7 @@ class DigitalArtist:
 
         # Add mild grain
         grain_amount = self.config.effect_params.intensity * 0.3
-        effects.add(lambda img, cfg, pal: add_grain(img, cfg, pal, grain_amount))
+        effects.add(add_grain, amount=grain_amount)
 
         # Add glow
         blur_amount = self.config.effect_params.blur_radius + 2
@@ -671,8 +671,8 @@ class DigitalArtist:
         effects = EffectChain()
 
         # Enhance contrast and brightness
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 1.5))
-        effects.add(lambda img, cfg, pal: adjust_brightness(img, cfg, pal, 1.2))
+        effects.add(adjust_contrast, amount=1.5)
+        effects.add(adjust_brightness, amount=1.2)
         effects.add(lambda img, cfg, pal: adjust_saturation(img, cfg, pal, 1.3))
 
         # Apply edge detection with neon effect
@@ -714,11 +714,11 @@ class DigitalArtist:
 
         # Add noise
         noise_amount = self.config.effect_params.noise_level * 0.4
-        effects.add(lambda img, cfg, pal: add_noise(img, cfg, pal, noise_amount))
+        effects.add(add_noise, amount=noise_amount)
 
         # Add vignette
         vignette_amount = 0.8 + self.config.effect_params.intensity * 0.3
-        effects.add(lambda img, cfg, pal: add_vignette(img, cfg, pal, vignette_amount))
+        effects.add(add_vignette, amount=vignette_amount)
 
         # Add the effect chain to the engine
         self.engine.add_transformation(effects)
@@ -729,8 +729,8 @@ class DigitalArtist:
         effects = EffectChain()
 
         # Adjust contrast and brightness
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 1.4))
-        effects.add(lambda img, cfg, pal: adjust_brightness(img, cfg, pal, 0.9))
+        effects.add(adjust_contrast, amount=1.4)
+        effects.add(adjust_brightness, amount=0.9)
 
         # Apply solarization
         effects.add(lambda img, cfg, pal: solarize(img, cfg, pal, 128))
@@ -789,7 +789,7 @@ class DigitalArtist:
 
         # Add noise
         noise_amount = self.config.effect_params.noise_level * 0.5
-        effects.add(lambda img, cfg, pal: add_noise(img, cfg, pal, noise_amount))
+        effects.add(add_noise, amount=noise_amount)
 
         # Add the effect chain to the engine
         self.engine.add_transformation(effects)
@@ -800,7 +800,7 @@ class DigitalArtist:
         effects = EffectChain()
 
         # Adjust contrast
-        effects.add(lambda img, cfg, pal: adjust_contrast(img, cfg, pal, 1.2))
+        effects.add(adjust_contrast, amount=1.2)
 
         # Simulate JPEG compression artifacts
         def add_compression_artifacts(img, cfg, pal):
@@ -0,0 +1,304 @@
+# packages/phantom-visuals/phantom_visuals/utils/buffers.py
+
+"""Float32 working frames shared by effect chains and the style engine.
+
+Most effects convert uint8 to float32, compute, and convert back, so a long
+chain used to allocate and quantize full frames at every step. Instead, a
+chain keeps one float32 working frame (values on the 0-255 scale of uint8
+images) for as long as its effects can work on it, and quantizes it back
+to uint8 once: before an effect that needs uint8, or when the result is
+saved.
+
+The buffer contract:
+
+    - Effects declare what they do with a frame with @buffer_effect:
+      "inplace" effects modify the frame they are given and return it;
+      "scratch" effects read the frame and write their result into an
+      `out` frame of the same shape, taken from the frame pool (the result
+      is copied back, so a pipeline keeps one frame from start to end).
+      Both still accept uint8 images when called directly, returning uint8
+      as before.
+    - Effects without a declaration get uint8 images and must return their
+      result as a new array (or the input itself, unchanged). Chains never
+      pass them the caller's image: they get a private copy instead.
+    - "chain" transformations (EffectChain) accept a uint8 image, which they
+      leave untouched, or a float32 frame handed over by an enclosing
+      pipeline; with quantize=False they may hand a frame back.
+
+Frames come from a process-wide pool that reuses released buffers of the
+same shape instead of allocating new ones.
+"""
+
+import functools
+import threading
+import weakref
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Buffer modes of effects and transformations
+INPLACE = "inplace"
+SCRATCH = "scratch"
+CHAIN = "chain"
+BUFFER_MODES = (INPLACE, SCRATCH, CHAIN)
+
+# Data type of working frames
+FRAME_DTYPE = np.float32
+# Default memory budget for released frames kept for reuse
+DEFAULT_MAX_FREE_BYTES = 256 * 1024 * 1024
+
+
+@dataclass
+class FramePoolStats:
+    """Counters of a FramePool."""
+
+    allocations: int = 0
+    reuses: int = 0
+    conversions: int = 0
+    quantizations: int = 0
+    bytes: int = 0
+    peak_bytes: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the counters with the memory use in MiB, for logging."""
+        stats = asdict(self)
+        stats["megabytes"] = round(stats.pop("bytes") / (1024 * 1024), 1)
+        stats["peak_megabytes"] = round(stats.pop("peak_bytes") / (1024 * 1024), 1)
+        return stats
+
+
+class FramePool:
+    """Pool of reusable float32 frames, keyed by shape.
+
+    acquire() hands out a released frame of the requested shape when there
+    is one and allocates otherwise; release() takes a frame back. Only
+    frames handed out by the pool are taken back, so releasing any other
+    array is a no-op. Released frames are kept up to `max_free_bytes`.
+    """
+
+    def __init__(self, max_free_bytes: int = DEFAULT_MAX_FREE_BYTES):
+        """Initialize the pool.
+
+        Args:
+            max_free_bytes: Memory budget for released frames kept for reuse
+        """
+        self.max_free_bytes = max_free_bytes
+        self._free: Dict[Tuple[int, ...], List[np.ndarray]] = defaultdict(list)
+        self._free_bytes = 0
+        self._issued: "weakref.WeakValueDictionary[int, np.ndarray]" = (
+            weakref.WeakValueDictionary()
+        )
+        self._lock = threading.Lock()
+        self.stats = FramePoolStats()
+
+    def acquire(self, shape: Tuple[int, ...]) -> np.ndarray:
+        """Return an uninitialized frame of the given shape."""
+        shape = tuple(shape)
+        with self._lock:
+            free = self._free.get(shape)
+            if free:
+                frame = free.pop()
+                self._free_bytes -= frame.nbytes
+                self.stats.reuses += 1
+            else:
+                frame = np.empty(shape, dtype=FRAME_DTYPE)
+                self.stats.allocations += 1
+                self.stats.bytes += frame.nbytes
+                self.stats.peak_bytes = max(self.stats.peak_bytes, self.stats.bytes)
+                weakref.finalize(frame, self._forget, frame.nbytes)
+            self._issued[id(frame)] = frame
+        return frame
+
+    def release(self, frame: np.ndarray) -> None:
+        """Take back a frame handed out by acquire(); it must not be used afterwards."""
+        with self._lock:
+            if self._issued.get(id(frame)) is not frame:
+                return
+            del self._issued[id(frame)]
+            if self._free_bytes + frame.nbytes <= self.max_free_bytes:
+                self._free[frame.shape].append(frame)
+                self._free_bytes += frame.nbytes
+
+    def owns(self, frame: np.ndarray) -> bool:
+        """Whether a frame is currently handed out by the pool."""
+        with self._lock:
+            return self._issued.get(id(frame)) is frame
+
+    def convert(self, image: np.ndarray) -> np.ndarray:
+        """Copy an image into a frame from the pool (the image is not modified)."""
+        frame = self.acquire(image.shape)
+        np.copyto(frame, image, casting="unsafe")
+        with self._lock:
+            self.stats.conversions += 1
+        return frame
+
+    def quantize(self, frame: np.ndarray) -> np.ndarray:
+        """Convert a frame to uint8 and release it (its contents are consumed).
+
+        Values are clipped and truncated, as the effects convert their own
+        float results.
+        """
+        np.clip(frame, 0, 255, out=frame)
+        result = frame.astype(np.uint8)
+        self.release(frame)
+        with self._lock:
+            self.stats.quantizations += 1
+        return result
+
+    def clear(self) -> None:
+        """Drop every released frame."""
+        with self._lock:
+            self._free.clear()
+            self._free_bytes = 0
+
+    def reset_stats(self) -> None:
+        """Zero the counters (the memory in use is kept)."""
+        with self._lock:
+            self.stats = FramePoolStats(
+                bytes=self.stats.bytes, peak_bytes=self.stats.bytes
+            )
+
+    def _forget(self, nbytes: int) -> None:
+        """Account for a frame that has been garbage collected."""
+        with self._lock:
+            self.stats.bytes -= nbytes
+
+
+# Process-wide pool shared by effect chains and the style engine
+frame_pool = FramePool()
+
+
+def buffer_effect(mode: str) -> Callable[[Callable], Callable]:
+    """Declare how an effect works on float32 frames (see the module docstring).
+
+    Args:
+        mode: "inplace" or "scratch"
+
+    Returns:
+        Decorator setting the effect's buffer_mode attribute
+    """
+    if mode not in (INPLACE, SCRATCH):
+        raise ValueError(f"Unknown buffer mode: {mode}")
+
+    def decorate(effect: Callable) -> Callable:
+        effect.buffer_mode = mode
+        return effect
+
+    return decorate
+
+
+def buffer_mode(effect: Callable) -> Optional[str]:
+    """Buffer mode of an effect (None if undeclared), looking through partials."""
+    while isinstance(effect, functools.partial):
+        if getattr(effect, "buffer_mode", None) is not None:
+            break
+        effect = effect.func
+    return getattr(effect, "buffer_mode", None)
+
+
+def is_frame(image: np.ndarray) -> bool:
+    """Whether an image is a float32 working frame rather than a uint8 image."""
+    return image.dtype == FRAME_DTYPE
+
+
+def float_frame(image: np.ndarray) -> np.ndarray:
+    """Float32 array for an effect to compute on in place.
+
+    Working frames are returned as they are; uint8 images are converted into
+    a new array.
+    """
+    if is_frame(image):
+        return image
+    return image.astype(FRAME_DTYPE)
+
+
+def finish_frame(result: np.ndarray, image: np.ndarray) -> np.ndarray:
+    """Return an effect's float32 result in the form of its input.
+
+    The result is clipped to 0-255 as the effects always did. Working frames
+    are clipped in place and stay float32; only the truncation to uint8 is
+    left to FramePool.quantize. uint8 inputs get a uint8 result.
+    """
+    if is_frame(image):
+        return np.clip(result, 0, 255, out=result)
+    return np.clip(result, 0, 255).astype(np.uint8)
+
+
+def _apply_scratch(
+    step: Callable, frame: np.ndarray, config: Any, palette: Any, pool: FramePool
+) -> np.ndarray:
+    """Apply a "scratch" effect to a working frame, through a pooled out frame."""
+    out = pool.acquire(frame.shape)
+    result = step(frame, config, palette, out=out)
+    if result is out:
+        # Copy back so that enclosing pipelines keep a single live frame
+        np.copyto(frame, out)
+        result = frame
+    pool.release(out)
+    if result is not frame:
+        # The effect returned a new array: the working frame is done with
+        pool.release(frame)
+    return result
+
+
+def run_pipeline(
+    steps: List[Callable],
+    image: np.ndarray,
+    config: Any,
+    palette: Any,
+    quantize_result: bool = True,
+    pool: FramePool = frame_pool,
+) -> np.ndarray:
+    """Apply effects or transformations in sequence under the buffer contract.
+
+    Consecutive declared effects share one working frame; the frame is
+    quantized only before an undeclared step and at the end.
+
+    Args:
+        steps: Effects or transformations, each called with (image, config, palette)
+        image: Input uint8 image (not modified), or a working frame handed over
+            to the pipeline
+        config: Configuration passed to every step
+        palette: Color palette passed to every step
+        quantize_result: Return uint8; False may return the working frame,
+            which the caller then owns (see FramePool.quantize)
+        pool: Pool of working frames
+
+    Returns:
+        The processed image
+    """
+    frame = image
+    # Whether frame is a working frame owned by this pipeline
+    owned = is_frame(image) and pool.owns(image)
+
+    for step in steps:
+        mode = buffer_mode(step)
+        if mode is None:
+            if owned:
+                frame, owned = pool.quantize(frame), False
+            elif frame is image:
+                # Undeclared steps may modify their input: keep the caller's intact
+                frame = image.copy()
+            frame = step(frame, config, palette)
+            continue
+
+        if not owned and (mode != CHAIN or is_frame(frame)):
+            frame, owned = pool.convert(frame), True
+        if mode == CHAIN:
+            result = step.apply(frame, config, palette, quantize=False)
+            owned = is_frame(result) and pool.owns(result)
+        elif mode == INPLACE:
+            result = step(frame, config, palette)
+            owned = result is frame
+        else:
+            result = _apply_scratch(step, frame, config, palette, pool)
+            owned = result is frame
+        frame = result
+
+    if owned and quantize_result:
+        return pool.quantize(frame)
+    if frame is image and not owned:
+        return image.copy()
+    return frame
@@ -0,0 +1,217 @@
+# packages/phantom-visuals/phantom_visuals/utils/field_cache.py
+
+"""Cache for image-independent fields in Phantom Visuals.
+
+Flow fields, seeded noise textures and vignette masks depend only on the
+image size and their parameters, not on image content, so a batch of images
+(or a grid of styles over one image) keeps regenerating the same arrays.
+This module keeps them in an in-memory LRU cache with a byte budget and,
+optionally, in a directory of `.npy` files that later runs (and parallel
+workers) memory-map instead of recomputing.
+
+Cached arrays are read-only; callers that need to modify a field must copy it.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+import numpy as np
+
+# Default memory budget of the process-wide cache
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+# Name of the on-disk store inside an output directory
+CACHE_DIR_NAME = ".field_cache"
+# Bump when a cached generator changes its output, so stale files are not reused
+CACHE_VERSION = 1
+
+Fields = Tuple[np.ndarray, ...]
+
+
+@dataclass
+class FieldCacheStats:
+    """Counters of a FieldCache."""
+
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the counters with the memory use in MiB, for logging."""
+        stats = asdict(self)
+        stats["megabytes"] = round(stats.pop("bytes") / (1024 * 1024), 1)
+        lookups = self.hits + self.disk_hits + self.misses
+        stats["hit_rate"] = f"{(self.hits + self.disk_hits) / lookups:.0%}" if lookups else "n/a"
+        return stats
+
+
+def _key_name(kind: str, params: Tuple[Any, ...]) -> str:
+    """File-name-safe key of a field; floats are keyed by their repr, so equal parameters map to one file."""
+    digest = hashlib.sha1(repr((CACHE_VERSION, kind, params)).encode("utf-8")).hexdigest()[:20]
+    return f"{kind}-{digest}"
+
+
+class FieldCache:
+    """LRU cache of image-independent fields, keyed by kind and parameters.
+
+    Each entry is a tuple of arrays (e.g. flow_x and flow_y). Entries are
+    evicted least-recently-used first once the cached arrays exceed
+    `max_bytes`. With a `directory`, every computed entry is also saved as
+    one `.npy` file per array; entries missing from memory are loaded from
+    there with `mmap_mode="r"`, so processes sharing the directory share the
+    pages instead of holding private copies.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        directory: Optional[Union[str, Path]] = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_bytes: Memory budget for cached arrays (0 disables the in-memory cache)
+            directory: Optional directory of the on-disk `.npy` store
+        """
+        self.max_bytes = max_bytes
+        self.directory = Path(directory) if directory is not None else None
+        self._entries: "OrderedDict[str, Fields]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = FieldCacheStats()
+
+    def configure(
+        self,
+        directory: Optional[Union[str, Path]] = None,
+        max_bytes: Optional[int] = None,
+    ) -> "FieldCache":
+        """Change the on-disk store (None disables it) and optionally the memory budget."""
+        with self._lock:
+            self.directory = Path(directory) if directory is not None else None
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+                self._evict()
+        return self
+
+    def reset_stats(self) -> None:
+        """Zero the hit/miss counters (entries are kept)."""
+        with self._lock:
+            self.stats = FieldCacheStats(entries=len(self._entries), bytes=self.stats.bytes)
+
+    def clear(self) -> None:
+        """Drop every in-memory entry (the on-disk store is left alone)."""
+        with self._lock:
+            self._entries.clear()
+            self.stats.entries = 0
+            self.stats.bytes = 0
+
+    def get(
+        self,
+        kind: str,
+        params: Tuple[Any, ...],
+        factory: Callable[[], Union[np.ndarray, Fields]],
+    ) -> Fields:
+        """Return the cached fields for (kind, params), computing them on a miss.
+
+        Args:
+            kind: Field kind, e.g. "flow_field" (also the file name prefix)
+            params: Hashable parameters that fully determine the fields
+            factory: Called on a miss; returns an array or a tuple of arrays
+
+        Returns:
+            Tuple of read-only arrays
+        """
+        name = _key_name(kind, params)
+        with self._lock:
+            fields = self._entries.get(name)
+            if fields is not None:
+                self._entries.move_to_end(name)
+                self.stats.hits += 1
+                return fields
+
+        fields = self._load(name)
+        if fields is not None:
+            with self._lock:
+                self.stats.disk_hits += 1
+        else:
+            produced = factory()
+            fields = produced if isinstance(produced, tuple) else (produced,)
+            fields = tuple(np.asarray(field) for field in fields)
+            for field in fields:
+                field.setflags(write=False)
+            self._store(name, fields)
+            with self._lock:
+                self.stats.misses += 1
+
+        self._remember(name, fields)
+        return fields
+
+    def _remember(self, name: str, fields: Fields) -> None:
+        size = sum(field.nbytes for field in fields)
+        with self._lock:
+            if size > self.max_bytes or name in self._entries:
+                return
+            self._entries[name] = fields
+            self.stats.entries += 1
+            self.stats.bytes += size
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop least-recently-used entries until the budget holds (lock held)."""
+        while self._entries and self.stats.bytes > self.max_bytes:
+            _, fields = self._entries.popitem(last=False)
+            self.stats.bytes -= sum(field.nbytes for field in fields)
+            self.stats.entries -= 1
+            self.stats.evictions += 1
+
+    def _paths(self, name: str, count: int) -> list[Path]:
+        return [self.directory / f"{name}.{index}.npy" for index in range(count)]
+
+    def _load(self, name: str) -> Optional[Fields]:
+        """Memory-map an entry from the on-disk store, if present."""
+        if self.directory is None:
+            return None
+        count_file = self.directory / f"{name}.count"
+        try:
+            count = int(count_file.read_text(encoding="utf-8"))
+            return tuple(np.load(path, mmap_mode="r") for path in self._paths(name, count))
+        except (OSError, ValueError):
+            return None
+
+    def _store(self, name: str, fields: Fields) -> None:
+        """Save an entry to the on-disk store; the count file is written last and marks it complete."""
+        if self.directory is None:
+            return
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            for field, path in zip(fields, self._paths(name, len(fields))):
+                tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+                with open(tmp_path, "wb") as f:
+                    np.save(f, field)
+                os.replace(tmp_path, path)
+            count_file = self.directory / f"{name}.count"
+            tmp_count = count_file.with_name(f"{count_file.name}.{os.getpid()}.tmp")
+            tmp_count.write_text(str(len(fields)), encoding="utf-8")
+            os.replace(tmp_count, count_file)
+        except OSError:
+            # The store is an optimization; a full or read-only disk only costs recomputation
+            pass
+
+
+# Process-wide cache shared by the transformers and effects
+field_cache = FieldCache()
+
+
+def cached_fields(
+    kind: str,
+    params: Tuple[Any, ...],
+    factory: Callable[[], Union[np.ndarray, Fields]],
+) -> Fields:
+    """Look up fields in the process-wide cache (see FieldCache.get)."""
+    return field_cache.get(kind, params, factory)
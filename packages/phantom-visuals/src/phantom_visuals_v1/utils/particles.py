@@ -0,0 +1,521 @@
+# packages/phantom-visuals/phantom_visuals/utils/particles.py
+
+"""Vectorized particle engine for the streak and weave styles.
+
+Particles live in contiguous float32 arrays (position, velocity, brightness
+and an optional color per particle) that are advected a whole population at
+a time with bilinear samples of flow fields. Each step deposits its segments
+(or plain points) into an accumulator canvas as bilinear splats, summed with
+`np.add.at` or combined with `np.maximum.at`. Dead particles are compacted
+out of the arrays, so later steps only touch live ones.
+
+Deposition can run on an optional numba backend, used automatically when
+numba is installed.
+"""
+
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+try:
+    import numba
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Backend used when none is requested
+DEFAULT_BACKEND = "numba" if NUMBA_AVAILABLE else "numpy"
+# Distance between the splats that make up a deposited segment, in pixels
+DEFAULT_SPACING = 0.5
+# Ways of combining deposits with the canvas (see deposit_segments)
+DEPOSIT_MODES = ("add", "max", "over")
+# Widest border (pixels) padded around the canvas for splats crossing its edges
+PAD_LIMIT = 16
+
+ArrayLike = Union[np.ndarray, float]
+
+
+def _splat_loop(
+    planes: np.ndarray,
+    height: int,
+    width: int,
+    x: np.ndarray,
+    y: np.ndarray,
+    weight_scale: np.ndarray,
+    source: np.ndarray,
+    values: np.ndarray,
+    use_max: bool,
+) -> None:
+    """Splat weight_scale * values[source] bilinearly at (x, y) (numba kernel)."""
+    channels = planes.shape[0]
+    for i in range(x.shape[0]):
+        col0 = np.floor(x[i])
+        row0 = np.floor(y[i])
+        fx = x[i] - col0
+        fy = y[i] - row0
+        for tap in range(4):
+            col = int(col0) + (tap & 1)
+            row = int(row0) + (tap >> 1)
+            if col < 0 or col >= width or row < 0 or row >= height:
+                continue
+            weight_x = fx if tap & 1 else 1.0 - fx
+            weight_y = fy if tap >> 1 else 1.0 - fy
+            weight = weight_x * weight_y * weight_scale[i]
+            if weight == 0:
+                continue
+            pixel = row * width + col
+            for c in range(channels):
+                value = weight * values[source[i], c]
+                if use_max:
+                    if value > planes[c, pixel]:
+                        planes[c, pixel] = value
+                else:
+                    planes[c, pixel] += value
+
+
+if NUMBA_AVAILABLE:
+    _splat_loop = numba.njit(cache=True, nogil=True)(_splat_loop)
+
+
+def _resolve_backend(backend: Optional[str]) -> str:
+    backend = backend or DEFAULT_BACKEND
+    if backend not in ("numpy", "numba"):
+        raise ValueError(f"Unknown particle backend: {backend}")
+    if backend == "numba" and not NUMBA_AVAILABLE:
+        raise ValueError("The numba particle backend requires numba to be installed")
+    return backend
+
+
+def sample_field(
+    field: np.ndarray,
+    x: np.ndarray,
+    y: np.ndarray,
+    interpolation: str = "bilinear",
+) -> np.ndarray:
+    """Sample a 2D (or HxWxC) field at fractional positions.
+
+    Positions are clamped to the field, so particles just outside it read the
+    border values.
+
+    Args:
+        field: Field to sample
+        x: Column positions
+        y: Row positions
+        interpolation: "bilinear" or "nearest"
+
+    Returns:
+        Sampled values (float32), one per position
+    """
+    height, width = field.shape[:2]
+    xc = np.clip(x, 0, width - 1)
+    yc = np.clip(y, 0, height - 1)
+    if interpolation == "nearest":
+        return field[np.round(yc).astype(np.intp), np.round(xc).astype(np.intp)]
+    if interpolation != "bilinear":
+        raise ValueError(f"Unknown interpolation: {interpolation}")
+
+    x0 = np.floor(xc).astype(np.intp)
+    y0 = np.floor(yc).astype(np.intp)
+    x1 = np.minimum(x0 + 1, width - 1)
+    y1 = np.minimum(y0 + 1, height - 1)
+    fx = (xc - x0).astype(np.float32)
+    fy = (yc - y0).astype(np.float32)
+    if field.ndim == 3:
+        fx = fx[:, None]
+        fy = fy[:, None]
+    top = field[y0, x0] * (1.0 - fx) + field[y0, x1] * fx
+    bottom = field[y1, x0] * (1.0 - fx) + field[y1, x1] * fx
+    return (top * (1.0 - fy) + bottom * fy).astype(np.float32, copy=False)
+
+
+def _planes(canvas: np.ndarray) -> np.ndarray:
+    """(channels, pixels) view of a C-contiguous HxW or HxWxC canvas."""
+    height, width = canvas.shape[:2]
+    return canvas.reshape(height * width, -1).T
+
+
+def _splat_planes(
+    planes: np.ndarray,
+    height: int,
+    width: int,
+    x: np.ndarray,
+    y: np.ndarray,
+    values: np.ndarray,
+    source: Optional[np.ndarray],
+    weight_scale: Optional[np.ndarray],
+    use_max: bool,
+    backend: Optional[str],
+) -> None:
+    """Splat values[source] bilinearly at (x, y) into planes (channels x pixels)."""
+    if _resolve_backend(backend) == "numba":
+        _splat_loop(
+            planes,
+            height,
+            width,
+            x,
+            y,
+            np.ones(len(x), np.float32) if weight_scale is None else weight_scale,
+            np.arange(len(x)) if source is None else source,
+            np.ascontiguousarray(values),
+            use_max,
+        )
+        return
+
+    col0 = np.floor(x)
+    row0 = np.floor(y)
+    fx = x - col0
+    fy = y - row0
+    col0 = col0.astype(np.intp)
+    row0 = row0.astype(np.intp)
+    sample_values = values.T if source is None else values.T[:, source]
+    if weight_scale is not None:
+        sample_values = sample_values * weight_scale
+
+    # Footprints crossing the border go to a padded scratch, merged below
+    pad = max(
+        -int(col0.min()),
+        int(col0.max()) - (width - 2),
+        -int(row0.min()),
+        int(row0.max()) - (height - 2),
+        0,
+    )
+    target, target_width = planes, width
+    if pad:
+        if pad > PAD_LIMIT:
+            # Samples far outside contribute nothing but would inflate the scratch
+            near = (col0 >= -1) & (col0 < width) & (row0 >= -1) & (row0 < height)
+            col0, row0, fx, fy = col0[near], row0[near], fx[near], fy[near]
+            sample_values = sample_values[:, near]
+            pad = 1
+        target_width = width + 2 * pad
+        target = np.full(
+            (len(planes), (height + 2 * pad) * target_width),
+            -np.inf if use_max else 0.0,
+            dtype=planes.dtype,
+        )
+        col0 += pad
+        row0 += pad
+
+    base = row0 * target_width + col0
+    ufunc = np.maximum if use_max else np.add
+    # One pass per tap of the 2x2 bilinear footprint
+    for dx, dy in ((0, 0), (1, 0), (0, 1), (1, 1)):
+        weight = (fx if dx else 1.0 - fx) * (fy if dy else 1.0 - fy)
+        index = base + (dy * target_width + dx)
+        tap_values = sample_values
+        # Samples on a pixel row or column (e.g. rasterized lines) leave taps empty
+        nonzero = np.flatnonzero(weight)
+        if len(nonzero) < len(weight):
+            index, weight = index[nonzero], weight[nonzero]
+            tap_values = sample_values[:, nonzero]
+        for plane, plane_values in zip(target, tap_values):
+            ufunc.at(plane, index, weight * plane_values)
+
+    if pad:
+        inner = target.reshape(len(planes), height + 2 * pad, target_width)
+        inner = inner[:, pad : pad + height, pad : pad + width]
+        ufunc(planes, inner.reshape(len(planes), -1), out=planes)
+
+
+def deposit(
+    canvas: np.ndarray,
+    x: np.ndarray,
+    y: np.ndarray,
+    values: np.ndarray,
+    source: Optional[np.ndarray] = None,
+    weight_scale: Optional[np.ndarray] = None,
+    mode: str = "add",
+    backend: Optional[str] = None,
+) -> None:
+    """Splat values[source] bilinearly at (x, y) into the canvas in place.
+
+    This is the primitive behind splat() and deposit_segments(); samples that
+    share a value (the samples of one segment) index it through `source`.
+
+    Args:
+        canvas: C-contiguous HxW or HxWxC canvas
+        x: Sample columns
+        y: Sample rows
+        values: Values (m, or m x channels) the samples index into
+        source: Index into values per sample (None: one value per sample)
+        weight_scale: Optional weight per sample
+        mode: "add", "max" or "over"
+        backend: "numpy" or "numba"
+    """
+    if mode not in DEPOSIT_MODES:
+        raise ValueError(f"Unknown deposit mode: {mode}")
+    if not canvas.flags.c_contiguous:
+        raise ValueError("The canvas must be C-contiguous")
+    if len(x) == 0:
+        return
+
+    height, width = canvas.shape[:2]
+    channels = canvas.shape[2] if canvas.ndim == 3 else 1
+    values = np.asarray(values, dtype=canvas.dtype).reshape(len(values), -1)
+    if values.shape[1] != channels:
+        values = np.broadcast_to(values, (len(values), channels))
+
+    if mode != "over":
+        _splat_planes(
+            _planes(canvas),
+            height,
+            width,
+            x,
+            y,
+            values,
+            source,
+            weight_scale,
+            mode == "max",
+            backend,
+        )
+        return
+
+    # Max-combine this call's deposits and their coverage in a layer with a
+    # one-pixel border, then composite the touched pixels like an
+    # anti-aliased overwrite: canvas * (1 - coverage) + coverage * value
+    near = (x >= -1) & (x < width) & (y >= -1) & (y < height)
+    if not near.all():
+        x, y = x[near], y[near]
+        source = np.flatnonzero(near) if source is None else source[near]
+        weight_scale = None if weight_scale is None else weight_scale[near]
+    layer_width = width + 2
+    layer = np.full(
+        (channels + 1, (height + 2) * layer_width), -np.inf, dtype=canvas.dtype
+    )
+    with_coverage = np.hstack([values, np.ones((len(values), 1), canvas.dtype)])
+    _splat_planes(
+        layer,
+        height + 2,
+        layer_width,
+        x + 1,
+        y + 1,
+        with_coverage,
+        source,
+        weight_scale,
+        True,
+        backend,
+    )
+
+    touched = np.flatnonzero(layer[-1] > 0)
+    rows, cols = np.divmod(touched, layer_width)
+    inside = (rows >= 1) & (rows <= height) & (cols >= 1) & (cols <= width)
+    touched = touched[inside]
+    pixels = (rows[inside] - 1) * width + (cols[inside] - 1)
+    coverage = layer[-1, touched]
+    planes = _planes(canvas)
+    planes[:, pixels] = planes[:, pixels] * (1.0 - coverage) + layer[:-1, touched]
+
+
+def splat(
+    canvas: np.ndarray,
+    x: np.ndarray,
+    y: np.ndarray,
+    values: ArrayLike,
+    mode: str = "add",
+    backend: Optional[str] = None,
+) -> np.ndarray:
+    """Deposit points into a canvas with bilinear weights.
+
+    Args:
+        canvas: C-contiguous HxW or HxWxC float canvas, modified in place
+        x: Column positions
+        y: Row positions
+        values: Value per point (scalar, n, or n x C)
+        mode: "add" sums deposits, "max" keeps the brightest per pixel, "over"
+            paints them over the canvas
+        backend: "numpy" or "numba" (default: numba when installed)
+
+    Returns:
+        The canvas
+    """
+    x = np.asarray(x, dtype=np.float32)
+    y = np.asarray(y, dtype=np.float32)
+    values = np.broadcast_to(
+        np.asarray(values, dtype=canvas.dtype), x.shape + np.shape(values)[1:]
+    )
+    deposit(canvas, x, y, values, mode=mode, backend=backend)
+    return canvas
+
+
+def deposit_segments(
+    canvas: np.ndarray,
+    x0: np.ndarray,
+    y0: np.ndarray,
+    x1: np.ndarray,
+    y1: np.ndarray,
+    values: ArrayLike,
+    thickness: ArrayLike = 1,
+    mode: str = "max",
+    spacing: float = DEFAULT_SPACING,
+    backend: Optional[str] = None,
+) -> np.ndarray:
+    """Deposit anti-aliased line segments into a canvas in one call.
+
+    Each segment is sampled every `spacing` pixels and the samples are
+    splatted bilinearly; thicker segments repeat the samples at unit offsets
+    across the segment.
+
+    Modes:
+        "max": keep the brightest deposit per pixel
+        "over": paint the segments over the canvas, blending by coverage like
+            cv2.line with LINE_AA (segments of the same call combine by max)
+        "add": sum the deposits; samples are weighted by the segment length
+            and the end of each segment is left to the next one, so a path
+            deposits its value once per pixel travelled however it is split
+            into steps
+
+    Args:
+        canvas: C-contiguous HxW or HxWxC float canvas, modified in place
+        x0: Start columns
+        y0: Start rows
+        x1: End columns
+        y1: End rows
+        values: Value per segment (scalar, n, or n x C)
+        thickness: Line width in pixels per segment (rounded, at least 1)
+        mode: "max", "over" or "add"
+        spacing: Distance between samples along a segment, in pixels
+        backend: "numpy" or "numba" (default: numba when installed)
+
+    Returns:
+        The canvas
+    """
+    x0 = np.asarray(x0, dtype=np.float32)
+    y0 = np.asarray(y0, dtype=np.float32)
+    dx = np.asarray(x1, dtype=np.float32) - x0
+    dy = np.asarray(y1, dtype=np.float32) - y0
+    count = len(x0)
+    if count == 0:
+        return canvas
+    values = np.broadcast_to(
+        np.asarray(values, dtype=canvas.dtype), (count,) + np.shape(values)[1:]
+    )
+    widths = np.broadcast_to(
+        np.maximum(1, np.round(np.asarray(thickness))).astype(np.intp), (count,)
+    )
+
+    # Samples at t = k / steps along each segment
+    length = np.hypot(dx, dy)
+    steps = np.maximum(1, np.ceil(length / spacing)).astype(np.int32)
+    closed = mode != "add"
+    samples = steps + 1 if closed else steps
+    segment = np.repeat(np.arange(count, dtype=np.int32), samples)
+    first = np.cumsum(samples, dtype=np.int32) - samples
+    t = (np.arange(len(segment), dtype=np.int32) - first[segment]).astype(np.float32)
+    t *= (1.0 / steps).astype(np.float32)[segment]
+    px = x0[segment] + t * dx[segment]
+    py = y0[segment] + t * dy[segment]
+    scale = None
+    if not closed:
+        scale = (np.maximum(length, 1.0) / steps).astype(np.float32)[segment]
+
+    # Wider segments: copies of their samples at unit offsets along the normal
+    max_width = int(widths.max())
+    if max_width > 1:
+        safe_length = np.where(length > 0, length, 1.0)
+        normal_x = (-dy / safe_length)[segment]
+        normal_y = (dx / safe_length)[segment]
+        sample_width = widths[segment]
+        parts = []
+        for offset in range(max_width):
+            wide = np.nonzero(sample_width > offset)[0]
+            shift = offset - (sample_width[wide] - 1) / 2.0
+            parts.append(
+                (
+                    px[wide] + shift * normal_x[wide],
+                    py[wide] + shift * normal_y[wide],
+                    segment[wide],
+                    None if scale is None else scale[wide],
+                )
+            )
+        px, py, segment, scale = (
+            None if part[0] is None else np.concatenate(part) for part in zip(*parts)
+        )
+
+    deposit(canvas, px, py, values, segment, scale, mode, backend)
+    return canvas
+
+
+class ParticleSystem:
+    """A population of particles stored as contiguous float32 arrays.
+
+    Usage:
+        particles = ParticleSystem(x, y, brightness, color)
+        for _ in range(steps):
+            dir_x, dir_y = particles.sample(flow_x, flow_y)
+            x_prev, y_prev = particles.advect(dir_x * speed, dir_y * speed)
+            deposit_segments(
+                canvas, x_prev, y_prev, particles.x, particles.y, particles.brightness
+            )
+            particles.fade(0.98)
+            particles.cull(width, height, min_brightness=5)
+    """
+
+    def __init__(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        brightness: np.ndarray,
+        color: Optional[np.ndarray] = None,
+    ):
+        """Initialize the particles.
+
+        Args:
+            x: Initial columns
+            y: Initial rows
+            brightness: Initial brightness per particle
+            color: Optional n x C color per particle
+        """
+        self.x = np.array(x, dtype=np.float32)
+        self.y = np.array(y, dtype=np.float32)
+        self.vx = np.zeros_like(self.x)
+        self.vy = np.zeros_like(self.x)
+        self.brightness = np.array(brightness, dtype=np.float32)
+        self.color = None if color is None else np.array(color, dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def sample(
+        self, *fields: np.ndarray, interpolation: str = "bilinear"
+    ) -> Union[np.ndarray, Tuple[np.ndarray, ...]]:
+        """Sample fields at the particle positions (one array per field)."""
+        samples = tuple(sample_field(f, self.x, self.y, interpolation) for f in fields)
+        return samples[0] if len(samples) == 1 else samples
+
+    def advect(self, vx: ArrayLike, vy: ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+        """Move every particle by its velocity.
+
+        Returns:
+            The previous positions (x, y), i.e. the start of this step's segments
+        """
+        x_prev, y_prev = self.x, self.y
+        self.vx = np.broadcast_to(np.asarray(vx, dtype=np.float32), self.x.shape).copy()
+        self.vy = np.broadcast_to(np.asarray(vy, dtype=np.float32), self.x.shape).copy()
+        self.x = x_prev + self.vx
+        self.y = y_prev + self.vy
+        return x_prev, y_prev
+
+    def fade(self, factor: float, color: bool = True) -> None:
+        """Scale the brightness (and, by default, the color) of every particle."""
+        self.brightness *= factor
+        if color and self.color is not None:
+            self.color *= factor
+
+    def inside(self, width: int, height: int) -> np.ndarray:
+        """Mask of particles within a width x height canvas."""
+        return (self.x >= 0) & (self.x < width) & (self.y >= 0) & (self.y < height)
+
+    def keep(self, mask: np.ndarray) -> None:
+        """Drop the particles where mask is False, compacting the arrays."""
+        self.x = self.x[mask]
+        self.y = self.y[mask]
+        self.vx = self.vx[mask]
+        self.vy = self.vy[mask]
+        self.brightness = self.brightness[mask]
+        if self.color is not None:
+            self.color = self.color[mask]
+
+    def cull(self, width: int, height: int, min_brightness: float = 0.0) -> None:
+        """Drop particles that left the canvas or faded below min_brightness."""
+        self.keep(self.inside(width, height) & (self.brightness >= min_brightness))
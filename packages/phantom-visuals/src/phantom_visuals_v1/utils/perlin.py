@@ -0,0 +1,240 @@
+# packages/phantom-visuals/phantom_visuals/utils/perlin.py
+
+"""Vectorized Perlin noise for Phantom Visuals.
+
+This module evaluates fractal (multi-octave) Perlin noise over whole
+coordinate grids with NumPy instead of one `noise.pnoise2` call per pixel.
+It uses the same gradient set and octave normalization as `pnoise2`, and a
+permutation table derived from the seed, so the same seed always gives the
+same field.
+
+Octaves that are smooth at the output resolution are evaluated on reduced
+grids and upsampled bilinearly; how far each octave is reduced follows from
+its amplitude and an error tolerance.
+"""
+
+import math
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+# Gradient directions of improved Perlin noise (x/y components of the 3D set)
+_GRAD_X = np.array([1, -1, 1, -1, 1, -1, 1, -1, 0, 0, 0, 0, 1, -1, 0, 0], dtype=np.float32)
+_GRAD_Y = np.array([1, 1, -1, -1, 0, 0, 0, 0, 1, -1, 1, -1, 0, 0, -1, 1], dtype=np.float32)
+
+# Default interpolation error accepted from octaves evaluated on reduced grids
+DEFAULT_TOLERANCE = 0.02
+# Maximum bilinear interpolation error of one octave sampled once per cell (measured)
+_INTERPOLATION_ERROR = 2.0
+
+
+@lru_cache(maxsize=64)
+def _permutation(seed: int) -> np.ndarray:
+    """Doubled permutation table for a seed (legacy RandomState keeps it stable across NumPy versions)."""
+    perm = np.random.RandomState(seed % (2**32)).permutation(256).astype(np.int32)
+    table = np.concatenate([perm, perm])
+    table.setflags(write=False)
+    return table
+
+
+def _fade(t: np.ndarray) -> np.ndarray:
+    """Quintic fade curve 6t^5 - 15t^4 + 10t^3."""
+    return t * t * t * (t * (t * 6.0 - 15.0) + 10.0)
+
+
+def perlin_grid(xs: np.ndarray, ys: np.ndarray, seed: int) -> np.ndarray:
+    """Evaluate one octave of 2D Perlin noise on the grid spanned by xs and ys.
+
+    The grid is separable: hashing and gradient lookups happen once per
+    lattice cell, and every row of pixels within a lattice row is a sum of
+    four rank-1 products of per-row and per-column factors, evaluated as one
+    small matrix product per lattice row.
+
+    Args:
+        xs: 1D array of x coordinates (columns)
+        ys: 1D array of y coordinates (rows)
+        seed: Seed selecting the permutation table
+
+    Returns:
+        Float32 array of shape (len(ys), len(xs)) with values in about [-1, 1]
+    """
+    perm = _permutation(seed)
+
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    x_floor = np.floor(xs)
+    y_floor = np.floor(ys)
+    xf = (xs - x_floor).astype(np.float32)
+    yf = (ys - y_floor).astype(np.float32)
+    u = _fade(xf)
+    v = _fade(yf)
+
+    # Lattice cells touched along each axis
+    cells_x, inv_x = np.unique(x_floor, return_inverse=True)
+    cells_y, inv_y = np.unique(y_floor, return_inverse=True)
+    inv_x = inv_x.ravel()
+    inv_y = inv_y.ravel()
+    xi = (cells_x.astype(np.int64) & 255).astype(np.int32)
+    yi = (cells_y.astype(np.int64) & 255).astype(np.int32)[:, None]
+    a = perm[xi][None, :]
+    b = perm[xi + 1][None, :]
+
+    # Gradient of each cell corner, on the (lattice rows x pixel columns) grid
+    def gradients(corner_hash: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        hashed = perm[corner_hash] & 15
+        return _GRAD_X[hashed][:, inv_x], _GRAD_Y[hashed][:, inv_x]
+
+    gx00, gy00 = gradients(perm[a + yi])
+    gx10, gy10 = gradients(perm[b + yi])
+    gx01, gy01 = gradients(perm[a + yi + 1])
+    gx11, gy11 = gradients(perm[b + yi + 1])
+
+    # noise = sum over the bottom (y0) and top (y1) corner pairs of
+    #   wy * (sum_x wx * xoff * gx) + wy * yoff * (sum_x wx * gy)
+    x_weight0 = 1.0 - u
+    x_term0 = x_weight0 * xf
+    x_term1 = u * (xf - 1.0)
+    right = np.stack(
+        [
+            x_term0 * gx00 + x_term1 * gx10,
+            x_weight0 * gy00 + u * gy10,
+            x_term0 * gx01 + x_term1 * gx11,
+            x_weight0 * gy01 + u * gy11,
+        ],
+        axis=1,
+    )  # (lattice rows, 4, columns)
+    y_weight0 = 1.0 - v
+    left = np.stack([y_weight0, y_weight0 * yf, v, v * (yf - 1.0)], axis=1)  # (rows, 4)
+
+    # Rows of the same lattice row share the right-hand factors
+    order = np.argsort(inv_y, kind="stable")
+    bounds = np.searchsorted(inv_y[order], np.arange(len(cells_y) + 1))
+    result = np.empty((len(ys), len(xs)), dtype=np.float32)
+    for row, (start, stop) in enumerate(zip(bounds[:-1], bounds[1:])):
+        rows = order[start:stop]
+        result[rows] = left[rows] @ right[row]
+    return result
+
+
+def _axis_samples(pixels: int, factor: int) -> np.ndarray:
+    """Pixel positions of a grid reduced by `factor`, padded by one sample per side.
+
+    Samples sit where cv2.resize(INTER_LINEAR) maps them when enlarging the grid
+    `factor` times, so cropping `factor` pixels per side restores the pixel grid
+    without clamping at the borders.
+    """
+    count = -(-pixels // factor) + 2
+    return (np.arange(count) - 0.5) * factor - 0.5
+
+
+def _octave_factor(cell_pixels: float, weight: float, octaves: int, tolerance: Optional[float]) -> int:
+    """Grid reduction for one octave along one axis.
+
+    Bilinear upsampling of Perlin noise sampled s times per cell errs by at most
+    about 2 / s**2; each octave gets an equal share of the tolerance, scaled by
+    its share of the total amplitude.
+    """
+    if not tolerance or tolerance <= 0:
+        return 1
+    samples_needed = math.sqrt(_INTERPOLATION_ERROR * weight * octaves / tolerance)
+    return max(1, int(cell_pixels / max(samples_needed, 1.0)))
+
+
+def fractal_noise(
+    width: int,
+    height: int,
+    scale: float,
+    octaves: int = 1,
+    persistence: float = 0.5,
+    lacunarity: float = 2.0,
+    seed: int = 0,
+    tolerance: Optional[float] = DEFAULT_TOLERANCE,
+) -> np.ndarray:
+    """Generate a fractal Perlin noise field.
+
+    Pixel (i, j) samples the noise at (j / width * scale, i / height * scale),
+    like the per-pixel `pnoise2` loop this replaces; octaves are summed with
+    amplitudes persistence**k at frequencies lacunarity**k and normalized by
+    the total amplitude.
+
+    Args:
+        width: Field width in pixels
+        height: Field height in pixels
+        scale: Noise cells across the field (higher is finer)
+        octaves: Number of octaves
+        persistence: Amplitude multiplier per octave
+        lacunarity: Frequency multiplier per octave
+        seed: Seed (the same seed gives the same field)
+        tolerance: Interpolation error (in noise units) accepted from evaluating
+            smooth octaves on reduced grids and upsampling them bilinearly;
+            None or 0 evaluates every octave at full resolution
+
+    Returns:
+        Float32 array of shape (height, width) with values in about [-1, 1]
+    """
+    octaves = max(1, int(octaves))
+    amplitudes = [persistence**octave for octave in range(octaves)]
+    total_amplitude = sum(amplitudes)
+
+    total = np.zeros((height, width), dtype=np.float32)
+    frequency = 1.0
+    for amplitude in amplitudes:
+        cells = scale * frequency
+        weight = amplitude / total_amplitude
+        factor_x = _octave_factor(width / cells, weight, octaves, tolerance) if cells > 0 else 1
+        factor_y = _octave_factor(height / cells, weight, octaves, tolerance) if cells > 0 else 1
+
+        if factor_x == 1 and factor_y == 1:
+            layer = perlin_grid(np.arange(width) / width * cells, np.arange(height) / height * cells, seed)
+        else:
+            cols = _axis_samples(width, factor_x)
+            rows = _axis_samples(height, factor_y)
+            coarse = perlin_grid(cols / width * cells, rows / height * cells, seed)
+            layer = cv2.resize(
+                coarse,
+                (len(cols) * factor_x, len(rows) * factor_y),
+                interpolation=cv2.INTER_LINEAR,
+            )[factor_y : factor_y + height, factor_x : factor_x + width]
+
+        total += weight * layer
+        frequency *= lacunarity
+    return total
+
+
+def perlin_flow_field(
+    width: int,
+    height: int,
+    scale: float,
+    octaves: int,
+    persistence: float,
+    lacunarity: float,
+    seed: int,
+    tolerance: Optional[float] = DEFAULT_TOLERANCE,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Generate a flow field from two fractal noise fields.
+
+    One field (seed) sets the flow angle (noise * 2pi), the other (seed + 1)
+    the magnitude (0.5 plus the noise mapped to [0, 1]).
+
+    Args:
+        width: Field width in pixels
+        height: Field height in pixels
+        scale: Noise cells across the field
+        octaves: Number of octaves
+        persistence: Amplitude multiplier per octave
+        lacunarity: Frequency multiplier per octave
+        seed: Seed for the angle field (seed + 1 is used for the magnitude)
+        tolerance: Error accepted in the flow vectors (see fractal_noise)
+
+    Returns:
+        Tuple of float32 arrays (flow_x, flow_y), each of shape (height, width)
+    """
+    # Angle errors are scaled by 2pi in the flow vectors, so the angle field gets a tighter tolerance
+    angle_tolerance = tolerance / (2.0 * np.pi) if tolerance else tolerance
+    angle = fractal_noise(width, height, scale, octaves, persistence, lacunarity, seed, angle_tolerance)
+    magnitude = fractal_noise(width, height, scale, octaves, persistence, lacunarity, seed + 1, tolerance)
+    angle *= 2.0 * np.pi
+    magnitude = 0.5 + (magnitude + 1.0) / 2.0
+    return np.cos(angle) * magnitude, np.sin(angle) * magnitude
@@ -0,0 +1,238 @@
+# packages/phantom-visuals/phantom_visuals/utils/warp.py
+
+"""Displacement-field warps applied with cv2.remap.
+
+Warping styles sample their input at (x + dx, y + dy) for a displacement
+field (dx, dy). This module builds such fields from composable analytic
+generators evaluated on whole NumPy coordinate grids (sums of sine waves,
+smoothed noise, radial falloffs), adds them together, and applies the result
+with one cv2.remap call using a named interpolation and border mode.
+
+Usage:
+    waves = [Wave(2.0, kx=1 / 9, ky=1 / 6)]
+    field = combine(
+        sine_field(height, width, waves_x=waves),
+        radial_field(height, width, strength=-0.1),
+    )
+    warped = warp(img, field, interpolation="linear", border="reflect")
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple, Union
+
+import cv2
+import numpy as np
+
+# Displacement field: per-pixel (dx, dy) in pixels, float32 HxW arrays
+Displacement = Tuple[np.ndarray, np.ndarray]
+
+INTERPOLATIONS = {
+    "nearest": cv2.INTER_NEAREST,
+    "linear": cv2.INTER_LINEAR,
+    "cubic": cv2.INTER_CUBIC,
+    "lanczos": cv2.INTER_LANCZOS4,
+}
+BORDERS = {
+    "constant": cv2.BORDER_CONSTANT,
+    "replicate": cv2.BORDER_REPLICATE,
+    "reflect": cv2.BORDER_REFLECT,
+    "reflect101": cv2.BORDER_REFLECT_101,
+    "wrap": cv2.BORDER_WRAP,
+}
+
+
+@dataclass(frozen=True)
+class Wave:
+    """One term of a sine field: amplitude * func(kx * x + ky * y + phase).
+
+    x and y are pixel coordinates; kx and ky are angular frequencies in
+    radians per pixel.
+    """
+
+    amplitude: float
+    kx: float = 0.0
+    ky: float = 0.0
+    phase: float = 0.0
+    func: str = "sin"
+
+
+def coordinate_grid(height: int, width: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Broadcastable pixel coordinates: x as a 1xW row, y as an Hx1 column."""
+    x = np.arange(width, dtype=np.float64)[np.newaxis, :]
+    y = np.arange(height, dtype=np.float64)[:, np.newaxis]
+    return x, y
+
+
+def zero_field(height: int, width: int) -> Displacement:
+    """Field that leaves the image unchanged."""
+    return (
+        np.zeros((height, width), dtype=np.float32),
+        np.zeros((height, width), dtype=np.float32),
+    )
+
+
+def _wave_sum(
+    waves: Sequence[Wave], x: np.ndarray, y: np.ndarray, out: np.ndarray
+) -> np.ndarray:
+    for wave in waves:
+        if wave.func not in ("sin", "cos"):
+            raise ValueError(f"Unknown wave function: {wave.func}")
+        func = np.sin if wave.func == "sin" else np.cos
+        # Terms are added in float32, one wave at a time
+        out += (wave.amplitude * func(x * wave.kx + y * wave.ky + wave.phase)).astype(
+            np.float32
+        )
+    return out
+
+
+def sine_field(
+    height: int,
+    width: int,
+    waves_x: Sequence[Wave] = (),
+    waves_y: Sequence[Wave] = (),
+) -> Displacement:
+    """Displacement made of sums of sine (or cosine) waves.
+
+    Args:
+        height: Field height
+        width: Field width
+        waves_x: Waves summed into the horizontal displacement
+        waves_y: Waves summed into the vertical displacement
+
+    Returns:
+        (dx, dy) field
+    """
+    x, y = coordinate_grid(height, width)
+    dx, dy = zero_field(height, width)
+    return _wave_sum(waves_x, x, y, dx), _wave_sum(waves_y, x, y, dy)
+
+
+def noise_field(
+    height: int,
+    width: int,
+    amplitude: float,
+    sigma: float = 15.0,
+    seed: Optional[int] = None,
+) -> Displacement:
+    """Smooth random displacement: Gaussian-blurred white noise.
+
+    Each component is normalized so its largest displacement is `amplitude`.
+
+    Args:
+        height: Field height
+        width: Field width
+        amplitude: Largest displacement in pixels
+        sigma: Blur sigma; larger values give broader, smoother swirls
+        seed: Seed of the noise (None: unseeded)
+
+    Returns:
+        (dx, dy) field
+    """
+    rng = np.random.default_rng(seed)
+    components = []
+    for noise in rng.standard_normal((2, height, width), dtype=np.float32):
+        smooth = cv2.GaussianBlur(noise, (0, 0), sigma)
+        peak = float(np.max(np.abs(smooth)))
+        components.append(smooth * (amplitude / peak) if peak > 0 else smooth)
+    return components[0], components[1]
+
+
+def radial_field(
+    height: int,
+    width: int,
+    strength: float,
+    center: Optional[Tuple[float, float]] = None,
+    radius: Optional[float] = None,
+    power: float = 2.0,
+) -> Displacement:
+    """Displacement along the direction from a center point.
+
+    Each pixel samples from strength * (1 - r / radius) ** power times its
+    offset from the center, so positive strengths pinch the image towards
+    the center and negative ones bulge it; pixels beyond the radius stay put.
+
+    Args:
+        height: Field height
+        width: Field width
+        strength: Fraction of the offset from the center added to it
+        center: (x, y) center (defaults to the image center)
+        radius: Radius of the effect in pixels (defaults to the half-diagonal)
+        power: Falloff exponent towards the radius
+
+    Returns:
+        (dx, dy) field
+    """
+    x, y = coordinate_grid(height, width)
+    center_x, center_y = center if center is not None else (width / 2, height / 2)
+    if radius is None:
+        radius = math.hypot(width / 2, height / 2)
+    offset_x = x - center_x
+    offset_y = y - center_y
+    falloff = np.clip(1.0 - np.sqrt(offset_x**2 + offset_y**2) / radius, 0.0, 1.0)
+    scale = strength * falloff**power
+    return (
+        (offset_x * scale).astype(np.float32),
+        (offset_y * scale).astype(np.float32),
+    )
+
+
+def combine(*fields: Displacement) -> Displacement:
+    """Sum displacement fields."""
+    dx = np.sum([field[0] for field in fields], axis=0, dtype=np.float32)
+    dy = np.sum([field[1] for field in fields], axis=0, dtype=np.float32)
+    return dx, dy
+
+
+def scale_field(
+    field: Displacement, factor: Union[float, np.ndarray]
+) -> Displacement:
+    """Multiply a field by a scalar or a per-pixel HxW factor."""
+    return (
+        (field[0] * factor).astype(np.float32, copy=False),
+        (field[1] * factor).astype(np.float32, copy=False),
+    )
+
+
+def sampling_maps(field: Displacement) -> Tuple[np.ndarray, np.ndarray]:
+    """cv2.remap maps (x + dx, y + dy) of a displacement field."""
+    height, width = field[0].shape
+    x, y = coordinate_grid(height, width)
+    map_x = field[0] + x.astype(np.float32)
+    map_y = field[1] + y.astype(np.float32)
+    return map_x, map_y
+
+
+def warp(
+    image: np.ndarray,
+    field: Displacement,
+    interpolation: str = "linear",
+    border: str = "reflect",
+    border_value: float = 0,
+) -> np.ndarray:
+    """Sample an image at (x + dx, y + dy) with cv2.remap.
+
+    Args:
+        image: Input image (any dtype and channel count cv2.remap accepts)
+        field: (dx, dy) displacement field of the image's size
+        interpolation: "nearest", "linear", "cubic" or "lanczos"
+        border: "constant", "replicate", "reflect", "reflect101" or "wrap";
+            "replicate" matches clamping the sampling coordinates to the image
+        border_value: Fill value for the "constant" border
+
+    Returns:
+        Warped image
+    """
+    if interpolation not in INTERPOLATIONS:
+        raise ValueError(f"Unknown interpolation: {interpolation}")
+    if border not in BORDERS:
+        raise ValueError(f"Unknown border mode: {border}")
+    map_x, map_y = sampling_maps(field)
+    return cv2.remap(
+        image,
+        map_x,
+        map_y,
+        interpolation=INTERPOLATIONS[interpolation],
+        borderMode=BORDERS[border],
+        borderValue=border_value,
+    )